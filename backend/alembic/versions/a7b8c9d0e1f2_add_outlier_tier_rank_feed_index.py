@@ -0,0 +1,38 @@
+"""add_outlier_tier_rank_feed_index
+
+Revision ID: a7b8c9d0e1f2
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-16 00:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7b8c9d0e1f2'
+down_revision = 'f1a2b3c4d5e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Stored tier rank (S=1 … C=4) so For-You / search_patterns can sort by index instead of array_position()
+    op.add_column('outlier_items', sa.Column(
+        'tier_rank', sa.SmallInteger(),
+        sa.Computed("CASE outlier_tier WHEN 'S' THEN 1 WHEN 'A' THEN 2 WHEN 'B' THEN 3 WHEN 'C' THEN 4 END", persisted=True),
+        nullable=True,
+    ))
+
+    # Partial covering index over analyzed items in feed order
+    op.create_index(
+        'ix_outlier_items_feed_rank', 'outlier_items',
+        ['tier_rank', sa.text('outlier_score DESC'), sa.text('view_count DESC'), sa.text('id DESC')],
+        postgresql_include=['category', 'platform'],
+        postgresql_where=sa.text("analysis_status = 'completed' AND tier_rank IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outlier_items_feed_rank', table_name='outlier_items')
+    op.drop_column('outlier_items', 'tier_rank')
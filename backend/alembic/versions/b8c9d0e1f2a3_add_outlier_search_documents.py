@@ -0,0 +1,46 @@
+"""add_outlier_search_documents
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 00:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8c9d0e1f2a3'
+down_revision = 'a7b8c9d0e1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        'outlier_search_documents',
+        sa.Column('outlier_item_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('search_text', sa.Text(), nullable=False, server_default=''),
+        sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['outlier_item_id'], ['outlier_items.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('outlier_item_id'),
+    )
+    op.create_index(
+        'ix_outlier_search_documents_vector', 'outlier_search_documents', ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_outlier_search_documents_trgm', 'outlier_search_documents', ['search_text'],
+        postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+    # Documents are tokenized in Python: run scripts/rebuild_search_index.py once after upgrading
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outlier_search_documents_trgm', table_name='outlier_search_documents')
+    op.drop_index('ix_outlier_search_documents_vector', table_name='outlier_search_documents')
+    op.drop_table('outlier_search_documents')
@@ -0,0 +1,38 @@
+"""add_outlier_listing_keyset_indexes
+
+Revision ID: f1a2b3c4d5e6
+Revises: 9cd5ab5c3645
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a2b3c4d5e6'
+down_revision = '9cd5ab5c3645'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pagination for GET /outliers: (sort key DESC NULLS LAST, id DESC)
+    op.create_index(
+        'ix_outlier_items_listing_score', 'outlier_items',
+        [sa.text('outlier_score DESC NULLS LAST'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_outlier_items_listing_views', 'outlier_items',
+        [sa.text('view_count DESC NULLS LAST'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_outlier_items_listing_crawled', 'outlier_items',
+        [sa.text('crawled_at DESC NULLS LAST'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outlier_items_listing_crawled', table_name='outlier_items')
+    op.drop_index('ix_outlier_items_listing_views', table_name='outlier_items')
+    op.drop_index('ix_outlier_items_listing_score', table_name='outlier_items')
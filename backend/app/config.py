@@ -39,9 +39,64 @@ class Settings(BaseSettings):
     GEMINI_MODEL: str = "gemini-3-pro-preview"  # Works with video analysis
     CLAUDE_API_KEY: str = ""
 
+    # GenAI Gateway (app/services/genai_gateway.py)
+    GENAI_MAX_CONCURRENCY: int = 16  # in-flight Gemini calls across all models
+    GENAI_MODEL_CONCURRENCY: int = 8  # in-flight Gemini calls per model
+    GENAI_MAX_RETRY_WAIT_SEC: float = 30.0  # cap on retry_after_ms-driven backoff
+
+    # VDG Vector Index (parent-candidate ANN snapshot)
+    VDG_INDEX_PATH: str = "data/vdg_index/vdg_vectors.npz"
+
+    # VDG Pass Cache (content-addressed Pass 1/Pass 2 results)
+    VDG_PASS_CACHE_DIR: str = "data/vdg_pass_cache"  # empty = disk store off
+    VDG_PASS_CACHE_REDIS: bool = False
+    VDG_PASS_CACHE_TTL_SEC: int = 7 * 86400
+
+    # VDG Analysis Job Queue (app/services/analysis_queue.py, scripts/run_analysis_worker.py)
+    ANALYSIS_QUEUE_BACKEND: str = "sqlite"  # sqlite (single host) | redis (multi-node)
+    ANALYSIS_QUEUE_SQLITE_PATH: str = "data/analysis_queue.sqlite3"
+    ANALYSIS_QUEUE_MAX_ATTEMPTS: int = 3
+    ANALYSIS_QUEUE_RETRY_BASE_SEC: float = 60.0  # backoff 60s, 120s, ...
+    ANALYSIS_QUEUE_LEASE_SEC: int = 900  # running-job lease, renewed by worker heartbeat
+    ANALYSIS_WORKER_CONCURRENCY: int = 4  # jobs per worker process
+    ANALYSIS_WORKER_INPROCESS: bool = False  # dev only: also run a worker inside the API process
+    ANALYSIS_STAGE_DOWNLOAD_CONCURRENCY: int = 4  # per worker process
+    ANALYSIS_STAGE_LLM_CONCURRENCY: int = 2
+    ANALYSIS_STAGE_CV_CONCURRENCY: int = 1
+
+    # For-You Feed Ranking (app/services/feed_ranking.py)
+    FOR_YOU_COUNT_CACHE_TTL_SEC: float = 60.0  # total_count per filter combination (per process, TTL-only refresh)
+
+    # Live Coaching Frame Analysis (app/services/frame_scheduler.py)
+    COACHING_FRAME_WORKERS: int = 4  # concurrent frame analyses across all sessions
+    COACHING_FRAME_INTERVAL_SEC: float = 1.0  # per-session analysis budget (1fps)
+    COACHING_VISION_BATCH_WINDOW_MS: int = 100  # coalesce frames across sessions (0 = per-frame calls)
+    COACHING_VISION_BATCH_MAX: int = 8  # frames per multi-image Gemini request
+    COACHING_VISION_BACKEND: str = "gemini"  # gemini | mock (offline load testing, no API key)
+    COACHING_VISION_MOCK_LATENCY_MS: int = 300
+
+    # Ghost Overlay Frame Store (app/services/frame_store.py)
+    FRAME_STORAGE_PATH: str = "/tmp/komission/frames"  # {content_id}/{t_ms}.jpg, source.mp4, _variants/
+    FRAME_MATCH_TOLERANCE_MS: int = 500  # nearest stored frame when no source video is cached
+    FRAME_EXTRACT_STEP_MS: int = 100  # on-demand extraction grid (10fps)
+    FRAME_EXTRACT_SPAN_MS: int = 2000  # one decode fills this much of the timeline
+    FRAME_MEMORY_CACHE_MB: int = 64  # encoded frames/variants kept in memory
+    FRAME_KEEP_SOURCE_VIDEO: bool = False  # keep VDG downloads as source.mp4 for on-demand extraction
+
+    # Coaching TTS Clip Cache (app/services/tts_cache.py)
+    TTS_CACHE_DIR: str = "data/tts_cache"  # empty = memory only
+    TTS_CACHE_MAX_ENTRIES: int = 1024
+    TTS_WARMUP_CONCURRENCY: int = 4  # parallel renders when a DirectorPack loads
+
+    # Coaching Session Registry (app/services/session_registry.py)
+    COACHING_SESSION_REGISTRY: str = "local"  # local | redis (required for >1 worker)
+    COACHING_SESSION_TTL_SEC: int = 6 * 3600  # session records, logs, feedback
+    COACHING_LIVE_SESSION_TTL_SEC: int = 120  # live WS snapshot, refreshed by heartbeat
+
     # Crawler APIs
     YOUTUBE_API_KEY: str = ""  # YouTube Data API v3
     APIFY_API_TOKEN: str = ""  # For TikTok/Instagram crawling
+    CRAWLER_HTTP_MAX_CONNECTIONS: int = 20  # shared AsyncClient pool (app/crawlers/async_http.py)
 
     # Monitoring
     SENTRY_DSN: str = ""
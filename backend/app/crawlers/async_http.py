@@ -0,0 +1,128 @@
+"""
+Async HTTP plumbing for crawlers
+
+- get_async_client: 프로세스 공유 httpx.AsyncClient (크롤러별 httpx.Client 대신 커넥션 풀 공유)
+- CrawlContext: 플랫폼 1회 크롤 실행 컨텍스트
+  - semaphore: 플랫폼별 동시 요청 상한
+  - quota_manager: 요청 전 QuotaManager.check_and_consume (초과 시 QuotaExceededError)
+- arun_apify_actor: Apify actor 실행 + dataset 조회 (TikTok / Instagram 공용)
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import httpx
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.services.quota_manager import QuotaManager
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TIMEOUT_SEC = 30.0
+APIFY_TIMEOUT_SEC = 330.0  # waitForFinish=300 + 여유
+
+
+class QuotaExceededError(RuntimeError):
+    """QuotaManager 가 요청을 거부함"""
+
+
+# ============================================
+# Shared AsyncClient
+# ============================================
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """공유 AsyncClient (첫 호출 시 생성, 닫혔으면 재생성)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT_SEC,
+            limits=httpx.Limits(
+                max_connections=settings.CRAWLER_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.CRAWLER_HTTP_MAX_CONNECTIONS // 2,
+            ),
+        )
+    return _client
+
+
+async def aclose_async_client() -> None:
+    """공유 AsyncClient 종료 (스크립트 / 앱 종료 시)"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+# ============================================
+# Crawl Context
+# ============================================
+
+@dataclass
+class CrawlContext:
+    """플랫폼 크롤 1회의 HTTP / 동시성 / quota 컨텍스트"""
+    platform: str
+    client: httpx.AsyncClient = field(default_factory=get_async_client)
+    semaphore: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(1))
+    quota_manager: Optional["QuotaManager"] = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        cost: int = 0,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        quota 차감 → semaphore 안에서 요청 → raise_for_status
+
+        Args:
+            cost: QuotaManager 단위 (0 이면 quota 체크 안 함)
+        """
+        if cost and self.quota_manager is not None:
+            if not await self.quota_manager.check_and_consume(self.platform, cost):
+                raise QuotaExceededError(f"{self.platform} quota exceeded (cost={cost})")
+
+        async with self.semaphore:
+            response = await self.client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
+
+
+async def arun_apify_actor(
+    ctx: CrawlContext,
+    base_url: str,
+    actor_id: str,
+    token: str,
+    run_input: Dict[str, Any],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """Apify actor 실행 (최대 5분 대기) 후 기본 dataset 아이템 반환"""
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await ctx.request(
+        "POST",
+        f"{base_url}/acts/{actor_id}/runs",
+        cost=1,
+        headers=headers,
+        json=run_input,
+        params={"waitForFinish": 300},
+        timeout=APIFY_TIMEOUT_SEC,
+    )
+    dataset_id = response.json().get("data", {}).get("defaultDatasetId")
+    if not dataset_id:
+        logger.warning(f"No dataset ID returned from Apify run ({actor_id})")
+        return []
+
+    response = await ctx.request(
+        "GET",
+        f"{base_url}/datasets/{dataset_id}/items",
+        headers=headers,
+        params={"limit": limit},
+    )
+    return response.json()
@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from app.schemas.evidence import OutlierCrawlItem
+from app.crawlers.async_http import CrawlContext
 
 class BaseCrawler(ABC):
     """
@@ -16,3 +18,16 @@ class BaseCrawler(ABC):
         Crawl sources and return a list of normalized outlier items.
         """
         pass
+
+    async def acrawl(
+        self,
+        limit: int = 10,
+        ctx: Optional[CrawlContext] = None,
+        **kwargs
+    ) -> List[OutlierCrawlItem]:
+        """
+        Async crawl. Native async crawlers override this and send requests
+        through ctx (shared AsyncClient, per-platform semaphore, quota).
+        Default: run the sync crawl in a worker thread.
+        """
+        return await asyncio.to_thread(self.crawl, limit=limit, **kwargs)
@@ -7,6 +7,13 @@ Content Filter for Outlier Crawling
 - 유튜버 편집 영상 (하이라이트, 클립)
 - 뉴스 / 시사 / 스포츠
 
+매칭 방식:
+- 모든 키워드 목록 (방송사 / 연예인 / 뉴스 / 리터럴 TV·편집 패턴) 을 Aho-Corasick 오토마톤 1개로 컴파일
+  → 키워드 수와 무관하게 텍스트 길이에 선형, 영상당 1회 스캔
+- 정규식 패턴 (r"\d+회" 등) 은 그룹별로 하나의 결합 정규식 → 매칭될 때만 개별 패턴으로 사유 확인
+- reject_reason 은 기존과 동일 (그룹 우선순위 → 목록 순서상 첫 키워드)
+  방송사 채널이 여러 개 매칭되면 채널명에서 가장 앞 (같으면 가장 긴) 키워드
+
 사용법:
     from app.crawlers.content_filter import ContentFilter, should_collect
     
@@ -14,9 +21,13 @@ Content Filter for Outlier Crawling
         # 수집 진행
     else:
         # 스킵
+
+    # 크롤러 배치: 한 번에 분류 (입력 순서대로 FilterResult)
+    results = content_filter.filter_batch([{"title": t, "channel_name": c} for t, c in rows])
 """
 import re
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -27,6 +38,62 @@ class FilterResult:
     confidence: float = 1.0
 
 
+_REGEX_METACHARS = set(".^$*+?{}[]\\|()")
+
+
+def _is_literal_pattern(pattern: str) -> bool:
+    return not (set(pattern) & _REGEX_METACHARS)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 문자열 매처 (키워드별 payload)"""
+
+    def __init__(self, keywords: Iterable[Tuple[str, Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]  # (키워드 길이, payload)
+        for keyword, payload in keywords:
+            if keyword:
+                self._add(keyword, payload)
+        self._build()
+
+    def _add(self, keyword: str, payload: Any) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(keyword), payload))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """(start, end, payload) - 겹치는 매칭 포함"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, payload in output[state]:
+                yield end - length, end, payload
+
+
 class ContentFilter:
     """
     체험단 콘텐츠 필터
@@ -131,7 +198,104 @@ class ContentFilter:
         # 정규식 컴파일
         self._tv_patterns = [re.compile(p, re.IGNORECASE) for p in self.TV_PROGRAM_KEYWORDS]
         self._edit_patterns = [re.compile(p, re.IGNORECASE) for p in self.EDIT_CLIP_PATTERNS]
-    
+
+        # 리터럴 키워드 → Aho-Corasick 1개 (payload: (그룹, 목록 순서, 원래 키워드))
+        literals: List[Tuple[str, Tuple[str, int, str]]] = [
+            (keyword.lower(), ("broadcast", 0, keyword)) for keyword in self.BROADCAST_CHANNELS
+        ]
+        for group, keywords in (("tv", self.TV_PROGRAM_KEYWORDS), ("edit", self.EDIT_CLIP_PATTERNS)):
+            literals += [
+                (keyword.lower(), (group, index, keyword))
+                for index, keyword in enumerate(keywords) if _is_literal_pattern(keyword)
+            ]
+        for group, keywords in (("celebrity", self.CELEBRITY_KEYWORDS), ("news", self.NEWS_SPORTS_KEYWORDS)):
+            literals += [(keyword.lower(), (group, index, keyword)) for index, keyword in enumerate(keywords)]
+        self._automaton = KeywordAutomaton(literals)
+
+        # 정규식 패턴 → 그룹별 결합 정규식 (매칭 시에만 개별 패턴 확인)
+        self._tv_regexes = self._regex_group(self._tv_patterns)
+        self._edit_regexes = self._regex_group(self._edit_patterns)
+        self._exclude_hashtags = {tag.lower(): tag for tag in self.EXCLUDE_HASHTAGS}
+
+    @staticmethod
+    def _regex_group(patterns: List[re.Pattern]) -> Tuple[Optional[re.Pattern], List[Tuple[int, re.Pattern]]]:
+        indexed = [(index, pattern) for index, pattern in enumerate(patterns) if not _is_literal_pattern(pattern.pattern)]
+        if not indexed:
+            return None, []
+        combined = re.compile("|".join(f"(?:{pattern.pattern})" for _, pattern in indexed), re.IGNORECASE)
+        return combined, indexed
+
+    @staticmethod
+    def _first_regex(
+        group: Tuple[Optional[re.Pattern], List[Tuple[int, re.Pattern]]], texts: Tuple[str, ...],
+    ) -> Optional[Tuple[int, str]]:
+        """결합 정규식이 매칭되면 목록 순서상 첫 패턴 (인덱스, 패턴)"""
+        combined, indexed = group
+        if combined is None or not any(combined.search(text) for text in texts if text):
+            return None
+        for index, pattern in indexed:
+            if any(pattern.search(text) for text in texts if text):
+                return index, pattern.pattern
+        return None
+
+    def _classify(
+        self,
+        title_lower: str,
+        channel_lower: str,
+        desc_lower: str,
+        hashtags: Optional[List[str]],
+    ) -> FilterResult:
+        """소문자화된 필드 1건 분류 (combined_text 1회 스캔)"""
+        combined_text = f"{title_lower} {channel_lower} {desc_lower}"
+        title_end = len(title_lower)
+        channel_start = title_end + 1
+        channel_end = channel_start + len(channel_lower)
+        desc_start = channel_end + 1
+
+        broadcast: Optional[Tuple[int, int, str]] = None  # (start, -length, keyword)
+        first: Dict[str, Tuple[int, str]] = {}  # 그룹 → (목록 순서, 키워드)
+        for start, end, (group, index, keyword) in self._automaton.iter_matches(combined_text):
+            if group == "broadcast":
+                if start >= channel_start and end <= channel_end:
+                    candidate = (start, start - end, keyword)
+                    if broadcast is None or candidate < broadcast:
+                        broadcast = candidate
+                continue
+            if group in ("tv", "edit") and not (end <= title_end or start >= desc_start):
+                continue  # 제목 / 설명 안에서만 (채널명 제외)
+            if group not in first or index < first[group][0]:
+                first[group] = (index, keyword)
+
+        texts = (title_lower, desc_lower)
+        for group, regexes in (("tv", self._tv_regexes), ("edit", self._edit_regexes)):
+            match = self._first_regex(regexes, texts)
+            if match is not None and (group not in first or match < first[group]):
+                first[group] = match
+
+        # 1. 방송사 채널 체크
+        if broadcast is not None:
+            return FilterResult(should_collect=False, reject_reason=f"broadcast_channel:{broadcast[2]}", confidence=0.95)
+        # 2. TV 프로그램 키워드 체크
+        if "tv" in first:
+            return FilterResult(should_collect=False, reject_reason=f"tv_program:{first['tv'][1]}", confidence=0.9)
+        # 3. 연예인/아이돌 키워드 체크
+        if "celebrity" in first:
+            return FilterResult(should_collect=False, reject_reason=f"celebrity:{first['celebrity'][1]}", confidence=0.85)
+        # 4. 편집/클립 영상 패턴 체크
+        if "edit" in first:
+            return FilterResult(should_collect=False, reject_reason=f"edit_clip:{first['edit'][1]}", confidence=0.85)
+        # 5. 제외 해시태그 체크 (입력 순서상 첫 해시태그)
+        for hashtag in hashtags or []:
+            exclude_tag = self._exclude_hashtags.get(hashtag.lower())
+            if exclude_tag is not None:
+                return FilterResult(should_collect=False, reject_reason=f"hashtag:{exclude_tag}", confidence=0.9)
+        # 6. 뉴스/시사/스포츠 체크
+        if "news" in first:
+            return FilterResult(should_collect=False, reject_reason=f"news_sports:{first['news'][1]}", confidence=0.8)
+
+        # 모든 필터 통과
+        return FilterResult(should_collect=True)
+
     def filter(
         self,
         title: str,
@@ -145,68 +309,33 @@ class ContentFilter:
         Returns:
             FilterResult: should_collect=True면 수집, False면 스킵
         """
-        title_lower = title.lower() if title else ""
-        channel_lower = channel_name.lower() if channel_name else ""
-        desc_lower = description.lower() if description else ""
-        hashtags_lower = {h.lower() for h in (hashtags or [])}
-        
-        # 1. 방송사 채널 체크
-        for broadcast in self.BROADCAST_CHANNELS:
-            if broadcast in channel_lower:
-                return FilterResult(
-                    should_collect=False,
-                    reject_reason=f"broadcast_channel:{broadcast}",
-                    confidence=0.95
-                )
-        
-        # 2. TV 프로그램 키워드 체크
-        for pattern in self._tv_patterns:
-            if pattern.search(title_lower) or pattern.search(desc_lower):
-                return FilterResult(
-                    should_collect=False,
-                    reject_reason=f"tv_program:{pattern.pattern}",
-                    confidence=0.9
-                )
-        
-        # 3. 연예인/아이돌 키워드 체크
-        combined_text = f"{title_lower} {channel_lower} {desc_lower}"
-        for celeb in self.CELEBRITY_KEYWORDS:
-            if celeb.lower() in combined_text:
-                return FilterResult(
-                    should_collect=False,
-                    reject_reason=f"celebrity:{celeb}",
-                    confidence=0.85
-                )
-        
-        # 4. 편집/클립 영상 패턴 체크
-        for pattern in self._edit_patterns:
-            if pattern.search(title_lower) or pattern.search(desc_lower):
-                return FilterResult(
-                    should_collect=False,
-                    reject_reason=f"edit_clip:{pattern.pattern}",
-                    confidence=0.85
-                )
-        
-        # 5. 제외 해시태그 체크
-        for exclude_tag in self.EXCLUDE_HASHTAGS:
-            if exclude_tag.lower() in hashtags_lower:
-                return FilterResult(
-                    should_collect=False,
-                    reject_reason=f"hashtag:{exclude_tag}",
-                    confidence=0.9
-                )
-        
-        # 6. 뉴스/시사/스포츠 체크
-        for keyword in self.NEWS_SPORTS_KEYWORDS:
-            if keyword.lower() in combined_text:
-                return FilterResult(
-                    should_collect=False,
-                    reject_reason=f"news_sports:{keyword}",
-                    confidence=0.8
-                )
-        
-        # 모든 필터 통과
-        return FilterResult(should_collect=True)
+        return self._classify(
+            title.lower() if title else "",
+            channel_name.lower() if channel_name else "",
+            description.lower() if description else "",
+            hashtags,
+        )
+
+    def filter_batch(self, items: Iterable[Mapping[str, Any]]) -> List[FilterResult]:
+        """
+        여러 영상 한 번에 필터링 (크롤러 배치용)
+
+        Args:
+            items: {"title", "channel_name", "hashtags", "description"} 매핑 (title 외 생략 가능)
+
+        Returns:
+            입력 순서대로 FilterResult (filter() 와 같은 reject_reason)
+        """
+        classify = self._classify
+        return [
+            classify(
+                (item.get("title") or "").lower(),
+                (item.get("channel_name") or "").lower(),
+                (item.get("description") or "").lower(),
+                item.get("hashtags"),
+            )
+            for item in items
+        ]
     
     def get_remixable_score(
         self,
@@ -242,8 +371,8 @@ class ContentFilter:
         # 개인 크리에이터 추정 (방송사 아님)
         if channel_name:
             is_personal = not any(
-                b in channel_name.lower() 
-                for b in self.BROADCAST_CHANNELS
+                payload[0] == "broadcast"
+                for _, _, payload in self._automaton.iter_matches(channel_name.lower())
             )
             if is_personal:
                 score += 2
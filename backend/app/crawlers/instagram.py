@@ -14,6 +14,7 @@ from typing import List, Optional, Dict, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from app.crawlers.async_http import CrawlContext, arun_apify_actor
 from app.crawlers.base import BaseCrawler
 from app.schemas.evidence import OutlierCrawlItem
 from app.config import settings
@@ -99,6 +100,41 @@ class InstagramCrawler(BaseCrawler):
             logger.error(f"Instagram crawl failed: {e}")
             raise
     
+    async def acrawl(
+        self,
+        limit: int = 30,
+        ctx: Optional[CrawlContext] = None,
+        hashtags: Optional[List[str]] = None,
+        category: str = "trending",
+        **kwargs
+    ) -> List[OutlierCrawlItem]:
+        """
+        Async version of crawl.
+        Apify mode uses the shared AsyncClient; Graph API mode runs the sync
+        crawl in a worker thread.
+        """
+        if self.use_graph_api and hashtags:
+            return await super().acrawl(limit=limit, ctx=ctx, hashtags=hashtags, category=category)
+        
+        ctx = ctx or CrawlContext(platform="instagram")
+        logger.info(f"Starting async Instagram crawl: hashtags={hashtags}, limit={limit}")
+        
+        if not self.apify_token:
+            logger.warning("No credentials - returning mock data")
+            return self._get_mock_data(limit)
+        
+        run_input = {
+            "hashtags": hashtags or ["viral", "trending"],
+            "resultsLimit": limit,
+            "proxy": {"useApifyProxy": True},
+        }
+        reels = await arun_apify_actor(
+            ctx, self.APIFY_BASE_URL, self.ACTORS["hashtag"], self.apify_token, run_input, limit
+        )
+        items = [self._normalize_to_outlier_item(r, category) for r in reels[:limit]]
+        logger.info(f"Async Instagram crawl complete: {len(items)} items collected")
+        return items
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
     def _crawl_via_graph_api(self, hashtags: List[str], limit: int) -> List[Dict[str, Any]]:
         """Crawl using Instagram Graph API (requires Business account)."""
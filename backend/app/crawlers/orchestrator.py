@@ -0,0 +1,181 @@
+"""
+Concurrent Crawl Orchestrator
+
+플랫폼 크롤을 순차 실행하던 방식 → asyncio.gather 로 동시 실행.
+전체 소요 시간 = 가장 느린 플랫폼 (합계 아님).
+
+- 공유 httpx.AsyncClient 1개 (app/crawlers/async_http.py)
+- 플랫폼별 동시 요청 상한 (semaphore)
+  - DEFAULT_PLATFORM_CONCURRENCY 를 QuotaManager 잔여량으로 추가 제한
+    (잔여량 // 가장 비싼 호출 비용, 최소 1)
+  - 잔여량이 최소 크롤 비용보다 적으면 해당 플랫폼은 "skipped"
+- 요청마다 QuotaManager.check_and_consume (CrawlContext.request)
+- 크롤러 없는 플랫폼(virlo 등)은 runners 로 코루틴 주입
+
+DB 적재는 호출자 책임 (AsyncSession 은 동시 사용 불가 → 결과를 받아 순차 INSERT).
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from app.crawlers.async_http import CrawlContext, get_async_client
+from app.crawlers.factory import CrawlerFactory
+from app.schemas.evidence import OutlierCrawlItem
+
+logger = logging.getLogger(__name__)
+
+
+# 플랫폼별 동시 요청 상한
+DEFAULT_PLATFORM_CONCURRENCY: Dict[str, int] = {
+    "youtube": 4,
+    "tiktok": 2,
+    "instagram": 1,
+    "virlo": 1,
+}
+
+# 가장 비싼 단일 호출 비용 (QuotaManager 단위) - 잔여량 기반 동시성 계산용
+QUOTA_UNIT_COST: Dict[str, int] = {
+    "youtube": 100,  # search.list (channel baseline)
+    "tiktok": 1,
+    "instagram": 1,
+}
+
+# 크롤 1회 최소 비용 - 잔여량이 이보다 적으면 스킵
+MIN_CRAWL_COST: Dict[str, int] = {
+    "youtube": 2,  # videos.list (id) + videos.list (details) 최소 1개
+    "tiktok": 1,
+    "instagram": 1,
+}
+
+
+@dataclass
+class PlatformCrawlResult:
+    """플랫폼 1개 크롤 결과"""
+    platform: str
+    status: str = "pending"  # success | failed | skipped
+    items: List[OutlierCrawlItem] = field(default_factory=list)
+    result: Dict[str, Any] = field(default_factory=dict)  # runner 반환값 (virlo 등)
+    error: Optional[str] = None
+    concurrency: int = 0
+    elapsed_ms: int = 0
+
+
+class CrawlOrchestrator:
+    """플랫폼 크롤 동시 실행기"""
+
+    def __init__(
+        self,
+        quota_manager=None,
+        concurrency: Optional[Dict[str, int]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.quota_manager = quota_manager
+        self.concurrency = {**DEFAULT_PLATFORM_CONCURRENCY, **(concurrency or {})}
+        self.client = client
+
+    async def _remaining_quota(self, platform: str) -> Optional[int]:
+        """QuotaManager 가 관리하는 플랫폼이면 잔여량, 아니면 None"""
+        if self.quota_manager is None or platform not in self.quota_manager.limits:
+            return None
+        return await self.quota_manager.get_remaining(platform)
+
+    def concurrency_for(self, platform: str, remaining: Optional[int]) -> int:
+        """기본 상한을 quota 잔여량으로 제한 (최소 1)"""
+        cap = self.concurrency.get(platform, 1)
+        if remaining is None:
+            return cap
+        unit = QUOTA_UNIT_COST.get(platform, 1)
+        return max(1, min(cap, remaining // unit))
+
+    async def _run_platform(
+        self,
+        platform: str,
+        limit: int,
+        category: str,
+        region: str,
+        runner: Optional[Callable[[], Awaitable[Dict[str, Any]]]],
+    ) -> PlatformCrawlResult:
+        outcome = PlatformCrawlResult(platform=platform)
+        start = time.perf_counter()
+
+        try:
+            if runner is not None:
+                outcome.concurrency = self.concurrency.get(platform, 1)
+                outcome.result = await runner() or {}
+                outcome.status = "success"
+                return outcome
+
+            remaining = await self._remaining_quota(platform)
+            if remaining is not None and remaining < MIN_CRAWL_COST.get(platform, 1):
+                outcome.status = "skipped"
+                outcome.error = f"quota exhausted (remaining={remaining})"
+                logger.warning(f"Skipping {platform} crawl: {outcome.error}")
+                return outcome
+
+            outcome.concurrency = self.concurrency_for(platform, remaining)
+            ctx = CrawlContext(
+                platform=platform,
+                client=self.client or get_async_client(),
+                semaphore=asyncio.Semaphore(outcome.concurrency),
+                quota_manager=self.quota_manager,
+            )
+
+            crawler = CrawlerFactory.create(platform)
+            region_kwargs = {"region_code": region} if platform == "youtube" else {"region": region}
+            try:
+                outcome.items = await crawler.acrawl(
+                    limit=limit,
+                    ctx=ctx,
+                    category=category,
+                    **region_kwargs,
+                )
+            finally:
+                if hasattr(crawler, "close"):
+                    crawler.close()
+            outcome.status = "success"
+
+        except Exception as e:
+            logger.error(f"Crawler {platform} failed: {e}")
+            outcome.status = "failed"
+            outcome.error = str(e)
+
+        finally:
+            outcome.elapsed_ms = int((time.perf_counter() - start) * 1000)
+
+        return outcome
+
+    async def run(
+        self,
+        platforms: List[str],
+        limit: int = 50,
+        category: str = "trending",
+        region: str = "KR",
+        runners: Optional[Dict[str, Callable[[], Awaitable[Dict[str, Any]]]]] = None,
+    ) -> Dict[str, PlatformCrawlResult]:
+        """
+        모든 플랫폼 동시 크롤
+
+        Args:
+            platforms: 플랫폼 목록
+            runners: 플랫폼 → 인자 없는 코루틴 팩토리 (CrawlerFactory 대신 실행)
+
+        Returns:
+            플랫폼 → PlatformCrawlResult (입력 순서 유지)
+        """
+        runners = runners or {}
+        start = time.perf_counter()
+
+        outcomes = await asyncio.gather(*(
+            self._run_platform(p, limit, category, region, runners.get(p))
+            for p in platforms
+        ))
+
+        logger.info(
+            f"Concurrent crawl finished in {int((time.perf_counter() - start) * 1000)}ms: "
+            + ", ".join(f"{o.platform}={o.status}({o.elapsed_ms}ms)" for o in outcomes)
+        )
+        return {o.platform: o for o in outcomes}
@@ -8,7 +8,6 @@ Collects platform updates from:
 - Instagram for Creators (scraping)
 - Social Media Today (RSS)
 """
-import os
 import logging
 import httpx
 import feedparser
@@ -218,9 +217,7 @@ class PlatformUpdatesCrawler:
             Updated PlatformUpdate with AI-generated summary
         """
         try:
-            from google import genai
-            
-            client = genai.Client(api_key=os.getenv('GOOGLE_API_KEY'))
+            from app.services.genai_gateway import get_genai_gateway
             
             prompt = f"""
             다음 소셜 미디어 플랫폼 업데이트 기사를 분석하세요.
@@ -238,9 +235,10 @@ class PlatformUpdatesCrawler:
             }}
             """
             
-            response = await client.aio.models.generate_content(
+            response = await get_genai_gateway().generate_or_raise(
+                prompt,
                 model="gemini-2.0-flash",
-                contents=prompt
+                site="platform_updates",
             )
             
             import json
@@ -25,6 +25,7 @@ from typing import List, Optional, Dict, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from app.crawlers.async_http import CrawlContext, arun_apify_actor
 from app.crawlers.base import BaseCrawler
 from app.schemas.evidence import OutlierCrawlItem
 from app.config import settings
@@ -88,29 +89,7 @@ class TikTokCrawler(BaseCrawler):
             else:
                 videos = self._crawl_trending(region, limit)
             
-            # Apply content filter (TV/연예인/편집영상 제외)
-            from app.crawlers.content_filter import filter_with_reason
-            filtered_videos = []
-            for video in videos:
-                title = video.get("desc") or video.get("text") or video.get("description", "")
-                author = video.get("author", {})
-                author_name = author.get("uniqueId") or author.get("nickname", "") if isinstance(author, dict) else str(author)
-                hashtag_list = video.get("hashtags", [])
-                
-                result = filter_with_reason(
-                    title=title,
-                    channel_name=author_name,
-                    hashtags=hashtag_list if isinstance(hashtag_list, list) else []
-                )
-                
-                if result.should_collect:
-                    filtered_videos.append(video)
-                else:
-                    logger.debug(f"Filtered out: {title[:50]}... ({result.reject_reason})")
-            
-            logger.info(f"Content filter: {len(videos)} → {len(filtered_videos)} videos")
-            
-            items = [self._normalize_to_outlier_item(v) for v in filtered_videos[:limit]]
+            items = self._filter_and_normalize(videos, limit)
             logger.info(f"TikTok crawl complete: {len(items)} items collected")
             return items
             
@@ -118,6 +97,62 @@ class TikTokCrawler(BaseCrawler):
             logger.error(f"TikTok crawl failed: {e}")
             raise
     
+    async def acrawl(
+        self,
+        limit: int = 50,
+        ctx: Optional[CrawlContext] = None,
+        region: str = "KR",
+        category: str = "trending",
+        hashtags: Optional[List[str]] = None,
+        **kwargs
+    ) -> List[OutlierCrawlItem]:
+        """Async version of crawl (Apify actor via shared AsyncClient)."""
+        ctx = ctx or CrawlContext(platform="tiktok")
+        logger.info(f"Starting async TikTok crawl: region={region}, category={category}, limit={limit}")
+        
+        if not self.api_token:
+            logger.warning("No API token - returning mock data")
+            return self._get_mock_data(limit)
+        
+        if category == "hashtag" and hashtags:
+            actor_id = self.ACTORS["hashtag"]
+            run_input = {"hashtags": hashtags, "maxItems": limit, "proxy": {"useApifyProxy": True}}
+        else:
+            actor_id = self.ACTORS["trending"]
+            run_input = {"country": region.lower(), "maxItems": limit, "proxy": {"useApifyProxy": True}}
+        
+        videos = await arun_apify_actor(
+            ctx, self.APIFY_BASE_URL, actor_id, self.api_token, run_input, limit
+        )
+        items = self._filter_and_normalize(videos, limit)
+        logger.info(f"Async TikTok crawl complete: {len(items)} items collected")
+        return items
+    
+    def _filter_and_normalize(self, videos: List[Dict[str, Any]], limit: int) -> List[OutlierCrawlItem]:
+        """Content filter (TV/연예인/편집영상 제외) + normalize."""
+        from app.crawlers.content_filter import content_filter
+        candidates = []
+        for video in videos:
+            title = video.get("desc") or video.get("text") or video.get("description", "")
+            author = video.get("author", {})
+            author_name = author.get("uniqueId") or author.get("nickname", "") if isinstance(author, dict) else str(author)
+            hashtag_list = video.get("hashtags", [])
+            candidates.append({
+                "title": title,
+                "channel_name": author_name,
+                "hashtags": hashtag_list if isinstance(hashtag_list, list) else [],
+            })
+
+        filtered_videos = []
+        for video, candidate, result in zip(videos, candidates, content_filter.filter_batch(candidates)):
+            if result.should_collect:
+                filtered_videos.append(video)
+            else:
+                logger.debug(f"Filtered out: {(candidate['title'] or '')[:50]}... ({result.reject_reason})")
+
+        logger.info(f"Content filter: {len(videos)} → {len(filtered_videos)} videos")
+        return [self._normalize_to_outlier_item(v) for v in filtered_videos[:limit]]
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
     def _crawl_trending(self, region: str, limit: int) -> List[Dict[str, Any]]:
         """Crawl trending videos using Apify actor."""
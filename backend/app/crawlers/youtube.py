@@ -7,15 +7,17 @@ Fetches trending YouTube Shorts and calculates outlier scores based on:
 """
 import os
 import re
+import asyncio
 import logging
 from datetime import timedelta
 from typing import List, Optional, Dict, Any
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from app.utils.time import utcnow
 
+from app.crawlers.async_http import CrawlContext
 from app.crawlers.base import BaseCrawler
 from app.schemas.evidence import OutlierCrawlItem
 from app.config import settings
@@ -138,32 +140,8 @@ class YouTubeCrawler(BaseCrawler):
             # Step 2: Get detailed stats for videos
             videos = self._get_video_details(video_ids)
             
-            # Step 3: Filter Shorts if requested
-            if shorts_only:
-                videos = [v for v in videos if self._is_shorts(v)]
-            
-            # Step 4: Apply content filter (TV/연예인/편집영상 제외)
-            from app.crawlers.content_filter import filter_with_reason
-            filtered_videos = []
-            for video in videos:
-                snippet = video.get("snippet", {})
-                title = snippet.get("title", "")
-                channel = snippet.get("channelTitle", "")
-                description = snippet.get("description", "")
-                
-                result = filter_with_reason(
-                    title=title,
-                    channel_name=channel,
-                    description=description
-                )
-                
-                if result.should_collect:
-                    filtered_videos.append(video)
-                else:
-                    logger.debug(f"Filtered out: {title[:50]}... ({result.reject_reason})")
-            
-            logger.info(f"Content filter: {len(videos)} → {len(filtered_videos)} videos")
-            videos = filtered_videos
+            # Step 3-4: Shorts + content filter
+            videos = self._filter_videos(videos, shorts_only)
             
             # Step 5: Calculate outlier scores and normalize
             items = []
@@ -196,6 +174,89 @@ class YouTubeCrawler(BaseCrawler):
             logger.error(f"YouTube crawl failed: {e}")
             raise
     
+    async def acrawl(
+        self,
+        limit: int = 50,
+        ctx: Optional[CrawlContext] = None,
+        region_code: str = "KR",
+        category: str = "entertainment",
+        shorts_only: bool = True,
+        **kwargs
+    ) -> List[OutlierCrawlItem]:
+        """
+        Async version of crawl.
+        
+        Channel baselines run concurrently (capped by ctx.semaphore); each
+        channel is looked up once per crawl. When QuotaManager refuses a
+        baseline search (100 units), that video scores with baseline 0.
+        """
+        ctx = ctx or CrawlContext(platform="youtube")
+        logger.info(f"Starting async YouTube crawl: region={region_code}, category={category}, limit={limit}")
+        
+        video_ids = await self._afetch_trending_videos(
+            ctx,
+            region_code=region_code,
+            category=category,
+            max_results=min(limit * 2, 50),
+        )
+        if not video_ids:
+            logger.warning("No trending videos found")
+            return []
+        
+        videos = await self._aget_video_details(ctx, video_ids)
+        videos = self._filter_videos(videos, shorts_only)[:limit]
+        
+        # Baselines only for videos with >= 100k views (quota), one lookup per channel
+        channel_tasks: Dict[str, asyncio.Task] = {}
+        for video in videos:
+            view_count = int(video.get("statistics", {}).get("viewCount", 0))
+            channel_id = video.get("snippet", {}).get("channelId")
+            if view_count >= 100000 and channel_id and channel_id not in channel_tasks:
+                channel_tasks[channel_id] = asyncio.ensure_future(
+                    self.aget_channel_baseline(ctx, channel_id)
+                )
+        if channel_tasks:
+            await asyncio.gather(*channel_tasks.values())
+        
+        items = []
+        for video in videos:
+            try:
+                view_count = int(video.get("statistics", {}).get("viewCount", 0))
+                channel_id = video.get("snippet", {}).get("channelId")
+                task = channel_tasks.get(channel_id) if view_count >= 100000 else None
+                baseline_views = task.result() if task else 0.0
+                items.append(self._normalize_to_outlier_item(video, category, baseline_views))
+            except Exception as e:
+                logger.warning(f"Failed to normalize video {video.get('id')}: {e}")
+        
+        logger.info(f"Async YouTube crawl complete: {len(items)} items, quota used: {self.quota_used}")
+        return items
+    
+    def _filter_videos(self, videos: List[Dict[str, Any]], shorts_only: bool) -> List[Dict[str, Any]]:
+        """Shorts filter + content filter (TV/연예인/편집영상 제외)."""
+        if shorts_only:
+            videos = [v for v in videos if self._is_shorts(v)]
+        
+        from app.crawlers.content_filter import content_filter
+        candidates = []
+        for video in videos:
+            snippet = video.get("snippet", {})
+            candidates.append({
+                "title": snippet.get("title", ""),
+                "channel_name": snippet.get("channelTitle", ""),
+                "description": snippet.get("description", ""),
+            })
+        
+        filtered_videos = []
+        for video, candidate, result in zip(videos, candidates, content_filter.filter_batch(candidates)):
+            if result.should_collect:
+                filtered_videos.append(video)
+            else:
+                logger.debug(f"Filtered out: {(candidate['title'] or '')[:50]}... ({result.reject_reason})")
+        
+        logger.info(f"Content filter: {len(videos)} → {len(filtered_videos)} videos")
+        return filtered_videos
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     def _fetch_trending_videos(
         self, 
@@ -250,6 +311,64 @@ class YouTubeCrawler(BaseCrawler):
         
         return all_videos
     
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=1, max=10),
+        retry=retry_if_exception_type(httpx.HTTPError),
+    )
+    async def _afetch_trending_videos(
+        self,
+        ctx: CrawlContext,
+        region_code: str,
+        category: str,
+        max_results: int = 50
+    ) -> List[str]:
+        """Async version of _fetch_trending_videos."""
+        category_id = self.CATEGORY_MAP.get(category.lower(), "24")
+        
+        response = await ctx.request(
+            "GET",
+            f"{self.BASE_URL}/videos",
+            cost=1,
+            params={
+                "part": "id",
+                "chart": "mostPopular",
+                "regionCode": region_code,
+                "videoCategoryId": category_id,
+                "maxResults": max_results,
+                "key": self.api_key,
+            }
+        )
+        self.quota_used += 1
+        
+        data = response.json()
+        return [item["id"] for item in data.get("items", [])]
+    
+    async def _aget_video_details(self, ctx: CrawlContext, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """Async version of _get_video_details (50-ID batches fetched concurrently)."""
+        batches = [video_ids[i:i+50] for i in range(0, len(video_ids), 50)]
+        results = await asyncio.gather(*(self._aget_video_batch(ctx, b) for b in batches))
+        return [video for batch in results for video in batch]
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=1, max=10),
+        retry=retry_if_exception_type(httpx.HTTPError),
+    )
+    async def _aget_video_batch(self, ctx: CrawlContext, batch: List[str]) -> List[Dict[str, Any]]:
+        response = await ctx.request(
+            "GET",
+            f"{self.BASE_URL}/videos",
+            cost=len(batch),
+            params={
+                "part": "snippet,statistics,contentDetails",
+                "id": ",".join(batch),
+                "key": self.api_key,
+            }
+        )
+        self.quota_used += len(batch)
+        return response.json().get("items", [])
+    
     def _is_shorts(self, video: Dict[str, Any]) -> bool:
         """Check if video is a YouTube Short (< 60s or has #shorts)."""
         # Check duration
@@ -400,6 +519,38 @@ class YouTubeCrawler(BaseCrawler):
             logger.warning(f"Failed to get baseline for channel {channel_id}: {e}")
             return 0.0
     
+    async def aget_channel_baseline(self, ctx: CrawlContext, channel_id: str) -> float:
+        """Async version of get_channel_baseline (0.0 on failure or quota refusal)."""
+        try:
+            response = await ctx.request(
+                "GET",
+                f"{self.BASE_URL}/search",
+                cost=100,
+                params={
+                    "part": "id",
+                    "channelId": channel_id,
+                    "type": "video",
+                    "order": "date",
+                    "maxResults": 20,
+                    "key": self.api_key,
+                }
+            )
+            self.quota_used += 100
+            
+            video_ids = [item["id"]["videoId"] for item in response.json().get("items", [])]
+            if not video_ids:
+                return 0.0
+            
+            videos = await self._aget_video_details(ctx, video_ids)
+            views = [int(v["statistics"].get("viewCount", 0)) for v in videos]
+            if not views:
+                return 0.0
+            return sum(views) / len(views)
+            
+        except Exception as e:
+            logger.warning(f"Failed to get baseline for channel {channel_id}: {e}")
+            return 0.0
+    
     def search_shorts_by_keyword(
         self,
         keyword: str,
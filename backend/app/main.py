@@ -2,6 +2,7 @@
 Komission FACTORY v5.2 Backend
 Main FastAPI Application
 """
+import asyncio
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,6 +17,7 @@ from app.routers import api_router
 from app.routers.pipelines import router as pipeline_router
 from app.services.cache import cache
 from app.services.graph_db import graph_db
+from app.services.vdg_vector_index import vdg_vector_index
 
 # Initialize Sentry (only if DSN is configured)
 if settings.SENTRY_DSN:
@@ -47,6 +49,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Redis connection failed: {e}")
 
+    # Coaching session registry (Redis 연결 확인, 실패 시 로컬)
+    from app.services.session_registry import close_session_registry, init_session_registry
+    registry = await init_session_registry()
+    print(f"✅ Coaching session registry: {registry.backend}")
+
     # Connect Neo4j Graph
     try:
         await graph_db.connect()
@@ -54,6 +61,26 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Neo4j connection failed: {e}")
 
+    # Bind GenAI gateway to this loop (VDG pipeline threads delegate LLM calls here)
+    from app.services.genai_gateway import get_genai_gateway
+    get_genai_gateway().bind_loop()
+
+    # Load VDG vector index (parent-candidate ANN) and catch up from DB
+    try:
+        await vdg_vector_index.startup()
+        print(f"✅ VDG vector index ready ({len(vdg_vector_index)} vectors)")
+    except Exception as e:
+        print(f"⚠️ VDG vector index load failed: {e}")
+
+    # Dev only: consume the analysis queue inside the API process
+    # (production runs scripts/run_analysis_worker.py as separate processes)
+    analysis_worker = analysis_worker_task = None
+    if settings.ANALYSIS_WORKER_INPROCESS:
+        from app.services.analysis_queue import build_analysis_worker
+        analysis_worker = build_analysis_worker()
+        analysis_worker_task = asyncio.create_task(analysis_worker.run())
+        print(f"⚠️ In-process analysis worker started ({analysis_worker.worker_id})")
+
     # Initialize MCP lifespan (for StreamableHTTPSessionManager)
     from app.mcp.http_server import app as mcp_app
     async with mcp_app.lifespan(mcp_app):
@@ -62,8 +89,16 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("👋 Shutting down...")
+    if analysis_worker is not None:
+        analysis_worker.stop()
+        analysis_worker_task.cancel()  # unfinished jobs are reclaimed after their lease expires
     await cache.disconnect()
+    await close_session_registry()
     await graph_db.close()
+    try:
+        await vdg_vector_index.shutdown()
+    except Exception as e:
+        print(f"⚠️ VDG vector index save failed: {e}")
 
 
 app = FastAPI(
@@ -3,11 +3,13 @@ MCP Tools - 패턴 검색 도구
 """
 from typing import Union
 
-from sqlalchemy import select, or_, func
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.database import AsyncSessionLocal
 from app.models import OutlierItem
+from app.services.feed_ranking import feed_filters, feed_order_by
+from app.services.search_index import PostgresSearchIndex
 from app.mcp.server import mcp, get_logger
 from app.mcp.utils.validators import safe_format_number
 from app.mcp.schemas.patterns import PatternResult, SearchFilters, SearchResponse
@@ -33,7 +35,7 @@ async def search_patterns(
     Returns a list of matching patterns with scores.
     
     Args:
-        query: Search keyword (matches title, cluster_name)
+        query: Search keyword (title, hashtags, kick mechanisms, hook patterns, top comments)
         category: Filter by category (beauty, meme, food, etc.)
         platform: Filter by platform (tiktok, youtube, instagram)
         min_tier: Minimum tier to include (S, A, B, C)
@@ -61,40 +63,18 @@ async def search_patterns(
     
     try:
         async with AsyncSessionLocal() as db:
-            # Build query
-            stmt = select(OutlierItem).where(
-                OutlierItem.analysis_status == "completed",
-                OutlierItem.outlier_tier.isnot(None),
-            )
+            # 분석 완료 + Tier 범위
+            feed = feed_filters(category=category, platform=platform, min_tier=min_tier)
             
-            # Apply text search
             if query:
-                stmt = stmt.where(
-                    or_(
-                        OutlierItem.title.ilike(f"%{query}%"),
-                        OutlierItem.category.ilike(f"%{query}%"),
-                    )
-                )
-            
-            # Apply filters
-            if category:
-                stmt = stmt.where(OutlierItem.category == category)
-            if platform:
-                stmt = stmt.where(OutlierItem.platform == platform)
-            
-            # Tier filter
-            min_priority = TIER_PRIORITY.get(min_tier, 4)
-            allowed_tiers = [t for t, p in TIER_PRIORITY.items() if p <= min_priority]
-            stmt = stmt.where(OutlierItem.outlier_tier.in_(allowed_tiers))
-            
-            # Order by tier and score
-            stmt = stmt.order_by(
-                func.array_position(['S', 'A', 'B', 'C'], OutlierItem.outlier_tier),
-                OutlierItem.outlier_score.desc(),
-            ).limit(limit)
-            
-            result = await db.execute(stmt)
-            patterns = result.scalars().all()
+                # Apply text search (검색 문서: 제목/해시태그/킥/훅/댓글, 관련도 × outlier_score 순)
+                hits = await PostgresSearchIndex().search(db, query, filters=feed, limit=limit)
+                patterns = [item for item, _ in hits]
+            else:
+                # Order by tier and score
+                stmt = select(OutlierItem).where(*feed).order_by(*feed_order_by()).limit(limit)
+                result = await db.execute(stmt)
+                patterns = result.scalars().all()
             
             # Build Pydantic models
             filters = SearchFilters(
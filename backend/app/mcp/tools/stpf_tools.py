@@ -292,7 +292,7 @@ async def stpf_monte_carlo(
     랜덤 시뮬레이션으로 확률 분포 추정.
     
     Args:
-        n_simulations: 시뮬레이션 횟수 (100-5000)
+        n_simulations: 시뮬레이션 횟수 (100-100000)
         noise_std: 노이즈 표준편차 (0.5-2.0)
     
     Returns:
@@ -325,7 +325,7 @@ async def stpf_monte_carlo(
         
         result = stpf_simulator.run_monte_carlo(
             variables,
-            n_simulations=max(100, min(5000, n_simulations)),
+            n_simulations=max(100, min(100000, n_simulations)),
             noise_std=max(0.5, min(2.0, noise_std)),
         )
         
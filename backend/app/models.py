@@ -3,9 +3,9 @@ SQLAlchemy Models for Komission FACTORY v5.2
 """
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Integer, Text, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum, Float
+from sqlalchemy import String, Integer, Text, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum, Float, Index, SmallInteger, Computed, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 import uuid
 import enum
 
@@ -591,6 +591,11 @@ class OutlierItem(Base):
     # Extended Metrics (for Outlier Detection)
     outlier_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     outlier_tier: Mapped[Optional[str]] = mapped_column(String(1), nullable=True)  # S/A/B/C
+    tier_rank: Mapped[Optional[int]] = mapped_column(  # S=1 … C=4 (For-You 정렬, app/services/feed_ranking.py)
+        SmallInteger,
+        Computed("CASE outlier_tier WHEN 'S' THEN 1 WHEN 'A' THEN 2 WHEN 'B' THEN 3 WHEN 'C' THEN 4 END", persisted=True),
+        nullable=True,
+    )
     creator_avg_views: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     engagement_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     creator_username: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Creator handle/username
@@ -642,6 +647,49 @@ class OutlierItem(Base):
     approver: Mapped[Optional["User"]] = relationship("User", foreign_keys=[approved_by])
 
 
+# GET /outliers keyset 페이지네이션 (app/services/outlier_listing.py): (정렬 키 DESC NULLS LAST, id DESC)
+Index("ix_outlier_items_listing_score", OutlierItem.outlier_score.desc().nullslast(), OutlierItem.id.desc())
+Index("ix_outlier_items_listing_views", OutlierItem.view_count.desc().nullslast(), OutlierItem.id.desc())
+Index("ix_outlier_items_listing_crawled", OutlierItem.crawled_at.desc().nullslast(), OutlierItem.id.desc())
+
+# For-You / MCP search_patterns 랭킹 (app/services/feed_ranking.py): 분석 완료 항목만, 정렬 = 인덱스 순서
+Index(
+    "ix_outlier_items_feed_rank",
+    OutlierItem.tier_rank,
+    OutlierItem.outlier_score.desc(),
+    OutlierItem.view_count.desc(),
+    OutlierItem.id.desc(),
+    postgresql_include=["category", "platform"],
+    postgresql_where=text("analysis_status = 'completed' AND tier_rank IS NOT NULL"),
+)
+
+
+class OutlierSearchDocument(Base):
+    """
+    아웃라이어 검색 문서 (app/services/search_index.py)
+
+    제목 / 해시태그 / 킥 mechanism / 훅 패턴 / 베스트 댓글을 토큰화해 저장
+    - search_vector: 필드 가중치 (A 제목, B 태그·훅·킥, C 댓글) tsvector → GIN
+    - search_text: 원문 연결 → pg_trgm GIN (부분 일치 / 오타)
+    """
+    __tablename__ = "outlier_search_documents"
+
+    outlier_item_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("outlier_items.id", ondelete="CASCADE"), primary_key=True
+    )
+    search_text: Mapped[str] = mapped_column(Text, default="")
+    search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
+
+    __table_args__ = (
+        Index("ix_outlier_search_documents_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_outlier_search_documents_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
+
+
 # =====================================
 # Curation Learning System
 # =====================================
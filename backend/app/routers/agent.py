@@ -25,7 +25,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, HTTPException, Depends
-from app.services.genai_client import get_genai_client, DEFAULT_MODEL_FLASH
+from app.services.genai_client import DEFAULT_MODEL_FLASH
+from app.services.genai_gateway import get_genai_gateway
 
 from app.routers.auth import get_current_user
 from app.services.proof_patterns import (
@@ -420,15 +421,15 @@ async def chat(
         history_contents.append({"role": "user", "parts": [{"text": request.message}]})
         
         # 6. Gemini 생성 (새 SDK)
-        client = get_genai_client()
-        response = client.models.generate_content(
+        response = await get_genai_gateway().generate_or_raise(
+            history_contents,
             model=DEFAULT_MODEL_FLASH,
-            contents=history_contents,
             config={
                 "system_instruction": system_prompt,
                 "temperature": 0.7,
                 "max_output_tokens": 4096,
-            }
+            },
+            site="agent_chat",
         )
         
         # 7. 인텐트 기반 추천 + 액션 생성
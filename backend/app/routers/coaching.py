@@ -27,6 +27,7 @@ from app.utils.time import utcnow, iso_now_z, generate_session_id
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel, Field
 
+from app.config import settings
 from app.schemas.director_pack import DirectorPack
 from app.schemas.session_events import (
     RuleEvaluatedEvent,
@@ -38,6 +39,11 @@ from app.schemas.vdg_v4 import CoachingIntervention, CoachingOutcome
 from app.services.audio_coach import AudioCoach
 from app.services.coaching_router import get_coaching_router
 from app.services.session_logger import get_session_logger
+from app.services.session_registry import (
+    NS_COACHING_SESSIONS,
+    NS_SESSION_FEEDBACK,
+    get_session_registry,
+)
 from app.services.credit_service import (
     get_user_credits, check_sufficient_credits, 
     CoachingCreditManager, COACHING_COSTS
@@ -116,18 +122,15 @@ class EndSessionRequest(BaseModel):
 
 
 # ====================
-# IN-MEMORY SESSION STORE (MVP)
+# SESSION STORE (SessionRegistry - 워커 간 공유)
 # ====================
 
-# Production에서는 Redis 사용 권장
-_sessions: Dict[str, Dict[str, Any]] = {}
-
-
-def get_session(session_id: str) -> Dict[str, Any]:
+async def get_session(session_id: str) -> Dict[str, Any]:
     """세션 조회"""
-    if session_id not in _sessions:
+    session = await get_session_registry().get(NS_COACHING_SESSIONS, session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    return _sessions[session_id]
+    return session
 
 
 # ====================
@@ -203,25 +206,24 @@ async def create_session(
     
     # P1: SessionLogger에 세션 등록
     session_logger = get_session_logger()
-    session_logger.start_session(
+    await session_logger.start_session(
         session_id=session_id,
         pack_id=pack.pack_meta.pack_id if pack.pack_meta else "unknown",
         assignment=assignment_result.assignment,
         holdout_group=assignment_result.holdout_group,
     )
     
-    # 세션 저장
-    _sessions[session_id] = {
+    # 세션 저장 (WS 연결은 다른 워커가 받을 수 있음)
+    await get_session_registry().put(NS_COACHING_SESSIONS, session_id, {
         "session_id": session_id,
         "status": "created",
-        "director_pack": pack.model_dump(),
+        "director_pack": pack.model_dump(mode="json"),
         "language": request.language,
         "voice_style": request.voice_style,
         "created_at": now.isoformat() + "Z",
         "expires_at": expires_at.isoformat() + "Z",
         "pattern_id": pack.pattern_id,
         "goal": pack.goal,
-        "feedbacks": [],
         # P0: video_id for WebSocket DirectorPack reload
         "video_id": request.video_id,
         # P1: Control group fields
@@ -230,7 +232,7 @@ async def create_session(
         # Credits
         "user_id": user_id,
         "coaching_tier": coaching_tier,
-    }
+    }, ttl_sec=settings.COACHING_SESSION_TTL_SEC)
     
     logger.info(
         f"Created coaching session: {session_id} for pattern: {pack.pattern_id} "
@@ -259,7 +261,7 @@ async def create_session(
 @router.get("/sessions/{session_id}", response_model=SessionResponse)
 async def get_session_status(session_id: str):
     """세션 상태 조회"""
-    session = get_session(session_id)
+    session = await get_session(session_id)
     
     return SessionResponse(
         session_id=session["session_id"],
@@ -280,11 +282,15 @@ async def end_session(
     """세션 종료 및 크레딧 차감"""
     from app.services.credit_service import deduct_coaching_credits
     
-    session = get_session(session_id)
+    session = await get_session(session_id)
     session["status"] = "ended"
     session["duration_sec"] = duration_sec
+    await get_session_registry().update(NS_COACHING_SESSIONS, session_id, {
+        "status": "ended",
+        "duration_sec": duration_sec,
+    })
     
-    # H9: effective_tier로 비용 계산 (Gemini 실패 시 basic 비용)
+    # H9: effective_tier로 비용 계산 (WS 워커가 연결 종료 시 레지스트리에 기록) (Gemini 실패 시 basic 비용)
     credits_deducted = 0
     user_id = session.get("user_id", "anonymous")
     coaching_tier = session.get("coaching_tier", "pro")
@@ -329,7 +335,7 @@ async def submit_feedback(session_id: str, request: FeedbackRequest):
     
     코칭 품질 개선을 위한 피드백 수집
     """
-    session = get_session(session_id)
+    await get_session(session_id)  # 404 if unknown
     
     feedback = {
         "rule_id": request.rule_id,
@@ -338,7 +344,9 @@ async def submit_feedback(session_id: str, request: FeedbackRequest):
         "timestamp": iso_now_z(),
     }
     
-    session["feedbacks"].append(feedback)
+    await get_session_registry().append(
+        NS_SESSION_FEEDBACK, session_id, feedback, ttl_sec=settings.COACHING_SESSION_TTL_SEC
+    )
     
     logger.info(f"Feedback recorded for session {session_id}: {request.feedback_type}")
     
@@ -355,7 +363,8 @@ async def list_sessions(
     current_user: User = Depends(require_admin),
 ):
     """활성 세션 목록 조회 (관리용)"""
-    sessions = list(_sessions.values())
+    sessions = await get_session_registry().values(NS_COACHING_SESSIONS)
+    total = len(sessions)
     
     if status:
         sessions = [s for s in sessions if s["status"] == status]
@@ -377,7 +386,7 @@ async def list_sessions(
             )
             for s in sessions
         ],
-        total=len(_sessions),
+        total=total,
     )
 
 
@@ -433,10 +442,10 @@ async def log_rule_evaluated(session_id: str, request: LogRuleEvaluatedRequest):
     
     CRITICAL: 개입 없는 구간도 로깅해야 반사실 학습 가능
     """
-    get_session(session_id)  # Verify session exists
+    await get_session(session_id)  # Verify session exists
     session_logger = get_session_logger()
     
-    event = session_logger.log_rule_evaluated(
+    event = await session_logger.log_rule_evaluated(
         session_id=session_id,
         rule_id=request.rule_id,
         ap_id=request.ap_id,
@@ -456,7 +465,7 @@ async def log_rule_evaluated(session_id: str, request: LogRuleEvaluatedRequest):
 @router.post("/sessions/{session_id}/events/intervention")
 async def log_intervention(session_id: str, request: LogInterventionRequest):
     """P1: 코칭 개입 이벤트 로깅"""
-    session = get_session(session_id)
+    session = await get_session(session_id)
     session_logger = get_session_logger()
     
     # Build CoachingIntervention
@@ -475,7 +484,7 @@ async def log_intervention(session_id: str, request: LogInterventionRequest):
         holdout_group=session.get("holdout_group", False),
     )
     
-    event = session_logger.log_intervention(intervention)
+    event = await session_logger.log_intervention(intervention)
     
     return {"logged": True, "event_id": event.event_id}
 
@@ -483,7 +492,7 @@ async def log_intervention(session_id: str, request: LogInterventionRequest):
 @router.post("/sessions/{session_id}/events/outcome")
 async def log_outcome(session_id: str, request: LogOutcomeRequest):
     """P1: 결과 관측 이벤트 로깅 (자동 Negative Evidence 판단)"""
-    get_session(session_id)  # Verify session exists
+    await get_session(session_id)  # Verify session exists
     session_logger = get_session_logger()
     
     # Build CoachingOutcome
@@ -507,7 +516,7 @@ async def log_outcome(session_id: str, request: LogOutcomeRequest):
         outcome_unknown_reason=request.outcome_unknown_reason,
     )
     
-    event = session_logger.log_outcome(outcome)
+    event = await session_logger.log_outcome(outcome)
     
     return {
         "logged": True,
@@ -520,10 +529,10 @@ async def log_outcome(session_id: str, request: LogOutcomeRequest):
 @router.get("/sessions/{session_id}/events")
 async def get_session_events(session_id: str):
     """P1: 세션의 모든 이벤트 조회"""
-    get_session(session_id)  # Verify session exists
+    await get_session(session_id)  # Verify session exists
     session_logger = get_session_logger()
     
-    events = session_logger.get_session_events(session_id)
+    events = await session_logger.get_session_events(session_id)
     
     return {
         "session_id": session_id,
@@ -535,10 +544,10 @@ async def get_session_events(session_id: str):
 @router.get("/sessions/{session_id}/summary", response_model=SessionEventSummary)
 async def get_session_summary(session_id: str):
     """P1: 세션 요약 통계 조회"""
-    get_session(session_id)  # Verify session exists
+    await get_session(session_id)  # Verify session exists
     session_logger = get_session_logger()
     
-    summary = session_logger.get_session_summary(session_id)
+    summary = await session_logger.get_session_summary(session_id)
     if not summary:
         raise HTTPException(status_code=404, detail="Session summary not found")
     
@@ -549,7 +558,7 @@ async def get_session_summary(session_id: str):
 async def get_all_sessions_stats(current_user: User = Depends(require_admin)):
     """P1: 전체 세션 통계 (Control Group 비율 검증용)"""
     session_logger = get_session_logger()
-    return session_logger.get_all_sessions_summary()
+    return await session_logger.get_all_sessions_summary()
 
 
 @router.get("/quality/report")
@@ -569,7 +578,7 @@ async def get_log_quality_report(current_user: User = Depends(require_admin)):
     from app.services.log_quality_validator import get_log_quality_validator
     
     validator = get_log_quality_validator()
-    report = validator.validate_all_sessions()
+    report = await validator.validate_all_sessions()
     
     return {
         "total_sessions": report.total_sessions,
@@ -593,12 +602,12 @@ async def get_log_quality_report(current_user: User = Depends(require_admin)):
 @router.get("/quality/session/{session_id}")
 async def get_session_quality(session_id: str, current_user: User = Depends(require_admin)):
     """P1: 개별 세션 로그 품질 검증"""
-    get_session(session_id)  # Verify session exists
+    await get_session(session_id)  # Verify session exists
     
     from app.services.log_quality_validator import get_log_quality_validator
     
     validator = get_log_quality_validator()
-    checks = validator.validate_session(session_id)
+    checks = await validator.validate_session(session_id)
     
     overall_pass = all(c.status.value == "pass" for c in checks)
     
@@ -7,18 +7,22 @@ Messages IN (Client → Server):
 - {"type": "audio", "data": "<base64 PCM>"}
 - {"type": "control", "action": "start"|"pause"|"stop"}
 - {"type": "metric", "rule_id": "...", "value": 0.5, "t_sec": 1.5}
+- binary (Sec-WebSocket-Protocol: coaching.binary.v1 또는 ?wire=binary 로 협상 시):
+  20-byte 헤더 + raw PCM / JPEG / H.264 payload (app/services/coaching_wire.py)
 
 Messages OUT (Server → Client):
 - {"type": "feedback", "message": "...", "audio_b64": "...", "rule_id": "..."}
 - {"type": "audio_response", "audio_b64": "...", "format": "pcm_24khz"}
 - {"type": "rule_update", "rule_id": "...", "status": "passed"|"failed"}
 - {"type": "session_status", "status": "active"|"ended", "stats": {...}}
+- {"type": "frame_backpressure", "dropped": n, "suggested_fps": 0.5, ...}
 - {"type": "error", "message": "..."}
 
 Hardening:
 - H1: Gemini audio response loop (background task)
 - H2: TTS fallback (Web Speech / Google Cloud)
 - H3: DirectorPack loading at session start
+- Session snapshots + routing metadata shared via SessionRegistry (multi-worker)
 
 Env:
 - SKIP_GEMINI_LIVE=1 to skip Gemini Live connection (smoke/CI)
@@ -28,16 +32,32 @@ import base64
 import json
 import logging
 import os
+import time
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any, Set, Union
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Depends
 from pydantic import BaseModel
 
+from app.config import settings
 from app.services.audio_coach import AudioCoach
 from app.services.coaching_session import get_coaching_service
+from app.services.coaching_wire import (
+    WIRE_BINARY,
+    WireProtocolError,
+    negotiate_wire,
+    parse_binary_message,
+)
 from app.services.proof_patterns import create_proof_pack  # H3: DirectorPack fallback
+from app.services.session_registry import (
+    NODE_ID,
+    NS_COACHING_SESSIONS,
+    NS_LIVE_SESSIONS,
+    WORKER_ID,
+    SessionRegistry,
+    get_session_registry,
+)
 from app.utils.time import utcnow
 from app.routers.auth import require_admin, User
 
@@ -71,22 +91,95 @@ AUDIO_SEND_RETRY_DELAY_SEC = 0.5
 # ACTIVE SESSIONS MANAGER
 # ==================
 
+# 레지스트리 스냅샷에 올리는 세션 필드 (직렬화 가능한 값만)
+LIVE_SNAPSHOT_FIELDS = (
+    "status", "recording_time", "voice_style", "output_mode", "persona", "wire",
+    "video_id", "outlier_id", "coaching_tier", "effective_tier", "tier_downgraded",
+    "rules_evaluated", "interventions_sent", "frames_received", "gemini_connected",
+)
+
+# POST 세션 레코드에 되돌려 쓰는 정산 필드 (DELETE /coaching/sessions 가 어느 워커에서든 사용)
+BOOKKEEPING_FIELDS = ("effective_tier", "tier_downgraded", "recording_time", "interventions_sent")
+
+
 class CoachingSessionManager:
-    """실시간 코칭 세션 관리자"""
+    """
+    실시간 코칭 세션 관리자
     
-    def __init__(self):
+    - active_sessions / websockets: 이 워커가 연결을 가진 세션의 라이브 객체 (AudioCoach, Task 등)
+    - SessionRegistry (NS_LIVE_SESSIONS): 세션 스냅샷 + 라우팅 메타 (worker_id, node)
+      → 어느 워커에서든 세션 목록 조회 / 정산 가능
+    """
+    
+    def __init__(self, registry: Optional[SessionRegistry] = None):
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.websockets: Dict[str, WebSocket] = {}
-    
-    async def connect(self, websocket: WebSocket, session_id: str) -> bool:
-        """WebSocket 연결"""
-        await websocket.accept()
+        self._registry = registry
+        self._published_at: Dict[str, float] = {}
+    
+    @property
+    def registry(self) -> SessionRegistry:
+        if self._registry is None:
+            self._registry = get_session_registry()
+        return self._registry
+    
+    async def connect(self, websocket: WebSocket, session_id: str, subprotocol: Optional[str] = None) -> bool:
+        """WebSocket 연결 (subprotocol: binary 모드 협상 시 응답할 Sec-WebSocket-Protocol)"""
+        await websocket.accept(subprotocol=subprotocol)
         self.websockets[session_id] = websocket
-        logger.info(f"✅ Coaching WS connected: {session_id}")
+        try:
+            await self.registry.put(NS_LIVE_SESSIONS, session_id, {
+                "session_id": session_id,
+                "status": "connected",
+                "worker_id": WORKER_ID,
+                "node": NODE_ID,
+                "connected_at": utcnow().isoformat(),
+            }, ttl_sec=settings.COACHING_LIVE_SESSION_TTL_SEC)
+        except Exception as e:
+            logger.warning(f"Session registry unavailable, {session_id} not shared: {e}")
+        logger.info(f"✅ Coaching WS connected: {session_id} (worker={WORKER_ID})")
         return True
     
-    def disconnect(self, session_id: str):
-        """연결 해제"""
+    async def publish(self, session_id: str):
+        """
+        세션 스냅샷을 레지스트리에 반영 (TTL 갱신 포함)
+        
+        정산 필드는 POST 세션 레코드에도 기록 → 세션 종료 요청이 다른 워커로 가도 같은 값 사용.
+        """
+        session = self.active_sessions.get(session_id)
+        if session is None:
+            return
+        snapshot = {field: session.get(field) for field in LIVE_SNAPSHOT_FIELDS if field in session}
+        started_at = session.get("started_at")
+        snapshot["started_at"] = started_at.isoformat() if started_at else None
+        snapshot["last_seen"] = utcnow().isoformat()
+        try:
+            await self.registry.update(
+                NS_LIVE_SESSIONS, session_id, snapshot, ttl_sec=settings.COACHING_LIVE_SESSION_TTL_SEC
+            )
+            await self.registry.update(
+                NS_COACHING_SESSIONS,
+                session_id,
+                {field: session[field] for field in BOOKKEEPING_FIELDS if field in session},
+            )
+            self._published_at[session_id] = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Session registry publish failed ({session_id}): {e}")
+    
+    async def heartbeat(self, session_id: str):
+        """수신 루프에서 호출 - TTL 의 1/4 주기로만 publish (메시지마다 레지스트리 호출 방지)"""
+        interval = settings.COACHING_LIVE_SESSION_TTL_SEC / 4
+        if time.monotonic() - self._published_at.get(session_id, 0.0) >= interval:
+            await self.publish(session_id)
+    
+    async def disconnect(self, session_id: str):
+        """연결 해제 (마지막 스냅샷을 POST 세션 레코드에 남기고 라이브 레코드 제거)"""
+        await self.publish(session_id)
+        self._published_at.pop(session_id, None)
+        try:
+            await self.registry.delete(NS_LIVE_SESSIONS, session_id)
+        except Exception as e:
+            logger.warning(f"Session registry delete failed ({session_id}): {e}")
         if session_id in self.websockets:
             del self.websockets[session_id]
         if session_id in self.active_sessions:
@@ -131,6 +224,24 @@ class CoachingSessionManager:
         }
         self.active_sessions[session_id] = session
         return session
+    
+    async def list_sessions(self) -> list:
+        """전 워커의 라이브 세션 스냅샷 (레지스트리 실패 시 이 워커 세션만)"""
+        try:
+            return await self.registry.values(NS_LIVE_SESSIONS)
+        except Exception as e:
+            logger.warning(f"Session registry list failed, local sessions only: {e}")
+            return [
+                {
+                    "session_id": sid,
+                    "status": session.get("status"),
+                    "recording_time": session.get("recording_time", 0),
+                    "started_at": session.get("started_at").isoformat() if session.get("started_at") else None,
+                    "worker_id": WORKER_ID,
+                    "node": NODE_ID,
+                }
+                for sid, session in self.active_sessions.items()
+            ]
 
 
 manager = CoachingSessionManager()
@@ -151,6 +262,7 @@ async def coaching_websocket(
     # Phase 1: 출력 모드 + 페르소나
     output_mode: str = Query(default="graphic"),  # graphic | text | audio | graphic_audio
     persona: str = Query(default="calm_mentor"),  # drill_sergeant/bestie/chill_guide/hype_coach (aliases: strict_pd/close_friend/calm_mentor/energetic)
+    wire: str = Query(default="json"),  # json | binary (subprotocol 미지원 클라이언트용)
 ):
     """
     실시간 오디오 코칭 WebSocket
@@ -164,6 +276,7 @@ async def coaching_websocket(
         - output_mode: graphic(디폴트) | text | audio | graphic_audio
         - persona: drill_sergeant | bestie | chill_guide(디폴트, alias calm_mentor) | hype_coach
                    (aliases: strict_pd | close_friend | calm_mentor | energetic)
+        - wire: json(디폴트) | binary — Sec-WebSocket-Protocol: coaching.binary.v1 제안 시에도 binary
     
     Flow:
         1. Connect → server sends session_status
@@ -172,8 +285,9 @@ async def coaching_websocket(
         4. Server sends feedback → graphic/text/audio based on output_mode
         5. Client sends control.stop → session ends
     """
-    # 1. Accept connection
-    if not await manager.connect(websocket, session_id):
+    # 1. Accept connection (wire 모드 협상)
+    wire_mode, subprotocol = negotiate_wire(websocket.scope.get("subprotocols", []), wire)
+    if not await manager.connect(websocket, session_id, subprotocol=subprotocol):
         return
     
     try:
@@ -181,11 +295,10 @@ async def coaching_websocket(
         coach = AudioCoach()
         session = manager.create_session(session_id, coach, voice_style)
         
-        # Merge data from POST session (coaching.py._sessions) if exists
+        # Merge data from POST session (SessionRegistry - POST 를 받은 워커가 달라도 조회됨)
         # This ensures video_id, director_pack, etc. from POST are available
         try:
-            from app.routers.coaching import _sessions as post_sessions
-            post_session_data = post_sessions.get(session_id, {})
+            post_session_data = await manager.registry.get(NS_COACHING_SESSIONS, session_id) or {}
             if post_session_data:
                 # Merge important fields from POST session
                 session["video_id"] = post_session_data.get("video_id") or video_id
@@ -208,13 +321,16 @@ async def coaching_websocket(
                 session["effective_tier"] = "pro"
                 session["tier_downgraded"] = False
                 logger.info(f"No POST session found, using query params: video_id={video_id}")
-        except ImportError:
+        except Exception as e:
+            logger.warning(f"POST session lookup failed, using query params: {e}")
             session["video_id"] = video_id
             session["outlier_id"] = outlier_id
         
         # Phase 1: 출력 모드 + 페르소나 저장
         session["output_mode"] = output_mode  # graphic | text | audio | graphic_audio
         session["persona"] = persona  # drill_sergeant/bestie/chill_guide/hype_coach (+ aliases)
+        session["wire"] = wire_mode  # json | binary
+        await manager.publish(session_id)
         
         # 3. Send initial status
         await manager.send_message(session_id, {
@@ -228,19 +344,29 @@ async def coaching_websocket(
             # Phase 1: 출력 모드 + 페르소나
             "output_mode": output_mode,
             "persona": persona,
+            "wire": wire_mode,
             "timestamp": utcnow().isoformat(),
         })
         
-        # 4. Message handling loop
+        # 4. Message handling loop (text = JSON, bytes = binary 오디오/영상)
         while True:
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                raw = await websocket.receive()
+                if raw["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(raw.get("code", 1000))
+                await manager.heartbeat(session_id)
+                
+                if raw.get("bytes") is not None:
+                    await handle_binary_message(session_id, session, raw["bytes"], voice_style)
+                    continue
+                
+                message = json.loads(raw.get("text") or "")
                 
                 msg_type = message.get("type")
                 
                 if msg_type == "control":
                     await handle_control(session_id, session, message)
+                    await manager.publish(session_id)  # 상태 / tier 변경 공유
                 
                 elif msg_type == "audio":
                     await handle_audio(session_id, session, message)
@@ -301,7 +427,9 @@ async def coaching_websocket(
                 await session["coach"].disconnect()
             except:
                 pass
-        manager.disconnect(session_id)
+        from app.services.frame_scheduler import get_frame_scheduler
+        get_frame_scheduler().remove_session(session_id)
+        await manager.disconnect(session_id)
 
 
 # ==================
@@ -420,6 +548,7 @@ async def load_director_pack_from_video(
                     
                     pack = compile_director_pack(vdg_v4)
                     logger.info(f"DirectorPack loaded from VDG: {node.node_id}, {len(pack.dna_invariants)} rules")
+                    schedule_tts_warmup(pack)  # 코칭 대사 TTS 미리 렌더
                     return pack
                 except Exception as compile_err:
                     logger.warning(f"DirectorPack compile failed: {compile_err}")
@@ -619,7 +748,7 @@ async def run_checkpoint_evaluation_loop(session_id: str, session: dict):
 # H8: AUDIO SEND WITH RETRY
 # ==================
 
-async def send_audio_with_retry(session_id: str, session: dict, pcm_data: bytes) -> bool:
+async def send_audio_with_retry(session_id: str, session: dict, pcm_data: Union[bytes, memoryview]) -> bool:
     """
     H8: 오디오 전송 + 재시도 로직
     
@@ -695,11 +824,12 @@ async def handle_user_feedback(session_id: str, session: dict, message: dict):
         
         # AdaptiveCoachingService 생성/재사용 (LLM 클라이언트 연동)
         if "adaptive_service" not in session:
-            # Gemini 클라이언트 가져오기 (코칭 세션용)
+            # Gemini 는 GenAI 게이트웨이 경유 (동시성 상한 / 재시도 / llm_metrics 공통 적용)
             llm_client = None
             try:
-                import google.generativeai as genai
-                llm_client = genai.GenerativeModel('gemini-1.5-flash')
+                from app.services.genai_gateway import get_genai_gateway
+                llm_client = get_genai_gateway()
+                llm_client.client  # API 키 없으면 ValueError → 폴백
             except Exception as e:
                 logger.warning(f"Gemini client not available, using fallback: {e}")
             
@@ -952,14 +1082,26 @@ async def generate_tts_fallback(
     
     Returns base64-encoded MP3 audio, or None if failed.
     Frontend will use Web Speech API if None.
+    
+    (text, lang, persona) 단위로 TTSClipCache 에 캐시 (메모리 LRU + 디스크).
+    DirectorPack 로드 시 warm_tts_clips 로 미리 렌더되므로 녹화 중에는 대부분 메모리 적중.
     """
     if not text or len(text) < 2:
         return None
     
+    from app.services.tts_cache import get_tts_clip_cache
+    
     # Phase 4: 페르소나별 TTS 설정
     persona_config = PERSONA_TTS_CONFIG.get(persona, PERSONA_TTS_CONFIG["calm_mentor"])
     slow = persona_config.get("slow", False)
     
+    return await get_tts_clip_cache().get_or_render(
+        text, lang, persona, lambda: _synthesize_gtts(text, lang, slow)
+    )
+
+
+def _synthesize_gtts(text: str, lang: str, slow: bool) -> Optional[bytes]:
+    """gTTS 합성 (동기, 네트워크 - TTSClipCache 가 스레드에서 호출)"""
     try:
         # Try gTTS (free, no API key)
         from gtts import gTTS
@@ -968,11 +1110,10 @@ async def generate_tts_fallback(
         tts = gTTS(text=text, lang=lang, slow=slow)
         audio_buffer = io.BytesIO()
         tts.write_to_fp(audio_buffer)
-        audio_buffer.seek(0)
         
-        audio_b64 = base64.b64encode(audio_buffer.read()).decode()
-        logger.debug(f"TTS generated ({persona}): {len(text)} chars -> {len(audio_b64)} bytes")
-        return audio_b64
+        audio = audio_buffer.getvalue()
+        logger.debug(f"TTS generated: {len(text)} chars -> {len(audio)} bytes")
+        return audio
         
     except ImportError:
         logger.warning("gTTS not installed, falling back to Web Speech API on client")
@@ -982,6 +1123,40 @@ async def generate_tts_fallback(
         return None
 
 
+# warm-up 태스크 참조 (GC 방지)
+_tts_warmup_tasks: Set[asyncio.Task] = set()
+
+
+async def warm_tts_clips(pack: Any, lang: str = "ko", persona: str = "calm_mentor") -> int:
+    """
+    DirectorPack 의 모든 코칭 대사를 미리 렌더해 TTS 캐시에 적재
+    
+    Returns:
+        캐시된 클립 수
+    """
+    from app.services.tts_cache import collect_coach_lines
+    
+    lines = collect_coach_lines(pack)
+    semaphore = asyncio.Semaphore(max(1, settings.TTS_WARMUP_CONCURRENCY))
+    
+    async def render(text: str) -> bool:
+        async with semaphore:
+            return await generate_tts_fallback(text, lang=lang, persona=persona) is not None
+    
+    rendered = await asyncio.gather(*(render(text) for text in lines))
+    logger.info(f"TTS warm-up ({persona}): {sum(rendered)}/{len(lines)} coach lines cached")
+    return sum(rendered)
+
+
+def schedule_tts_warmup(pack: Any, lang: str = "ko", persona: str = "calm_mentor") -> None:
+    """warm_tts_clips 를 백그라운드로 실행 (pack 로드/세션 시작을 막지 않음)"""
+    if pack is None:
+        return
+    task = asyncio.create_task(warm_tts_clips(pack, lang=lang, persona=persona))
+    _tts_warmup_tasks.add(task)
+    task.add_done_callback(_tts_warmup_tasks.discard)
+
+
 # ==================
 # Phase 1: GRAPHIC GUIDE GENERATION
 # ==================
@@ -1224,6 +1399,11 @@ async def handle_control(session_id: str, session: dict, message: dict):
             
             # 3. AudioCoach에 컨텍스트 설정
             coach.set_coaching_context(pack, tone=voice_style)
+            
+            # TTS 미리 렌더: 기본 페르소나 (체크포인트/프레임 피드백) + 세션 페르소나 (audio_feedback)
+            # VDG 로드 시 warm-up 과 키가 겹치면 캐시 적중으로 끝남
+            for warm_persona in {"calm_mentor", session.get("persona") or "calm_mentor"}:
+                schedule_tts_warmup(pack, persona=warm_persona)
             logger.info(f"DirectorPack applied: {len(pack.dna_invariants)} rules, video_id={video_id}")
             
         except Exception as e:
@@ -1367,7 +1547,7 @@ async def handle_control(session_id: str, session: dict, message: dict):
 
 
 async def handle_audio(session_id: str, session: dict, message: dict):
-    """Audio 청크 처리 (H7: 활동 추적, H8: 재시도 로직)"""
+    """Audio 청크 처리 - JSON 모드 (base64 PCM)"""
     if session.get("status") != "recording":
         return
     
@@ -1375,13 +1555,25 @@ async def handle_audio(session_id: str, session: dict, message: dict):
     if not audio_b64:
         return
     
+    try:
+        # Base64 → PCM bytes
+        pcm_data = base64.b64decode(audio_b64)
+    except Exception as e:
+        logger.error(f"Audio processing error: {e}")
+        return
+    
+    await handle_audio_pcm(session_id, session, pcm_data)
+
+
+async def handle_audio_pcm(session_id: str, session: dict, pcm_data: Union[bytes, memoryview]):
+    """PCM 청크 처리 (H7: 활동 추적, H8: 재시도 로직) - binary 모드는 memoryview 그대로"""
+    if session.get("status") != "recording" or not len(pcm_data):
+        return
+    
     # H7: Update last activity
     session["last_activity"] = utcnow()
     
     try:
-        # Base64 → PCM bytes
-        pcm_data = base64.b64decode(audio_b64)
-        
         # H8: AudioCoach에 전달 (재시도 로직 포함)
         if session.get("gemini_connected"):
             await send_audio_with_retry(session_id, session, pcm_data)
@@ -1457,6 +1649,53 @@ async def handle_metric(session_id: str, session: dict, message: dict, voice_sty
         })
 
 
+# ==================
+# BINARY WIRE (coaching.binary.v1)
+# ==================
+
+async def handle_binary_message(session_id: str, session: dict, data: bytes, voice_style: str):
+    """
+    binary 메시지 처리: 헤더 파싱 후 payload memoryview 를 복사 없이 오디오/프레임 경로로 전달
+    
+    연결 시 binary 모드로 협상된 세션만 허용 (JSON 클라이언트는 기존 text 메시지 사용).
+    """
+    if session.get("wire") != WIRE_BINARY:
+        await manager.send_message(session_id, {
+            "type": "error",
+            "message": "Binary messages require wire=binary (coaching.binary.v1)",
+        })
+        return
+    
+    try:
+        header, payload = parse_binary_message(data)
+    except WireProtocolError as e:
+        await manager.send_message(session_id, {
+            "type": "error",
+            "message": str(e),
+        })
+        return
+    
+    if header.is_audio:
+        await handle_audio_pcm(session_id, session, payload)
+        return
+    
+    if not len(payload):
+        await manager.send_message(session_id, {
+            "type": "error",
+            "message": "video frame payload is empty",
+        })
+        return
+    
+    await submit_video_frame(
+        session_id,
+        session,
+        payload,
+        t_sec=header.t_ms / 1000.0,
+        t_ms=header.client_ts_ms or None,
+        codec=header.codec,
+    )
+
+
 # ==================
 # P3: VIDEO FRAME ANALYSIS
 # ==================
@@ -1467,6 +1706,8 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
     
     프론트엔드에서 1fps로 전송되는 프레임을 분석하여
     DNAInvariant 규칙 준수 여부를 실시간으로 평가하고 피드백을 제공합니다.
+    결정론적 메트릭 규칙은 로컬 CV, 의미 판단 규칙만 Gemini Vision (HybridFrameEvaluator).
+    분석은 FrameAnalysisScheduler 워커에서 비동기로 실행되고 결과는 _send_frame_feedback 으로 전달.
     
     Message format:
         {
@@ -1475,8 +1716,6 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
             "t_sec": 2.5
         }
     """
-    from app.services.frame_analyzer import get_frame_analyzer
-    
     frame_b64 = message.get("frame_b64")
     t_sec = message.get("t_sec", 0.0)
     t_ms = message.get("t_ms")  # Phase 2: Client timestamp for latency tracking
@@ -1490,6 +1729,24 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
         })
         return
     
+    await submit_video_frame(session_id, session, frame_b64, t_sec, t_ms, codec)
+
+
+async def submit_video_frame(
+    session_id: str,
+    session: dict,
+    frame: Union[str, bytes, memoryview],
+    t_sec: float,
+    t_ms: Optional[int],
+    codec: str,
+):
+    """
+    프레임 → frame_ack + 활성 규칙 추출 + 스케줄러 제출
+    
+    frame 은 base64 문자열 (JSON 모드) 또는 수신 버퍼 memoryview (binary 모드).
+    """
+    from app.services.frame_scheduler import get_frame_scheduler
+    
     session["frames_received"] = session.get("frames_received", 0) + 1
     
     # Phase 2: Send frame_ack for latency measurement
@@ -1509,25 +1766,41 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
         logger.debug("No DirectorPack available for frame analysis")
         return
     
-    # 현재 시간에 활성화된 규칙만 추출
-    active_rules = []
-    for rule in pack.dna_invariants:
-        t_window = rule.time_scope.t_window if rule.time_scope else [0, 999]
-        if t_window[0] <= t_sec <= t_window[1]:
-            active_rules.append(rule)
+    # 현재 시간에 활성화된 규칙만 추출 (RuleIntervalIndex 이진 탐색)
+    active_rules = coach.get_time_scoped_rules(t_sec)
     
     if not active_rules:
         return
     
-    # FrameAnalyzer로 프레임 분석
+    # 세션별 스케줄러에 제출 (latest-frame-wins, 세션당 1fps 예산, 유한 워커 풀)
+    scheduler = get_frame_scheduler()
+    
+    async def on_result(results: Dict[str, Any], analyzed_t_sec: float):
+        await _send_frame_feedback(session_id, session, active_rules, results, analyzed_t_sec)
+    
+    await scheduler.submit(session_id, frame, active_rules, t_sec, on_result)
+    
+    # 백프레셔: 예산보다 빨리 보내 프레임이 교체되고 있으면 권장 fps 전달
+    signal = scheduler.backpressure(session_id)
+    if signal:
+        await manager.send_message(session_id, {
+            "type": "frame_backpressure",
+            **signal,
+            "timestamp": utcnow().isoformat(),
+        })
+
+
+async def _send_frame_feedback(
+    session_id: str,
+    session: dict,
+    active_rules: list,
+    results: Dict[str, Any],
+    t_sec: float,
+):
+    """프레임 분석 결과 → 위반 규칙 피드백 전송 (One-command policy)"""
+    coach: AudioCoach = session["coach"]
+    
     try:
-        analyzer = get_frame_analyzer()
-        results = await analyzer.analyze_frame(
-            frame_base64=frame_b64,
-            rules=active_rules,
-            current_time=t_sec
-        )
-        
         # 위반 규칙이 있으면 피드백 전송
         for rule_id, result in results.items():
             if not result.is_compliant:
@@ -1557,6 +1830,7 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
                 await manager.send_message(session_id, {
                     "type": "feedback",
                     "source": "video_analysis",
+                    "evaluator": result.source,
                     "rule_id": rule_id,
                     "message": feedback_msg,
                     "priority": rule.priority,
@@ -1571,7 +1845,7 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
                 coach.report_violation(rule_id, t_sec, severity="warning")
                 session["interventions_sent"] = session.get("interventions_sent", 0) + 1
                 
-                logger.info(f"Video analysis feedback: {session_id}, rule={rule_id}, conf={result.confidence:.2f}")
+                logger.info(f"Video analysis feedback: {session_id}, rule={rule_id}, conf={result.confidence:.2f}, via={result.source}")
                 
                 # One-command policy: 한 번에 하나만
                 break
@@ -1587,25 +1861,42 @@ async def handle_video_frame(session_id: str, session: dict, message: dict, voic
 @router.get("/coaching/ws/health")
 async def coaching_ws_health(current_user: User = Depends(require_admin)):
     """WebSocket 상태 확인"""
+    from app.services import frame_analyzer
+    from app.services.frame_scheduler import get_frame_scheduler
+    from app.services.hybrid_frame_evaluator import get_hybrid_frame_evaluator
+    from app.services.tts_cache import get_tts_clip_cache
+    
+    analyzer = frame_analyzer._frame_analyzer  # 첫 Vision escalation 전에는 None
     return {
         "status": "ok",
+        "worker_id": WORKER_ID,
+        "session_registry": manager.registry.backend,
         "active_sessions": len(manager.active_sessions),
+        "cluster_sessions": len(await manager.list_sessions()),
         "connected_websockets": len(manager.websockets),
+        "frame_evaluator": get_hybrid_frame_evaluator().stats.to_dict(),
+        "frame_scheduler": get_frame_scheduler().get_stats(),
+        "vision_batcher": analyzer.batcher.get_stats() if analyzer and analyzer.batcher else None,
+        "tts_cache": get_tts_clip_cache().stats(),
         "timestamp": utcnow().isoformat(),
     }
 
 
 @router.get("/coaching/ws/sessions")
 async def list_ws_sessions(current_user: User = Depends(require_admin)):
-    """활성 WebSocket 세션 목록"""
-    sessions = []
-    for sid, session in manager.active_sessions.items():
-        sessions.append({
-            "session_id": sid,
-            "status": session.get("status"),
-            "recording_time": session.get("recording_time", 0),
-            "started_at": session.get("started_at").isoformat() if session.get("started_at") else None,
-        })
+    """활성 WebSocket 세션 목록 (전 워커 - worker_id / node 로 연결 위치 표시)"""
+    sessions = [
+        {
+            "session_id": s["session_id"],
+            "status": s.get("status"),
+            "recording_time": s.get("recording_time", 0),
+            "started_at": s.get("started_at"),
+            "worker_id": s.get("worker_id"),
+            "node": s.get("node"),
+            "local": s.get("worker_id") == WORKER_ID,
+        }
+        for s in await manager.list_sessions()
+    ]
     
     return {
         "sessions": sessions,
@@ -4,7 +4,7 @@ For You Router - Answer-First UX 패턴 추천 API
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy import select, func, desc
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -21,10 +21,6 @@ from app.schemas.for_you import (
 router = APIRouter(prefix="/for-you", tags=["For You"])
 
 
-# Tier 우선순위 매핑
-TIER_PRIORITY = {"S": 1, "A": 2, "B": 3, "C": 4}
-
-
 @router.get("", response_model=ForYouResponse)
 async def get_for_you_recommendations(
     category: Optional[str] = Query(None, description="카테고리 필터"),
@@ -42,39 +38,30 @@ async def get_for_you_recommendations(
     - Evidence (댓글, 지표) 포함
     - Recurrence (재등장) 정보 포함
     """
-    # 1. 기본 쿼리: 분석 완료된 Outlier만
-    query = select(OutlierItem).where(
-        OutlierItem.analysis_status == "completed",
-        OutlierItem.outlier_tier.isnot(None),
+    from app.services.feed_ranking import (
+        count_feed_detached,
+        feed_filters,
+        feed_page_ids_statement,
+        get_feed_count_cache,
+        order_by_ids,
+        tier_rank_limit,
     )
+
+    # 1~3. 분석 완료 + 필터 + Tier 범위 (tier_rank <= min_tier)
+    filters = feed_filters(category=category, platform=platform, min_tier=min_tier)
     
-    # 2. 필터 적용
-    if category:
-        query = query.where(OutlierItem.category == category)
-    if platform:
-        query = query.where(OutlierItem.platform == platform)
-    
-    # 3. Tier 필터
-    min_priority = TIER_PRIORITY.get(min_tier, 4)
-    allowed_tiers = [t for t, p in TIER_PRIORITY.items() if p <= min_priority]
-    query = query.where(OutlierItem.outlier_tier.in_(allowed_tiers))
+    # 4~5. Tier 우선순위 (S > A > B > C), outlier_score 높은 순 - 인덱스에서 id 만 페이지네이션 후 행 로드
+    page_ids = (await db.execute(feed_page_ids_statement(filters, offset=offset, limit=limit))).scalars().all()
+    outliers = []
+    if page_ids:
+        result = await db.execute(select(OutlierItem).where(OutlierItem.id.in_(page_ids)))
+        outliers = order_by_ids(result.scalars().all(), page_ids)
     
-    # 4. Tier 우선순위로 정렬 (S > A > B > C), outlier_score 높은 순
-    query = query.order_by(
-        # PostgreSQL CASE 표현식으로 Tier 우선순위
-        func.array_position(['S', 'A', 'B', 'C'], OutlierItem.outlier_tier),
-        desc(OutlierItem.outlier_score),
-        desc(OutlierItem.view_count),
+    # 총 개수는 필터 조합별 TTL 캐시 (count 는 요청 세션과 분리된 세션에서)
+    total_count = await get_feed_count_cache().get_or_load(
+        ("for_you", category, platform, tier_rank_limit(min_tier)), lambda: count_feed_detached(filters),
     )
-    
-    # 5. 페이지네이션
-    total_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(total_query)
-    total_count = total_result.scalar() or 0
-    
-    query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
-    outliers = result.scalars().all()
+    total_count = max(total_count, offset + len(outliers))
     
     # 6. PatternCluster 정보 조회 (있으면)
     cluster_map = {}
@@ -1,35 +1,33 @@
 """
 Frame Serving Router
 
-키프레임 이미지 서빙 엔드포인트
+키프레임 이미지 서빙 엔드포인트 (Ghost Overlay)
 
-작동 방식:
-1. VDG CV 분석 시 저장된 evidence frames 서빙
-2. 프레임이 없으면 동적으로 영상에서 추출
-3. CDN/스토리지 통합 가능
+작동 방식 (app/services/frame_store.py):
+1. VDG CV 분석 시 저장된 evidence frames 를 정렬 인덱스로 최근접 탐색
+2. 프레임이 없으면 캐시된 원본 영상에서 온디맨드 추출 (구간 단위, single-flight)
+3. width/quality 변형은 버킷으로 스냅 후 디스크 + 메모리 캐시
+4. CDN/스토리지 통합 가능
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, Response
-from pathlib import Path
+from fastapi.responses import Response
 import logging
-import os
 from typing import Optional
 
+from app.services.frame_store import DEFAULT_QUALITY, get_frame_store, is_valid_content_id
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/frames", tags=["frames"])
 
-# 프레임 저장 기본 경로
-FRAME_STORAGE_PATH = Path(os.getenv("FRAME_STORAGE_PATH", "/tmp/komission/frames"))
-
 
 @router.get("/{content_id}/{t_ms}")
 async def get_frame(
     content_id: str,
     t_ms: int,
     width: Optional[int] = Query(None, ge=100, le=1920, description="리사이즈 너비"),
-    quality: int = Query(85, ge=50, le=100, description="JPEG 품질"),
+    quality: int = Query(DEFAULT_QUALITY, ge=50, le=100, description="JPEG 품질"),
 ):
     """
     키프레임 이미지 서빙
@@ -37,40 +35,28 @@ async def get_frame(
     Args:
         content_id: VDG 콘텐츠 ID
         t_ms: 타임스탬프 (밀리초)
-        width: 옵션 - 리사이즈 너비
-        quality: JPEG 품질 (기본 85)
+        width: 옵션 - 리사이즈 너비 (160/320/640/1280 버킷으로 올림, 초과 시 원본 너비)
+        quality: JPEG 품질 (기본 85, 60/85 버킷으로 스냅)
     
     Returns:
-        JPEG 이미지
+        JPEG 이미지 (X-Frame-T-Ms: 실제 프레임 타임스탬프)
     """
-    # 1. 정확한 타임스탬프 파일 찾기
-    frame_path = FRAME_STORAGE_PATH / content_id / f"{t_ms}.jpg"
-    
-    if frame_path.exists():
-        logger.info(f"📸 Serving frame: {frame_path}")
-        return FileResponse(
-            path=str(frame_path),
+    if not is_valid_content_id(content_id):
+        raise HTTPException(status_code=400, detail="Invalid content ID")
+
+    frame = await get_frame_store().get_frame(content_id, t_ms, width=width, quality=quality)
+    if frame is not None:
+        return Response(
+            content=frame.data,
             media_type="image/jpeg",
-            headers={"Cache-Control": "public, max-age=31536000"}  # 1년 캐시
+            headers={
+                "Cache-Control": "public, max-age=31536000",  # 1년 캐시
+                "X-Frame-T-Ms": str(frame.t_ms),
+                "X-Frame-Source": frame.source,
+            },
         )
     
-    # 2. 근사치 프레임 찾기 (±500ms)
-    content_dir = FRAME_STORAGE_PATH / content_id
-    if content_dir.exists():
-        for frame_file in content_dir.glob("*.jpg"):
-            try:
-                file_t_ms = int(frame_file.stem)
-                if abs(file_t_ms - t_ms) <= 500:  # 500ms 허용
-                    logger.info(f"📸 Serving approximate frame: {frame_file} (requested: {t_ms})")
-                    return FileResponse(
-                        path=str(frame_file),
-                        media_type="image/jpeg",
-                        headers={"Cache-Control": "public, max-age=31536000"}
-                    )
-            except ValueError:
-                continue
-    
-    # 3. 동적 추출은 비용이 높으므로 placeholder 반환
+    # 저장된 프레임도 원본 영상도 없음 → placeholder
     logger.warning(f"🔴 Frame not found: {content_id}/{t_ms}, returning placeholder")
     
     # 투명 1x1 픽셀 이미지 (placeholder)
@@ -104,22 +90,21 @@ async def list_frames(content_id: str):
     Returns:
         프레임 타임스탬프 목록
     """
-    content_dir = FRAME_STORAGE_PATH / content_id
-    
-    if not content_dir.exists():
-        return {"content_id": content_id, "frames": [], "count": 0}
-    
+    if not is_valid_content_id(content_id):
+        raise HTTPException(status_code=400, detail="Invalid content ID")
+
+    store = get_frame_store()
     frames = []
-    for frame_file in sorted(content_dir.glob("*.jpg")):
+    for t_ms in store.timestamps(content_id):
         try:
-            t_ms = int(frame_file.stem)
-            frames.append({
-                "t_ms": t_ms,
-                "url": f"/api/frames/{content_id}/{t_ms}",
-                "size_bytes": frame_file.stat().st_size,
-            })
-        except ValueError:
+            size_bytes = store.frame_path(content_id, t_ms).stat().st_size
+        except FileNotFoundError:  # 인덱스 이후 삭제된 프레임
             continue
+        frames.append({
+            "t_ms": t_ms,
+            "url": f"/api/frames/{content_id}/{t_ms}",
+            "size_bytes": size_bytes,
+        })
     
     return {
         "content_id": content_id,
@@ -3,8 +3,12 @@ Monitoring & Health Check Routes (PEGL v1.0)
 
 운영 모니터링 API
 """
-from fastapi import APIRouter
+from typing import Optional
 
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from app.services.llm_metrics import llm_metrics, render_gauges
 from app.services.monitoring import health_checker, metrics_collector
 
 router = APIRouter(prefix="/api/v1/monitoring", tags=["Monitoring"])
@@ -21,7 +25,10 @@ async def detailed_health_check():
 
 
 @router.get("/metrics")
-async def get_metrics():
+async def get_metrics(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(json|prometheus)$"),
+):
     """
     성능 메트릭 (관리자 전용)
     
@@ -29,8 +36,52 @@ async def get_metrics():
     - 요청 수
     - 에러율
     - 레이턴시 통계
+    - llm: GenAI 호출 model/site 별 호출 수, 토큰, 레이턴시
+    
+    Prometheus 텍스트: ?format=prometheus 또는 Accept: text/plain (스크레이퍼 기본 헤더)
+    """
+    accept = request.headers.get("accept", "")
+    if format == "prometheus" or (format is None and ("text/plain" in accept or "openmetrics" in accept)):
+        from app.services.genai_gateway import get_genai_gateway
+        gateway = get_genai_gateway().stats
+        body = llm_metrics.render_prometheus() + render_gauges({
+            "komission_llm_in_flight": ("LLM calls currently holding a gateway slot.", gateway.in_flight),
+            "komission_llm_waiting": ("LLM calls waiting for a gateway slot.", gateway.waiting),
+        })
+        return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
+    return {**metrics_collector.get_metrics(), "llm": llm_metrics.snapshot()}
+
+
+@router.get("/vdg-cache")
+async def vdg_pass_cache_stats():
+    """
+    VDG Pass 캐시 통계 (content-addressed)
+    
+    - pass1/pass2 hits, misses, stores, errors
+    - hit rate (프로세스 로컬)
+    - global: Redis 공유 카운터 (VDG_PASS_CACHE_REDIS 사용 시)
     """
-    return metrics_collector.get_metrics()
+    from app.services.vdg_2pass.pass_cache import vdg_pass_cache
+    import asyncio
+    return await asyncio.to_thread(vdg_pass_cache.stats)
+
+
+@router.get("/analysis-queue")
+async def analysis_queue_stats():
+    """
+    VDG 분석 작업 큐 상태
+
+    - pending / running: 레인별 (high, normal, low) 작업 수
+    - stages: 이 프로세스의 스테이지 슬롯 사용량 (in-process 워커 사용 시에만 의미 있음)
+    """
+    from app.services.analysis_queue import get_analysis_queue, get_stage_limiter
+    import asyncio
+    queue = get_analysis_queue()
+    return {
+        "backend": queue.backend,
+        **await asyncio.to_thread(queue.counts),
+        "stages": get_stage_limiter().get_stats(),
+    }
 
 
 @router.get("/ready")
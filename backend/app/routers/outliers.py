@@ -7,9 +7,10 @@ import csv
 import io
 import asyncio
 import math
-from app.utils.time import utcnow, days_ago
+from app.utils.time import utcnow
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, Form
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import Optional, List
@@ -27,6 +28,7 @@ from app.models import (
 )
 from app.routers.auth import require_curator, get_current_user, get_current_user_optional, User
 from app.services.remix_nodes import generate_remix_node_id
+from app.services.outlier_ingest import bulk_insert_outliers, get_or_create_source
 from app.schemas.evidence import (
     OutlierSourceCreate,
     OutlierSourceResponse,
@@ -85,92 +87,148 @@ async def resolve_short_url(url: str):
 # ==================
 # AUTO-ANALYSIS HELPER
 # ==================
-def trigger_auto_analysis(node_id: str, video_url: str, outlier_item_id: str = None):
+async def _enqueue_analysis(kind: str, payload: dict, *, lane: str, dedupe_key: str):
+    """분석 작업을 큐에 등록 (실행은 전용 워커 프로세스 - scripts/run_analysis_worker.py)
+
+    저장소 호출은 동기 (SQLite busy timeout / Redis 소켓 타임아웃) → 스레드로 넘겨 이벤트 루프를 막지 않음
     """
-    Background task to trigger Gemini analysis after promote.
-    Uses sync wrapper for async operations.
+    from app.config import settings
+    from app.services.analysis_queue import get_analysis_queue
+
+    job = await asyncio.to_thread(
+        get_analysis_queue().enqueue,
+        kind,
+        payload,
+        lane=lane,
+        dedupe_key=dedupe_key,
+        max_attempts=settings.ANALYSIS_QUEUE_MAX_ATTEMPTS,
+    )
+    print(f"📨 Queued {kind} job {job.job_id} (lane={job.lane}, status={job.status})")
+    return job
+
+
+async def trigger_auto_analysis(node_id: str, video_url: str, outlier_item_id: str = None):
+    """
+    Queue Gemini analysis after promote (runs on an analysis worker, not the API process).
     
     Now also saves to normalized viral_kicks tables.
     """
-    async def _run_analysis():
-        from app.services.gemini_pipeline import gemini_pipeline
-        from app.services.vdg_2pass.vdg_db_saver import vdg_db_saver
-        from app.database import async_session_maker
-        from app.models import RemixNode
+    from app.services.analysis_queue import JOB_VDG_AUTO_ANALYSIS, LANE_NORMAL
+
+    return await _enqueue_analysis(
+        JOB_VDG_AUTO_ANALYSIS,
+        {"node_id": node_id, "video_url": video_url, "outlier_item_id": outlier_item_id},
+        lane=LANE_NORMAL,
+        dedupe_key=f"vdg_auto:{node_id}",
+    )
+
+
+async def _enqueue_vdg_analysis(item: OutlierItem, node_id: str, *, lane: str, platform: str = None):
+    """베스트 댓글 + VDG 분석 작업 등록 (같은 아이템의 활성 작업이 있으면 그 작업 반환)"""
+    from app.services.analysis_queue import JOB_VDG_ANALYSIS
+
+    return await _enqueue_analysis(
+        JOB_VDG_ANALYSIS,
+        {
+            "item_id": str(item.id),
+            "node_id": node_id,
+            "video_url": item.video_url,
+            "platform": platform or item.platform or "youtube",
+        },
+        lane=lane,
+        dedupe_key=f"vdg:{item.id}",
+    )
+
+
+async def _refresh_search_document(item_id: UUID) -> None:
+    """검색 문서 갱신 (킥 / 베스트 댓글 / 제목 변경 후) - 실패해도 본 작업은 유지
+
+    별도 세션에서 실행: 호출자 세션을 rollback 하면 로드된 객체가 모두 expire 되어
+    이후 속성 접근이 async 컨텍스트에서 lazy load (MissingGreenlet) 로 실패함.
+    """
+    from app.database import async_session_maker
+    from app.services.search_index import refresh_search_document
+
+    try:
+        async with async_session_maker() as session:
+            await refresh_search_document(session, item_id)
+            await session.commit()
+    except Exception as e:
+        print(f"⚠️ Search document refresh failed (non-fatal): {e}")
+
+
+async def run_auto_analysis_job(node_id: str, video_url: str, outlier_item_id: str = None):
+    """Analysis worker job: VDG v4 analysis + normalized viral_kicks save"""
+    from app.services.gemini_pipeline import gemini_pipeline
+    from app.services.vdg_2pass.vdg_db_saver import vdg_db_saver
+    from app.database import async_session_maker
+    from app.models import RemixNode
+    
+    try:
+        print(f"🚀 Auto-analyzing node {node_id}...")
+        result = await gemini_pipeline.analyze_video_v4(video_url, node_id)
         
-        try:
-            print(f"🚀 Auto-analyzing node {node_id}...")
-            result = await gemini_pipeline.analyze_video_v4(video_url, node_id)
+        # Save result to database
+        async with async_session_maker() as db:
+            stmt = select(RemixNode).where(RemixNode.node_id == node_id)
+            db_result = await db.execute(stmt)
+            node = db_result.scalar_one_or_none()
             
-            # Save result to database
-            async with async_session_maker() as db:
-                stmt = select(RemixNode).where(RemixNode.node_id == node_id)
-                db_result = await db.execute(stmt)
-                node = db_result.scalar_one_or_none()
+            if node:
+                vdg_data = result.model_dump()
+                node.gemini_analysis = vdg_data
+                await db.commit()
+                print(f"✅ Auto-analysis complete for {node_id}")
                 
-                if node:
-                    vdg_data = result.model_dump()
-                    node.gemini_analysis = vdg_data
-                    await db.commit()
-                    print(f"✅ Auto-analysis complete for {node_id}")
+                # P1-1: Save to normalized viral_kicks tables
+                try:
+                    save_result = await vdg_db_saver.save_vdg_to_db(
+                        db=db,
+                        node_id=node_id,
+                        vdg_data=vdg_data,
+                        video_path=None,  # Already deleted after pipeline
+                        outlier_item_id=outlier_item_id,
+                    )
                     
-                    # P1-1: Save to normalized viral_kicks tables
-                    try:
-                        save_result = await vdg_db_saver.save_vdg_to_db(
-                            db=db,
-                            node_id=node_id,
-                            vdg_data=vdg_data,
-                            video_path=None,  # Already deleted after pipeline
-                            outlier_item_id=outlier_item_id,
-                        )
-                        
-                        # 저장 결과에 따라 OutlierItem 상태 업데이트
-                        if outlier_item_id:
+                    # 저장 결과에 따라 OutlierItem 상태 업데이트
+                    if outlier_item_id:
+                        from app.models import OutlierItem
+                        outlier_stmt = select(OutlierItem).where(OutlierItem.id == UUID(outlier_item_id))
+                        outlier_result = await db.execute(outlier_stmt)
+                        outlier_item = outlier_result.scalar_one_or_none()
+                        if outlier_item:
+                            if save_result.get('warning'):
+                                outlier_item.analysis_status = f"vdg_warning:{save_result['warning']}"
+                            elif save_result['kicks_saved'] == 0:
+                                outlier_item.analysis_status = "vdg_no_kicks"
+                            else:
+                                outlier_item.analysis_status = f"vdg_complete:{save_result['kicks_saved']}kicks"
+                            await db.commit()
+                        await _refresh_search_document(UUID(outlier_item_id))
+                    
+                    print(f"💾 VDG DB saved: {save_result['kicks_saved']} kicks, "
+                          f"{save_result['keyframes_saved']} keyframes")
+                    print(f"🏁 Full VDG analysis complete for {node_id}")
+                except Exception as e:
+                    print(f"⚠️ VDG DB save failed (analysis still saved): {e}")
+                    # 실패 상태 기록
+                    if outlier_item_id:
+                        try:
                             from app.models import OutlierItem
                             outlier_stmt = select(OutlierItem).where(OutlierItem.id == UUID(outlier_item_id))
                             outlier_result = await db.execute(outlier_stmt)
                             outlier_item = outlier_result.scalar_one_or_none()
                             if outlier_item:
-                                if save_result.get('warning'):
-                                    outlier_item.analysis_status = f"vdg_warning:{save_result['warning']}"
-                                elif save_result['kicks_saved'] == 0:
-                                    outlier_item.analysis_status = "vdg_no_kicks"
-                                else:
-                                    outlier_item.analysis_status = f"vdg_complete:{save_result['kicks_saved']}kicks"
+                                outlier_item.analysis_status = f"vdg_db_error:{str(e)[:50]}"
                                 await db.commit()
-                        
-                        print(f"💾 VDG DB saved: {save_result['kicks_saved']} kicks, "
-                              f"{save_result['keyframes_saved']} keyframes")
-                        print(f"🏁 Full VDG analysis complete for {node_id}")
-                    except Exception as e:
-                        print(f"⚠️ VDG DB save failed (analysis still saved): {e}")
-                        # 실패 상태 기록
-                        if outlier_item_id:
-                            try:
-                                from app.models import OutlierItem
-                                outlier_stmt = select(OutlierItem).where(OutlierItem.id == UUID(outlier_item_id))
-                                outlier_result = await db.execute(outlier_stmt)
-                                outlier_item = outlier_result.scalar_one_or_none()
-                                if outlier_item:
-                                    outlier_item.analysis_status = f"vdg_db_error:{str(e)[:50]}"
-                                    await db.commit()
-                            except:
-                                pass
-                        print(f"🏁 VDG analysis complete for {node_id} (DB save failed)")
-                else:
-                    print(f"⚠️ Node {node_id} not found for analysis save")
-        except Exception as e:
-            print(f"❌ Auto-analysis failed for {node_id}: {e}")
-    
-    # Run async function in new event loop (background task context)
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.create_task(_run_analysis())
-        else:
-            asyncio.run(_run_analysis())
-    except RuntimeError:
-        asyncio.run(_run_analysis())
+                        except:
+                            pass
+                    print(f"🏁 VDG analysis complete for {node_id} (DB save failed)")
+            else:
+                print(f"⚠️ Node {node_id} not found for analysis save")
+    except Exception as e:
+        print(f"❌ Auto-analysis failed for {node_id}: {e}")
+        raise  # 큐 워커가 재시도/실패 처리
 
 
 def _temporal_phase_for_age(age_days: int) -> str:
@@ -215,20 +273,7 @@ def _calculate_burstiness(item) -> float:
 
 
 async def _get_or_create_source(db: AsyncSession, name: str) -> OutlierSource:
-    result = await db.execute(select(OutlierSource).where(OutlierSource.name == name))
-    source = result.scalar_one_or_none()
-    if source:
-        return source
-
-    source = OutlierSource(
-        name=name,
-        base_url="manual://",
-        auth_type="none",
-        crawl_interval_hours=24,
-    )
-    db.add(source)
-    await db.flush()
-    return source
+    return await get_or_create_source(db, name, base_url="manual://", crawl_interval_hours=24)
 
 
 # ==================
@@ -294,6 +339,7 @@ async def list_sources(
 @router.get("/")
 @router.get("")
 async def list_outliers(
+    request: Request,
     category: Optional[str] = None,
     platform: Optional[str] = None,
     tier: Optional[str] = None,
@@ -302,91 +348,52 @@ async def list_outliers(
     analysis_status: Optional[str] = None,  # NEW: Filter by analysis status
     freshness: Optional[str] = Query(default="7d"),
     sort_by: Optional[str] = Query(default="outlier_score"),
-    limit: int = Query(default=100, le=2000),
+    limit: int = Query(default=100, ge=1, le=2000),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (keyset 페이지네이션)"),
+    include_vdg: bool = Query(default=False, description="raw_payload.vdg_analysis 포함 여부"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     아웃라이어 목록 조회 (프론트엔드용)
     프론트엔드에서 /api/v1/outliers 호출 시 사용
+
+    - 필요한 컬럼만 조회, vdg_analysis 는 include_vdg=true 일 때만
+    - next_cursor 로 다음 페이지 (정렬 키 + id keyset)
+    - ETag / If-None-Match → 변경 없으면 304 (행 조회 생략)
     """
-    query = select(OutlierItem)
-    
-    # Filters
-    if category:
-        query = query.where(OutlierItem.category == category)
-    if platform:
-        query = query.where(OutlierItem.platform == platform)
-    if tier:
-        query = query.where(OutlierItem.outlier_tier == tier)
-    if status:
-        # Map status string to enum (case-insensitive)
-        status_upper = status.upper()
-        status_enum = getattr(OutlierItemStatus, status_upper, None)
-        if status_enum:
-            query = query.where(OutlierItem.status == status_enum)
-    if campaign_eligible is not None:
-        query = query.where(OutlierItem.campaign_eligible == campaign_eligible)
-    
-    # NEW: analysis_status filter (completed, analyzing, pending)
-    if analysis_status:
-        query = query.where(OutlierItem.analysis_status == analysis_status)
-    
-    # Freshness filter
-    if freshness == "24h":
-        from datetime import timedelta
-        cutoff = utcnow() - timedelta(hours=24)
-        query = query.where(OutlierItem.crawled_at >= cutoff)
-    elif freshness == "7d":
-        cutoff = days_ago(7)
-        query = query.where(OutlierItem.crawled_at >= cutoff)
-    elif freshness == "30d":
-        cutoff = days_ago(30)
-        query = query.where(OutlierItem.crawled_at >= cutoff)
-    
-    # Sorting
-    if sort_by == "view_count":
-        query = query.order_by(OutlierItem.view_count.desc())
-    elif sort_by == "crawled_at":
-        query = query.order_by(OutlierItem.crawled_at.desc())
-    else:
-        query = query.order_by(OutlierItem.outlier_score.desc().nullslast())
-    
-    query = query.limit(limit)
-    result = await db.execute(query)
-    items = result.scalars().all()
-    
-    return {
-        "total": len(items),
-        "items": [
-            {
-                "id": str(i.id),
-                "external_id": i.external_id,
-                "video_url": i.video_url,
-                "platform": i.platform,
-                "category": i.category,
-                "title": i.title,
-                "thumbnail_url": i.thumbnail_url,
-                "view_count": i.view_count or 0,
-                "like_count": i.like_count or 0,
-                "share_count": i.share_count or 0,
-                "outlier_score": i.outlier_score or 0,
-                "outlier_tier": i.outlier_tier or "C",
-                "creator_avg_views": i.creator_avg_views or 10000,
-                "creator_username": i.creator_username or (i.raw_payload or {}).get("creator_username"),
-                "upload_date": i.upload_date.isoformat() if i.upload_date else None,
-                "engagement_rate": (i.like_count or 0) / max(i.view_count or 1, 1),
-                "crawled_at": i.crawled_at.isoformat() if i.crawled_at else None,
-                "status": i.status.value.lower() if i.status else "pending",
-                # VDG Analysis Gate
-                "analysis_status": i.analysis_status or "pending",
-                "promoted_to_node_id": str(i.promoted_to_node_id) if i.promoted_to_node_id else None,
-                "best_comments_count": len(i.best_comments) if i.best_comments else 0,
-                # VDG Analysis Data (from raw_payload)
-                "vdg_analysis": (i.raw_payload or {}).get("vdg_analysis") if i.raw_payload else None,
-            }
-            for i in items
-        ],
-    }
+    from app.services.outlier_listing import (
+        OutlierListQuery,
+        build_validator_statement,
+        compute_etag,
+        etag_matches,
+        fetch_outlier_page,
+    )
+
+    list_query = OutlierListQuery(
+        category=category,
+        platform=platform,
+        tier=tier,
+        status=status,
+        campaign_eligible=campaign_eligible,
+        analysis_status=analysis_status,
+        freshness=freshness,
+        sort_by=sort_by,
+        limit=limit,
+        cursor=cursor,
+        include_vdg=include_vdg,
+    )
+
+    count, max_updated_at = (await db.execute(build_validator_statement(list_query))).one()
+    etag = compute_etag(list_query, count, max_updated_at)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    try:
+        page = await fetch_outlier_page(db, list_query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return JSONResponse(content=page, headers=cache_headers)
 
 
 # ==================
@@ -645,7 +652,6 @@ async def create_item_manual(
 @router.get("/items/{item_id}")
 async def get_outlier_item(
     item_id: str,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -842,14 +848,10 @@ async def get_outlier_item(
             item.analysis_status = "analyzing"
             await db.commit()
             
-            # Re-queue the background task
-            background_tasks.add_task(
-                _run_vdg_analysis_with_comments,
-                item_id=str(item.id),
-                node_id=node.node_id,
-                video_url=item.video_url,
-                platform=item.platform or "youtube",
-            )
+            # Re-queue on the low lane (dedupe returns the active job if one exists)
+            from app.services.analysis_queue import LANE_LOW
+            job = await _enqueue_vdg_analysis(item, node.node_id, lane=LANE_LOW)
+            response["analysis_job_id"] = job.job_id
             # Update response to show analyzing
             response["analysis_status"] = "analyzing"
     
@@ -1663,7 +1665,6 @@ async def update_item_status(
 @router.post("/items/{item_id}/promote")
 async def promote_to_parent(
     item_id: str,
-    background_tasks: BackgroundTasks,
     request: OutlierPromoteRequest = None,  # Optional Request Body
     current_user: Optional[User] = Depends(get_current_user_optional),  # 인증 선택사항
     db: AsyncSession = Depends(get_db)
@@ -1760,15 +1761,11 @@ async def promote_to_parent(
     await db.commit()
     await db.refresh(node)
 
-    # ✅ Auto-analysis ENABLED - VDG 분석 즉시 시작
+    # ✅ Auto-analysis ENABLED - VDG 분석 작업 큐 등록 (분석 워커가 실행)
+    analysis_job = None
     if item.video_url:
-        background_tasks.add_task(
-            _run_vdg_analysis_with_comments,
-            item_id=str(item.id),
-            node_id=node.node_id,
-            video_url=item.video_url,
-            platform=item.platform,
-        )
+        from app.services.analysis_queue import LANE_NORMAL
+        analysis_job = await _enqueue_vdg_analysis(item, node.node_id, lane=LANE_NORMAL)
     
     # P3: STPF 승격 기록 (상관관계 분석용)
     stpf_record = None
@@ -1821,6 +1818,7 @@ async def promote_to_parent(
         "node_id": node.node_id,
         "remix_id": str(node.id),
         "analysis_status": "analyzing",  # 즉시 분석 시작
+        "analysis_job_id": analysis_job.job_id if analysis_job else None,
         "decision_type": decision_type.value,
         "stpf_record": stpf_record,  # P3: STPF 기록 추가
         "message": "VDG 분석이 자동으로 시작됩니다.",
@@ -1985,8 +1983,8 @@ async def bulk_upload_csv(
     source = await _get_or_create_source(db, source_name)
     
     reader = csv.DictReader(io.StringIO(text))
-    inserted = 0
-    skipped = 0
+    rows = []
+    invalid = 0
     
     for raw_row in reader:
         # Normalize keys to lowercase
@@ -1996,45 +1994,37 @@ async def bulk_upload_csv(
         title = _resolve_field(row, "title")
         
         if not source_url or not title:
-            skipped += 1
+            invalid += 1
             continue
         
         # Generate external_id from URL hash
         external_id = f"{source_name}_{hashlib.sha256(source_url.encode()).hexdigest()[:12]}"
         
-        # Check for duplicates by video_url (more robust than external_id)
-        existing = await db.execute(
-            select(OutlierItem).where(OutlierItem.video_url == source_url)
-        )
-        if existing.scalar_one_or_none():
-            skipped += 1
-            continue
-        
         platform = _resolve_field(row, "platform") or default_platform or _infer_platform(source_url)
         category = _resolve_field(row, "category") or default_category
         views = _parse_number(_resolve_field(row, "views")) or 0
         growth_rate = _resolve_field(row, "growth_rate") or None
         
-        item = OutlierItem(
-            source_id=source.id,
-            external_id=external_id,
-            video_url=source_url,
-            title=title,
-            platform=platform,
-            category=category,
-            view_count=views,
-            growth_rate=growth_rate,
-            status=OutlierItemStatus.PENDING,
-        )
-        db.add(item)
-        inserted += 1
-    
+        rows.append({
+            "source_id": source.id,
+            "external_id": external_id,
+            "video_url": source_url,
+            "title": title,
+            "platform": platform,
+            "category": category,
+            "view_count": views,
+            "growth_rate": growth_rate,
+            "status": OutlierItemStatus.PENDING,
+        })
+    
+    # 중복(video_url / external_id)은 INSERT ... ON CONFLICT DO NOTHING 으로 스킵
+    result = await bulk_insert_outliers(db, rows)
     await db.commit()
     
     return {
         "status": "success",
-        "inserted": inserted,
-        "skipped": skipped,
+        "inserted": result.inserted,
+        "skipped": result.skipped + invalid,
         "source_name": source_name,
     }
 
@@ -2046,7 +2036,6 @@ async def bulk_upload_csv(
 @router.post("/items/{item_id}/approve")
 async def approve_vdg_analysis(
     item_id: str,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_curator),  # Admin/Curator only
     db: AsyncSession = Depends(get_db)
 ):
@@ -2097,15 +2086,11 @@ async def approve_vdg_analysis(
     if not node:
         raise HTTPException(status_code=404, detail="Promoted node not found")
     
-    # Trigger analysis with best comments in background
+    # Queue analysis with best comments (admin-approved → high lane)
+    analysis_job = None
     if item.video_url:
-        background_tasks.add_task(
-            _run_vdg_analysis_with_comments,
-            item_id=str(item.id),
-            node_id=node.node_id,
-            video_url=item.video_url,
-            platform=item.platform,
-        )
+        from app.services.analysis_queue import LANE_HIGH
+        analysis_job = await _enqueue_vdg_analysis(item, node.node_id, lane=LANE_HIGH)
     
     return {
         "approved": True,
@@ -2113,18 +2098,57 @@ async def approve_vdg_analysis(
         "node_id": node.node_id,
         "analysis_status": "approved",
         "approved_by": str(current_user.id),
+        "analysis_job_id": analysis_job.job_id if analysis_job else None,
         "message": "VDG 분석이 시작됩니다. 베스트 댓글 추출 후 Gemini 분석이 실행됩니다.",
     }
 
 
+@router.get("/analysis-jobs/{job_id}")
+async def get_analysis_job(job_id: str):
+    """
+    VDG 분석 작업 상태 조회
+
+    status: queued | running | retrying | succeeded | failed (attempts / last_error 포함)
+    """
+    from app.services.analysis_queue import get_analysis_queue
+
+    job = await asyncio.to_thread(get_analysis_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+    return job.to_dict()
+
+
+async def run_vdg_analysis_job(item_id: str, node_id: str, video_url: str, platform: str):
+    """
+    Analysis worker job (JOB_VDG_ANALYSIS)
+
+    댓글 게이트 (수동 리뷰 대기 / 댓글 추출 실패) 는 재시도해도 같으므로 즉시 실패,
+    그 외 오류는 큐의 백오프 재시도로 넘김.
+    """
+    from app.services.analysis_queue import PermanentJobError
+
+    try:
+        await _run_vdg_analysis_with_comments(
+            item_id=item_id,
+            node_id=node_id,
+            video_url=video_url,
+            platform=platform,
+            raise_errors=True,
+        )
+    except HTTPException as e:
+        raise PermanentJobError(str(e.detail)) from e
+
+
 async def _run_vdg_analysis_with_comments(
     item_id: str,
     node_id: str,
     video_url: str,
-    platform: str
+    platform: str,
+    raise_errors: bool = False,
 ):
     """
-    Background task: Best comments extraction + VDG analysis + Clustering + NotebookLibrary
+    Best comments extraction + VDG analysis + Clustering + NotebookLibrary
+    (analysis worker job via run_vdg_analysis_job; raise_errors=True re-raises after status reset)
     
     Pipeline:
     1. Extract best comments
@@ -2185,6 +2209,7 @@ async def _run_vdg_analysis_with_comments(
                     item.best_comments = normalized_comments
                     item.comments_missing_reason = None
                     await db.commit()
+                    await _refresh_search_document(item.id)
                 # Mark as analyzing now that we confirmed comments exist
                 if item and item.analysis_status != "analyzing":
                     item.analysis_status = "analyzing"
@@ -2192,16 +2217,19 @@ async def _run_vdg_analysis_with_comments(
             else:
                 # 3. Extract best comments (TikTok: TikTokUnifiedExtractor, Others: comment_extractor)
                 try:
-                    if platform.lower() == "tiktok":
-                        # Use sophisticated TikTok extractor (UNIVERSAL_DATA JSON parsing)
-                        from app.services.tiktok_extractor import extract_tiktok_complete
-                        tiktok_data = await extract_tiktok_complete(video_url, include_comments=True)
-                        best_comments = tiktok_data.get("top_comments", [])
-                        print(f"📝 TikTok unified extractor: {len(best_comments)} comments, source={tiktok_data.get('source')}")
-                    else:
-                        # YouTube/Instagram: use comment_extractor
-                        from app.services.comment_extractor import extract_best_comments
-                        best_comments = await extract_best_comments(video_url, platform, limit=10)
+                    from app.services.analysis_queue import STAGE_DOWNLOAD, get_stage_limiter
+
+                    async with get_stage_limiter().aslot(STAGE_DOWNLOAD):
+                        if platform.lower() == "tiktok":
+                            # Use sophisticated TikTok extractor (UNIVERSAL_DATA JSON parsing)
+                            from app.services.tiktok_extractor import extract_tiktok_complete
+                            tiktok_data = await extract_tiktok_complete(video_url, include_comments=True)
+                            best_comments = tiktok_data.get("top_comments", [])
+                            print(f"📝 TikTok unified extractor: {len(best_comments)} comments, source={tiktok_data.get('source')}")
+                        else:
+                            # YouTube/Instagram: use comment_extractor
+                            from app.services.comment_extractor import extract_best_comments
+                            best_comments = await extract_best_comments(video_url, platform, limit=10)
                     
                     if not best_comments:
                         raise ValueError("No comments extracted - empty result")
@@ -2211,6 +2239,7 @@ async def _run_vdg_analysis_with_comments(
                         item.best_comments = best_comments
                         item.analysis_status = "analyzing"  # Set analyzing AFTER comments confirmed
                         await db.commit()
+                        await _refresh_search_document(item.id)
                     print(f"📝 Extracted {len(best_comments)} best comments for {node_id}")
                 
                 except Exception as e:
@@ -2405,6 +2434,7 @@ async def _run_vdg_analysis_with_comments(
             if item:
                 item.analysis_status = "completed"
                 await db.commit()
+                await _refresh_search_document(item.id)
             
     except Exception as e:
         print(f"❌ VDG analysis failed for {node_id}: {e}")
@@ -2422,6 +2452,8 @@ async def _run_vdg_analysis_with_comments(
                     await db.commit()
         except:
             pass
+        if raise_errors:
+            raise
 
 
 # ==================
@@ -2485,6 +2517,7 @@ async def add_manual_comments(
     item.analysis_status = "comments_ready"
     item.comments_missing_reason = None  # Clear the failure reason
     await db.commit()
+    await _refresh_search_document(item.id)
     
     return {
         "success": True,
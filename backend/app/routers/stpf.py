@@ -6,8 +6,11 @@ Week 2: Bayesian + Patches + Anchors API 추가.
 """
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+import json
 import logging
+import time
 
 from app.services.stpf.schemas import (
     STPFGates,
@@ -325,7 +328,7 @@ class MonteCarloRequest(BaseModel):
     numerator: STPFNumerator
     denominator: STPFDenominator
     multipliers: STPFMultipliers
-    n_simulations: int = Field(1000, ge=100, le=10000)
+    n_simulations: int = Field(1000, ge=100, le=100000)
     noise_std: float = Field(1.0, ge=0.1, le=3.0)
 
 
@@ -394,6 +397,53 @@ async def simulate_monte_carlo(request: MonteCarloRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class STPFBatchScoreRequest(BaseModel):
+    """배치 점수 계산 요청"""
+    # 아이템은 스트림 안에서 STPFBatchItem 으로 개별 검증 (하나가 잘못돼도 전체 422 가 되지 않음)
+    items: List[Any] = Field(..., min_length=1, max_length=50000, description="STPFBatchItem 목록")
+    apply_patches: bool = True
+    time_investment_hours: float = Field(10.0, ge=1, le=100)
+    expected_view_multiplier: float = Field(3.0, ge=1, le=100)
+    chunk_size: int = Field(500, ge=1, le=5000)
+
+
+@router.post("/batch/score")
+async def batch_score(request: STPFBatchScoreRequest):
+    """배치 STPF 점수 계산 (NDJSON 스트리밍)
+    
+    chunk 단위로 컬럼 연산 후 한 줄씩 전송 → 클라이언트는 배치 완료 전부터 렌더링 가능.
+    마지막 줄은 {"done": true, ...} 요약.
+    잘못된 아이템은 {"index", "id", "success": false, "error"} 행으로 전송.
+    """
+    items = request.items
+    
+    def generate():
+        start = time.time()
+        succeeded = failed = 0
+        for row in stpf_service.score_batch(
+            items,
+            apply_patches=request.apply_patches,
+            time_investment_hours=request.time_investment_hours,
+            expected_view_multiplier=request.expected_view_multiplier,
+            chunk_size=request.chunk_size,
+        ):
+            if row["success"]:
+                succeeded += 1
+            else:
+                failed += 1
+            yield json.dumps(row, ensure_ascii=False) + "\n"
+        yield json.dumps({
+            "done": True,
+            "total": len(items),
+            "succeeded": succeeded,
+            "failed": failed,
+            "elapsed_ms": round((time.time() - start) * 1000, 1),
+        }) + "\n"
+    
+    # sync generator → Starlette 가 threadpool 에서 순회
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/kelly/{score}")
 async def get_kelly_decision(
     score: int = Path(..., ge=0, le=1000, description="STPF 점수"),
@@ -460,6 +510,7 @@ async def health_check():
             # Week 3
             "POST /stpf/simulate/tot",
             "POST /stpf/simulate/monte-carlo",
+            "POST /stpf/batch/score",
             "GET /stpf/kelly/{score}",
             "GET /stpf/grade/{score}",
             # P2-P3 Behavior
@@ -16,7 +16,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.time import utcnow
-from app.services.genai_client import get_genai_client, DEFAULT_MODEL_FLASH
+from app.services.genai_client import DEFAULT_MODEL_FLASH
+from app.services.genai_gateway import get_genai_gateway
 
 from app.database import get_db
 from app.config import settings
@@ -182,16 +183,16 @@ async def _generate_seed_params(
     """Gemini를 사용하여 시드 파라미터 생성 (new SDK)"""
     
     try:
-        client = get_genai_client()
         prompt = _build_opal_prompt(template_type, parent_data, cluster_id, context)
         
-        response = client.models.generate_content(
+        response = await get_genai_gateway().generate_or_raise(
+            [prompt],
             model=DEFAULT_MODEL_FLASH,
-            contents=[prompt],
             config={
                 "temperature": 0.3,
                 "response_mime_type": "application/json",
             },
+            site="template_seeds",
         )
         
         import json
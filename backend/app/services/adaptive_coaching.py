@@ -12,6 +12,7 @@ Phase 3: LLM-Based Adaptive Coaching Service
 from typing import Optional, List, Dict, Any, Literal
 from dataclasses import dataclass
 from app.schemas.director_pack import DirectorPack, DNAInvariant, MutationSlot
+from app.services.genai_gateway import GenAIGateway
 import logging
 import json
 
@@ -129,10 +130,12 @@ class AdaptiveCoachingService:
     LLM이 바이럴 요소를 이해하고 스마트하게 판단
     """
     
+    GEMINI_MODEL = "gemini-1.5-flash"
+    
     def __init__(
         self,
         director_pack: Optional[DirectorPack] = None,
-        llm_client: Optional[Any] = None,  # Gemini/OpenAI client
+        llm_client: Optional[Any] = None,  # GenAIGateway / OpenAI client
         use_llm: bool = True,  # LLM 사용 여부 (폴백용)
     ):
         self._pack = director_pack
@@ -265,8 +268,18 @@ class AdaptiveCoachingService:
         """
         LLM API 호출 (Gemini 또는 OpenAI)
         """
-        if hasattr(self._llm_client, 'generate_content'):
-            # Gemini
+        if isinstance(self._llm_client, GenAIGateway):
+            # Gemini (GenAI 게이트웨이)
+            response = await self._llm_client.generate_or_raise(
+                f"{system_prompt}\n\n{user_message}",
+                model=self.GEMINI_MODEL,
+                config={"temperature": 0.3, "max_output_tokens": 500},
+                site="adaptive_coaching",
+            )
+            return response.text
+        
+        elif hasattr(self._llm_client, 'generate_content'):
+            # Gemini (legacy google.generativeai GenerativeModel)
             response = await self._llm_client.generate_content_async(
                 contents=[
                     {"role": "user", "parts": [{"text": f"{system_prompt}\n\n{user_message}"}]}
@@ -11,6 +11,7 @@ import logging
 from typing import Optional
 from datetime import datetime
 from app.services.genai_client import get_genai_client, DEFAULT_MODEL_FLASH
+from app.services.genai_gateway import get_genai_gateway
 
 from app.schemas.analysis_schema import (
     VideoAnalysisSchema,
@@ -108,14 +109,15 @@ Return ONLY valid JSON matching this schema: {VideoAnalysisSchema.model_json_sch
             
             # Generate analysis with new SDK
             prompt = self._build_prompt(request.video_url)
-            response = self.client.models.generate_content(
+            response = await get_genai_gateway().generate_or_raise(
+                [prompt],
                 model=ANALYSIS_MODEL,
-                contents=[prompt],
                 config={
                     "temperature": 0.1,
                     "max_output_tokens": 4096,
                     "response_mime_type": "application/json",
-                }
+                },
+                site="analysis_pipeline",
             )
             
             # Parse JSON response
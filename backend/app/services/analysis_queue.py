@@ -0,0 +1,918 @@
+"""
+VDG Analysis Job Queue (영구 분석 작업 큐 + 전용 워커)
+
+기존: 승격/승인/셀프힐링 시 routers/outliers.py 가 BackgroundTasks (또는 asyncio.create_task)
+      로 다운로드 + Gemini + CV 분석을 API 프로세스 안에서 직접 실행
+→ 분석이 몰리면 웹 워커의 이벤트 루프/스레드풀/메모리를 잡아먹어 API 레이턴시가
+  동시 분석 수에 비례해 늘어나고, 재시작 시 진행 중 작업이 유실 (셀프힐링으로만 복구).
+
+현재: API 는 작업을 큐에 넣기만 하고, 전용 워커 프로세스 (scripts/run_analysis_worker.py) 가 실행
+- 작업 상태: queued → running → succeeded | retrying → ... → failed
+- 재시도: 지수 백오프 (ANALYSIS_QUEUE_RETRY_BASE_SEC × 2^(attempt-1)), PermanentJobError 는 즉시 실패
+- 우선순위 레인: high (관리자 승인) > normal (승격) > low (셀프힐링/백필)
+- 중복 방지: dedupe_key 가 같은 활성 작업 (queued/retrying/running) 이 있으면 기존 작업 반환
+- 리스: running 작업은 워커 하트비트로 연장, 워커가 죽으면 만료 후 다시 큐로 (reclaim_expired)
+- 스테이지 슬롯: download / llm / cv 별 동시 실행 수 제한 (StageLimiter)
+
+저장소:
+- SQLiteAnalysisJobStore: 단일 호스트 (기본, 로컬/테스트) - API 와 워커 프로세스가 같은 파일 공유
+- RedisAnalysisJobStore: 여러 노드 공유 (ANALYSIS_QUEUE_BACKEND=redis)
+
+Usage:
+    job = get_analysis_queue().enqueue(JOB_VDG_ANALYSIS, {...}, lane=LANE_HIGH, dedupe_key=f"vdg:{item_id}")
+
+    worker = AnalysisWorker(get_analysis_queue(), concurrency=4)
+    await worker.run()
+
+    async with get_stage_limiter().aslot(STAGE_DOWNLOAD):
+        ...
+"""
+import asyncio
+import importlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from app.services.session_registry import WORKER_ID
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# Job Types / States / Lanes
+# ============================================
+
+JOB_VDG_ANALYSIS = "vdg_analysis"  # 베스트 댓글 + VDG + 클러스터링 (routers/outliers.py)
+JOB_VDG_AUTO_ANALYSIS = "vdg_auto_analysis"  # VDG + viral_kicks 정규화 저장 (trigger_auto_analysis)
+
+# kind → "module:function" (워커에서 지연 import - API 프로세스는 핸들러를 import 하지 않음)
+JOB_HANDLERS: Dict[str, str] = {
+    JOB_VDG_ANALYSIS: "app.routers.outliers:run_vdg_analysis_job",
+    JOB_VDG_AUTO_ANALYSIS: "app.routers.outliers:run_auto_analysis_job",
+}
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_RETRYING = "retrying"  # 백오프 대기 중 (available_at 이후 재실행)
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RETRYING, STATUS_RUNNING)
+
+LANE_HIGH = "high"
+LANE_NORMAL = "normal"
+LANE_LOW = "low"
+LANES = (LANE_HIGH, LANE_NORMAL, LANE_LOW)  # 앞쪽 레인이 먼저 소비됨
+
+STAGE_DOWNLOAD = "download"  # 영상 다운로드, 댓글/메타 수집
+STAGE_LLM = "llm"  # Gemini Pass 1
+STAGE_CV = "cv"  # CV Pass 2
+
+
+class PermanentJobError(Exception):
+    """재시도해도 결과가 같은 실패 (입력 오류, 댓글 게이트 등) - 즉시 failed 처리"""
+
+
+@dataclass
+class AnalysisJob:
+    """큐 작업 레코드 (시각은 epoch 초)"""
+    job_id: str
+    kind: str
+    payload: Dict[str, Any]
+    lane: str = LANE_NORMAL
+    status: str = STATUS_QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    dedupe_key: Optional[str] = None
+    available_at: float = 0.0
+    lease_until: Optional[float] = None
+    worker_id: Optional[str] = None
+    last_error: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_JOB_FIELDS = tuple(f.name for f in fields(AnalysisJob))
+
+
+def _lane_rank(lane: str) -> int:
+    return LANES.index(lane)
+
+
+def _ranked(lanes: Iterable[str]) -> List[str]:
+    return sorted(set(lanes), key=_lane_rank)
+
+
+def _check_lane(lane: str) -> str:
+    if lane not in LANES:
+        raise ValueError(f"Unknown lane: {lane} (expected one of {LANES})")
+    return lane
+
+
+def _new_job(
+    kind: str,
+    payload: Dict[str, Any],
+    lane: str,
+    dedupe_key: Optional[str],
+    max_attempts: int,
+    delay_sec: float,
+) -> AnalysisJob:
+    now = time.time()
+    return AnalysisJob(
+        job_id=uuid.uuid4().hex,
+        kind=kind,
+        payload=payload,
+        lane=_check_lane(lane),
+        max_attempts=max(1, max_attempts),
+        dedupe_key=dedupe_key,
+        available_at=now + delay_sec,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+# ============================================
+# Job Stores
+# ============================================
+
+class AnalysisJobStore(ABC):
+    """
+    작업 저장소 인터페이스 (동기 API - API 에서는 enqueue/get 만 호출)
+
+    complete / retry / fail / heartbeat 는 worker_id 가 현재 소유자일 때만 반영
+    → 리스 만료 후 다른 워커가 가져간 작업을 늦게 끝난 워커가 덮어쓰지 않음.
+    """
+
+    backend = "base"
+
+    @abstractmethod
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        *,
+        lane: str = LANE_NORMAL,
+        dedupe_key: Optional[str] = None,
+        max_attempts: int = 3,
+        delay_sec: float = 0.0,
+    ) -> AnalysisJob:
+        """작업 추가 (같은 dedupe_key 의 활성 작업이 있으면 그 작업 반환)"""
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str, lanes: Sequence[str], lease_sec: float) -> Optional[AnalysisJob]:
+        """실행 가능한 작업 1개를 레인 우선순위 → available_at 순으로 가져와 running 으로 전환"""
+        pass
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str, lease_sec: float) -> bool:
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def retry(self, job_id: str, worker_id: str, error: str, delay_sec: float) -> bool:
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        pass
+
+    @abstractmethod
+    def reclaim_expired(self) -> int:
+        """리스 만료된 running 작업 복구 (시도 횟수 남으면 retrying, 아니면 failed)"""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        pass
+
+    @abstractmethod
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """{"pending": {lane: n}, "running": {lane: n}} (pending = queued + retrying)"""
+        pass
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    lane_rank INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    dedupe_key TEXT,
+    available_at REAL NOT NULL,
+    lease_until REAL,
+    worker_id TEXT,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_analysis_jobs_claim ON analysis_jobs (status, lane_rank, available_at);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_analysis_jobs_active_dedupe ON analysis_jobs (dedupe_key)
+    WHERE dedupe_key IS NOT NULL AND status IN ('queued', 'retrying', 'running');
+"""
+
+
+class SQLiteAnalysisJobStore(AnalysisJobStore):
+    """
+    SQLite 저장소 (단일 호스트 - API/워커 프로세스가 같은 파일 공유)
+
+    호출마다 새 연결 (프로세스/스레드 간 공유 없음), WAL 모드로 읽기는 쓰기와 병행.
+    claim 은 BEGIN IMMEDIATE 로 직렬화 → 같은 작업을 두 워커가 가져가지 않음.
+    활성 작업 dedupe 는 부분 유니크 인덱스로 원자적으로 보장.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, busy_timeout_sec: float = 5.0):
+        self.path = path
+        self.busy_timeout_sec = busy_timeout_sec
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SQLITE_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout_sec, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> AnalysisJob:
+        values = {name: row[name] for name in _JOB_FIELDS}
+        values["payload"] = json.loads(values["payload"])
+        return AnalysisJob(**values)
+
+    def enqueue(self, kind, payload, *, lane=LANE_NORMAL, dedupe_key=None, max_attempts=3, delay_sec=0.0):
+        job = _new_job(kind, payload, lane, dedupe_key, max_attempts, delay_sec)
+        row = job.to_dict()
+        row["payload"] = json.dumps(payload, ensure_ascii=False, default=str)
+        row["lane_rank"] = _lane_rank(job.lane)
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{name}" for name in row)
+        for _ in range(3):  # dedupe 충돌 직후 기존 작업이 끝난 경우 재시도
+            with self._connect() as conn:
+                try:
+                    conn.execute(f"INSERT INTO analysis_jobs ({columns}) VALUES ({placeholders})", row)
+                    return job
+                except sqlite3.IntegrityError:
+                    existing = conn.execute(
+                        "SELECT * FROM analysis_jobs WHERE dedupe_key = ? AND status IN (?, ?, ?)",
+                        (dedupe_key, *ACTIVE_STATUSES),
+                    ).fetchone()
+                    if existing is not None:
+                        return self._to_job(existing)
+        raise RuntimeError(f"Could not enqueue {kind} job (dedupe_key={dedupe_key})")
+
+    def claim(self, worker_id, lanes, lease_sec):
+        lanes = _ranked(lanes)
+        if not lanes:
+            return None
+        now = time.time()
+        lane_marks = ", ".join("?" for _ in lanes)
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT * FROM analysis_jobs WHERE status IN (?, ?) AND available_at <= ? AND lane IN ({lane_marks})"
+                " ORDER BY lane_rank, available_at, created_at LIMIT 1",
+                (STATUS_QUEUED, STATUS_RETRYING, now, *lanes),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE analysis_jobs SET status = ?, attempts = attempts + 1, lease_until = ?, worker_id = ?,"
+                " updated_at = ? WHERE job_id = ?",
+                (STATUS_RUNNING, now + lease_sec, worker_id, now, row["job_id"]),
+            )
+            job = self._to_job(row)
+        job.status, job.attempts, job.lease_until, job.worker_id, job.updated_at = (
+            STATUS_RUNNING, job.attempts + 1, now + lease_sec, worker_id, now,
+        )
+        return job
+
+    def _update_owned(self, job_id: str, worker_id: str, assignments: str, params: tuple) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE analysis_jobs SET {assignments}, updated_at = ?"
+                " WHERE job_id = ? AND status = ? AND worker_id = ?",
+                (*params, time.time(), job_id, STATUS_RUNNING, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, job_id, worker_id, lease_sec):
+        return self._update_owned(job_id, worker_id, "lease_until = ?", (time.time() + lease_sec,))
+
+    def complete(self, job_id, worker_id):
+        return self._update_owned(
+            job_id, worker_id, "status = ?, lease_until = NULL, finished_at = ?",
+            (STATUS_SUCCEEDED, time.time()),
+        )
+
+    def retry(self, job_id, worker_id, error, delay_sec):
+        return self._update_owned(
+            job_id, worker_id, "status = ?, lease_until = NULL, available_at = ?, last_error = ?",
+            (STATUS_RETRYING, time.time() + delay_sec, error),
+        )
+
+    def fail(self, job_id, worker_id, error):
+        return self._update_owned(
+            job_id, worker_id, "status = ?, lease_until = NULL, last_error = ?, finished_at = ?",
+            (STATUS_FAILED, error, time.time()),
+        )
+
+    def reclaim_expired(self):
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE analysis_jobs SET"
+                " status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END,"
+                " finished_at = CASE WHEN attempts >= max_attempts THEN ? ELSE NULL END,"
+                " lease_until = NULL, available_at = ?, last_error = ?, updated_at = ?"
+                " WHERE status = ? AND lease_until < ?",
+                (STATUS_FAILED, STATUS_RETRYING, now, now, "lease expired (worker lost)", now, STATUS_RUNNING, now),
+            )
+            reclaimed = cursor.rowcount
+        if reclaimed:
+            logger.warning(f"Analysis queue: reclaimed {reclaimed} expired job(s)")
+        return reclaimed
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM analysis_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def counts(self):
+        result = {"pending": {lane: 0 for lane in LANES}, "running": {lane: 0 for lane in LANES}}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, lane, COUNT(*) AS n FROM analysis_jobs WHERE status IN (?, ?, ?) GROUP BY status, lane",
+                ACTIVE_STATUSES,
+            ).fetchall()
+        for row in rows:
+            bucket = "running" if row["status"] == STATUS_RUNNING else "pending"
+            result[bucket][row["lane"]] += row["n"]
+        return result
+
+
+def _encode(values: Dict[str, Any]) -> Dict[str, str]:
+    return {k: json.dumps(v, ensure_ascii=False, default=str) for k, v in values.items()}
+
+
+def _decode(raw: Dict[str, str]) -> Dict[str, Any]:
+    return {k: json.loads(v) for k, v in raw.items()}
+
+
+# Redis 상태 전환 스크립트 - 한 번의 EVALSHA 로 원자적으로 실행 (중간에 워커가 죽어도 작업이 어느
+# ZSET 에도 없는 상태가 생기지 않음). 해시 값은 필드별 JSON 이라 상태 비교도 JSON 문자열로.
+# 작업 해시 / 레인 키는 prefix 로 스크립트 안에서 조합 (단일 Redis 노드 기준, 클러스터 미지원)
+_LUA_HELPERS = """
+local prefix = ARGV[1]
+
+local function finish(job_id, running_key, retention_sec, fields)
+    local job_key = prefix .. ':job:' .. job_id
+    redis.call('HSET', job_key, unpack(fields))
+    redis.call('EXPIRE', job_key, retention_sec)
+    redis.call('ZREM', running_key, job_id)
+    local dedupe = cjson.decode(redis.call('HGET', job_key, 'dedupe_key') or 'null')
+    if type(dedupe) == 'string' then
+        local dedupe_key = prefix .. ':dedupe:' .. dedupe
+        if redis.call('GET', dedupe_key) == job_id then
+            redis.call('DEL', dedupe_key)
+        end
+    end
+end
+
+local function requeue(job_id, running_key, lane_key, available_at, fields)
+    redis.call('HSET', prefix .. ':job:' .. job_id, unpack(fields))
+    redis.call('ZREM', running_key, job_id)
+    redis.call('ZADD', lane_key, available_at, job_id)
+end
+
+local function is_active(status)
+    return status == ARGV[2] or status == ARGV[3] or status == ARGV[4]
+end
+"""
+
+# KEYS: job, lane, dedupe ('' = 없음) / ARGV: prefix, active x3, job_id, available_at, field, value, ...
+_LUA_ENQUEUE = _LUA_HELPERS + """
+if KEYS[3] ~= '' then
+    local existing = redis.call('GET', KEYS[3])
+    if existing and is_active(redis.call('HGET', prefix .. ':job:' .. existing, 'status')) then
+        return existing
+    end
+    redis.call('SET', KEYS[3], ARGV[5])  -- 새 키 또는 종료/유실된 작업의 잔여 키
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 7))
+redis.call('ZADD', KEYS[2], ARGV[6], ARGV[5])
+return ARGV[5]
+"""
+
+# KEYS: lane, running / ARGV: prefix, active x3, now, lease_until, field, value, ...
+_LUA_CLAIM = _LUA_HELPERS + """
+local job_id = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[5], 'LIMIT', 0, 1)[1]
+if not job_id then
+    return false
+end
+local job_key = prefix .. ':job:' .. job_id
+redis.call('ZREM', KEYS[1], job_id)
+redis.call('HSET', job_key, unpack(ARGV, 7))
+redis.call('HINCRBY', job_key, 'attempts', 1)
+redis.call('ZADD', KEYS[2], ARGV[6], job_id)
+return job_id
+"""
+
+# KEYS: job / ARGV: prefix, active x3, running, job_id, worker_id, action, score, retention_sec, field, value, ...
+# action: heartbeat (score = lease_until) | requeue (score = available_at) | finish
+_LUA_TRANSITION = _LUA_HELPERS + """
+local job_id = ARGV[6]
+if redis.call('HGET', KEYS[1], 'status') ~= ARGV[5] or redis.call('HGET', KEYS[1], 'worker_id') ~= ARGV[7] then
+    return 0
+end
+local lane = cjson.decode(redis.call('HGET', KEYS[1], 'lane'))
+local running_key = prefix .. ':running:' .. lane
+local fields = {unpack(ARGV, 11)}
+if ARGV[8] == 'heartbeat' then
+    redis.call('HSET', KEYS[1], unpack(fields))
+    redis.call('ZADD', running_key, 'XX', ARGV[9], job_id)
+elseif ARGV[8] == 'requeue' then
+    requeue(job_id, running_key, prefix .. ':lane:' .. lane, ARGV[9], fields)
+else
+    finish(job_id, running_key, ARGV[10], fields)
+end
+return 1
+"""
+
+# KEYS: running, lane / ARGV: prefix, active x3, job_id, now, retention_sec, failed fields count, failed..., retrying...
+_LUA_RECLAIM = _LUA_HELPERS + """
+local job_id = ARGV[5]
+local score = redis.call('ZSCORE', KEYS[1], job_id)
+if not score or tonumber(score) >= tonumber(ARGV[6]) then
+    return 0  -- 그 사이 하트비트로 연장됐거나 다른 워커가 이미 회수
+end
+local job_key = prefix .. ':job:' .. job_id
+if redis.call('EXISTS', job_key) == 0 then
+    redis.call('ZREM', KEYS[1], job_id)
+    return 0
+end
+local n = tonumber(ARGV[8])
+local attempts = tonumber(redis.call('HGET', job_key, 'attempts'))
+local max_attempts = tonumber(redis.call('HGET', job_key, 'max_attempts'))
+if attempts >= max_attempts then
+    finish(job_id, KEYS[1], ARGV[7], {unpack(ARGV, 9, 8 + n)})
+else
+    requeue(job_id, KEYS[1], KEYS[2], ARGV[6], {unpack(ARGV, 9 + n)})
+end
+return 1
+"""
+
+
+def _flatten(values: Dict[str, Any]) -> List[str]:
+    """{"field": value} → [field, json(value), ...] (Lua HSET 인자)"""
+    return [item for pair in _encode(values).items() for item in pair]
+
+
+class RedisAnalysisJobStore(AnalysisJobStore):
+    """
+    Redis 저장소 (여러 노드 공유)
+
+    - 작업: 해시 {prefix}:job:{id} (필드별 JSON), 종료 후 retention_sec 동안 보존
+    - 대기열: 레인별 ZSET {prefix}:lane:{lane} (score = available_at)
+    - 실행 중: 레인별 ZSET {prefix}:running:{lane} (score = lease_until)
+    - dedupe: {prefix}:dedupe:{key} → job_id
+
+    상태 전환 (enqueue / claim / 소유자 확인 후 heartbeat·완료·재시도 / 리스 회수) 은 모두
+    Lua 스크립트 한 번으로 실행 → 중간 실패로 작업이 고아가 되거나 중복 작업이 생기지 않음.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client: Any, prefix: str = "analysis_queue", retention_sec: int = 7 * 86400):
+        """
+        Args:
+            client: redis.Redis (decode_responses=True)
+            prefix: 키 접두사
+            retention_sec: 종료된 작업 레코드 보존 기간
+        """
+        self._redis = client
+        self.prefix = prefix
+        self.retention_sec = retention_sec
+        self._enqueue_script = client.register_script(_LUA_ENQUEUE)
+        self._claim_script = client.register_script(_LUA_CLAIM)
+        self._transition_script = client.register_script(_LUA_TRANSITION)
+        self._reclaim_script = client.register_script(_LUA_RECLAIM)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def _lane_key(self, lane: str) -> str:
+        return f"{self.prefix}:lane:{lane}"
+
+    def _running_key(self, lane: str) -> str:
+        return f"{self.prefix}:running:{lane}"
+
+    def _dedupe_key(self, key: str) -> str:
+        return f"{self.prefix}:dedupe:{key}"
+
+    def _args(self, *args: Any) -> List[Any]:
+        """스크립트 공통 선행 인자 (prefix, 활성 상태 JSON x3)"""
+        return [self.prefix, *(json.dumps(status) for status in ACTIVE_STATUSES), *args]
+
+    def enqueue(self, kind, payload, *, lane=LANE_NORMAL, dedupe_key=None, max_attempts=3, delay_sec=0.0):
+        job = _new_job(kind, payload, lane, dedupe_key, max_attempts, delay_sec)
+        job_id = self._enqueue_script(
+            keys=[self._job_key(job.job_id), self._lane_key(job.lane), self._dedupe_key(dedupe_key) if dedupe_key else ""],
+            args=self._args(job.job_id, job.available_at, *_flatten(job.to_dict())),
+        )
+        if job_id == job.job_id:
+            return job
+        return self.get(job_id) or job
+
+    def claim(self, worker_id, lanes, lease_sec):
+        now = time.time()
+        lease_until = now + lease_sec
+        fields = _flatten({
+            "status": STATUS_RUNNING, "lease_until": lease_until, "worker_id": worker_id, "updated_at": now,
+        })
+        for lane in _ranked(lanes):
+            job_id = self._claim_script(
+                keys=[self._lane_key(lane), self._running_key(lane)],
+                args=self._args(now, lease_until, *fields),
+            )
+            if job_id:
+                return self.get(job_id)
+        return None
+
+    def _transition(
+        self, job_id: str, worker_id: str, action: str, score: float, values: Dict[str, Any]
+    ) -> bool:
+        """worker_id 가 현재 소유자인 running 작업에만 적용 (확인 + 변경을 한 스크립트로)"""
+        return bool(self._transition_script(
+            keys=[self._job_key(job_id)],
+            args=self._args(
+                json.dumps(STATUS_RUNNING), job_id, json.dumps(worker_id, ensure_ascii=False),
+                action, score, self.retention_sec, *_flatten({**values, "updated_at": time.time()}),
+            ),
+        ))
+
+    def heartbeat(self, job_id, worker_id, lease_sec):
+        lease_until = time.time() + lease_sec
+        return self._transition(job_id, worker_id, "heartbeat", lease_until, {"lease_until": lease_until})
+
+    def complete(self, job_id, worker_id):
+        return self._transition(job_id, worker_id, "finish", 0, {
+            "status": STATUS_SUCCEEDED, "lease_until": None, "finished_at": time.time(),
+        })
+
+    def retry(self, job_id, worker_id, error, delay_sec):
+        available_at = time.time() + delay_sec
+        return self._transition(job_id, worker_id, "requeue", available_at, {
+            "status": STATUS_RETRYING, "lease_until": None, "last_error": error, "available_at": available_at,
+        })
+
+    def fail(self, job_id, worker_id, error):
+        return self._transition(job_id, worker_id, "finish", 0, {
+            "status": STATUS_FAILED, "lease_until": None, "last_error": error, "finished_at": time.time(),
+        })
+
+    def reclaim_expired(self):
+        now = time.time()
+        error = "lease expired (worker lost)"
+        failed = _flatten({
+            "status": STATUS_FAILED, "lease_until": None, "last_error": error, "finished_at": now, "updated_at": now,
+        })
+        retrying = _flatten({
+            "status": STATUS_RETRYING, "lease_until": None, "last_error": error, "available_at": now, "updated_at": now,
+        })
+        reclaimed = 0
+        for lane in LANES:
+            for job_id in self._redis.zrangebyscore(self._running_key(lane), "-inf", now):
+                reclaimed += self._reclaim_script(
+                    keys=[self._running_key(lane), self._lane_key(lane)],
+                    args=self._args(job_id, now, self.retention_sec, len(failed), *failed, *retrying),
+                )
+        if reclaimed:
+            logger.warning(f"Analysis queue: reclaimed {reclaimed} expired job(s)")
+        return reclaimed
+
+    def get(self, job_id):
+        if not job_id:
+            return None
+        raw = self._redis.hgetall(self._job_key(job_id))
+        if not raw:
+            return None
+        values = _decode(raw)
+        return AnalysisJob(**{k: v for k, v in values.items() if k in _JOB_FIELDS})
+
+    def counts(self):
+        pipe = self._redis.pipeline()
+        for lane in LANES:
+            pipe.zcard(self._lane_key(lane))
+            pipe.zcard(self._running_key(lane))
+        values = pipe.execute()
+        return {
+            "pending": {lane: values[2 * i] for i, lane in enumerate(LANES)},
+            "running": {lane: values[2 * i + 1] for i, lane in enumerate(LANES)},
+        }
+
+
+# ============================================
+# Stage Limiter (download / llm / cv)
+# ============================================
+
+class StageLimiter:
+    """
+    스테이지별 동시 실행 수 제한 (프로세스 단위)
+
+    VDG 파이프라인은 다운로드는 이벤트 루프에서, Pass 1/2 는 executor 스레드에서 돌기 때문에
+    threading 세마포어 하나로 두 경로를 모두 제한:
+    - slot(stage): 동기 (executor 스레드)
+    - aslot(stage): 비동기 - 논블로킹 acquire 폴링 (취소돼도 슬롯 누수 없음)
+    제한이 없는 스테이지 이름은 통과.
+    """
+
+    def __init__(self, limits: Dict[str, int], poll_interval_sec: float = 0.05):
+        self.limits = {stage: max(1, n) for stage, n in limits.items()}
+        self.poll_interval_sec = poll_interval_sec
+        self._semaphores = {stage: threading.BoundedSemaphore(n) for stage, n in self.limits.items()}
+        self._lock = threading.Lock()
+        self.active = {stage: 0 for stage in self.limits}
+        self.waiting = {stage: 0 for stage in self.limits}
+
+    def _count(self, counter: Dict[str, int], stage: str, delta: int) -> None:
+        with self._lock:
+            counter[stage] += delta
+
+    @contextmanager
+    def slot(self, stage: str):
+        semaphore = self._semaphores.get(stage)
+        if semaphore is None:
+            yield
+            return
+        self._count(self.waiting, stage, 1)
+        try:
+            semaphore.acquire()
+        finally:
+            self._count(self.waiting, stage, -1)
+        self._count(self.active, stage, 1)
+        try:
+            yield
+        finally:
+            self._count(self.active, stage, -1)
+            semaphore.release()
+
+    @asynccontextmanager
+    async def aslot(self, stage: str):
+        semaphore = self._semaphores.get(stage)
+        if semaphore is None:
+            yield
+            return
+        self._count(self.waiting, stage, 1)
+        try:
+            while not semaphore.acquire(blocking=False):
+                await asyncio.sleep(self.poll_interval_sec)
+        finally:
+            self._count(self.waiting, stage, -1)
+        self._count(self.active, stage, 1)
+        try:
+            yield
+        finally:
+            self._count(self.active, stage, -1)
+            semaphore.release()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                stage: {"limit": limit, "active": self.active[stage], "waiting": self.waiting[stage]}
+                for stage, limit in self.limits.items()
+            }
+
+
+# ============================================
+# Worker
+# ============================================
+
+def resolve_handler(kind: str, handlers: Optional[Dict[str, Union[str, Callable]]] = None) -> Callable:
+    """kind → 핸들러 ("module:function" 은 지연 import)"""
+    target = (handlers if handlers is not None else JOB_HANDLERS).get(kind)
+    if target is None:
+        raise PermanentJobError(f"No handler registered for job kind '{kind}'")
+    if callable(target):
+        return target
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+@dataclass
+class AnalysisWorkerStats:
+    """워커 누적 통계"""
+    claimed: int = 0
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+    running: int = 0
+    last_error: Optional[str] = None
+    kinds: Dict[str, int] = field(default_factory=dict)
+
+
+class AnalysisWorker:
+    """
+    큐 소비 워커 (전용 프로세스에서 실행 - scripts/run_analysis_worker.py)
+
+    concurrency 개까지 작업을 동시에 실행하고, 실행 중 작업의 리스를 lease_sec/3 마다 연장.
+    저장소 호출은 to_thread 로 넘겨 파이프라인 이벤트 루프 (GenAI 게이트웨이) 를 막지 않음.
+    """
+
+    def __init__(
+        self,
+        store: AnalysisJobStore,
+        *,
+        concurrency: int = 4,
+        lanes: Sequence[str] = LANES,
+        lease_sec: float = 900.0,
+        poll_interval_sec: float = 1.0,
+        retry_base_sec: float = 60.0,
+        handlers: Optional[Dict[str, Union[str, Callable]]] = None,
+        worker_id: Optional[str] = None,
+    ):
+        self.store = store
+        self.concurrency = max(1, concurrency)
+        self.lanes = _ranked(_check_lane(lane) for lane in lanes)
+        self.lease_sec = lease_sec
+        self.poll_interval_sec = poll_interval_sec
+        self.retry_base_sec = retry_base_sec
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{WORKER_ID}:{uuid.uuid4().hex[:6]}"
+        self.stats = AnalysisWorkerStats()
+        self._tasks: set = set()
+        self._stopping = False
+
+    def stop(self) -> None:
+        """새 작업 수령 중단 (실행 중 작업은 끝까지 실행)"""
+        self._stopping = True
+
+    async def run(self) -> None:
+        """stop() 까지 폴링하며 실행"""
+        logger.info(f"Analysis worker {self.worker_id} started (concurrency={self.concurrency}, lanes={self.lanes})")
+        reclaim_interval = max(self.poll_interval_sec, min(60.0, self.lease_sec / 2))
+        last_reclaim = 0.0
+        while not self._stopping:
+            if time.monotonic() - last_reclaim >= reclaim_interval:
+                last_reclaim = time.monotonic()
+                await asyncio.to_thread(self.store.reclaim_expired)
+            await self._fill()
+            await asyncio.sleep(self.poll_interval_sec)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"Analysis worker {self.worker_id} stopped")
+
+    async def drain(self) -> None:
+        """지금 실행 가능한 작업을 모두 처리하고 반환 (백오프 대기 작업은 제외)"""
+        await asyncio.to_thread(self.store.reclaim_expired)
+        while True:
+            await self._fill()
+            if not self._tasks:
+                return
+            await asyncio.wait(set(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+
+    async def _fill(self) -> None:
+        while len(self._tasks) < self.concurrency and not self._stopping:
+            job = await asyncio.to_thread(self.store.claim, self.worker_id, self.lanes, self.lease_sec)
+            if job is None:
+                return
+            self.stats.claimed += 1
+            self.stats.kinds[job.kind] = self.stats.kinds.get(job.kind, 0) + 1
+            task = asyncio.create_task(self._execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _heartbeat(self, job: AnalysisJob) -> None:
+        while True:
+            await asyncio.sleep(self.lease_sec / 3)
+            if not await asyncio.to_thread(self.store.heartbeat, job.job_id, self.worker_id, self.lease_sec):
+                logger.warning(f"Analysis job {job.job_id} lease lost")
+                return
+
+    async def _execute(self, job: AnalysisJob) -> None:
+        self.stats.running += 1
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        started = time.monotonic()
+        try:
+            result = resolve_handler(job.kind, self.handlers)(**job.payload)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"[:500]
+            self.stats.last_error = error
+            if isinstance(e, PermanentJobError) or job.attempts >= job.max_attempts:
+                self.stats.failed += 1
+                logger.error(f"Analysis job {job.job_id} ({job.kind}) failed after {job.attempts} attempt(s): {error}")
+                await asyncio.to_thread(self.store.fail, job.job_id, self.worker_id, error)
+            else:
+                delay = self.retry_base_sec * 2 ** (job.attempts - 1)
+                self.stats.retried += 1
+                logger.warning(f"Analysis job {job.job_id} ({job.kind}) attempt {job.attempts} failed, retry in {delay:.0f}s: {error}")
+                await asyncio.to_thread(self.store.retry, job.job_id, self.worker_id, error, delay)
+        else:
+            self.stats.succeeded += 1
+            logger.info(f"Analysis job {job.job_id} ({job.kind}) done in {time.monotonic() - started:.1f}s")
+            await asyncio.to_thread(self.store.complete, job.job_id, self.worker_id)
+        finally:
+            heartbeat.cancel()
+            self.stats.running -= 1
+
+
+# Singleton instance
+_analysis_queue: Optional[AnalysisJobStore] = None
+_stage_limiter: Optional[StageLimiter] = None
+
+
+def get_analysis_queue() -> AnalysisJobStore:
+    """
+    싱글톤 AnalysisJobStore 반환
+
+    ANALYSIS_QUEUE_BACKEND=redis 이면 Redis (연결 실패 시 SQLite 로 폴백 + 경고),
+    그 외에는 SQLiteAnalysisJobStore (ANALYSIS_QUEUE_SQLITE_PATH).
+    """
+    global _analysis_queue
+    if _analysis_queue is None:
+        from app.config import settings
+
+        if settings.ANALYSIS_QUEUE_BACKEND == "redis":
+            try:
+                import redis
+                client = redis.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    decode_responses=True,
+                    socket_timeout=2.0,
+                )
+                client.ping()
+                _analysis_queue = RedisAnalysisJobStore(client)
+                logger.info(f"Analysis queue: Redis ({settings.REDIS_HOST}:{settings.REDIS_PORT})")
+            except Exception as e:
+                logger.warning(f"Analysis queue: Redis unavailable, using SQLite ({e})")
+        if _analysis_queue is None:
+            _analysis_queue = SQLiteAnalysisJobStore(settings.ANALYSIS_QUEUE_SQLITE_PATH)
+    return _analysis_queue
+
+
+def get_stage_limiter() -> StageLimiter:
+    """싱글톤 StageLimiter 반환 (ANALYSIS_STAGE_*_CONCURRENCY)"""
+    global _stage_limiter
+    if _stage_limiter is None:
+        from app.config import settings
+
+        _stage_limiter = StageLimiter({
+            STAGE_DOWNLOAD: settings.ANALYSIS_STAGE_DOWNLOAD_CONCURRENCY,
+            STAGE_LLM: settings.ANALYSIS_STAGE_LLM_CONCURRENCY,
+            STAGE_CV: settings.ANALYSIS_STAGE_CV_CONCURRENCY,
+        })
+    return _stage_limiter
+
+
+def build_analysis_worker(**overrides: Any) -> AnalysisWorker:
+    """설정 기반 워커 생성 (overrides 가 우선)"""
+    from app.config import settings
+
+    options = {
+        "concurrency": settings.ANALYSIS_WORKER_CONCURRENCY,
+        "lease_sec": settings.ANALYSIS_QUEUE_LEASE_SEC,
+        "retry_base_sec": settings.ANALYSIS_QUEUE_RETRY_BASE_SEC,
+        **{k: v for k, v in overrides.items() if v is not None},
+    }
+    return AnalysisWorker(get_analysis_queue(), **options)
@@ -6,6 +6,7 @@ Gemini Live Audio Coach (L3: The Director)
 Blueprint Philosophy:
 - One-Command Priority Queue: Critical DNA > Technical Fail > High Impact > Minor Fix
 - Checkpoint-Based Rule Activation: time-based rule activation
+  (set_coaching_context 시 RuleIntervalIndex 로 컴파일 → 시간 t 조회는 이진 탐색)
 - DNA Lock: 모델이 바뀌어도 제약조건은 우리가 쥔다
 
 Hardening (H0-1 ~ H0-6):
@@ -43,6 +44,7 @@ from app.schemas.director_pack import (
     Policy,
     CoachLineTemplates
 )
+from app.services.rule_interval_index import PRIORITY_ORDER, RuleIntervalIndex
 from app.utils.time import utcnow
 
 logging.basicConfig(level=logging.INFO)
@@ -51,9 +53,6 @@ logger = logging.getLogger(__name__)
 # 오디오 전용 Live API 모델 (2025 Latest)
 LIVE_MODEL = "gemini-2.5-flash-native-audio-latest"
 
-# Priority order for One-Command Queue
-PRIORITY_ORDER = ["critical", "high", "medium", "low"]
-
 
 # ==================
 # H0-5: Coaching Event Log
@@ -103,6 +102,7 @@ class AudioCoach:
         self.client = genai.Client(api_key=self.api_key)
         self._session = None
         self._director_pack: Optional[DirectorPack] = None
+        self._rule_index: Optional[RuleIntervalIndex] = None
         self._system_prompt: Optional[str] = None
         
         # Cooldown tracking
@@ -214,9 +214,11 @@ class AudioCoach:
         # Support both Pydantic and dict for backward compat
         if isinstance(director_pack, dict):
             self._director_pack = None
+            self._rule_index = None
             self._system_prompt = self._build_prompt_legacy(director_pack)
         else:
             self._director_pack = director_pack
+            self._rule_index = RuleIntervalIndex(director_pack)
             self._system_prompt = self._build_prompt_from_pack(director_pack)
             
             # Apply policy
@@ -348,84 +350,63 @@ class AudioCoach:
         if now - self._last_command_time < self._cooldown_sec:
             return None
         
-        # Get active rules based on checkpoints
+        # Get active rules based on checkpoints (이미 우선순위 정렬됨)
         active_rules = self._get_active_rules(current_time)
         
         if not active_rules:
             return None
         
         # Priority queue with H0-6 dedup
-        for priority in PRIORITY_ORDER:
-            for rule in active_rules:
-                if rule.priority == priority:
-                    # H0-6: Skip already delivered
-                    if rule.rule_id in self._delivered_rule_ids:
-                        continue
-                    
-                    self._last_command_time = now
-                    cmd = self._format_command(rule)
-                    
-                    # H0-5: Log the event
-                    self._coaching_log.append(CoachingEvent(
-                        rule_id=rule.rule_id,
-                        command=cmd,
-                        current_time=current_time,
-                        timestamp=utcnow(),
-                        tone=self._tone,
-                        priority=priority,
-                        checkpoint_id=self._get_current_checkpoint_id(current_time)
-                    ))
-                    
-                    # H0-6: Mark as delivered
-                    self._delivered_rule_ids.add(rule.rule_id)
-                    
-                    logger.info(f"📣 Command @ {current_time:.1f}s [{priority}]: {cmd[:30]}...")
-                    return cmd
+        for rule in active_rules:
+            if rule.priority not in PRIORITY_ORDER:
+                continue
+            # H0-6: Skip already delivered
+            if rule.rule_id in self._delivered_rule_ids:
+                continue
+            
+            self._last_command_time = now
+            cmd = self._format_command(rule)
+            
+            # H0-5: Log the event
+            self._coaching_log.append(CoachingEvent(
+                rule_id=rule.rule_id,
+                command=cmd,
+                current_time=current_time,
+                timestamp=utcnow(),
+                tone=self._tone,
+                priority=rule.priority,
+                checkpoint_id=self._get_current_checkpoint_id(current_time)
+            ))
+            
+            # H0-6: Mark as delivered
+            self._delivered_rule_ids.add(rule.rule_id)
+            
+            logger.info(f"📣 Command @ {current_time:.1f}s [{rule.priority}]: {cmd[:30]}...")
+            return cmd
         
         return None
     
     def _get_current_checkpoint_id(self, current_time: float) -> Optional[str]:
         """현재 checkpoint ID 반환"""
-        if not self._director_pack:
+        if not self._rule_index:
             return None
-        for cp in self._director_pack.checkpoints:
-            if cp.t_window[0] <= current_time <= cp.t_window[1]:
-                return cp.checkpoint_id
-        return None
+        return self._rule_index.checkpoint_id_at(current_time)
     
     def _get_active_rules(self, current_time: float) -> List[DNAInvariant]:
-        """Checkpoint 기반 규칙 활성화"""
-        if not self._director_pack:
-            return []
-        
-        # Find active checkpoints
-        active_checkpoints = [
-            cp for cp in self._director_pack.checkpoints
-            if cp.t_window[0] <= current_time <= cp.t_window[1]
-        ]
-        
-        # Collect active rule IDs
-        active_rule_ids = set()
-        for cp in active_checkpoints:
-            active_rule_ids.update(cp.active_rules)
+        """
+        Checkpoint 기반 규칙 활성화 (우선순위 정렬)
         
-        # If no checkpoints, use "overall" or all rules
-        if not active_rule_ids:
-            overall = next(
-                (cp for cp in self._director_pack.checkpoints if cp.checkpoint_id == "overall"),
-                None
-            )
-            if overall:
-                active_rule_ids.update(overall.active_rules)
-            else:
-                # Fallback: all rules active
-                return list(self._director_pack.dna_invariants)
-        
-        # Filter rules by active IDs
-        return [
-            r for r in self._director_pack.dna_invariants
-            if r.rule_id in active_rule_ids
-        ]
+        활성 checkpoint 의 active_rules 합집합, 없으면 "overall" checkpoint 또는 전체 규칙.
+        """
+        if not self._rule_index:
+            return []
+        return list(self._rule_index.active_rules_at(current_time))
+    
+    def get_time_scoped_rules(self, current_time: float) -> List[DNAInvariant]:
+        """time_scope.t_window 가 현재 시간을 포함하는 규칙 (프레임 분석용)"""
+        if not self._rule_index:
+            return []
+        return list(self._rule_index.scoped_rules_at(current_time))
     
     def _format_command(self, rule: DNAInvariant) -> str:
         """규칙 → 코칭 명령 포맷팅 (VDG 맞춤 메시지 우선)"""
@@ -745,10 +726,17 @@ class AudioCoach:
             logger.error(f"명령 전송 실패: {e}")
             return False
             
-    async def send_audio(self, pcm_data: bytes):
-        """오디오 입력 전송 (16-bit PCM, 16kHz, mono)"""
+    async def send_audio(self, pcm_data: Union[bytes, memoryview]):
+        """
+        오디오 입력 전송 (16-bit PCM, 16kHz, mono)
+
+        binary WebSocket 모드는 수신 버퍼 memoryview 를 그대로 넘기고,
+        SDK Blob 이 bytes 만 받으므로 여기서 한 번만 materialize.
+        """
         if not self._session:
             raise RuntimeError("연결 안됨")
+        if not isinstance(pcm_data, bytes):
+            pcm_data = bytes(pcm_data)
         await self._session.send_realtime_input(
             audio={"data": pcm_data, "mime_type": "audio/pcm"}
         )
@@ -802,6 +790,7 @@ async def test_hardened_coach():
     # 2. Test hardened features (no API key needed)
     coach = AudioCoach.__new__(AudioCoach)
     coach._director_pack = pack
+    coach._rule_index = RuleIntervalIndex(pack)
     coach._system_prompt = "test"
     coach._cooldown_sec = 2.0
     coach._tone = "friendly"
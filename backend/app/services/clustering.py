@@ -211,7 +211,8 @@ class PatternClusteringService:
         max_len = max(n, m)
         return max(0.0, 1.0 - (dist / max_len))
 
-    def _normalize_schema(self, schema) -> dict:
+    @staticmethod
+    def _normalize_schema(schema) -> dict:
         """스키마 형태를 통일 (VideoAnalysisSchema / VDG / dict 지원)"""
         if hasattr(schema, "model_dump"):
             payload = schema.model_dump()
@@ -443,12 +444,15 @@ async def create_similarity_based_edges(
     child_schema: VideoAnalysisSchema,
     similarity_threshold: float = 0.70,
     max_edges: int = 5,
+    candidate_pool: int = 200,
 ) -> List[Tuple[str, float]]:
     """
     유사도 기반으로 VDGEdge candidate 생성 (PEGL v1.0)
     
     새로 분석된 콘텐츠와 기존 Parent 후보들 사이의 유사도를 계산하여
     임계값 이상인 경우 VDGEdge candidate를 생성합니다.
+    후보는 전체 코퍼스 대상 VDGVectorIndex top-k 로 추리고,
+    BatchSimilarityEngine 의 정확한 유사도로 재정렬합니다.
     
     Args:
         db: DB 세션
@@ -456,48 +460,43 @@ async def create_similarity_based_edges(
         child_schema: 새 노드의 분석 스키마
         similarity_threshold: Edge 생성 임계값 (기본 0.70)
         max_edges: 최대 생성할 Edge 수 (기본 5)
+        candidate_pool: ANN 인덱스에서 가져올 후보 수 (기본 200)
         
     Returns:
         [(parent_node_id, confidence), ...] 생성된 Edge 정보
     """
     from app.services.vdg_edge_service import VDGEdgeService
+    from app.services.similarity_engine import BatchSimilarityEngine
+    from app.services.vdg_vector_index import vdg_vector_index
     from uuid import UUID
     
-    service = PatternClusteringService(db)
     edge_service = VDGEdgeService(db)
     
-    # Parent 후보 조회 (분석 스키마가 있는 RemixNode)
-    result = await db.execute(
-        select(RemixNode)
-        .where(RemixNode.gemini_analysis.isnot(None))
-        .where(RemixNode.id != child_node_id)  # 자기 자신 제외
-        .order_by(RemixNode.created_at.desc())
-        .limit(100)  # 최근 100개만 비교
+    # Parent 후보 조회: 다른 워커가 추가한 노드 반영 후 ANN top-k (자기 자신 제외)
+    await vdg_vector_index.sync_from_db(db)
+    ann_candidates = vdg_vector_index.query(
+        child_schema, k=candidate_pool, exclude=str(child_node_id)
     )
-    parent_candidates = result.scalars().all()
-    
-    # 유사도 계산 및 정렬
-    scored_parents = []
-    for parent in parent_candidates:
-        try:
-            parent_schema = parent.gemini_analysis
-            if not parent_schema:
-                continue
-            
-            score = service.calculate_similarity(child_schema, parent_schema)
-            if score >= similarity_threshold:
-                scored_parents.append((parent, score))
-        except Exception as e:
-            logger.warning(f"Similarity calculation failed for {parent.id}: {e}")
-            continue
+    parent_candidates = []
+    if ann_candidates:
+        result = await db.execute(
+            select(RemixNode.id, RemixNode.gemini_analysis)
+            .where(RemixNode.id.in_([UUID(key) for key, _ in ann_candidates]))
+            .where(RemixNode.gemini_analysis.isnot(None))
+        )
+        parent_candidates = [(row.id, row.gemini_analysis) for row in result.all() if row.gemini_analysis]
     
-    # 점수순 정렬
-    scored_parents.sort(key=lambda x: x[1], reverse=True)
-    scored_parents = scored_parents[:max_edges]
+    # 유사도 일괄 계산 및 정렬
+    engine = BatchSimilarityEngine()
+    engine.add_many(
+        [parent_id for parent_id, _ in parent_candidates],
+        [schema for _, schema in parent_candidates],
+    )
+    scored_parents = engine.top_k(child_schema, k=max_edges, threshold=similarity_threshold)
     
     # VDGEdge candidate 생성
     created_edges = []
-    for parent, score in scored_parents:
+    for parent_id, score in scored_parents:
         try:
             # Edge 타입 결정 (유사도 기준)
             if score >= 0.85:
@@ -508,7 +507,7 @@ async def create_similarity_based_edges(
                 edge_type = VDGEdgeType.INSPIRED_BY
             
             edge = await edge_service.create_candidate_edge(
-                parent_node_id=parent.id,
+                parent_node_id=parent_id,
                 child_node_id=UUID(str(child_node_id)) if not isinstance(child_node_id, UUID) else child_node_id,
                 edge_type=edge_type,
                 confidence=score,
@@ -518,12 +517,15 @@ async def create_similarity_based_edges(
                     "threshold": similarity_threshold,
                 }
             )
-            created_edges.append((str(parent.id), score))
-            logger.info(f"Created candidate edge: {parent.id} -> {child_node_id} (confidence={score:.2f})")
+            created_edges.append((str(parent_id), score))
+            logger.info(f"Created candidate edge: {parent_id} -> {child_node_id} (confidence={score:.2f})")
         except Exception as e:
-            logger.warning(f"Failed to create edge for {parent.id}: {e}")
+            logger.warning(f"Failed to create edge for {parent_id}: {e}")
     
     await db.commit()
     
-    logger.info(f"Created {len(created_edges)} similarity-based VDGEdge candidates for {child_node_id}")
+    logger.info(
+        f"Created {len(created_edges)} similarity-based VDGEdge candidates for {child_node_id} "
+        f"({len(engine)} candidates scored)"
+    )
     return created_edges
@@ -9,15 +9,20 @@ v1.1 Hardening:
 - Finalize session with per-rule stats
 - Error handling
 
+세션 로그 / 쿨다운은 SessionRegistry 에 저장 (여러 워커가 같은 세션을 이어서 처리 가능)
+- 세션 레코드 (session, upload_outcome, 집계) 는 레코드 1개
+- 개입 / 결과는 이벤트마다 append → 쓰기 O(1), 워커 간 동시 기록 유실 없음
+- SessionCompleteLog 는 읽을 때 조립
+
 Usage:
     service = get_coaching_service()
-    session = service.start_session(
+    session = await service.start_session(
         user_id_hash="abc123",
         mode="homage"
     )
     
     # Evaluate using MetricEvaluator
-    result = service.evaluate_with_evaluator(
+    result = await service.evaluate_with_evaluator(
         session_id=session.session_id,
         rule_id="hook_start_within_2s_v1",
         t_sec=1.5,
@@ -43,6 +48,14 @@ from app.services.proof_patterns import (
     PatternValidator
 )
 from app.services.coaching_router import get_coaching_router
+from app.services.session_registry import (
+    NS_COOLDOWNS,
+    NS_SESSION_INTERVENTIONS,
+    NS_SESSION_LOGS,
+    NS_SESSION_OUTCOMES,
+    LocalSessionRegistry,
+    SessionRegistry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,37 +75,70 @@ class CoachingSessionService:
     
     DEFAULT_COOLDOWN_SEC = 4.0
     
-    def __init__(self):
-        self._sessions: Dict[str, SessionCompleteLog] = {}
+    def __init__(self, registry: Optional[SessionRegistry] = None, ttl_sec: Optional[int] = None):
+        """
+        Args:
+            registry: 세션 로그 저장소 (기본: 이 인스턴스 전용 LocalSessionRegistry)
+            ttl_sec: 세션 로그 보존 기간 (None = 무기한)
+        """
+        self._registry = registry or LocalSessionRegistry()
+        self._ttl_sec = ttl_sec
         self._router = get_coaching_router()
         self._evaluator = get_metric_evaluator()
-        
-        # Cooldown tracking: {session_id: {rule_id: last_intervention_time}}
-        self._cooldowns: Dict[str, Dict[str, float]] = {}
     
-    def _can_intervene(self, session_id: str, rule_id: str, t_sec: float) -> bool:
+    async def _load_session(self, session_id: str) -> Optional[SessionLog]:
+        raw = await self._registry.get(NS_SESSION_LOGS, session_id)
+        return SessionLog.model_validate(raw["session"]) if raw else None
+    
+    async def _load_interventions(self, session_id: str) -> List[InterventionEvent]:
+        return [
+            InterventionEvent.model_validate(raw)
+            for raw in await self._registry.items(NS_SESSION_INTERVENTIONS, session_id)
+        ]
+    
+    async def _load(self, session_id: str) -> Optional[SessionCompleteLog]:
+        """세션 레코드 + 개입/결과 이벤트 리스트 → SessionCompleteLog 조립"""
+        raw = await self._registry.get(NS_SESSION_LOGS, session_id)
+        if raw is None:
+            return None
+        return SessionCompleteLog.model_validate({
+            **raw,
+            "interventions": await self._registry.items(NS_SESSION_INTERVENTIONS, session_id),
+            "outcomes": await self._registry.items(NS_SESSION_OUTCOMES, session_id),
+        })
+    
+    async def _save(self, complete_log: SessionCompleteLog) -> None:
+        """세션 레코드 저장 (개입/결과는 _append 로만 기록)"""
+        await self._registry.put(
+            NS_SESSION_LOGS,
+            complete_log.session.session_id,
+            complete_log.model_dump(mode="json", exclude={"interventions", "outcomes"}),
+            ttl_sec=self._ttl_sec,
+        )
+    
+    async def _append(self, ns: str, session_id: str, event) -> None:
+        await self._registry.append(ns, session_id, event.model_dump(mode="json"), ttl_sec=self._ttl_sec)
+    
+    async def _can_intervene(self, session_id: str, rule_id: str, t_sec: float) -> bool:
         """Check if cooldown has passed for this rule."""
-        if session_id not in self._cooldowns:
-            return True
-        
-        session_cooldowns = self._cooldowns[session_id]
+        # Cooldown tracking: {session_id: {rule_id: last_intervention_time}}
+        session_cooldowns = await self._registry.get(NS_COOLDOWNS, session_id) or {}
         if rule_id not in session_cooldowns:
             return True
         
         last_time = session_cooldowns[rule_id]
         return (t_sec - last_time) >= self.DEFAULT_COOLDOWN_SEC
     
-    def _update_cooldown(self, session_id: str, rule_id: str, t_sec: float):
+    async def _update_cooldown(self, session_id: str, rule_id: str, t_sec: float):
         """Update cooldown tracking."""
-        if session_id not in self._cooldowns:
-            self._cooldowns[session_id] = {}
-        self._cooldowns[session_id][rule_id] = t_sec
+        if not await self._registry.update(NS_COOLDOWNS, session_id, {rule_id: t_sec}):
+            await self._registry.put(NS_COOLDOWNS, session_id, {rule_id: t_sec}, ttl_sec=self._ttl_sec)
     
     # ====================
     # SESSION LIFECYCLE
     # ====================
     
-    def start_session(
+    async def start_session(
         self,
         user_id_hash: str,
         mode: Literal["homage", "mutation", "campaign"],
@@ -132,22 +178,22 @@ class CoachingSessionService:
             started_at=utcnow()
         )
         
-        # Store in memory (TODO: persist to DB)
-        self._sessions[session_id] = SessionCompleteLog(session=session)
+        # Store in shared registry (TODO: persist to DB)
+        await self._save(SessionCompleteLog(session=session))
         
         return session
     
-    def end_session(self, session_id: str) -> Optional[SessionCompleteLog]:
+    async def end_session(self, session_id: str) -> Optional[SessionCompleteLog]:
         """
         End a session and calculate metrics.
         
         Returns:
             Complete session log with aggregated metrics
         """
-        if session_id not in self._sessions:
+        complete_log = await self._load(session_id)
+        if complete_log is None:
             return None
         
-        complete_log = self._sessions[session_id]
         session = complete_log.session
         
         # Update end time
@@ -177,13 +223,19 @@ class CoachingSessionService:
         except Exception as e:
             logger.warning(f"STPF learning failed for session {session_id}: {e}")
         
+        # upload_outcome 은 다른 워커가 필드 단위로 갱신할 수 있어 제외
+        await self._registry.update(
+            NS_SESSION_LOGS,
+            session_id,
+            complete_log.model_dump(mode="json", exclude={"interventions", "outcomes", "upload_outcome"}),
+        )
         return complete_log
     
     # ====================
     # RULE EVALUATION
     # ====================
     
-    def evaluate_rule(
+    async def evaluate_rule(
         self,
         session_id: str,
         rule_id: str,
@@ -206,12 +258,10 @@ class CoachingSessionService:
         Returns:
             InterventionEvent if rule violated, None otherwise
         """
-        if session_id not in self._sessions:
+        session = await self._load_session(session_id)
+        if session is None:
             return None
         
-        complete_log = self._sessions[session_id]
-        session = complete_log.session
-        
         # Skip if control group
         if session.assignment == "control":
             return None
@@ -242,7 +292,7 @@ class CoachingSessionService:
             metric_threshold=spec.target
         )
         
-        complete_log.interventions.append(intervention)
+        await self._append(NS_SESSION_INTERVENTIONS, session_id, intervention)
         return intervention
     
     def _check_violation(self, spec, value: float) -> bool:
@@ -268,7 +318,7 @@ class CoachingSessionService:
     # OUTCOME RECORDING
     # ====================
     
-    def record_outcome(
+    async def record_outcome(
         self,
         session_id: str,
         rule_id: str,
@@ -293,14 +343,12 @@ class CoachingSessionService:
         Returns:
             OutcomeEvent
         """
-        if session_id not in self._sessions:
+        if await self._load_session(session_id) is None:
             return None
         
-        complete_log = self._sessions[session_id]
-        
         # Calculate latency from last intervention
         last_intervention = None
-        for i in reversed(complete_log.interventions):
+        for i in reversed(await self._load_interventions(session_id)):
             if i.rule_id == rule_id:
                 last_intervention = i
                 break
@@ -323,10 +371,10 @@ class CoachingSessionService:
             latency_sec=latency_sec
         )
         
-        complete_log.outcomes.append(outcome)
+        await self._append(NS_SESSION_OUTCOMES, session_id, outcome)
         return outcome
     
-    def record_upload_outcome(
+    async def record_upload_outcome(
         self,
         session_id: str,
         uploaded: bool,
@@ -337,7 +385,7 @@ class CoachingSessionService:
         self_rating: Optional[int] = None
     ) -> Optional[UploadOutcome]:
         """Record upload result for session."""
-        if session_id not in self._sessions:
+        if await self._load_session(session_id) is None:
             return None
         
         outcome = UploadOutcome(
@@ -348,16 +396,18 @@ class CoachingSessionService:
             self_rating=self_rating
         )
         
-        self._sessions[session_id].upload_outcome = outcome
+        await self._registry.update(
+            NS_SESSION_LOGS, session_id, {"upload_outcome": outcome.model_dump(mode="json")}
+        )
         return outcome
     
     # ====================
     # GETTERS
     # ====================
     
-    def get_session(self, session_id: str) -> Optional[SessionCompleteLog]:
+    async def get_session(self, session_id: str) -> Optional[SessionCompleteLog]:
         """Get complete session log."""
-        return self._sessions.get(session_id)
+        return await self._load(session_id)
     
     def get_active_patterns(self) -> List[str]:
         """Get list of active proof pattern IDs."""
@@ -387,5 +437,10 @@ def get_coaching_service() -> CoachingSessionService:
     """Get singleton coaching session service."""
     global _service_instance
     if _service_instance is None:
-        _service_instance = CoachingSessionService()
+        from app.config import settings
+        from app.services.session_registry import get_session_registry
+        _service_instance = CoachingSessionService(
+            registry=get_session_registry(),
+            ttl_sec=settings.COACHING_SESSION_TTL_SEC,
+        )
     return _service_instance
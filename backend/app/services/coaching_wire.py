@@ -0,0 +1,106 @@
+"""
+Coaching WebSocket Binary Sub-protocol (v1)
+
+기존 JSON 모드: 오디오 {"type": "audio", "data": "<base64>"}, 영상 {"type": "video_frame", "frame_b64": ...}
+→ base64 로 대역폭 +33%, 청크마다 JSON 파싱 + base64 디코드.
+
+Binary 모드 (연결 시 협상):
+- Sec-WebSocket-Protocol: coaching.binary.v1  (또는 ?wire=binary)
+- 오디오/영상은 binary 메시지: 20-byte 헤더 + raw payload
+- control / ping / metric 등 나머지 메시지는 그대로 JSON text
+
+Header (little-endian, struct "<BBHIIQ"):
+    version      u8   = 1
+    kind         u8   1=audio PCM16 16kHz mono, 2=video JPEG, 3=video H.264, 4=video PNG
+    flags        u16  (reserved)
+    seq          u32  클라이언트 시퀀스 번호
+    t_ms         u32  녹화 시점 (ms)
+    client_ts_ms u64  클라이언트 전송 시각 (epoch ms, 0 = 없음) → frame_ack 에 에코
+
+Payload 는 수신 버퍼 위 memoryview (복사 없음).
+"""
+import struct
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+
+WIRE_JSON = "json"
+WIRE_BINARY = "binary"
+BINARY_SUBPROTOCOL = "coaching.binary.v1"
+
+WIRE_VERSION = 1
+HEADER_STRUCT = struct.Struct("<BBHIIQ")
+HEADER_SIZE = HEADER_STRUCT.size  # 20
+
+KIND_AUDIO_PCM16 = 1
+KIND_VIDEO_JPEG = 2
+KIND_VIDEO_H264 = 3
+KIND_VIDEO_PNG = 4
+
+VIDEO_CODECS = {
+    KIND_VIDEO_JPEG: "jpeg",
+    KIND_VIDEO_H264: "h264",
+    KIND_VIDEO_PNG: "png",
+}
+
+
+class WireProtocolError(ValueError):
+    """binary 메시지 형식 오류"""
+
+
+@dataclass(frozen=True)
+class BinaryFrameHeader:
+    version: int
+    kind: int
+    flags: int
+    seq: int
+    t_ms: int
+    client_ts_ms: int
+
+    @property
+    def is_audio(self) -> bool:
+        return self.kind == KIND_AUDIO_PCM16
+
+    @property
+    def codec(self) -> Optional[str]:
+        return VIDEO_CODECS.get(self.kind)
+
+
+def negotiate_wire(offered_subprotocols: Iterable[str], wire_param: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    연결 시 wire 모드 결정
+
+    Returns:
+        (wire, accept 할 subprotocol 또는 None)
+    """
+    if BINARY_SUBPROTOCOL in (offered_subprotocols or ()):
+        return WIRE_BINARY, BINARY_SUBPROTOCOL
+    if (wire_param or "").lower() == WIRE_BINARY:
+        return WIRE_BINARY, None
+    return WIRE_JSON, None
+
+
+def parse_binary_message(data: bytes) -> Tuple[BinaryFrameHeader, memoryview]:
+    """binary 메시지 → (헤더, payload memoryview)"""
+    if len(data) < HEADER_SIZE:
+        raise WireProtocolError(f"binary message too short: {len(data)} bytes")
+
+    view = memoryview(data)
+    header = BinaryFrameHeader(*HEADER_STRUCT.unpack_from(view))
+    if header.version != WIRE_VERSION:
+        raise WireProtocolError(f"unsupported wire version: {header.version}")
+    if header.kind != KIND_AUDIO_PCM16 and header.kind not in VIDEO_CODECS:
+        raise WireProtocolError(f"unknown payload kind: {header.kind}")
+    return header, view[HEADER_SIZE:]
+
+
+def pack_binary_message(
+    kind: int,
+    payload: bytes,
+    seq: int = 0,
+    t_ms: int = 0,
+    client_ts_ms: int = 0,
+    flags: int = 0,
+) -> bytes:
+    """헤더 + payload (클라이언트 / 테스트용)"""
+    return HEADER_STRUCT.pack(WIRE_VERSION, kind, flags, seq, t_ms, client_ts_ms) + payload
@@ -72,10 +72,11 @@ class DebateEngine:
         """
 
         try:
-            from google.genai import types
-            response = self.client.models.generate_content(
+            from app.services.genai_gateway import get_genai_gateway
+            response = await get_genai_gateway().generate_or_raise(
+                prompt,
                 model=self.model,
-                contents=prompt
+                site="debate",
             )
             return response.text
         except Exception as e:
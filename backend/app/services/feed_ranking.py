@@ -0,0 +1,154 @@
+"""
+For-You Feed Ranking (tier_rank 컬럼 + 부분 커버링 인덱스 + 총 개수 캐시)
+
+기존: ORDER BY array_position(['S','A','B','C'], outlier_tier), outlier_score DESC ...
+      → 표현식 정렬이라 인덱스를 못 타고 매 페이지 전체 정렬, 페이지마다 count(*) 서브쿼리까지 실행
+→ outlier_items 가 커질수록 For-You 깊은 페이지 / MCP search_patterns 가 선형으로 느려짐.
+
+현재:
+- outlier_items.tier_rank: outlier_tier 에서 계산되는 STORED generated 컬럼 (S=1 … C=4, 그 외 NULL)
+  → 쓰기 경로 수정 없이 항상 최신
+- ix_outlier_items_feed_rank: (tier_rank, outlier_score DESC, view_count DESC, id DESC)
+  INCLUDE (category, platform) WHERE analysis_status = 'completed' AND tier_rank IS NOT NULL
+  → 정렬 = 인덱스 순서, min_tier = tier_rank 범위 조건
+- 페이지 조회는 id 만 인덱스에서 (index-only) OFFSET/LIMIT 후 해당 행만 로드 (deferred join)
+- 총 개수는 (category, platform, min_tier) 별 TTL 캐시 (동시 miss 는 count 쿼리 1회로 합침)
+  - 프로세스 로컬 캐시 + TTL 만료로만 갱신: 분석은 별도 워커 프로세스에서 완료되므로
+    새로 완료된 아이템이 총 개수에 반영되기까지 최대 FOR_YOU_COUNT_CACHE_TTL_SEC 지연
+    (페이지 목록 자체는 매 요청 조회라 즉시 반영)
+  - count 는 요청과 분리된 세션에서 실행 (합류한 요청이 기다리는 동안 첫 요청 세션이 닫혀도 안전)
+
+Usage:
+    filters = feed_filters(category="beauty", platform=None, min_tier="A")
+    ids = (await db.execute(feed_page_ids_statement(filters, offset=20, limit=10))).scalars().all()
+    total = await get_feed_count_cache().get_or_load(("beauty", None, "A"), lambda: count_feed_detached(filters))
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.models import OutlierItem
+
+logger = logging.getLogger(__name__)
+
+
+TIER_RANKS = {"S": 1, "A": 2, "B": 3, "C": 4}
+DEFAULT_MIN_TIER = "C"
+
+
+def tier_rank_limit(min_tier: Optional[str]) -> int:
+    """min_tier → 허용 tier_rank 상한 (알 수 없는 값은 C)"""
+    return TIER_RANKS.get((min_tier or DEFAULT_MIN_TIER).upper(), TIER_RANKS[DEFAULT_MIN_TIER])
+
+
+def feed_filters(
+    category: Optional[str] = None,
+    platform: Optional[str] = None,
+    min_tier: Optional[str] = DEFAULT_MIN_TIER,
+) -> List[Any]:
+    """분석 완료 + 티어 범위 (ix_outlier_items_feed_rank 부분 인덱스 조건 포함)"""
+    conditions = [
+        OutlierItem.analysis_status == "completed",
+        OutlierItem.tier_rank.isnot(None),
+        OutlierItem.tier_rank <= tier_rank_limit(min_tier),
+    ]
+    if category:
+        conditions.append(OutlierItem.category == category)
+    if platform:
+        conditions.append(OutlierItem.platform == platform)
+    return conditions
+
+
+def feed_order_by() -> Tuple[Any, ...]:
+    """S > A > B > C, 같은 티어는 outlier_score / view_count 높은 순 (인덱스 순서와 동일)"""
+    return (
+        OutlierItem.tier_rank.asc(),
+        OutlierItem.outlier_score.desc(),
+        OutlierItem.view_count.desc(),
+        OutlierItem.id.desc(),
+    )
+
+
+def feed_page_ids_statement(filters: List[Any], offset: int = 0, limit: int = 10) -> Select:
+    """한 페이지의 id 만 (커버링 인덱스에서 index-only scan)"""
+    return select(OutlierItem.id).where(*filters).order_by(*feed_order_by()).offset(offset).limit(limit)
+
+
+def feed_count_statement(filters: List[Any]) -> Select:
+    return select(func.count(OutlierItem.id)).where(*filters)
+
+
+async def count_feed(db: AsyncSession, filters: List[Any]) -> int:
+    return (await db.execute(feed_count_statement(filters))).scalar() or 0
+
+
+async def count_feed_detached(filters: List[Any]) -> int:
+    """FeedCountCache 로더용 - 자체 세션으로 count (요청의 AsyncSession 수명과 무관)"""
+    from app.database import async_session_maker
+
+    async with async_session_maker() as db:
+        return await count_feed(db, filters)
+
+
+def order_by_ids(rows: List[Any], ids: List[Any]) -> List[Any]:
+    """IN (...) 로 로드한 행을 페이지 id 순서로 재정렬"""
+    by_id = {row.id: row for row in rows}
+    return [by_id[item_id] for item_id in ids if item_id in by_id]
+
+
+# ==================
+# Total Count Cache
+# ==================
+
+class FeedCountCache:
+    """필터 조합별 총 개수 TTL 캐시 (프로세스 로컬 - 다른 프로세스의 변경은 TTL 로만 반영)"""
+
+    def __init__(self, ttl_sec: float = 60.0, max_entries: int = 512):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[int]]) -> int:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[int]]) -> int:
+        count = int(await loader() or 0)
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[key] = (time.monotonic() + self.ttl_sec, count)
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "ttl_sec": self.ttl_sec}
+
+
+# Singleton instance
+_feed_count_cache: Optional[FeedCountCache] = None
+
+
+def get_feed_count_cache() -> FeedCountCache:
+    """싱글톤 FeedCountCache 인스턴스 반환"""
+    global _feed_count_cache
+    if _feed_count_cache is None:
+        from app.config import settings
+        _feed_count_cache = FeedCountCache(ttl_sec=settings.FOR_YOU_COUNT_CACHE_TTL_SEC)
+    return _feed_count_cache
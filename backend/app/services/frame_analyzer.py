@@ -8,10 +8,10 @@ Usage:
     analyzer = FrameAnalyzer(api_key)
     compliance = await analyzer.analyze_frame(frame_base64, rules)
 """
-import asyncio
 import base64
+import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,87 @@ class FrameAnalysisResult:
     confidence: float  # 0.0 ~ 1.0
     message: Optional[str] = None  # 위반 시 피드백 메시지
     measured_value: Optional[float] = None  # 측정된 값
+    source: str = "vision"  # vision (Gemini) | local_cv (MetricCalculators)
+
+
+def is_visual_rule(rule: Any) -> bool:
+    """규칙이 시각적 분석이 필요한지 확인"""
+    if not hasattr(rule, 'domain'):
+        return False
+    
+    # composition, lighting 관련 규칙만 시각 분석
+    if rule.domain in ["composition", "safety"]:
+        return True
+    
+    # metric_id로 판단
+    if hasattr(rule, 'spec') and rule.spec:
+        metric_id = rule.spec.metric_id if hasattr(rule.spec, 'metric_id') else ""
+        visual_metrics = ["cmp.", "lit.", "stb.", "center", "brightness", "stability"]
+        return any(m in metric_id for m in visual_metrics)
+    
+    return False
+
+
+def frame_bytes(frame: Union[str, bytes, memoryview]) -> bytes:
+    """프레임 payload → raw 이미지 bytes (JSON 모드는 base64, binary 모드는 이미 raw)"""
+    if isinstance(frame, str):
+        return base64.b64decode(frame)
+    return bytes(frame)
+
+
+def format_rule_lines(rules: List[Any]) -> str:
+    """프롬프트용 규칙 목록 ("- rule_id: hint (target: x)" 줄)"""
+    lines = []
+    for rule in rules:
+        metric_id = rule.spec.metric_id if hasattr(rule.spec, 'metric_id') else "unknown"
+        target = rule.spec.target if hasattr(rule.spec, 'target') else None
+        line = f"- {rule.rule_id}: {rule.check_hint or metric_id}"
+        if target:
+            line += f" (target: {target})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_vision_json(response_text: str) -> Dict[str, Any]:
+    """Vision 응답 텍스트 → dict (```json 코드블록 제거). 파싱 실패 시 JSONDecodeError"""
+    text = response_text.strip()
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+    return json.loads(text)
+
+
+def build_analysis_prompt(rules: List[Any]) -> str:
+    """단일 프레임 분석 프롬프트 생성"""
+    prompt = """You are a video coaching assistant analyzing a single frame.
+        
+Evaluate the following visual rules and respond in JSON format:
+
+Rules to evaluate:
+"""
+    prompt += "\n" + format_rule_lines(rules)
+    
+    prompt += """
+
+For each rule, respond with:
+{
+    "rule_id": {
+        "compliant": true/false,
+        "confidence": 0.0-1.0,
+        "measured_value": number or null,
+        "feedback": "brief Korean feedback if not compliant"
+    }
+}
+
+Important:
+- center_offset: 0.0 = perfect center, 1.0 = edge
+- brightness: 0.0 = dark, 1.0 = bright
+- stability: inferred from blur/motion (1.0 = stable)
+
+Respond ONLY with valid JSON, no markdown or explanation."""
+        
+    return prompt
 
 
 class FrameAnalyzer:
@@ -37,10 +118,18 @@ class FrameAnalyzer:
     1fps 프레임을 분석하여 DNAInvariant 규칙 준수 여부를 판단합니다.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        batcher: Optional[Any] = None,
+        min_interval_sec: Optional[float] = None,
+    ):
         """
         Args:
             api_key: Gemini API 키 (없으면 환경변수에서 로드)
+            batcher: VisionBatcher (여러 세션 프레임을 한 요청으로 합침, None 이면 프레임당 1회 호출)
+            min_interval_sec: 세션당 최소 분석 간격 (None = COACHING_FRAME_INTERVAL_SEC,
+                              0 = 제한 없음 - FrameAnalysisScheduler 가 예산을 관리할 때)
         """
         import os
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
@@ -48,43 +137,60 @@ class FrameAnalyzer:
             raise ValueError("GEMINI_API_KEY is required")
         
         try:
-            from google import genai
-            self.client = genai.Client(api_key=self.api_key)
+            from app.services.genai_gateway import GenAIGateway, get_genai_gateway
+            if api_key and api_key != os.getenv("GEMINI_API_KEY"):
+                # 환경변수와 다른 키 (스크립트/테스트) → 전용 Client
+                from google import genai
+                self.gateway = GenAIGateway(client=genai.Client(api_key=self.api_key))
+            else:
+                self.gateway = get_genai_gateway()  # 공유 Client + 동시성 상한
+            self.client = self.gateway.client
         except ImportError:
             logger.warning("google-genai not installed, using mock client")
+            self.gateway = None
             self.client = None
         
         self.model = VISION_MODEL
-        self._last_analysis_time = 0
-        self._min_interval_sec = 1.0  # 최소 분석 간격 (1fps)
+        self.batcher = batcher
+        self._last_analysis_times: Dict[str, float] = {}  # session_id → 마지막 분석 시각
+        if min_interval_sec is None:
+            from app.config import settings
+            min_interval_sec = settings.COACHING_FRAME_INTERVAL_SEC
+        self._min_interval_sec = min_interval_sec  # 세션당 최소 분석 간격
     
     async def analyze_frame(
         self,
-        frame_base64: str,
+        frame_base64: Union[str, bytes, memoryview],
         rules: List[Any],  # List[DNAInvariant]
-        current_time: float = 0.0
+        current_time: float = 0.0,
+        session_id: Optional[str] = None,
     ) -> Dict[str, FrameAnalysisResult]:
         """
         프레임 분석 → 규칙 준수 여부 판단
         
         Args:
             frame_base64: Base64 인코딩된 프레임 이미지 (JPEG/PNG)
+                          또는 raw 이미지 bytes / memoryview (binary WebSocket 모드)
             rules: 평가할 DNAInvariant 규칙 목록
             current_time: 현재 영상 시간 (초)
+            session_id: 코칭 세션 ID (rate limit 은 세션 단위)
         
         Returns:
             {rule_id: FrameAnalysisResult} 형태의 딕셔너리
         """
         import time
         
-        # Rate limiting (1fps)
-        now = time.time()
-        if now - self._last_analysis_time < self._min_interval_sec:
-            logger.debug("Skipping frame analysis (rate limited)")
-            return {}
-        self._last_analysis_time = now
+        # Rate limiting (세션당 - 전역 게이트면 동시 세션 프레임이 모두 드롭됨)
+        if self._min_interval_sec > 0:
+            key = session_id or "_default"
+            now = time.monotonic()
+            last = self._last_analysis_times.get(key)
+            if last is not None and now - last < self._min_interval_sec:
+                logger.debug(f"Skipping frame analysis for {key} (rate limited)")
+                return {}
+            self._last_analysis_times[key] = now
         
-        if not self.client:
+        if not self.client and self.batcher is None:
             logger.warning("Vision client not available, returning mock results")
             return self._mock_analysis(rules)
         
@@ -95,14 +201,21 @@ class FrameAnalyzer:
             if not visual_rules:
                 return {}
             
+            if self.batcher is not None:
+                # 다른 세션 프레임과 합쳐 1회 호출 → 이 프레임 몫의 응답만 받음
+                try:
+                    data = await self.batcher.submit(frame_base64, visual_rules)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse batched Vision response: {e}")
+                    return self._unparsed_results(visual_rules)
+                results = self._results_from_data(data, visual_rules)
+                logger.info(f"Frame analysis complete: {len(results)} rules evaluated at t={current_time:.1f}s (batched)")
+                return results
+            
             prompt = self._build_analysis_prompt(visual_rules)
             
-            # Gemini Vision API 호출
-            response = await asyncio.to_thread(
-                self._call_vision_api,
-                frame_base64,
-                prompt
-            )
+            # Gemini Vision API 호출 (GenAIGateway, 이벤트 루프 블로킹 없음)
+            response = await self._call_vision_api(frame_base64, prompt)
             
             results = self._parse_response(response, visual_rules)
             logger.info(f"Frame analysis complete: {len(results)} rules evaluated at t={current_time:.1f}s")
@@ -113,70 +226,28 @@ class FrameAnalyzer:
             logger.error(f"Frame analysis failed: {e}")
             return {}
     
+    def forget_session(self, session_id: str) -> None:
+        """세션 종료 시 rate limit 상태 제거"""
+        self._last_analysis_times.pop(session_id, None)
+    
     def _is_visual_rule(self, rule: Any) -> bool:
         """규칙이 시각적 분석이 필요한지 확인"""
-        if not hasattr(rule, 'domain'):
-            return False
-        
-        # composition, lighting 관련 규칙만 시각 분석
-        if rule.domain in ["composition", "safety"]:
-            return True
-        
-        # metric_id로 판단
-        if hasattr(rule, 'spec') and rule.spec:
-            metric_id = rule.spec.metric_id if hasattr(rule.spec, 'metric_id') else ""
-            visual_metrics = ["cmp.", "lit.", "stb.", "center", "brightness", "stability"]
-            return any(m in metric_id for m in visual_metrics)
-        
-        return False
+        return is_visual_rule(rule)
     
     def _build_analysis_prompt(self, rules: List[Any]) -> str:
         """규칙 기반 분석 프롬프트 생성"""
-        prompt = """You are a video coaching assistant analyzing a single frame.
-        
-Evaluate the following visual rules and respond in JSON format:
-
-Rules to evaluate:
-"""
-        for rule in rules:
-            metric_id = rule.spec.metric_id if hasattr(rule.spec, 'metric_id') else "unknown"
-            target = rule.spec.target if hasattr(rule.spec, 'target') else None
-            prompt += f"\n- {rule.rule_id}: {rule.check_hint or metric_id}"
-            if target:
-                prompt += f" (target: {target})"
-        
-        prompt += """
-
-For each rule, respond with:
-{
-    "rule_id": {
-        "compliant": true/false,
-        "confidence": 0.0-1.0,
-        "measured_value": number or null,
-        "feedback": "brief Korean feedback if not compliant"
-    }
-}
-
-Important:
-- center_offset: 0.0 = perfect center, 1.0 = edge
-- brightness: 0.0 = dark, 1.0 = bright
-- stability: inferred from blur/motion (1.0 = stable)
-
-Respond ONLY with valid JSON, no markdown or explanation."""
-        
-        return prompt
+        return build_analysis_prompt(rules)
     
-    def _call_vision_api(self, frame_base64: str, prompt: str) -> str:
-        """동기 Vision API 호출 (별도 스레드에서 실행)"""
+    async def _call_vision_api(self, frame_base64: Union[str, bytes, memoryview], prompt: str) -> str:
+        """Vision API 호출 (GenAIGateway - 재시도/동시성 상한 공통 적용)"""
         try:
-            # 이미지 데이터 준비
-            image_data = base64.b64decode(frame_base64)
+            # 이미지 데이터 준비 (binary 모드는 이미 raw bytes)
+            image_data = frame_bytes(frame_base64)
             
             # Gemini Vision API 호출
             from google.genai import types
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=[
+            response = await self.gateway.generate_or_raise(
+                [
                     types.Content(
                         parts=[
                             types.Part(text=prompt),
@@ -187,10 +258,12 @@ Respond ONLY with valid JSON, no markdown or explanation."""
                         ]
                     )
                 ],
+                model=self.model,
                 config=types.GenerateContentConfig(
                     temperature=0.1,  # 낮은 온도로 일관된 분석
                     max_output_tokens=500
-                )
+                ),
+                site="frame_analysis",
             )
             
             return response.text
@@ -205,47 +278,50 @@ Respond ONLY with valid JSON, no markdown or explanation."""
         rules: List[Any]
     ) -> Dict[str, FrameAnalysisResult]:
         """API 응답 파싱 → FrameAnalysisResult"""
-        import json
-        
-        results = {}
-        
         try:
-            # JSON 파싱 (코드블록 제거)
-            text = response_text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            
-            data = json.loads(text)
-            
-            for rule in rules:
-                rule_id = rule.rule_id
-                if rule_id in data:
-                    item = data[rule_id]
-                    results[rule_id] = FrameAnalysisResult(
-                        rule_id=rule_id,
-                        is_compliant=item.get("compliant", True),
-                        confidence=item.get("confidence", 0.5),
-                        message=item.get("feedback"),
-                        measured_value=item.get("measured_value")
-                    )
-                else:
-                    # 응답에 없으면 준수로 간주
-                    results[rule_id] = FrameAnalysisResult(
-                        rule_id=rule_id,
-                        is_compliant=True,
-                        confidence=0.3
-                    )
-                    
+            data = parse_vision_json(response_text)
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse Vision response: {e}")
-            # 파싱 실패 시 모든 규칙 준수로 간주
-            for rule in rules:
-                results[rule.rule_id] = FrameAnalysisResult(
-                    rule_id=rule.rule_id,
+            return self._unparsed_results(rules)
+        
+        return self._results_from_data(data, rules)
+    
+    def _unparsed_results(self, rules: List[Any]) -> Dict[str, FrameAnalysisResult]:
+        """파싱 실패 시 모든 규칙 준수로 간주 (단일/배치 공통, 낮은 confidence)"""
+        return {
+            rule.rule_id: FrameAnalysisResult(
+                rule_id=rule.rule_id,
+                is_compliant=True,
+                confidence=0.1
+            )
+            for rule in rules
+        }
+    
+    def _results_from_data(
+        self,
+        data: Dict[str, Any],
+        rules: List[Any]
+    ) -> Dict[str, FrameAnalysisResult]:
+        """{rule_id: {compliant, confidence, ...}} → FrameAnalysisResult"""
+        results = {}
+        
+        for rule in rules:
+            rule_id = rule.rule_id
+            item = data.get(rule_id)
+            if isinstance(item, dict):
+                results[rule_id] = FrameAnalysisResult(
+                    rule_id=rule_id,
+                    is_compliant=item.get("compliant", True),
+                    confidence=item.get("confidence", 0.5),
+                    message=item.get("feedback"),
+                    measured_value=item.get("measured_value")
+                )
+            else:
+                # 응답에 없으면 준수로 간주
+                results[rule_id] = FrameAnalysisResult(
+                    rule_id=rule_id,
                     is_compliant=True,
-                    confidence=0.1
+                    confidence=0.3
                 )
         
         return results
@@ -275,8 +351,35 @@ _frame_analyzer: Optional[FrameAnalyzer] = None
 
 
 def get_frame_analyzer(api_key: Optional[str] = None) -> FrameAnalyzer:
-    """싱글톤 FrameAnalyzer 인스턴스 반환"""
+    """
+    싱글톤 FrameAnalyzer 인스턴스 반환
+
+    COACHING_VISION_BATCH_WINDOW_MS > 0 이면 VisionBatcher 로 세션 간 요청 합치기,
+    COACHING_VISION_BACKEND=mock 이면 API 키 없이 MockVisionBackend (오프라인 부하 테스트).
+    """
     global _frame_analyzer
     if _frame_analyzer is None:
-        _frame_analyzer = FrameAnalyzer(api_key)
+        from app.config import settings
+        from app.services.vision_batcher import (
+            GeminiVisionBackend,
+            MockVisionBackend,
+            VisionBatcher,
+        )
+
+        mock = settings.COACHING_VISION_BACKEND == "mock"
+        # 세션 예산은 FrameAnalysisScheduler 가 관리 → 여기서 다시 throttle 하면 타이머 지터로 프레임 드롭
+        analyzer = FrameAnalyzer(api_key or ("mock" if mock else None), min_interval_sec=0)
+        if mock:
+            analyzer.batcher = VisionBatcher(
+                MockVisionBackend(latency_sec=settings.COACHING_VISION_MOCK_LATENCY_MS / 1000),
+                window_sec=settings.COACHING_VISION_BATCH_WINDOW_MS / 1000,
+                max_batch=settings.COACHING_VISION_BATCH_MAX,
+            )
+        elif analyzer.client is not None and settings.COACHING_VISION_BATCH_WINDOW_MS > 0:
+            analyzer.batcher = VisionBatcher(
+                GeminiVisionBackend(analyzer.gateway, analyzer.model),
+                window_sec=settings.COACHING_VISION_BATCH_WINDOW_MS / 1000,
+                max_batch=settings.COACHING_VISION_BATCH_MAX,
+            )
+        _frame_analyzer = analyzer
     return _frame_analyzer
@@ -0,0 +1,272 @@
+"""
+Frame Analysis Scheduler for Real-time Video Coaching
+
+기존: FrameAnalyzer 싱글톤의 _last_analysis_time 이 전 세션 공유
+→ 동시 세션 50개면 서버 전체에서 1초에 1프레임만 분석, 나머지는 조용히 드롭.
+
+현재:
+- 세션별 예산: 세션마다 COACHING_FRAME_INTERVAL_SEC 당 최대 1회 분석
+- 세션별 latest-frame-wins 슬롯: 대기 중 프레임은 새 프레임이 오면 교체 (오래된 프레임 분석 안 함)
+- 유한 워커 풀 (COACHING_FRAME_WORKERS): 준비된 세션을 FIFO 로 라운드로빈 처리 → 세션 간 공정
+- 백프레셔: submit 결과 (queued / replaced) + 세션 상태로 클라이언트에 권장 fps 전달
+
+Usage:
+    scheduler = get_frame_scheduler()
+    status = await scheduler.submit(session_id, frame_b64, rules, t_sec, on_result)
+    ...
+    scheduler.remove_session(session_id)
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from app.services.frame_analyzer import FrameAnalysisResult
+
+logger = logging.getLogger(__name__)
+
+
+# 교체(드롭) 발생 시 백프레셔 메시지 최소 간격
+BACKPRESSURE_NOTIFY_INTERVAL_SEC = 5.0
+
+ResultCallback = Callable[[Dict[str, FrameAnalysisResult], float], Awaitable[None]]
+
+
+@dataclass
+class _PendingFrame:
+    frame_b64: Union[str, bytes, memoryview]  # binary 모드는 수신 버퍼 memoryview
+    rules: List[Any]
+    t_sec: float
+    on_result: ResultCallback
+
+
+@dataclass
+class _SessionSlot:
+    """세션별 스케줄 상태"""
+    pending: Optional[_PendingFrame] = None
+    last_started_at: float = 0.0
+    queued: bool = False  # ready 큐에 들어가 있음 (또는 타이머 대기)
+    in_flight: bool = False
+    submitted: int = 0
+    analyzed: int = 0
+    replaced: int = 0  # latest-frame-wins 로 버려진 프레임
+    replaced_since_notify: int = 0
+    last_backpressure_at: float = 0.0
+
+
+class FrameAnalysisScheduler:
+    """세션 공정 프레임 분석 스케줄러"""
+
+    def __init__(
+        self,
+        evaluator: Optional[Any] = None,
+        workers: int = 4,
+        interval_sec: float = 1.0,
+    ):
+        """
+        Args:
+            evaluator: evaluate_frame(frame_b64, rules, t_sec, session_id) 제공 객체
+                       (기본: HybridFrameEvaluator 싱글톤)
+            workers: 동시 분석 상한 (전 세션 합계)
+            interval_sec: 세션당 최소 분석 간격
+        """
+        self._evaluator = evaluator
+        self.workers = max(1, workers)
+        self.interval_sec = interval_sec
+        self._slots: Dict[str, _SessionSlot] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------
+    # Lifecycle
+    # ------------------
+
+    def _get_evaluator(self) -> Any:
+        if self._evaluator is None:
+            from app.services.hybrid_frame_evaluator import get_hybrid_frame_evaluator
+            self._evaluator = get_hybrid_frame_evaluator()
+        return self._evaluator
+
+    def _ensure_started(self) -> None:
+        """첫 submit 시 (또는 이벤트 루프가 바뀌면) 현재 루프에서 워커 시작"""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop and not all(t.done() for t in self._worker_tasks):
+            return
+        self._loop = loop
+        self._ready = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(i), name=f"frame-worker-{i}")
+            for i in range(self.workers)
+        ]
+        for session_id, slot in self._slots.items():
+            slot.queued = False
+            if slot.pending is not None:
+                self._enqueue(session_id)
+
+    async def stop(self) -> None:
+        """워커 종료 (대기 프레임은 버림)"""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._ready = None
+        self._loop = None
+
+    # ------------------
+    # Public API
+    # ------------------
+
+    async def submit(
+        self,
+        session_id: str,
+        frame_b64: Union[str, bytes, memoryview],
+        rules: List[Any],
+        t_sec: float,
+        on_result: ResultCallback,
+    ) -> str:
+        """
+        프레임 제출 (즉시 반환, 분석 결과는 on_result(results, t_sec) 로 전달)
+
+        Returns:
+            "queued": 대기 슬롯이 비어 있었음
+            "replaced": 이전 대기 프레임을 교체 (클라이언트가 예산보다 빨리 보냄)
+        """
+        self._ensure_started()
+        slot = self._slots.setdefault(session_id, _SessionSlot())
+        slot.submitted += 1
+
+        status = "queued"
+        if slot.pending is not None:
+            slot.replaced += 1
+            slot.replaced_since_notify += 1
+            status = "replaced"
+
+        slot.pending = _PendingFrame(
+            frame_b64=frame_b64,
+            rules=rules,
+            t_sec=t_sec,
+            on_result=on_result,
+        )
+        if not slot.queued and not slot.in_flight:
+            self._enqueue(session_id)
+        return status
+
+    def backpressure(self, session_id: str, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        백프레셔 신호 (직전 신호 이후 교체 발생 시, BACKPRESSURE_NOTIFY_INTERVAL_SEC 마다 최대 1회)
+
+        Returns:
+            {"dropped", "suggested_fps", "active_sessions", "workers"} 또는 None
+        """
+        slot = self._slots.get(session_id)
+        if slot is None or (not slot.replaced_since_notify and not force):
+            return None
+        now = time.monotonic()
+        if not force and now - slot.last_backpressure_at < BACKPRESSURE_NOTIFY_INTERVAL_SEC:
+            return None
+        slot.last_backpressure_at = now
+        dropped, slot.replaced_since_notify = slot.replaced_since_notify, 0
+        return {
+            "dropped": dropped,
+            "suggested_fps": round(self.suggested_fps(), 3),
+            "active_sessions": len(self._slots),
+            "workers": self.workers,
+        }
+
+    def suggested_fps(self) -> float:
+        """
+        세션당 권장 전송 fps
+
+        세션 예산 (1 / interval) 을 기본으로, 활성 세션이 워커보다 많으면
+        실제 처리 가능량 (workers / sessions) 비율로 낮춤.
+        """
+        base = 1.0 / self.interval_sec if self.interval_sec > 0 else 1.0
+        sessions = max(1, len(self._slots))
+        return base * min(1.0, self.workers / sessions)
+
+    def remove_session(self, session_id: str) -> None:
+        """세션 종료: 대기 프레임 폐기"""
+        self._slots.pop(session_id, None)
+        if self._evaluator is not None and hasattr(self._evaluator, "forget_session"):
+            self._evaluator.forget_session(session_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "interval_sec": self.interval_sec,
+            "active_sessions": len(self._slots),
+            "queue_depth": self._ready.qsize() if self._ready else 0,
+            "in_flight": sum(1 for s in self._slots.values() if s.in_flight),
+            "submitted": sum(s.submitted for s in self._slots.values()),
+            "analyzed": sum(s.analyzed for s in self._slots.values()),
+            "replaced": sum(s.replaced for s in self._slots.values()),
+        }
+
+    def session_stats(self, session_id: str) -> Optional[Dict[str, int]]:
+        slot = self._slots.get(session_id)
+        if slot is None:
+            return None
+        return {"submitted": slot.submitted, "analyzed": slot.analyzed, "replaced": slot.replaced}
+
+    # ------------------
+    # Internals
+    # ------------------
+
+    def _enqueue(self, session_id: str) -> None:
+        """세션을 ready 큐에 넣음 (예산 남았으면 타이머로 지연)"""
+        slot = self._slots.get(session_id)
+        if slot is None or self._ready is None:
+            return
+        slot.queued = True
+        wait = slot.last_started_at + self.interval_sec - time.monotonic()
+        if wait > 0:
+            asyncio.get_running_loop().call_later(wait, self._ready.put_nowait, session_id)
+        else:
+            self._ready.put_nowait(session_id)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            session_id = await self._ready.get()
+            slot = self._slots.get(session_id)
+            if slot is None:  # 제출 후 세션 종료
+                continue
+            slot.queued = False
+            frame, slot.pending = slot.pending, None
+            if frame is None:
+                continue
+
+            slot.in_flight = True
+            slot.last_started_at = time.monotonic()
+            try:
+                results = await self._get_evaluator().evaluate_frame(
+                    frame.frame_b64, frame.rules, t_sec=frame.t_sec, session_id=session_id
+                )
+                slot.analyzed += 1
+                await frame.on_result(results, frame.t_sec)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Frame analysis failed for {session_id}: {e}")
+            finally:
+                slot.in_flight = False
+                # 분석 중 새 프레임이 왔으면 다음 예산 시점에 재스케줄
+                if slot.pending is not None and session_id in self._slots:
+                    self._enqueue(session_id)
+
+
+# Singleton instance
+_frame_scheduler: Optional[FrameAnalysisScheduler] = None
+
+
+def get_frame_scheduler() -> FrameAnalysisScheduler:
+    """싱글톤 FrameAnalysisScheduler 인스턴스 반환"""
+    global _frame_scheduler
+    if _frame_scheduler is None:
+        from app.config import settings
+        _frame_scheduler = FrameAnalysisScheduler(
+            workers=settings.COACHING_FRAME_WORKERS,
+            interval_sec=settings.COACHING_FRAME_INTERVAL_SEC,
+        )
+    return _frame_scheduler
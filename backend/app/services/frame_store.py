@@ -0,0 +1,352 @@
+"""
+Ghost Overlay Frame Store (인덱스 기반 프레임 서빙)
+
+기존: GET /frames/{content_id}/{t_ms} 가 요청마다 콘텐츠 디렉토리의 *.jpg 를 전부 glob 해
+      ±500ms 프레임을 선형 탐색, width/quality 파라미터는 무시, 없으면 1x1 placeholder
+→ 에디터에서 Ghost Overlay 를 스크럽하면 요청마다 디렉토리 스캔 + 원본 JPEG 전송.
+
+현재:
+- 콘텐츠별 정렬된 타임스탬프 인덱스 (디렉토리 mtime 이 바뀔 때만 재스캔) → bisect 로 최근접 프레임
+- 저장된 프레임이 없으면 캐시된 원본 영상 ({root}/{content_id}/source.*) 에서 온디맨드 추출
+  - 요청 시각이 속한 구간 (FRAME_EXTRACT_SPAN_MS) 을 한 번의 디코드로 FRAME_EXTRACT_STEP_MS 그리드만큼 저장
+  - 같은 구간 동시 요청은 디코드 1회로 합침 (single-flight)
+  - 영상 끝 너머 구간 (디코드해도 프레임 없음) 은 기억 → 같은 요청에 재디코드하지 않음
+- 리사이즈/재인코딩 변형은 (t_ms, width, quality) 별로 디스크 캐시
+  ({root}/_variants/{content_id}/{t_ms}_w{width}_q{quality}.jpg) + 메모리 LRU (바이트 상한)
+  - width/quality 는 WIDTH_BUCKETS / QUALITY_BUCKETS 로 스냅 → 프레임당 변형 수 상한 (임의 값으로 디스크 폭증 방지)
+  (콘텐츠 디렉토리 밖에 둬서 변형 저장이 인덱스 재스캔을 일으키지 않음)
+  → 스크럽 중 반복 요청은 파일 I/O 없이 메모리에서 응답
+
+Usage:
+    store = get_frame_store()
+    frame = await store.get_frame(content_id, t_ms, width=320, quality=70)
+    if frame: Response(frame.data, media_type="image/jpeg")
+"""
+import asyncio
+import bisect
+import logging
+import os
+import re
+import shutil
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_QUALITY = 85  # 이 품질 + width 없음 → 저장된 원본 그대로 (재인코딩 없음)
+EXTRACT_QUALITY = 90  # 온디맨드 추출 원본 JPEG 품질
+SOURCE_VIDEO_SUFFIXES = (".mp4", ".mov", ".webm", ".mkv")
+VARIANTS_DIR = "_variants"  # content_id 는 영숫자로 시작 → 충돌 없음
+WIDTH_BUCKETS = (160, 320, 640, 1280)  # 요청 width 이상인 가장 작은 버킷 (더 크면 원본 너비)
+QUALITY_BUCKETS = (60, DEFAULT_QUALITY)  # 가장 가까운 버킷
+
+_CONTENT_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
+
+
+def is_valid_content_id(content_id: str) -> bool:
+    """경로 탈출 방지 (디렉토리 이름으로 쓰이는 값)"""
+    return bool(_CONTENT_ID_RE.match(content_id)) and ".." not in content_id
+
+
+def snap_variant(width: Optional[int], quality: int) -> Tuple[Optional[int], int]:
+    """(width, quality) → 변형 버킷 (width None = 원본 너비)"""
+    if width:
+        width = next((bucket for bucket in WIDTH_BUCKETS if bucket >= width), None)
+    quality = min(QUALITY_BUCKETS, key=lambda bucket: (abs(bucket - quality), -bucket))
+    return width, quality
+
+
+@dataclass
+class FrameResult:
+    """서빙할 프레임"""
+    data: bytes
+    t_ms: int  # 실제 프레임 타임스탬프 (요청 시각과 다를 수 있음)
+    source: str  # memory | disk | variant | extracted
+
+
+@dataclass
+class _ContentIndex:
+    """콘텐츠 디렉토리 스냅샷"""
+    mtime_ns: int
+    timestamps: List[int] = field(default_factory=list)
+    source_video: Optional[Path] = None
+
+
+class FrameStore:
+    """콘텐츠별 프레임 인덱스 + 온디맨드 추출 + 변형 캐시"""
+
+    def __init__(
+        self,
+        root: str,
+        match_tolerance_ms: int = 500,
+        extract_step_ms: int = 100,
+        extract_span_ms: int = 2000,
+        memory_cache_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Args:
+            root: 프레임 저장 루트 ({root}/{content_id}/{t_ms}.jpg)
+            match_tolerance_ms: 원본 영상이 없을 때 허용하는 최근접 프레임 거리
+            extract_step_ms: 온디맨드 추출 그리드 (원본 영상이 있으면 step/2 안의 프레임만 재사용)
+            extract_span_ms: 디코드 1회로 채우는 구간 길이
+            memory_cache_bytes: 메모리 LRU 상한 (바이트)
+        """
+        self.root = Path(root)
+        self.match_tolerance_ms = match_tolerance_ms
+        self.extract_step_ms = max(1, extract_step_ms)
+        self.extract_span_ms = max(self.extract_step_ms, extract_span_ms)
+        self.memory_cache_bytes = memory_cache_bytes
+        self._indexes: Dict[str, _ContentIndex] = {}
+        self._index_lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, int, int, int], bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._source_end_ms: Dict[str, int] = {}  # 프레임이 나오지 않은 첫 구간 시작 (영상 끝)
+        self._stats: Counter = Counter()
+
+    # ---- Index ----
+
+    def _scan(self, directory: Path, mtime_ns: int) -> _ContentIndex:
+        entry = _ContentIndex(mtime_ns=mtime_ns)
+        with os.scandir(directory) as it:
+            for item in it:
+                stem, suffix = os.path.splitext(item.name)
+                if suffix == ".jpg" and stem.isdigit():
+                    entry.timestamps.append(int(stem))
+                elif stem == "source" and suffix in SOURCE_VIDEO_SUFFIXES:
+                    entry.source_video = Path(item.path)
+        entry.timestamps.sort()
+        self._stats["index_scans"] += 1
+        return entry
+
+    def _index(self, content_id: str) -> Optional[_ContentIndex]:
+        """디렉토리 mtime 이 같으면 캐시된 인덱스 (stat 1회)"""
+        directory = self.root / content_id
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            self._indexes.pop(content_id, None)
+            return None
+        entry = self._indexes.get(content_id)
+        if entry is None or entry.mtime_ns != mtime_ns:
+            with self._index_lock:
+                entry = self._scan(directory, mtime_ns)
+                self._indexes[content_id] = entry
+        return entry
+
+    @staticmethod
+    def _nearest(timestamps: List[int], t_ms: int, tolerance_ms: int) -> Optional[int]:
+        i = bisect.bisect_left(timestamps, t_ms)
+        candidates = timestamps[max(0, i - 1):i + 1]
+        if not candidates:
+            return None
+        best = min(candidates, key=lambda t: (abs(t - t_ms), t))
+        return best if abs(best - t_ms) <= tolerance_ms else None
+
+    def _resolve(self, content_id: str) -> Tuple[Optional[_ContentIndex], int]:
+        """(인덱스, 허용 거리) - 원본 영상이 있으면 추출 그리드 기준으로 좁힘"""
+        entry = self._index(content_id)
+        if entry is not None and entry.source_video is not None:
+            return entry, self.extract_step_ms // 2
+        return entry, self.match_tolerance_ms
+
+    def timestamps(self, content_id: str) -> List[int]:
+        entry = self._index(content_id)
+        return list(entry.timestamps) if entry else []
+
+    def frame_path(self, content_id: str, t_ms: int) -> Path:
+        return self.root / content_id / f"{t_ms}.jpg"
+
+    def _variant_path(self, content_id: str, t_ms: int, width: int, quality: int) -> Path:
+        return self.root / VARIANTS_DIR / content_id / f"{t_ms}_w{width}_q{quality}.jpg"
+
+    # ---- Source Video / Extraction ----
+
+    def register_source(self, content_id: str, video_path: str) -> Path:
+        """원본 영상을 캐시에 등록 (하드링크, 불가능하면 복사) - 이후 누락 프레임 온디맨드 추출"""
+        suffix = Path(video_path).suffix.lower()
+        target = self.root / content_id / f"source{suffix if suffix in SOURCE_VIDEO_SUFFIXES else '.mp4'}"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            os.link(video_path, tmp_path)
+        except OSError:
+            shutil.copyfile(video_path, tmp_path)
+        os.replace(tmp_path, target)
+        self._source_end_ms.pop(content_id, None)
+        return target
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _extract_span(self, content_id: str, video_path: Path, span_start_ms: int) -> int:
+        """구간 [span_start, span_start + span) 을 한 번 디코드해 그리드 프레임 저장 (스레드에서 실행)"""
+        import cv2
+        from app.services.vdg_2pass.cv_measurement_pass import StreamingFrameReader
+
+        reader = StreamingFrameReader(str(video_path), fps=1000.0 / self.extract_step_ms)
+        center = span_start_ms + self.extract_span_ms // 2
+        saved = 0
+        for _, frames in reader.iter_windows([(center, self.extract_span_ms)]):
+            for timestamp_ms, frame in frames:
+                path = self.frame_path(content_id, int(round(timestamp_ms)))
+                if path.exists():
+                    continue
+                ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, EXTRACT_QUALITY])
+                if ok:
+                    self._write_atomic(path, encoded.tobytes())
+                    saved += 1
+        logger.info(f"🎞️ Extracted {saved} frames for {content_id} [{span_start_ms}ms, +{self.extract_span_ms}ms)")
+        return saved
+
+    # ---- Variants ----
+
+    def _load(self, content_id: str, t_ms: int, width: int, quality: int) -> Tuple[bytes, str]:
+        """원본 또는 변형 바이트 (변형은 디스크 캐시, 없으면 리사이즈/재인코딩 후 저장)"""
+        original = self.frame_path(content_id, t_ms)
+        if not width and quality == DEFAULT_QUALITY:
+            return original.read_bytes(), "disk"
+
+        variant = self._variant_path(content_id, t_ms, width, quality)
+        try:
+            return variant.read_bytes(), "disk"
+        except FileNotFoundError:
+            pass
+
+        import cv2
+
+        image = cv2.imread(str(original))
+        if image is None:
+            raise FileNotFoundError(original)
+        height, original_width = image.shape[:2]
+        if width and width < original_width:  # 업스케일은 하지 않음
+            image = cv2.resize(
+                image, (width, max(1, round(height * width / original_width))), interpolation=cv2.INTER_AREA,
+            )
+        ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError(f"JPEG encode failed: {original}")
+        data = encoded.tobytes()
+        self._write_atomic(variant, data)
+        return data, "variant"
+
+    def _remember(self, key: Tuple[str, int, int, int], data: bytes) -> None:
+        if len(data) > self.memory_cache_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.memory_cache_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats["evictions"] += 1
+
+    async def _single_flight(self, key: Hashable, fn: Callable, *args: Any) -> Any:
+        """같은 key 의 동시 호출은 스레드 실행 1회로 합침"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._stats["inflight_joins"] += 1
+        return await asyncio.shield(task)
+
+    # ---- Public API ----
+
+    async def get_frame(
+        self,
+        content_id: str,
+        t_ms: int,
+        width: Optional[int] = None,
+        quality: int = DEFAULT_QUALITY,
+    ) -> Optional[FrameResult]:
+        """
+        t_ms 에 가장 가까운 프레임 (width/quality 변형 적용)
+
+        Returns:
+            FrameResult 또는 None (저장된 프레임도 원본 영상도 없음)
+        """
+        self._stats["requests"] += 1
+        width, quality = snap_variant(width, quality)
+        entry, tolerance_ms = self._resolve(content_id)
+        frame_t = self._nearest(entry.timestamps, t_ms, tolerance_ms) if entry else None
+        extracted = False
+
+        if frame_t is None and entry is not None and entry.source_video is not None:
+            span_start = (max(0, t_ms) // self.extract_span_ms) * self.extract_span_ms
+            if span_start >= self._source_end_ms.get(content_id, span_start + 1):
+                self._stats["empty_span_hits"] += 1
+                self._stats["misses"] += 1
+                return None
+            try:
+                await self._single_flight(
+                    ("extract", content_id, span_start), self._extract_span, content_id, entry.source_video, span_start,
+                )
+                self._stats["extractions"] += 1
+                extracted = True
+            except Exception as e:
+                self._stats["extract_errors"] += 1
+                logger.warning(f"Frame extraction failed ({content_id}@{t_ms}ms): {e}")
+            entry = self._index(content_id)
+            frame_t = self._nearest(entry.timestamps, t_ms, self.match_tolerance_ms) if entry else None
+            if frame_t is None and extracted:  # 디코드해도 프레임 없음 → 이 구간부터는 영상 끝
+                self._source_end_ms[content_id] = min(self._source_end_ms.get(content_id, span_start), span_start)
+
+        if frame_t is None:
+            self._stats["misses"] += 1
+            return None
+
+        key = (content_id, frame_t, width or 0, quality)
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return FrameResult(data=data, t_ms=frame_t, source="memory")
+
+        try:
+            data, source = await self._single_flight(("load",) + key, self._load, *key)
+        except (FileNotFoundError, ValueError) as e:  # 인덱스 이후 삭제된 파일 등
+            logger.warning(f"Frame load failed ({content_id}@{frame_t}ms): {e}")
+            self._stats["misses"] += 1
+            return None
+        self._stats[f"{source}_loads"] += 1
+        self._remember(key, data)
+        return FrameResult(data=data, t_ms=frame_t, source="extracted" if extracted else source)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **dict(self._stats),
+            "indexed_contents": len(self._indexes),
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "root": str(self.root),
+        }
+
+
+# Singleton instance
+_frame_store: Optional[FrameStore] = None
+
+
+def get_frame_store() -> FrameStore:
+    """싱글톤 FrameStore 인스턴스 반환"""
+    global _frame_store
+    if _frame_store is None:
+        from app.config import settings
+        _frame_store = FrameStore(
+            root=settings.FRAME_STORAGE_PATH,
+            match_tolerance_ms=settings.FRAME_MATCH_TOLERANCE_MS,
+            extract_step_ms=settings.FRAME_EXTRACT_STEP_MS,
+            extract_span_ms=settings.FRAME_EXTRACT_SPAN_MS,
+            memory_cache_bytes=settings.FRAME_MEMORY_CACHE_MB * 1024 * 1024,
+        )
+    return _frame_store
@@ -17,7 +17,6 @@ Usage:
 import os
 import time
 import logging
-import asyncio
 from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, Tuple
@@ -182,12 +181,18 @@ def get_genai_client() -> genai.Client:
     """
     Get singleton GenAI client.
     
-    Uses GOOGLE_API_KEY or GEMINI_API_KEY from environment.
+    Uses GEMINI_API_KEY (preferred) or GOOGLE_API_KEY from environment / settings.
     
     Returns:
         google.genai.Client instance
     """
-    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+    from app.config import settings
+    
+    # GEMINI_API_KEY 우선 (환경변수 → settings/.env), 그다음 GOOGLE_API_KEY
+    api_key = (
+        os.environ.get("GEMINI_API_KEY") or settings.GEMINI_API_KEY
+        or os.environ.get("GOOGLE_API_KEY") or settings.GOOGLE_API_KEY
+    )
     
     if not api_key:
         raise ValueError("No API key found. Set GOOGLE_API_KEY or GEMINI_API_KEY")
@@ -223,10 +228,14 @@ def generate_content(
     max_output_tokens: int = 8192,
     response_mime_type: Optional[str] = None,
     system_instruction: Optional[str] = None,
+    site: str = "genai_client",
 ) -> GenAIResponse:
     """
     Generate content with standardized response envelope.
     
+    Blocking (time.sleep backoff) - sync scripts / worker threads only.
+    Async code should use generate_content_async (GenAIGateway).
+    
     Includes:
     - Automatic retry with exponential backoff (max 3 attempts)
     - Standardized error mapping
@@ -240,10 +249,13 @@ def generate_content(
         max_output_tokens: Max output tokens
         response_mime_type: e.g. "application/json"
         system_instruction: System prompt (currently unused by new SDK)
+        site: Call-site label for llm_metrics
         
     Returns:
         GenAIResponse with success/failure info
     """
+    from app.services.llm_metrics import llm_metrics
+    
     client = get_genai_client()
     
     config = GenerateContentConfig(
@@ -275,7 +287,7 @@ def generate_content(
                 f"latency={latency_ms}ms"
             )
             
-            return GenAIResponse(
+            result = GenAIResponse(
                 success=True,
                 text=response.text,
                 raw_response=response,
@@ -284,6 +296,8 @@ def generate_content(
                 usage=_extract_usage(response),
                 attempt_count=attempt + 1,
             )
+            llm_metrics.record(result, site=site)
+            return result
             
         except Exception as e:
             last_error = e
@@ -308,7 +322,7 @@ def generate_content(
     latency_ms = int((time.time() - start_time) * 1000)
     error_code, retryable, retry_after = _map_error(last_error)
     
-    return GenAIResponse(
+    result = GenAIResponse(
         success=False,
         model=model,
         latency_ms=latency_ms,
@@ -318,6 +332,8 @@ def generate_content(
         retry_after_ms=retry_after,
         attempt_count=GENAI_MAX_RETRIES if retryable else 1,
     )
+    llm_metrics.record(result, site=site)
+    return result
 
 
 # ============================================
@@ -332,14 +348,15 @@ async def generate_content_async(
     response_mime_type: Optional[str] = None,
     system_instruction: Optional[str] = None,
     timeout: float = GENAI_TIMEOUT_SECONDS,
+    site: str = "genai_client",
 ) -> GenAIResponse:
     """
     Async content generation with timeout and retry.
     
-    Uses client.aio.models for true async operation.
-    Includes timeout wrapping for safety.
+    GenAIGateway 로 위임: 공유 client.aio, 전역/모델별 동시성 상한,
+    retry_after_ms 기반 asyncio.sleep 백오프.
     """
-    client = get_genai_client()
+    from app.services.genai_gateway import get_genai_gateway
     
     config = GenerateContentConfig(
         temperature=temperature,
@@ -350,84 +367,12 @@ async def generate_content_async(
     if response_mime_type:
         config.response_mime_type = response_mime_type
     
-    last_error: Optional[Exception] = None
-    start_time = time.time()
-    
-    for attempt in range(GENAI_MAX_RETRIES):
-        try:
-            # Wrap with timeout
-            response = await asyncio.wait_for(
-                client.aio.models.generate_content(
-                    model=model,
-                    contents=contents,
-                    config=config,
-                ),
-                timeout=timeout
-            )
-            
-            latency_ms = int((time.time() - start_time) * 1000)
-            
-            logger.debug(
-                f"GenAI async success: model={model}, attempt={attempt+1}, "
-                f"latency={latency_ms}ms"
-            )
-            
-            return GenAIResponse(
-                success=True,
-                text=response.text,
-                raw_response=response,
-                model=model,
-                latency_ms=latency_ms,
-                usage=_extract_usage(response),
-                attempt_count=attempt + 1,
-            )
-            
-        except asyncio.TimeoutError as e:
-            last_error = e
-            logger.warning(
-                f"GenAI timeout: model={model}, attempt={attempt+1}/{GENAI_MAX_RETRIES}, "
-                f"timeout={timeout}s"
-            )
-            
-            if attempt < GENAI_MAX_RETRIES - 1:
-                delay = _calculate_backoff(attempt)
-                await asyncio.sleep(delay)
-                
-        except Exception as e:
-            last_error = e
-            error_code, retryable, retry_after = _map_error(e)
-            
-            logger.warning(
-                f"GenAI async error: model={model}, attempt={attempt+1}/{GENAI_MAX_RETRIES}, "
-                f"error_code={error_code}, error={str(e)[:100]}"
-            )
-            
-            if not retryable:
-                break
-            
-            if attempt < GENAI_MAX_RETRIES - 1:
-                delay = _calculate_backoff(attempt)
-                await asyncio.sleep(delay)
-    
-    # All retries exhausted
-    latency_ms = int((time.time() - start_time) * 1000)
-    
-    if isinstance(last_error, asyncio.TimeoutError):
-        error_code = GenAIErrorCode.TIMEOUT
-        retryable = True
-        retry_after = 5000
-    else:
-        error_code, retryable, retry_after = _map_error(last_error)
-    
-    return GenAIResponse(
-        success=False,
+    return await get_genai_gateway().generate(
+        contents,
         model=model,
-        latency_ms=latency_ms,
-        error=str(last_error),
-        error_code=error_code,
-        retryable=retryable,
-        retry_after_ms=retry_after,
-        attempt_count=GENAI_MAX_RETRIES,
+        config=config,
+        timeout=timeout,
+        site=site,
     )
 
 
@@ -0,0 +1,378 @@
+"""
+GenAI Gateway (async-native 단일 Gemini 호출 경로)
+
+기존:
+- genai_client.generate_content: time.sleep 백오프 (호출 스레드 블로킹)
+- frame_analyzer / gemini_pipeline / analysis_pipeline / opal / debate / 라우터가
+  각자 Client 를 만들거나 async 함수 안에서 sync client.models.generate_content 를 직접 호출
+  → 느린 호출 1개가 이벤트 루프 전체 (코칭 WS 포함) 를 멈춤
+- UnifiedPass._upload_video: time.sleep(1.0) 최대 60회 폴링
+- 동시 호출 상한 없음 → 부하 시 429 연쇄
+
+현재: GenAIGateway
+- 공유 Client 1개 (get_genai_client) 의 client.aio 사용 → 커넥션 재사용, 스레드 없음
+- 동시성 상한: 모델별 세마포어 (GENAI_MODEL_CONCURRENCY) → 전역 세마포어 (GENAI_MAX_CONCURRENCY)
+  (모델 슬롯을 먼저 잡아 포화된 모델이 전역 슬롯을 점유하지 않음)
+- 재시도: asyncio.sleep 백오프, _map_error 의 retry_after_ms 우선 (GENAI_MAX_RETRY_WAIT_SEC 상한)
+  백오프 대기 중에는 슬롯을 반납
+- 업로드: client.aio.files.upload + asyncio.sleep 상태 폴링
+- 모든 호출 결과를 llm_metrics 에 기록 (model / site 별 레이턴시, 토큰, 재시도)
+- 스레드에서 도는 동기 코드 (VDG UnifiedPass) 는 run_sync 로 앱 이벤트 루프에 위임
+  → 상한/백오프가 모든 호출에 공통 적용
+  (바인딩된 루프가 없으면 게이트웨이 전용 루프 스레드 1개를 띄워 모든 호출을 그 루프에서 실행
+   → client.aio 의 httpx 클라이언트가 항상 같은 루프에서 쓰임)
+
+Usage:
+    gateway = get_genai_gateway()
+    response = await gateway.generate(contents, model=DEFAULT_MODEL_PRO, config=config, site="vdg_pass1")
+    raw = await gateway.generate_or_raise(contents, model=...)  # 실패 시 GenAIGatewayError
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.services.genai_client import (
+    DEFAULT_MODEL_FLASH,
+    GENAI_BASE_DELAY_SECONDS,
+    GENAI_MAX_RETRIES,
+    GENAI_TIMEOUT_SECONDS,
+    GenAIErrorCode,
+    GenAIResponse,
+    _extract_usage,
+    _map_error,
+    get_genai_client,
+)
+from app.services.llm_metrics import llm_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 업로드 파일 처리 상태
+FILE_READY_STATES = (None, "ACTIVE", "SUCCEEDED")
+FILE_FAILED_STATES = ("FAILED", "ERROR")
+
+
+class GenAIGatewayError(RuntimeError):
+    """게이트웨이 호출 실패 (response: 실패 GenAIResponse, 업로드 실패 시 None)"""
+
+    def __init__(self, message: str, response: Optional[GenAIResponse] = None):
+        super().__init__(message)
+        self.response = response
+
+
+@dataclass
+class GenAIGatewayStats:
+    """게이트웨이 통계"""
+    calls: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    in_flight: int = 0
+    waiting: int = 0  # 세마포어 대기 중
+    uploads: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "uploads": self.uploads,
+        }
+
+
+class GenAIGateway:
+    """공유 Client + 동시성 상한 + async 재시도 Gemini 게이트웨이"""
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        max_concurrency: int = 16,
+        model_concurrency: int = 8,
+        max_retries: int = GENAI_MAX_RETRIES,
+        timeout_sec: float = GENAI_TIMEOUT_SECONDS,
+        max_retry_wait_sec: float = 30.0,
+    ):
+        """
+        Args:
+            client: google.genai.Client (기본: get_genai_client 공유 Client, 첫 사용 시 생성)
+            max_concurrency: 전 모델 합계 동시 호출 상한
+            model_concurrency: 모델별 동시 호출 상한
+            max_retries: 최대 시도 횟수
+            timeout_sec: 시도당 타임아웃
+            max_retry_wait_sec: 재시도 대기 상한 (retry_after_ms 가 더 커도 이 값까지만)
+        """
+        self._client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self.model_concurrency = max(1, model_concurrency)
+        self.max_retries = max(1, max_retries)
+        self.timeout_sec = timeout_sec
+        self.max_retry_wait_sec = max_retry_wait_sec
+        self.stats = GenAIGatewayStats()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        self._model_sems: Dict[str, asyncio.Semaphore] = {}
+        self._fallback_lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """공유 Client (API 키 없으면 ValueError)"""
+        if self._client is None:
+            self._client = get_genai_client()
+        return self._client
+
+    # ------------------
+    # Event loop / limits
+    # ------------------
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """세마포어를 이 루프에 생성 (앱 시작 시 호출 → run_sync 가 이 루프로 위임)"""
+        loop = loop or asyncio.get_running_loop()
+        if loop is self._loop and self._global_sem is not None:
+            return
+        self._loop = loop
+        self._global_sem = asyncio.Semaphore(self.max_concurrency)
+        self._model_sems = {}
+
+    @asynccontextmanager
+    async def _slot(self, model: str):
+        """모델 슬롯 → 전역 슬롯 순으로 획득"""
+        self.bind_loop()
+        # 획득한 세마포어 객체를 그대로 해제 (다른 루프의 호출이 중간에 재바인딩해도 안전)
+        global_sem = self._global_sem
+        model_sem = self._model_sems.get(model)
+        if model_sem is None:
+            model_sem = self._model_sems[model] = asyncio.Semaphore(self.model_concurrency)
+
+        self.stats.waiting += 1
+        try:
+            await model_sem.acquire()
+            try:
+                await global_sem.acquire()
+            except BaseException:
+                model_sem.release()
+                raise
+        finally:
+            self.stats.waiting -= 1
+
+        self.stats.in_flight += 1
+        try:
+            yield
+        finally:
+            self.stats.in_flight -= 1
+            global_sem.release()
+            model_sem.release()
+
+    def _retry_delay(self, attempt: int, retry_after_ms: Optional[int]) -> float:
+        """지수 백오프 (±25% jitter) 와 retry_after_ms 중 큰 값, max_retry_wait_sec 상한"""
+        delay = GENAI_BASE_DELAY_SECONDS * (2 ** attempt)
+        delay += delay * 0.25 * (random.random() * 2 - 1)
+        if retry_after_ms:
+            delay = max(delay, retry_after_ms / 1000)
+        return min(delay, self.max_retry_wait_sec)
+
+    # ------------------
+    # Calls
+    # ------------------
+
+    async def generate(
+        self,
+        contents: Any,
+        *,
+        model: str = DEFAULT_MODEL_FLASH,
+        config: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        site: str = "unknown",
+    ) -> GenAIResponse:
+        """
+        generate_content (재시도 + 동시성 상한)
+
+        Args:
+            contents: SDK contents (str / Part / Content / dict 리스트)
+            model: 모델 ID
+            config: GenerateContentConfig 또는 dict
+            timeout: 시도당 타임아웃 (기본 timeout_sec)
+            max_retries: 최대 시도 횟수 (기본 max_retries)
+            site: 호출 지점 이름 (llm_metrics 라벨 - 코드 상수만)
+
+        Returns:
+            GenAIResponse (실패해도 예외 대신 success=False)
+        """
+        attempts = max_retries or self.max_retries
+        timeout = timeout or self.timeout_sec
+        start_time = time.time()
+        last_error: Optional[Exception] = None
+        error_code, retryable, retry_after = GenAIErrorCode.UNKNOWN, False, None
+        self.stats.calls += 1
+
+        attempt = 0
+        for attempt in range(attempts):
+            try:
+                async with self._slot(model):
+                    response = await asyncio.wait_for(
+                        self.client.aio.models.generate_content(
+                            model=model,
+                            contents=contents,
+                            config=config,
+                        ),
+                        timeout=timeout,
+                    )
+                self.stats.successes += 1
+                return self._record(GenAIResponse(
+                    success=True,
+                    text=response.text,
+                    raw_response=response,
+                    model=model,
+                    latency_ms=int((time.time() - start_time) * 1000),
+                    usage=_extract_usage(response),
+                    attempt_count=attempt + 1,
+                ), site)
+            except asyncio.TimeoutError as e:
+                last_error = e
+                error_code, retryable, retry_after = GenAIErrorCode.TIMEOUT, True, 5000
+            except Exception as e:
+                last_error = e
+                error_code, retryable, retry_after = _map_error(e)
+
+            logger.warning(
+                f"GenAI error: model={model}, attempt={attempt+1}/{attempts}, "
+                f"error_code={error_code}, retryable={retryable}, error={str(last_error)[:100]}"
+            )
+            if not retryable or attempt == attempts - 1:
+                break
+
+            delay = self._retry_delay(attempt, retry_after)
+            self.stats.retries += 1
+            logger.info(f"Retrying in {delay:.2f}s...")
+            await asyncio.sleep(delay)  # 슬롯 반납 상태로 대기
+
+        self.stats.failures += 1
+        return self._record(GenAIResponse(
+            success=False,
+            model=model,
+            latency_ms=int((time.time() - start_time) * 1000),
+            error=str(last_error),
+            error_code=error_code,
+            retryable=retryable,
+            retry_after_ms=retry_after,
+            attempt_count=attempt + 1,
+        ), site)
+
+    @staticmethod
+    def _record(response: GenAIResponse, site: str) -> GenAIResponse:
+        llm_metrics.record(response, site=site)
+        return response
+
+    async def generate_or_raise(self, contents: Any, **kwargs) -> Any:
+        """generate → SDK 원본 응답 반환 (실패 시 GenAIGatewayError)"""
+        response = await self.generate(contents, **kwargs)
+        if not response.success:
+            raise GenAIGatewayError(
+                f"GenAI call failed: {response.error_code} - {response.error}",
+                response=response,
+            )
+        return response.raw_response
+
+    async def upload_file(
+        self,
+        path: Any,
+        *,
+        poll_interval_sec: float = 1.0,
+        timeout_sec: float = 60.0,
+    ) -> Any:
+        """
+        파일 업로드 후 ACTIVE 될 때까지 async 폴링
+
+        timeout_sec 안에 ACTIVE 가 안 되면 경고 후 마지막 상태의 파일 반환 (기존 동작).
+
+        Raises:
+            GenAIGatewayError: 처리 실패 상태 (FAILED / ERROR)
+        """
+        self.bind_loop()
+        async with self._slot("files"):
+            uploaded = await self.client.aio.files.upload(file=path)
+        self.stats.uploads += 1
+
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            state = getattr(uploaded, "state", None)
+            name = getattr(state, "name", None) if state else None
+            if name in FILE_READY_STATES:
+                return uploaded
+            if name in FILE_FAILED_STATES:
+                raise GenAIGatewayError(f"file processing failed: state={name}")
+            if time.monotonic() >= deadline:
+                logger.warning(f"File polling timed out, state={name}. Inference may fail.")
+                return uploaded
+            await asyncio.sleep(poll_interval_sec)
+            try:
+                uploaded = await self.client.aio.files.get(name=uploaded.name)
+            except Exception:
+                pass
+
+    # ------------------
+    # Sync bridge
+    # ------------------
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """바인딩된 루프가 없을 때 (순수 동기 호출자) 쓰는 게이트웨이 전용 루프 (데몬 스레드, 프로세스 수명)"""
+        with self._fallback_lock:
+            loop = self._loop
+            if loop is None or not loop.is_running():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="genai-gateway-loop", daemon=True).start()
+                self.bind_loop(loop)
+            return loop
+
+    def run_sync(self, coro_fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        동기 코드 (executor 스레드) 에서 게이트웨이 호출
+
+        바인딩된 루프 (앱 / 워커 / 스크립트의 bind_loop) 에서 실행하고 결과를 기다림
+        (스레드만 대기, 루프는 계속 동작). 바인딩된 루프가 없으면 전용 루프 스레드에서 실행
+        → 호출마다 새 루프를 만들지 않아 공유 Client 의 커넥션이 닫힌 루프에 묶이지 않음.
+        """
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            loop = self._background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("run_sync called on the event loop thread; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro_fn(*args, **kwargs), loop).result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats.to_dict(),
+            "max_concurrency": self.max_concurrency,
+            "model_concurrency": self.model_concurrency,
+        }
+
+
+# Singleton instance
+_genai_gateway: Optional[GenAIGateway] = None
+
+
+def get_genai_gateway() -> GenAIGateway:
+    """싱글톤 GenAIGateway 반환 (Client 는 첫 호출 시 생성)"""
+    global _genai_gateway
+    if _genai_gateway is None:
+        from app.config import settings
+
+        _genai_gateway = GenAIGateway(
+            max_concurrency=settings.GENAI_MAX_CONCURRENCY,
+            model_concurrency=settings.GENAI_MODEL_CONCURRENCY,
+            max_retry_wait_sec=settings.GENAI_MAX_RETRY_WAIT_SEC,
+        )
+    return _genai_gateway
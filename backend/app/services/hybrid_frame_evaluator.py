@@ -0,0 +1,288 @@
+"""
+Hybrid Frame Evaluator for Real-time Video Coaching
+
+1fps 코칭 프레임 평가를 로컬 CV 우선으로 처리.
+
+기존: 모든 프레임 → FrameAnalyzer.analyze_frame (Gemini Vision 원격 호출, 수 초)
+현재:
+1. 프레임 1회 디코드 (base64 또는 binary 모드 raw bytes → BGR ndarray)
+2. 결정론적으로 측정 가능한 규칙은 로컬 계산
+   - MetricCalculators (cv_measurement_pass.py) 로 측정
+   - MetricEvaluator.evaluate (proof_patterns.py) 로 판정
+3. 의미 판단이 필요한 시각 규칙만 Gemini Vision 으로 escalate
+
+로컬 측정 메트릭 (단일 프레임):
+- cmp.center_offset_xy.v1 → max(|x|, |y|)
+- lit.brightness_ratio.v1
+- cmp.blur_score.v1
+- cmp.face_bbox.v1 → area_ratio
+- txt.text_density.v1 → text_area_ratio
+(edit.scene_change.v1 은 2 프레임 이상 필요 → 대상 아님)
+
+Usage:
+    evaluator = get_hybrid_frame_evaluator()
+    results = await evaluator.evaluate_frame(frame_b64, rules, t_sec)
+"""
+import asyncio
+import base64
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.services.frame_analyzer import FrameAnalysisResult, is_visual_rule
+from app.services.proof_patterns import EvaluationStatus, MetricEvaluator, get_metric_evaluator
+
+logger = logging.getLogger(__name__)
+
+
+# ====================
+# LOCAL METRICS
+# ====================
+
+def _center_offset(frame: np.ndarray) -> Tuple[Optional[float], float]:
+    from app.services.vdg_2pass.cv_measurement_pass import MetricCalculators
+
+    (offset_x, offset_y), confidence = MetricCalculators.center_offset_xy([frame])
+    return max(abs(offset_x), abs(offset_y)), confidence
+
+
+def _brightness(frame: np.ndarray) -> Tuple[Optional[float], float]:
+    from app.services.vdg_2pass.cv_measurement_pass import MetricCalculators
+
+    return MetricCalculators.brightness_ratio([frame])
+
+
+def _blur(frame: np.ndarray) -> Tuple[Optional[float], float]:
+    from app.services.vdg_2pass.cv_measurement_pass import MetricCalculators
+
+    value, _ = MetricCalculators.blur_score([frame])
+    return value, 0.8  # 단일 프레임 (배치 confidence 는 프레임 수 기반이라 사용 안 함)
+
+
+def _face_area(frame: np.ndarray) -> Tuple[Optional[float], float]:
+    from app.services.vdg_2pass.cv_measurement_pass import MetricCalculators
+
+    value, confidence = MetricCalculators.face_bbox([frame])
+    return value["area_ratio"], confidence
+
+
+def _text_density(frame: np.ndarray) -> Tuple[Optional[float], float]:
+    from app.services.vdg_2pass.cv_measurement_pass import MetricCalculators
+
+    value, _ = MetricCalculators.text_density([frame])
+    return value["text_area_ratio"], 0.8
+
+
+# metric_id → frame → (scalar value, confidence)
+LOCAL_FRAME_METRICS: Dict[str, Callable[[np.ndarray], Tuple[Optional[float], float]]] = {
+    "cmp.center_offset_xy.v1": _center_offset,
+    "lit.brightness_ratio.v1": _brightness,
+    "cmp.blur_score.v1": _blur,
+    "cmp.face_bbox.v1": _face_area,
+    "txt.text_density.v1": _text_density,
+}
+
+
+FramePayload = Union[str, bytes, memoryview]
+
+
+def decode_frame(frame: FramePayload) -> Optional[np.ndarray]:
+    """
+    JPEG/PNG → BGR ndarray (실패 시 None)
+
+    str 은 base64 로 디코드, bytes / memoryview 는 버퍼를 그대로 사용 (복사 없음).
+    """
+    import cv2
+
+    try:
+        raw = base64.b64decode(frame) if isinstance(frame, str) else frame
+        data = np.frombuffer(raw, dtype=np.uint8)
+    except (ValueError, TypeError):
+        return None
+    if data.size == 0:
+        return None
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+def _metric_id(rule: Any) -> str:
+    spec = getattr(rule, "spec", None)
+    return getattr(spec, "metric_id", "") or ""
+
+
+def is_local_rule(rule: Any) -> bool:
+    """로컬 CV 로 결정론적 측정 가능한 규칙인지"""
+    return _metric_id(rule) in LOCAL_FRAME_METRICS
+
+
+# ====================
+# HYBRID EVALUATOR
+# ====================
+
+@dataclass
+class HybridFrameStats:
+    """평가 통계 (모니터링용)"""
+    frames: int = 0
+    decode_failures: int = 0
+    local_rules: int = 0
+    escalated_rules: int = 0
+    vision_calls: int = 0
+    local_ms_total: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "decode_failures": self.decode_failures,
+            "local_rules": self.local_rules,
+            "escalated_rules": self.escalated_rules,
+            "vision_calls": self.vision_calls,
+            "avg_local_ms": round(self.local_ms_total / self.frames, 2) if self.frames else 0.0,
+        }
+
+
+class HybridFrameEvaluator:
+    """
+    로컬 CV 우선 + Gemini Vision escalation 프레임 평가기
+
+    반환 형식은 FrameAnalyzer.analyze_frame 과 동일 ({rule_id: FrameAnalysisResult}).
+    """
+
+    def __init__(
+        self,
+        metric_evaluator: Optional[MetricEvaluator] = None,
+        vision_analyzer: Optional[Any] = None,
+        use_vision: bool = True,
+    ):
+        """
+        Args:
+            metric_evaluator: 규칙 판정기 (기본: 싱글톤)
+            vision_analyzer: FrameAnalyzer (없으면 첫 escalation 시 get_frame_analyzer)
+            use_vision: False 면 로컬 규칙만 평가
+        """
+        self.metric_evaluator = metric_evaluator or get_metric_evaluator()
+        self._vision_analyzer = vision_analyzer
+        self.use_vision = use_vision
+        self.stats = HybridFrameStats()
+
+    def _get_vision_analyzer(self) -> Optional[Any]:
+        if self._vision_analyzer is None and self.use_vision:
+            try:
+                from app.services.frame_analyzer import get_frame_analyzer
+                self._vision_analyzer = get_frame_analyzer()
+            except ValueError as e:
+                logger.warning(f"Vision analyzer unavailable, local CV only: {e}")
+                self.use_vision = False
+        return self._vision_analyzer
+
+    def forget_session(self, session_id: str) -> None:
+        """세션 종료 시 Vision rate limit 상태 제거"""
+        if self._vision_analyzer is not None and hasattr(self._vision_analyzer, "forget_session"):
+            self._vision_analyzer.forget_session(session_id)
+
+    def split_rules(self, rules: List[Any]) -> Tuple[List[Any], List[Any]]:
+        """(로컬 규칙, escalate 대상 시각 규칙)"""
+        local, remote = [], []
+        for rule in rules:
+            if is_local_rule(rule):
+                local.append(rule)
+            elif is_visual_rule(rule):
+                remote.append(rule)
+        return local, remote
+
+    def evaluate_local(
+        self,
+        frame: np.ndarray,
+        rules: List[Any],
+        t_sec: float = 0.0,
+    ) -> Dict[str, FrameAnalysisResult]:
+        """디코드된 프레임으로 로컬 규칙 평가 (동기, CPU)"""
+        measured: Dict[str, Tuple[Optional[float], float]] = {}
+        results: Dict[str, FrameAnalysisResult] = {}
+
+        for rule in rules:
+            metric_id = _metric_id(rule)
+            if metric_id not in measured:  # 같은 메트릭은 프레임당 1회만 측정
+                try:
+                    measured[metric_id] = LOCAL_FRAME_METRICS[metric_id](frame)
+                except Exception as e:
+                    logger.warning(f"Local metric {metric_id} failed: {e}")
+                    measured[metric_id] = (None, 0.0)
+            value, confidence = measured[metric_id]
+
+            evaluation = self.metric_evaluator.evaluate(pattern=rule, metric_value=value, t_sec=t_sec)
+            if evaluation.status in (EvaluationStatus.UNKNOWN, EvaluationStatus.ERROR):
+                continue
+
+            results[rule.rule_id] = FrameAnalysisResult(
+                rule_id=rule.rule_id,
+                is_compliant=evaluation.status != EvaluationStatus.FAIL,
+                confidence=round(confidence, 4),
+                message=evaluation.coach_line,
+                measured_value=value,
+                source="local_cv",
+            )
+        return results
+
+    async def evaluate_frame(
+        self,
+        frame_base64: FramePayload,
+        rules: List[Any],
+        t_sec: float = 0.0,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, FrameAnalysisResult]:
+        """
+        프레임 평가: 로컬 규칙 (스레드) + 필요 시 Vision escalation (동시 실행)
+
+        Args:
+            frame_base64: base64 문자열 (JSON 모드) 또는 raw bytes / memoryview (binary 모드)
+
+        Returns:
+            {rule_id: FrameAnalysisResult}
+        """
+        local_rules, remote_rules = self.split_rules(rules)
+        self.stats.frames += 1
+        self.stats.local_rules += len(local_rules)
+
+        vision_task = None
+        analyzer = self._get_vision_analyzer() if remote_rules else None
+        if analyzer is not None:
+            self.stats.escalated_rules += len(remote_rules)
+            self.stats.vision_calls += 1
+            vision_task = asyncio.ensure_future(
+                analyzer.analyze_frame(
+                    frame_base64, remote_rules, current_time=t_sec, session_id=session_id
+                )
+            )
+
+        results: Dict[str, FrameAnalysisResult] = {}
+        if local_rules:
+            start = time.perf_counter()
+            frame = await asyncio.to_thread(decode_frame, frame_base64)
+            if frame is None:
+                self.stats.decode_failures += 1
+                logger.warning("Frame decode failed, skipping local evaluation")
+            else:
+                results.update(await asyncio.to_thread(self.evaluate_local, frame, local_rules, t_sec))
+            self.stats.local_ms_total += (time.perf_counter() - start) * 1000
+
+        if vision_task is not None:
+            try:
+                results.update(await vision_task)
+            except Exception as e:
+                logger.error(f"Vision escalation failed: {e}")
+
+        return results
+
+
+# Singleton instance
+_hybrid_evaluator: Optional[HybridFrameEvaluator] = None
+
+
+def get_hybrid_frame_evaluator() -> HybridFrameEvaluator:
+    """싱글톤 HybridFrameEvaluator 인스턴스 반환"""
+    global _hybrid_evaluator
+    if _hybrid_evaluator is None:
+        _hybrid_evaluator = HybridFrameEvaluator()
+    return _hybrid_evaluator
@@ -0,0 +1,199 @@
+"""
+LLM Call Metrics Registry (토큰/레이턴시 집계)
+
+기존: GenAIResponse 에 latency_ms / usage / attempt_count 가 있지만 집계하는 곳이 없음
+→ 어떤 파이프라인 (VDG Pass 1, 프레임 분석, 에이전트 채팅 ...) 이 비용/꼬리 레이턴시를
+  지배하는지, 워커 풀을 얼마나 잡아야 하는지 알 수 없음.
+
+현재: 모든 GenAI 호출 (GenAIGateway.generate, genai_client.generate_content) 이
+프로세스 내 레지스트리에 기록 → /api/v1/monitoring/metrics 에서 Prometheus 텍스트로 노출
+- komission_llm_requests_total{model, site, status}     호출 수 (status: success | error_code)
+- komission_llm_request_duration_seconds{model, site}   레이턴시 히스토그램 (재시도 포함 전체)
+- komission_llm_tokens_total{model, site, type}         토큰 (prompt | completion)
+- komission_llm_retries_total{model, site}              재시도 횟수
+
+site 는 호출 지점 이름 (vdg_pass1, frame_analysis, agent_chat ...) - 라벨 카디널리티가
+모델 수 × 호출 지점 수로 고정되도록 자유 문자열 대신 코드 상수로만 넘길 것.
+
+Usage:
+    llm_metrics.record(response, site="vdg_pass1")
+    text = llm_metrics.render_prometheus()
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# 레이턴시 버킷 (초) - 프레임 분석 (~1s) 부터 영상 Pass 1 (수 분) 까지
+DEFAULT_LATENCY_BUCKETS_SEC = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+METRIC_PREFIX = "komission_llm"
+
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@dataclass
+class _Histogram:
+    """누적 버킷 히스토그램"""
+    buckets: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한 기준 근사 분위수 (마지막 버킷 초과면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, cumulative in zip(self.buckets, self.counts):
+            if cumulative >= rank:
+                return bound
+        return None
+
+
+class LLMMetricsRegistry:
+    """프로세스 내 LLM 호출 메트릭 레지스트리 (thread-safe)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_SEC):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._latency: Dict[Tuple[str, str], _Histogram] = {}
+        self._tokens: Dict[Tuple[str, str, str], int] = {}
+        self._retries: Dict[Tuple[str, str], int] = {}
+
+    def observe(
+        self,
+        *,
+        model: str,
+        site: str,
+        status: str,
+        latency_ms: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        attempts: int = 1,
+    ) -> None:
+        """호출 1회 기록"""
+        model = model or "unknown"
+        with self._lock:
+            self._requests[(model, site, status)] = self._requests.get((model, site, status), 0) + 1
+
+            histogram = self._latency.get((model, site))
+            if histogram is None:
+                histogram = self._latency[(model, site)] = _Histogram(self.buckets)
+            histogram.observe(max(0.0, latency_ms) / 1000)
+
+            for kind, value in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+                if value:
+                    self._tokens[(model, site, kind)] = self._tokens.get((model, site, kind), 0) + value
+            if attempts > 1:
+                self._retries[(model, site)] = self._retries.get((model, site), 0) + attempts - 1
+
+    def record(self, response: Any, site: str = "unknown") -> None:
+        """GenAIResponse 기록"""
+        usage = response.usage or {}
+        if response.success:
+            status = "success"
+        else:
+            status = getattr(response.error_code, "value", None) or str(response.error_code or "unknown")
+        self.observe(
+            model=response.model,
+            site=site,
+            status=status,
+            latency_ms=response.latency_ms,
+            prompt_tokens=usage.get("prompt_tokens") or 0,
+            completion_tokens=usage.get("completion_tokens") or 0,
+            attempts=response.attempt_count,
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._latency.clear()
+            self._tokens.clear()
+            self._retries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON 요약 (model/site 별 호출 수, 토큰, 평균/근사 p95 레이턴시)"""
+        with self._lock:
+            sites: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            for (model, site), histogram in self._latency.items():
+                p95 = histogram.quantile(0.95)
+                sites[(model, site)] = {
+                    "model": model,
+                    "site": site,
+                    "calls": histogram.count,
+                    "errors": sum(
+                        n for (m, s, status), n in self._requests.items()
+                        if (m, s) == (model, site) and status != "success"
+                    ),
+                    "retries": self._retries.get((model, site), 0),
+                    "prompt_tokens": self._tokens.get((model, site, "prompt"), 0),
+                    "completion_tokens": self._tokens.get((model, site, "completion"), 0),
+                    "avg_latency_ms": round(histogram.total / histogram.count * 1000, 1),
+                    "p95_latency_ms_upper": p95 * 1000 if p95 is not None else None,
+                }
+        return {"calls": sorted(sites.values(), key=lambda r: (r["site"], r["model"]))}
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            name = f"{METRIC_PREFIX}_requests_total"
+            lines += [f"# HELP {name} LLM calls by model, call site and outcome.", f"# TYPE {name} counter"]
+            for (model, site, status), value in sorted(self._requests.items()):
+                lines.append(f"{name}{_labels(model=model, site=site, status=status)} {value}")
+
+            name = f"{METRIC_PREFIX}_request_duration_seconds"
+            lines += [f"# HELP {name} LLM call latency including retries.", f"# TYPE {name} histogram"]
+            for (model, site), histogram in sorted(self._latency.items()):
+                for bound, cumulative in zip(histogram.buckets, histogram.counts):
+                    labels = _labels(model=model, site=site, le=_number(bound))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                lines.append(f"{name}_bucket{_labels(model=model, site=site, le='+Inf')} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(model=model, site=site)} {_number(round(histogram.total, 6))}")
+                lines.append(f"{name}_count{_labels(model=model, site=site)} {histogram.count}")
+
+            name = f"{METRIC_PREFIX}_tokens_total"
+            lines += [f"# HELP {name} LLM tokens by model, call site and type.", f"# TYPE {name} counter"]
+            for (model, site, kind), value in sorted(self._tokens.items()):
+                lines.append(f"{name}{_labels(model=model, site=site, type=kind)} {value}")
+
+            name = f"{METRIC_PREFIX}_retries_total"
+            lines += [f"# HELP {name} LLM call retries by model and call site.", f"# TYPE {name} counter"]
+            for (model, site), value in sorted(self._retries.items()):
+                lines.append(f"{name}{_labels(model=model, site=site)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def render_gauges(gauges: Dict[str, Tuple[str, float]]) -> str:
+    """{name: (help, value)} → Prometheus gauge 텍스트 (게이트웨이 in-flight 등 순간값)"""
+    lines: List[str] = []
+    for name, (help_text, value) in gauges.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {_number(value)}"]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+# Singleton instance
+llm_metrics = LLMMetricsRegistry()
@@ -80,7 +80,7 @@ class LogQualityValidator:
     
     Usage:
         validator = LogQualityValidator()
-        report = validator.validate_all_sessions()
+        report = await validator.validate_all_sessions()
         
         if report.is_ready_for_flywheel:
             print("✅ Ready for DistillRun!")
@@ -95,14 +95,14 @@ class LogQualityValidator:
         """Initialize with optional session logger."""
         self._logger = session_logger or get_session_logger()
     
-    def validate_all_sessions(self) -> LogQualityReport:
+    async def validate_all_sessions(self) -> LogQualityReport:
         """
         Run all quality checks on logged sessions.
         
         Returns:
             LogQualityReport with all check results
         """
-        stats = self._logger.get_all_sessions_summary()
+        stats = await self._logger.get_all_sessions_summary()
         total_sessions = stats.get("total_sessions", 0)
         
         checks = []
@@ -133,14 +133,14 @@ class LogQualityValidator:
             summary=summary
         )
     
-    def validate_session(self, session_id: str) -> List[QualityCheck]:
+    async def validate_session(self, session_id: str) -> List[QualityCheck]:
         """
         Validate a single session's log quality.
         
         Returns:
             List of quality checks for this session
         """
-        summary = self._logger.get_session_summary(session_id)
+        summary = await self._logger.get_session_summary(session_id)
         if not summary:
             return [QualityCheck(
                 name="session_exists",
@@ -73,12 +73,14 @@ class OpalEngine:
         
         try:
             from google.genai import types
-            response = self.client.models.generate_content(
+            from app.services.genai_gateway import get_genai_gateway
+            response = await get_genai_gateway().generate_or_raise(
+                prompt,
                 model=self.model,
-                contents=prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json"
-                )
+                ),
+                site="opal_decision",
             )
             result = json.loads(response.text)
             
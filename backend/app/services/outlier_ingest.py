@@ -0,0 +1,195 @@
+"""
+Outlier Bulk Ingestion
+
+크롤러 / CSV 결과를 outlier_items 에 일괄 적재.
+
+기존 방식: 아이템마다 SELECT ... WHERE external_id = ? + flush()
+→ 500개 크롤 = 1000+ DB 왕복
+
+현재 방식:
+1. 메모리 dedupe (external_id, video_url 기준, 먼저 나온 행 유지)
+2. chunk 마다 INSERT ... ON CONFLICT DO NOTHING RETURNING id, external_id 1회
+   - external_id / video_url 모두 unique → 충돌 대상 미지정 (둘 중 어느 쪽이든 스킵)
+3. inserted / skipped 카운트 반환 → RunManager result_summary 에 기록
+
+사용처:
+- scripts/run_scheduled_crawl.py (run_outlier_crawlers)
+- scripts/ingest_outlier_csv_db.py
+- POST /api/v1/outliers/items/bulk-csv
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import OutlierItem, OutlierItemStatus, OutlierSource
+from app.utils.time import utcnow
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+# INSERT 컬럼 (모든 행이 같은 키를 가져야 multi-VALUES 로 묶임)
+INGEST_COLUMNS = (
+    "source_id",
+    "external_id",
+    "video_url",
+    "title",
+    "thumbnail_url",
+    "platform",
+    "category",
+    "view_count",
+    "like_count",
+    "share_count",
+    "growth_rate",
+    "outlier_score",
+    "outlier_tier",
+    "creator_username",
+    "status",
+    "raw_payload",
+    "canonical_url",
+    "run_id",
+    "upload_date",
+    "crawled_at",
+)
+
+
+@dataclass
+class OutlierIngestResult:
+    """일괄 적재 결과"""
+    received: int = 0
+    duplicates_in_batch: int = 0  # 메모리 dedupe 로 제거된 행
+    inserted: int = 0
+    skipped_existing: int = 0  # DB 에 이미 있어 ON CONFLICT 로 스킵된 행
+    invalid: int = 0  # external_id / video_url 누락
+    inserted_ids: List[Tuple[UUID, str]] = field(default_factory=list)  # (id, external_id)
+
+    @property
+    def skipped(self) -> int:
+        return self.duplicates_in_batch + self.skipped_existing + self.invalid
+
+    def merge(self, other: "OutlierIngestResult") -> "OutlierIngestResult":
+        return OutlierIngestResult(
+            received=self.received + other.received,
+            duplicates_in_batch=self.duplicates_in_batch + other.duplicates_in_batch,
+            inserted=self.inserted + other.inserted,
+            skipped_existing=self.skipped_existing + other.skipped_existing,
+            invalid=self.invalid + other.invalid,
+            inserted_ids=self.inserted_ids + other.inserted_ids,
+        )
+
+    def to_summary(self) -> Dict[str, int]:
+        """RunManager result_summary / API 응답용"""
+        return {
+            "received": self.received,
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "skipped_existing": self.skipped_existing,
+            "duplicates_in_batch": self.duplicates_in_batch,
+            "invalid": self.invalid,
+        }
+
+
+async def get_or_create_source(
+    db: AsyncSession,
+    name: str,
+    base_url: str = "manual://",
+    auth_type: str = "none",
+    **extra: Any,
+) -> OutlierSource:
+    """OutlierSource 조회, 없으면 생성 (flush 로 id 할당)"""
+    result = await db.execute(select(OutlierSource).where(OutlierSource.name == name))
+    source = result.scalar_one_or_none()
+    if source:
+        return source
+
+    source = OutlierSource(name=name, base_url=base_url, auth_type=auth_type, **extra)
+    db.add(source)
+    await db.flush()
+    return source
+
+
+def _normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    values = {col: row.get(col) for col in INGEST_COLUMNS}
+    values["status"] = values["status"] or OutlierItemStatus.PENDING
+    values["crawled_at"] = values["crawled_at"] or utcnow()
+    values["view_count"] = values["view_count"] or 0
+    if values["raw_payload"] is None:  # JSONB 에 None 을 넘기면 JSON 'null' 로 저장됨 → SQL NULL
+        values["raw_payload"] = null()
+    return values
+
+
+def dedupe_rows(rows: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int, int]:
+    """external_id / video_url 기준 메모리 dedupe
+
+    Returns:
+        (unique_rows, duplicates, invalid)
+    """
+    seen_ids = set()
+    seen_urls = set()
+    unique: List[Dict[str, Any]] = []
+    duplicates = 0
+    invalid = 0
+
+    for row in rows:
+        external_id = row.get("external_id")
+        video_url = row.get("video_url")
+        if not external_id or not video_url:
+            invalid += 1
+            continue
+        if external_id in seen_ids or video_url in seen_urls:
+            duplicates += 1
+            continue
+        seen_ids.add(external_id)
+        seen_urls.add(video_url)
+        unique.append(row)
+
+    return unique, duplicates, invalid
+
+
+async def bulk_insert_outliers(
+    db: AsyncSession,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> OutlierIngestResult:
+    """OutlierItem 일괄 INSERT (이미 있는 external_id / video_url 은 스킵)
+
+    Args:
+        db: AsyncSession (commit 은 호출자 책임)
+        rows: INGEST_COLUMNS 키를 가진 dict 목록 (누락 키는 None/기본값)
+        chunk_size: INSERT 한 번에 묶을 행 수
+
+    Returns:
+        OutlierIngestResult
+    """
+    unique, duplicates, invalid = dedupe_rows(rows)
+    result = OutlierIngestResult(
+        received=len(rows),
+        duplicates_in_batch=duplicates,
+        invalid=invalid,
+    )
+
+    for start in range(0, len(unique), chunk_size):
+        chunk = [_normalize_row(row) for row in unique[start:start + chunk_size]]
+        stmt = (
+            pg_insert(OutlierItem)
+            .values(chunk)
+            .on_conflict_do_nothing()
+            .returning(OutlierItem.id, OutlierItem.external_id)
+        )
+        inserted = (await db.execute(stmt)).all()
+        result.inserted += len(inserted)
+        result.skipped_existing += len(chunk) - len(inserted)
+        result.inserted_ids.extend((row_id, ext_id) for row_id, ext_id in inserted)
+
+    logger.info(
+        f"Outlier ingest: received={result.received}, inserted={result.inserted}, "
+        f"skipped={result.skipped} (existing={result.skipped_existing}, "
+        f"dup={result.duplicates_in_batch}, invalid={result.invalid})"
+    )
+    return result
@@ -0,0 +1,274 @@
+"""
+Outlier Listing Engine (GET /api/v1/outliers)
+
+기존: select(OutlierItem) 로 limit (최대 2000) 행의 모든 컬럼 (raw_payload, best_comments JSONB 포함) 을
+      읽어 와 파이썬에서 vdg_analysis 추출 + len(best_comments) 계산
+→ 큐레이터 대시보드 폴링이 DB egress / 직렬화 시간을 지배.
+
+현재:
+- 컬럼 프로젝션: 목록에 필요한 컬럼만 SELECT
+  - best_comments_count = jsonb_array_length (SQL), creator_username 폴백 = raw_payload->>'creator_username'
+  - vdg_analysis (raw_payload->'vdg_analysis') 는 include_vdg=true 일 때만
+- keyset 커서: (정렬 키 DESC NULLS LAST, id DESC) 기준 - OFFSET/큰 limit 없이 다음 페이지
+  (ix_outlier_items_listing_* 인덱스와 같은 순서)
+- 조건부 GET: 필터 집합의 (count, max(updated_at)) 로 ETag 계산 → If-None-Match 일치 시 행 조회 없이 304
+
+Usage:
+    query = OutlierListQuery(sort_by="outlier_score", limit=100, cursor=request_cursor)
+    etag = compute_etag(query, *(await db.execute(build_validator_statement(query))).one())
+    page = await fetch_outlier_page(db, query)  # {"total", "items", "next_cursor"}
+"""
+import base64
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.models import OutlierItem, OutlierItemStatus
+from app.utils.time import days_ago, utcnow
+
+
+CURSOR_VERSION = 1
+
+# sort_by → 정렬 컬럼 (알 수 없는 값은 outlier_score - 기존 동작)
+SORT_COLUMNS = {
+    "outlier_score": OutlierItem.outlier_score,
+    "view_count": OutlierItem.view_count,
+    "crawled_at": OutlierItem.crawled_at,
+}
+DEFAULT_SORT = "outlier_score"
+
+
+@dataclass
+class OutlierListQuery:
+    """목록 요청 파라미터 (ETag 키에도 사용)"""
+    category: Optional[str] = None
+    platform: Optional[str] = None
+    tier: Optional[str] = None
+    status: Optional[str] = None
+    campaign_eligible: Optional[bool] = None
+    analysis_status: Optional[str] = None
+    freshness: Optional[str] = "7d"
+    sort_by: Optional[str] = DEFAULT_SORT
+    limit: int = 100
+    cursor: Optional[str] = None
+    include_vdg: bool = False
+
+    @property
+    def sort_key(self) -> str:
+        return self.sort_by if self.sort_by in SORT_COLUMNS else DEFAULT_SORT
+
+
+# ==================
+# Cursor
+# ==================
+
+def _encode_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_cursor(sort_key: str, value: Any, item_id: UUID) -> str:
+    """마지막 행의 (정렬 값, id) → URL-safe 커서"""
+    raw = json.dumps([CURSOR_VERSION, sort_key, _encode_value(value), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, UUID]:
+    """
+    커서 → (정렬 값, id)
+
+    Raises:
+        ValueError: 손상된 커서 또는 다른 sort_by 로 만든 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        version, cursor_sort, value, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        item_uuid = UUID(item_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    if version != CURSOR_VERSION or cursor_sort != sort_key:
+        raise ValueError("Cursor does not match sort_by")
+    if value is not None and sort_key == "crawled_at":
+        value = datetime.fromisoformat(value)
+    return value, item_uuid
+
+
+def keyset_predicate(column: Any, value: Any, last_id: UUID):
+    """(column DESC NULLS LAST, id DESC) 순서에서 (value, last_id) 다음 행"""
+    if value is None:
+        return and_(column.is_(None), OutlierItem.id < last_id)
+    return or_(
+        column < value,
+        and_(column == value, OutlierItem.id < last_id),
+        column.is_(None),
+    )
+
+
+# ==================
+# Statements
+# ==================
+
+def listing_filters(query: OutlierListQuery) -> List[Any]:
+    """WHERE 조건 (기존 list_outliers 필터와 동일)"""
+    conditions = []
+    if query.category:
+        conditions.append(OutlierItem.category == query.category)
+    if query.platform:
+        conditions.append(OutlierItem.platform == query.platform)
+    if query.tier:
+        conditions.append(OutlierItem.outlier_tier == query.tier)
+    if query.status:
+        status_enum = getattr(OutlierItemStatus, query.status.upper(), None)
+        if status_enum:
+            conditions.append(OutlierItem.status == status_enum)
+    if query.campaign_eligible is not None:
+        conditions.append(OutlierItem.campaign_eligible == query.campaign_eligible)
+    if query.analysis_status:
+        conditions.append(OutlierItem.analysis_status == query.analysis_status)
+
+    if query.freshness == "24h":
+        conditions.append(OutlierItem.crawled_at >= utcnow() - timedelta(hours=24))
+    elif query.freshness == "7d":
+        conditions.append(OutlierItem.crawled_at >= days_ago(7))
+    elif query.freshness == "30d":
+        conditions.append(OutlierItem.crawled_at >= days_ago(30))
+    return conditions
+
+
+def listing_columns(include_vdg: bool = False) -> List[Any]:
+    """목록 응답에 필요한 컬럼만 (raw_payload / best_comments 전체는 읽지 않음)"""
+    columns = [
+        OutlierItem.id,
+        OutlierItem.external_id,
+        OutlierItem.video_url,
+        OutlierItem.platform,
+        OutlierItem.category,
+        OutlierItem.title,
+        OutlierItem.thumbnail_url,
+        OutlierItem.view_count,
+        OutlierItem.like_count,
+        OutlierItem.share_count,
+        OutlierItem.outlier_score,
+        OutlierItem.outlier_tier,
+        OutlierItem.creator_avg_views,
+        func.coalesce(
+            OutlierItem.creator_username, OutlierItem.raw_payload["creator_username"].astext,
+        ).label("creator_username"),
+        OutlierItem.upload_date,
+        OutlierItem.crawled_at,
+        OutlierItem.status,
+        OutlierItem.analysis_status,
+        OutlierItem.promoted_to_node_id,
+        case(
+            (func.jsonb_typeof(OutlierItem.best_comments) == "array", func.jsonb_array_length(OutlierItem.best_comments)),
+            else_=0,
+        ).label("best_comments_count"),
+    ]
+    if include_vdg:
+        columns.append(OutlierItem.raw_payload["vdg_analysis"].label("vdg_analysis"))
+    else:
+        columns.append(literal(None).label("vdg_analysis"))
+    return columns
+
+
+def build_list_statement(query: OutlierListQuery) -> Select:
+    """
+    한 페이지 조회 (limit + 1 행 - 다음 페이지 존재 여부 판단용)
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    sort_column = SORT_COLUMNS[query.sort_key]
+    statement = select(*listing_columns(query.include_vdg)).where(*listing_filters(query))
+    if query.cursor:
+        value, last_id = decode_cursor(query.cursor, query.sort_key)
+        statement = statement.where(keyset_predicate(sort_column, value, last_id))
+    return statement.order_by(sort_column.desc().nullslast(), OutlierItem.id.desc()).limit(query.limit + 1)
+
+
+def build_validator_statement(query: OutlierListQuery) -> Select:
+    """ETag 검증용 (count, max(updated_at)) - 필터 집합 기준 (행 데이터는 읽지 않음)"""
+    return select(func.count(OutlierItem.id), func.max(OutlierItem.updated_at)).where(*listing_filters(query))
+
+
+def compute_etag(query: OutlierListQuery, count: int, max_updated_at: Optional[datetime]) -> str:
+    """요청 파라미터 + 필터 집합 버전 → weak ETag"""
+    raw = json.dumps(
+        [asdict(query), count, _encode_value(max_updated_at)], sort_keys=True, default=str,
+    )
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 비교 (weak 비교, 목록/와일드카드 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in if_none_match.split(",")}
+
+
+# ==================
+# Page
+# ==================
+
+def serialize_row(row: Any) -> Dict[str, Any]:
+    """프로젝션 행 → 기존 응답 형식"""
+    return {
+        "id": str(row.id),
+        "external_id": row.external_id,
+        "video_url": row.video_url,
+        "platform": row.platform,
+        "category": row.category,
+        "title": row.title,
+        "thumbnail_url": row.thumbnail_url,
+        "view_count": row.view_count or 0,
+        "like_count": row.like_count or 0,
+        "share_count": row.share_count or 0,
+        "outlier_score": row.outlier_score or 0,
+        "outlier_tier": row.outlier_tier or "C",
+        "creator_avg_views": row.creator_avg_views or 10000,
+        "creator_username": row.creator_username,
+        "upload_date": row.upload_date.isoformat() if row.upload_date else None,
+        "engagement_rate": (row.like_count or 0) / max(row.view_count or 1, 1),
+        "crawled_at": row.crawled_at.isoformat() if row.crawled_at else None,
+        "status": row.status.value.lower() if row.status else "pending",
+        # VDG Analysis Gate
+        "analysis_status": row.analysis_status or "pending",
+        "promoted_to_node_id": str(row.promoted_to_node_id) if row.promoted_to_node_id else None,
+        "best_comments_count": row.best_comments_count or 0,
+        # VDG Analysis Data (raw_payload.vdg_analysis, include_vdg=true 일 때만)
+        "vdg_analysis": row.vdg_analysis,
+    }
+
+
+async def fetch_outlier_page(db: AsyncSession, query: OutlierListQuery) -> Dict[str, Any]:
+    """
+    한 페이지 조회
+
+    Returns:
+        {"total": 이 페이지 행 수, "items": [...], "next_cursor": str | None}
+    """
+    rows = (await db.execute(build_list_statement(query))).all()
+    has_more = len(rows) > query.limit
+    rows = rows[:query.limit]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(query.sort_key, getattr(last, query.sort_key), last.id)
+    return {
+        "total": len(rows),
+        "items": [serialize_row(row) for row in rows],
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,134 @@
+"""
+Rule Interval Index for Time-windowed Rule Activation
+
+기존: AudioCoach.get_next_command / _get_active_rules / _get_current_checkpoint_id,
+      handle_video_frame 가 메트릭/프레임 메시지마다 checkpoints + dna_invariants 전체를 선형 스캔
+→ 수백 규칙 long-form pack 을 10Hz+ 로 평가하면 세션 수에 비례해 CPU 낭비.
+
+현재: set_coaching_context 시 DirectorPack 을 정렬된 구간 인덱스로 1회 컴파일
+- 모든 창 경계점을 정렬 → 경계점 자체 + 경계점 사이 열린 구간 = 원소 구간 (2n+1 개)
+- 원소 구간마다 결과를 미리 계산
+  - 활성 checkpoint (pack 순서 유지)
+  - checkpoint 기반 활성 규칙 (우선순위 정렬, 같은 우선순위는 pack 순서)
+  - time_scope 기반 활성 규칙 (handle_video_frame 용)
+- 조회: bisect 1회 → O(log n)
+
+창은 양끝 포함 [start, end] (기존 `t_window[0] <= t <= t_window[1]` 와 동일).
+
+Usage:
+    index = RuleIntervalIndex(pack)
+    rules = index.active_rules_at(t_sec)
+"""
+from bisect import bisect_left
+from typing import Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# One-Command Priority Queue 순서 (audio_coach 가 여기서 import 해 사용)
+PRIORITY_ORDER = ["critical", "high", "medium", "low"]
+
+# time_scope 없는 규칙의 기본 창 (handle_video_frame 기존 동작)
+DEFAULT_T_WINDOW = (0.0, 999.0)
+
+
+def priority_rank(rule) -> int:
+    """우선순위 정렬 키 (알 수 없는 우선순위는 맨 뒤)"""
+    try:
+        return PRIORITY_ORDER.index(rule.priority)
+    except ValueError:
+        return len(PRIORITY_ORDER)
+
+
+class IntervalTable(Generic[T]):
+    """
+    닫힌 구간 [start, end] → 값 목록의 정적 점 조회 테이블
+
+    원소 구간 i 의 값은 입력 순서를 유지한 tuple.
+    """
+
+    def __init__(self, items: Iterable[Tuple[float, float, T]]):
+        items = [(float(start), float(end), value) for start, end, value in items]
+        self.points: List[float] = sorted({p for start, end, _ in items for p in (start, end)})
+
+        buckets: List[List[T]] = [[] for _ in range(2 * len(self.points) + 1)]
+        for start, end, value in items:
+            if start > end:
+                continue
+            lo = self._piece(start)
+            hi = self._piece(end)
+            for piece in range(lo, hi + 1):
+                buckets[piece].append(value)
+        self.pieces: List[Tuple[T, ...]] = [tuple(bucket) for bucket in buckets]
+
+    def _piece(self, t: float) -> int:
+        """
+        t 가 속한 원소 구간 번호
+
+        짝수 2i: points[i-1] < t < points[i] (열린 구간), 홀수 2i+1: t == points[i]
+        """
+        i = bisect_left(self.points, t)
+        if i < len(self.points) and self.points[i] == t:
+            return 2 * i + 1
+        return 2 * i
+
+    def at(self, t: float) -> Tuple[T, ...]:
+        return self.pieces[self._piece(t)]
+
+    def __len__(self) -> int:
+        return len(self.pieces)
+
+
+class RuleIntervalIndex:
+    """DirectorPack → 시간 t 의 활성 checkpoint / 규칙 조회 인덱스"""
+
+    def __init__(self, pack):
+        rules = list(pack.dna_invariants)
+        checkpoints = list(pack.checkpoints)
+
+        self.checkpoints: IntervalTable = IntervalTable(
+            (cp.t_window[0], cp.t_window[1], cp) for cp in checkpoints
+        )
+
+        # checkpoint 가 없는 구간의 폴백: "overall" checkpoint 규칙, 없으면 전체 규칙
+        overall = next((cp for cp in checkpoints if cp.checkpoint_id == "overall"), None)
+        fallback = (
+            self._select(rules, set(overall.active_rules)) if overall else self._sort(rules)
+        )
+
+        active: List[Tuple] = []
+        for cps in self.checkpoints.pieces:
+            rule_ids = {rule_id for cp in cps for rule_id in cp.active_rules}
+            active.append(self._select(rules, rule_ids) if rule_ids else fallback)
+        self._active_by_piece: List[Tuple] = active
+
+        self.scoped_rules: IntervalTable = IntervalTable(
+            (*self._t_window(rule), rule) for rule in rules
+        )
+
+    @staticmethod
+    def _sort(rules: Sequence) -> Tuple:
+        return tuple(sorted(rules, key=priority_rank))  # stable → 같은 우선순위는 pack 순서
+
+    @classmethod
+    def _select(cls, rules: Sequence, rule_ids: set) -> Tuple:
+        return cls._sort([r for r in rules if r.rule_id in rule_ids])
+
+    @staticmethod
+    def _t_window(rule) -> Tuple[float, float]:
+        time_scope = getattr(rule, "time_scope", None)
+        if time_scope is None or not time_scope.t_window:
+            return DEFAULT_T_WINDOW
+        return time_scope.t_window[0], time_scope.t_window[1]
+
+    def active_rules_at(self, t: float) -> Tuple:
+        """checkpoint 기반 활성 규칙 (우선순위 정렬)"""
+        return self._active_by_piece[self.checkpoints._piece(t)]
+
+    def checkpoint_id_at(self, t: float) -> Optional[str]:
+        """t 를 포함하는 첫 checkpoint ID (pack 순서)"""
+        cps = self.checkpoints.at(t)
+        return cps[0].checkpoint_id if cps else None
+
+    def scoped_rules_at(self, t: float) -> Tuple:
+        """time_scope.t_window 가 t 를 포함하는 규칙 (pack 순서)"""
+        return self.scoped_rules.at(t)
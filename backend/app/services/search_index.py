@@ -0,0 +1,305 @@
+"""
+Outlier Search Index (전문 검색 + 트라이그램)
+
+기존: MCP search_patterns 가 title ILIKE '%q%' OR category ILIKE '%q%'
+      → 순차 스캔, ViralKick.mechanism / 베스트 댓글 / VDG 훅 텍스트는 검색 불가,
+        한국어는 조사가 붙으면 ("스쿼트댄스를") 부분 문자열로만 겨우 매칭, 관련도 정렬 없음.
+
+현재:
+- 아웃라이어별 검색 문서 (outlier_search_documents) 를 분석 완료 시 갱신
+  - A: 제목 / B: 카테고리·해시태그·훅 패턴·킥 mechanism / C: 베스트 댓글 (상위 5개)
+- 한국어 인식 토큰화: NFKC + 소문자, 한글 구간은 단어 + 음절 bigram
+  → "스쿼트댄스를" 과 "스쿼트 댄스" 가 bigram 으로 만남 (형태소 분석기 의존성 없음)
+- Postgres: 토큰을 'simple' tsvector (필드 가중치) 로 저장 → GIN,
+  원문은 pg_trgm GIN (word_similarity, 부분 일치 / 오타)
+- 순위 = 텍스트 관련도 × (1 + SCORE_WEIGHT × ln(1 + outlier_score))
+- InMemorySearchIndex: 같은 토큰화 / 가중치 / 순위식의 순수 파이썬 역색인 (테스트·오프라인)
+
+Usage:
+    await refresh_search_document(db, item_id)              # 분석 완료 훅
+    hits = await PostgresSearchIndex().search(db, "스쿼트 챌린지", filters=feed_filters(min_tier="A"))
+    for item, score in hits: ...
+"""
+import logging
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import OutlierItem, OutlierSearchDocument, ViralKick
+
+logger = logging.getLogger(__name__)
+
+
+TEXT_SEARCH_CONFIG = "simple"  # 토큰화는 파이썬에서 → Postgres 는 소문자화/분리만
+FIELD_WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2}  # ts_rank 기본 가중치 {D, C, B, A} = {0.1, 0.2, 0.4, 1.0} 과 동일
+SCORE_WEIGHT = 0.1  # outlier_score 가 순위에 미치는 비중
+MAX_COMMENTS = 5
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
+
+# ==================
+# Tokenization
+# ==================
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    한국어 인식 토큰화 (문서 / 질의 공통)
+
+    - 영숫자: 단어 그대로 ("#squat" → "squat")
+    - 한글 구간: 구간 전체 + 음절 bigram ("댄스를" → "댄스를", "댄스", "스를")
+    """
+    tokens: List[str] = []
+    for word in _TOKEN_RE.findall(normalize(text)):
+        tokens.append(word)
+        for run in _HANGUL_RE.findall(word):
+            if run != word:
+                tokens.append(run)
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+# ==================
+# Search Document
+# ==================
+
+@dataclass
+class SearchDocument:
+    """아웃라이어 1건의 검색 문서 (필드별 원문)"""
+    outlier_item_id: UUID
+    title: str = ""
+    keywords: List[str] = field(default_factory=list)  # B: 카테고리, 해시태그, 훅 패턴, 킥 mechanism
+    comments: List[str] = field(default_factory=list)  # C: 베스트 댓글
+    outlier_score: float = 0.0
+    category: Optional[str] = None
+    platform: Optional[str] = None
+    tier_rank: Optional[int] = None
+
+    def field_texts(self) -> Dict[str, str]:
+        return {"A": self.title or "", "B": " ".join(self.keywords), "C": " ".join(self.comments)}
+
+    @property
+    def search_text(self) -> str:
+        return " ".join(text for text in self.field_texts().values() if text)
+
+
+def _hook_texts(vdg_analysis: Any) -> List[str]:
+    """VDG v3~v5 hook_genome 에서 패턴 / 요약 / 전달 방식"""
+    if not isinstance(vdg_analysis, dict):
+        return []
+    semantic = vdg_analysis.get("semantic")
+    hook_genome = semantic.get("hook_genome") if isinstance(semantic, dict) else None
+    if not isinstance(hook_genome, dict):
+        hook_genome = vdg_analysis.get("hook_genome")
+    if not isinstance(hook_genome, dict):
+        return []
+    return [
+        str(hook_genome[key]) for key in ("pattern", "hook_summary", "delivery")
+        if hook_genome.get(key) and hook_genome.get(key) != "other"
+    ]
+
+
+def build_search_document(item: Any, kicks: Iterable[Tuple[Optional[str], Optional[str]]] = ()) -> SearchDocument:
+    """
+    OutlierItem (+ ViralKick (title, mechanism) 목록) → 검색 문서
+
+    raw_payload 의 hashtags/tags, vdg_analysis.hook_genome, best_comments[:5].text 사용
+    """
+    raw_payload = item.raw_payload if isinstance(item.raw_payload, dict) else {}
+    hashtags = raw_payload.get("hashtags") or raw_payload.get("tags") or []
+    keywords = [item.category or ""]
+    keywords += [str(tag) for tag in hashtags if tag] if isinstance(hashtags, list) else []
+    keywords += _hook_texts(raw_payload.get("vdg_analysis"))
+    for kick_title, mechanism in kicks:
+        keywords += [text for text in (kick_title, mechanism) if text]
+
+    comments = []
+    for comment in (item.best_comments or [])[:MAX_COMMENTS] if isinstance(item.best_comments, list) else []:
+        text = comment.get("text") if isinstance(comment, dict) else comment
+        if text:
+            comments.append(str(text))
+
+    return SearchDocument(
+        outlier_item_id=item.id,
+        title=item.title or "",
+        keywords=[keyword for keyword in keywords if keyword],
+        comments=comments,
+        outlier_score=item.outlier_score or 0.0,
+        category=item.category,
+        platform=item.platform,
+        tier_rank=getattr(item, "tier_rank", None),
+    )
+
+
+def combine_score(relevance: float, outlier_score: Optional[float]) -> float:
+    """텍스트 관련도 × outlier_score 보정 (두 백엔드 공통)"""
+    return relevance * (1.0 + SCORE_WEIGHT * math.log1p(max(outlier_score or 0.0, 0.0)))
+
+
+# ==================
+# In-Memory Index (tests / offline)
+# ==================
+
+class InMemorySearchIndex:
+    """순수 파이썬 역색인 - Postgres 백엔드와 같은 토큰화 / 필드 가중치 / 순위식"""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[UUID, float]] = defaultdict(dict)  # token → {doc_id: 가중 tf}
+        self._documents: Dict[UUID, SearchDocument] = {}
+        self._doc_tokens: Dict[UUID, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def upsert(self, document: SearchDocument) -> None:
+        self.remove(document.outlier_item_id)
+        weights: Dict[str, float] = defaultdict(float)
+        for label, text in document.field_texts().items():
+            for token in tokenize(text):
+                weights[token] += FIELD_WEIGHTS[label]
+        for token, weight in weights.items():
+            self._postings[token][document.outlier_item_id] = weight
+        self._documents[document.outlier_item_id] = document
+        self._doc_tokens[document.outlier_item_id] = list(weights)
+
+    def remove(self, outlier_item_id: UUID) -> None:
+        self._documents.pop(outlier_item_id, None)
+        for token in self._doc_tokens.pop(outlier_item_id, []):
+            del self._postings[token][outlier_item_id]
+            if not self._postings[token]:
+                del self._postings[token]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        max_tier_rank: Optional[int] = None,
+    ) -> List[Tuple[SearchDocument, float]]:
+        """(문서, 점수) 목록 - 점수 내림차순"""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+        total = len(self._documents)
+        relevance: Dict[UUID, float] = defaultdict(float)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1.0 + total / len(postings))
+            for doc_id, weight in postings.items():
+                relevance[doc_id] += idf * weight / (weight + 1.0)  # tf 포화
+
+        hits = []
+        for doc_id, value in relevance.items():
+            document = self._documents[doc_id]
+            if category and document.category != category:
+                continue
+            if platform and document.platform != platform:
+                continue
+            if max_tier_rank is not None and (document.tier_rank is None or document.tier_rank > max_tier_rank):
+                continue
+            hits.append((document, combine_score(value / len(tokens), document.outlier_score)))
+        hits.sort(key=lambda hit: (-hit[1], str(hit[0].outlier_item_id)))
+        return hits[:limit]
+
+
+# ==================
+# Postgres Index
+# ==================
+
+def _weighted_vector(document: SearchDocument):
+    """setweight(to_tsvector(A)) || setweight(to_tsvector(B)) || setweight(to_tsvector(C))"""
+    vector = None
+    for label, text in document.field_texts().items():
+        part = func.setweight(func.to_tsvector(TEXT_SEARCH_CONFIG, " ".join(tokenize(text))), label)
+        vector = part if vector is None else vector.op("||")(part)
+    return vector
+
+
+def build_tsquery(query: str):
+    """질의 토큰 OR → to_tsquery (토큰은 \\w 만 포함 → 따옴표 처리만)"""
+    tokens = sorted(set(tokenize(query)))
+    if not tokens:
+        return None
+    return func.to_tsquery(TEXT_SEARCH_CONFIG, " | ".join(f"'{token}'" for token in tokens))
+
+
+class PostgresSearchIndex:
+    """outlier_search_documents (tsvector GIN + pg_trgm GIN) 기반 검색"""
+
+    async def upsert(self, db: AsyncSession, document: SearchDocument) -> None:
+        values = {
+            "outlier_item_id": document.outlier_item_id,
+            "search_text": normalize(document.search_text),
+            "search_vector": _weighted_vector(document),
+        }
+        statement = pg_insert(OutlierSearchDocument).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[OutlierSearchDocument.outlier_item_id],
+            set_={
+                "search_text": statement.excluded.search_text,
+                "search_vector": statement.excluded.search_vector,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(statement)
+
+    def search_statement(self, query: str, filters: Optional[List[Any]] = None, limit: int = 10):
+        """
+        (OutlierItem, search_score) SELECT
+
+        매칭 = tsvector @@ 질의 OR 원문 %> 질의 (pg_trgm word_similarity_threshold, 기본 0.6)
+        관련도 = greatest(ts_rank, word_similarity) → combine_score 와 같은 식으로 outlier_score 보정
+        """
+        normalized = normalize(query)
+        tsquery = build_tsquery(query)
+        similarity = func.word_similarity(normalized, OutlierSearchDocument.search_text)
+        matched = OutlierSearchDocument.search_text.op("%>")(normalized)
+        relevance = similarity
+        if tsquery is not None:
+            matched = or_(OutlierSearchDocument.search_vector.op("@@")(tsquery), matched)
+            relevance = func.greatest(func.ts_rank(OutlierSearchDocument.search_vector, tsquery), similarity)
+        score = relevance * (
+            1.0 + SCORE_WEIGHT * func.ln(1.0 + func.greatest(func.coalesce(OutlierItem.outlier_score, 0.0), 0.0))
+        )
+        return (
+            select(OutlierItem, score.label("search_score"))
+            .join(OutlierSearchDocument, OutlierSearchDocument.outlier_item_id == OutlierItem.id)
+            .where(matched, *(filters or []))
+            .order_by(score.desc(), OutlierItem.id.desc())
+            .limit(limit)
+        )
+
+    async def search(
+        self, db: AsyncSession, query: str, filters: Optional[List[Any]] = None, limit: int = 10,
+    ) -> List[Tuple[OutlierItem, float]]:
+        result = await db.execute(self.search_statement(query, filters=filters, limit=limit))
+        return [(row[0], float(row[1] or 0.0)) for row in result.all()]
+
+
+async def refresh_search_document(db: AsyncSession, item_id: UUID) -> Optional[SearchDocument]:
+    """OutlierItem + ViralKick 으로 검색 문서 재생성 (커밋은 호출자)"""
+    item = (await db.execute(select(OutlierItem).where(OutlierItem.id == item_id))).scalar_one_or_none()
+    if item is None:
+        return None
+    kicks = (await db.execute(
+        select(ViralKick.title, ViralKick.mechanism).where(ViralKick.outlier_item_id == item_id)
+    )).all()
+    document = build_search_document(item, kicks)
+    await PostgresSearchIndex().upsert(db, document)
+    return document
@@ -6,13 +6,12 @@ Session Logger
 2. intervention - 코칭 개입
 3. outcome - 결과 관측
 
-MVP: In-memory 저장 → 추후 DB 마이그레이션
+저장소: SessionRegistry (get_session_logger 싱글톤은 공유 레지스트리 → 여러 워커에서 같은 로그)
 
 P1 Roadmap: 세션 로깅 인프라
 """
 import logging
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import List, Optional
 
 from app.utils.time import iso_now
 from app.schemas.session_events import (
@@ -23,9 +22,22 @@ from app.schemas.session_events import (
     SessionEventSummary,
 )
 from app.schemas.vdg_v4 import CoachingIntervention, CoachingOutcome
+from app.services.session_registry import (
+    NS_INTERVENTION_LINKS,
+    NS_LOG_EVENTS,
+    NS_LOG_SESSIONS,
+    LocalSessionRegistry,
+    SessionRegistry,
+)
 
 logger = logging.getLogger(__name__)
 
+_EVENT_TYPES = {
+    "rule_evaluated": RuleEvaluatedEvent,
+    "intervention": InterventionEvent,
+    "outcome": OutcomeEvent,
+}
+
 
 class SessionLogger:
     """
@@ -35,7 +47,7 @@ class SessionLogger:
         session_logger = SessionLogger()
         
         # Log rule evaluation (even without intervention)
-        session_logger.log_rule_evaluated(
+        await session_logger.log_rule_evaluated(
             session_id="sess_123",
             rule_id="hook_center",
             ap_id="ap_hook_001",
@@ -44,28 +56,34 @@ class SessionLogger:
         )
         
         # Log intervention
-        session_logger.log_intervention(intervention)
+        await session_logger.log_intervention(intervention)
         
         # Log outcome
-        session_logger.log_outcome(outcome)
+        await session_logger.log_outcome(outcome)
     """
     
-    def __init__(self):
-        """Initialize in-memory event store."""
-        # session_id -> List[SessionEvent]
-        self._events: Dict[str, List[SessionEvent]] = defaultdict(list)
-        
-        # session_id -> metadata
-        self._sessions: Dict[str, dict] = {}
+    def __init__(self, registry: Optional[SessionRegistry] = None, ttl_sec: Optional[int] = None):
+        """
+        Args:
+            registry: 이벤트 저장소 (기본: 이 인스턴스 전용 LocalSessionRegistry)
+            ttl_sec: 세션 메타/이벤트 보존 기간 (None = 무기한)
         
-        # intervention_id -> session_id (for outcome linking)
-        self._intervention_map: Dict[str, str] = {}
+        Registry layout:
+            NS_LOG_SESSIONS[session_id] -> metadata
+            NS_LOG_EVENTS[session_id] items -> events
+            NS_INTERVENTION_LINKS[intervention_id] -> session_id (for outcome linking)
+        """
+        self._registry = registry or LocalSessionRegistry()
+        self._ttl_sec = ttl_sec
+    
+    async def _append_event(self, event: SessionEvent) -> None:
+        await self._registry.append(NS_LOG_EVENTS, event.session_id, event.model_dump(mode="json"), ttl_sec=self._ttl_sec)
     
     # ====================
     # SESSION MANAGEMENT
     # ====================
     
-    def start_session(
+    async def start_session(
         self,
         session_id: str,
         pack_id: str,
@@ -73,21 +91,22 @@ class SessionLogger:
         holdout_group: bool = False
     ) -> dict:
         """Register a new session."""
-        self._sessions[session_id] = {
+        meta = {
             "session_id": session_id,
             "pack_id": pack_id,
             "assignment": assignment,
             "holdout_group": holdout_group,
             "started_at": iso_now(),
         }
+        await self._registry.put(NS_LOG_SESSIONS, session_id, meta, ttl_sec=self._ttl_sec)
         logger.info(f"📊 Session started: {session_id} (assignment={assignment}, holdout={holdout_group})")
-        return self._sessions[session_id]
+        return meta
     
     # ====================
     # EVENT LOGGING
     # ====================
     
-    def log_rule_evaluated(
+    async def log_rule_evaluated(
         self,
         session_id: str,
         rule_id: str,
@@ -120,11 +139,11 @@ class SessionLogger:
             intervention_triggered=intervention_triggered,
         )
         
-        self._events[session_id].append(event)
+        await self._append_event(event)
         logger.debug(f"📋 Rule evaluated: {rule_id} = {result} (intervention={intervention_triggered})")
         return event
     
-    def log_intervention(
+    async def log_intervention(
         self,
         intervention: CoachingIntervention,
     ) -> InterventionEvent:
@@ -144,19 +163,25 @@ class SessionLogger:
             evidence_id=intervention.evidence_id,
         )
         
-        self._events[intervention.session_id].append(event)
-        self._intervention_map[intervention.intervention_id] = intervention.session_id
+        await self._append_event(event)
+        await self._registry.put(
+            NS_INTERVENTION_LINKS,
+            intervention.intervention_id,
+            {"session_id": intervention.session_id},
+            ttl_sec=self._ttl_sec,
+        )
         
         logger.debug(f"🎙️ Intervention: {intervention.rule_id} (assignment={intervention.assignment})")
         return event
     
-    def log_outcome(
+    async def log_outcome(
         self,
         outcome: CoachingOutcome,
     ) -> OutcomeEvent:
         """Log outcome event with automatic negative evidence detection."""
         # Find session from intervention
-        session_id = self._intervention_map.get(outcome.intervention_id, "unknown")
+        link = await self._registry.get(NS_INTERVENTION_LINKS, outcome.intervention_id)
+        session_id = link["session_id"] if link else "unknown"
         
         # Auto-detect negative evidence
         is_negative = self._detect_negative_evidence(outcome)
@@ -184,7 +209,7 @@ class SessionLogger:
             negative_reason=negative_reason,
         )
         
-        self._events[session_id].append(event)
+        await self._append_event(event)
         
         log_level = "⚠️" if is_negative else "✅"
         logger.debug(f"{log_level} Outcome: compliance={outcome.compliance_detected}, negative={is_negative}")
@@ -230,17 +255,20 @@ class SessionLogger:
     # RETRIEVAL
     # ====================
     
-    def get_session_events(self, session_id: str) -> List[SessionEvent]:
+    async def get_session_events(self, session_id: str) -> List[SessionEvent]:
         """Get all events for a session."""
-        return self._events.get(session_id, [])
+        return [
+            _EVENT_TYPES.get(raw.get("event_type"), SessionEvent).model_validate(raw)
+            for raw in await self._registry.items(NS_LOG_EVENTS, session_id)
+        ]
     
-    def get_session_summary(self, session_id: str) -> Optional[SessionEventSummary]:
+    async def get_session_summary(self, session_id: str) -> Optional[SessionEventSummary]:
         """Get summary statistics for a session."""
-        if session_id not in self._sessions:
+        session_meta = await self._registry.get(NS_LOG_SESSIONS, session_id)
+        if session_meta is None:
             return None
         
-        events = self._events.get(session_id, [])
-        session_meta = self._sessions[session_id]
+        events = await self.get_session_events(session_id)
         
         # Count by type
         rules_evaluated = sum(1 for e in events if e.event_type == "rule_evaluated")
@@ -277,11 +305,11 @@ class SessionLogger:
             events=events,
         )
     
-    def get_all_sessions_summary(self) -> dict:
+    async def get_all_sessions_summary(self) -> dict:
         """Get summary of all sessions for P1 verification."""
         summaries = []
-        for session_id in self._sessions:
-            summary = self.get_session_summary(session_id)
+        for session_meta in await self._registry.values(NS_LOG_SESSIONS):
+            summary = await self.get_session_summary(session_meta["session_id"])
             if summary:
                 summaries.append(summary)
         
@@ -314,5 +342,10 @@ def get_session_logger() -> SessionLogger:
     """Get singleton SessionLogger instance."""
     global _logger_instance
     if _logger_instance is None:
-        _logger_instance = SessionLogger()
+        from app.config import settings
+        from app.services.session_registry import get_session_registry
+        _logger_instance = SessionLogger(
+            registry=get_session_registry(),
+            ttl_sec=settings.COACHING_SESSION_TTL_SEC,
+        )
     return _logger_instance
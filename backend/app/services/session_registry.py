@@ -0,0 +1,318 @@
+"""
+Coaching Session Registry (워커 간 공유 세션 상태)
+
+기존: CoachingSessionManager.active_sessions, coaching.py _sessions,
+      CoachingSessionService / SessionLogger 가 모두 프로세스 메모리 dict
+→ gunicorn 워커 2개 이상이면 POST /sessions 를 받은 워커와 WS 를 받은 워커가 달라
+  세션 상태/로그/크레딧 정산 정보가 유실.
+
+현재: 직렬화 가능한 세션 상태는 모두 레지스트리에 저장
+- LocalSessionRegistry: 단일 프로세스용 (기본, 테스트)
+- RedisSessionRegistry: 여러 워커/노드 공유 (COACHING_SESSION_REGISTRY=redis, redis.asyncio)
+  - 레코드: 해시 {prefix}:{ns}:{key} (필드별 JSON → HSET 필드 단위 원자적 갱신)
+  - 인덱스: 셋 {prefix}:{ns} (values / count 용)
+  - 이벤트 로그: 리스트 {prefix}:{ns}:{key}:items
+
+라이브 WebSocket 객체 (AudioCoach, Task, WebSocket) 는 직렬화 불가라 연결을 가진
+워커에만 남고, 레지스트리에는 스냅샷 + 라우팅 메타 (worker_id, node) 만 올라감.
+
+Usage:
+    registry = get_session_registry()
+    await registry.put(NS_COACHING_SESSIONS, session_id, {...})
+    await registry.update(NS_COACHING_SESSIONS, session_id, {"status": "ended"})
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 네임스페이스
+NS_COACHING_SESSIONS = "coaching_sessions"  # POST /coaching/sessions 레코드 (routers/coaching.py)
+NS_SESSION_FEEDBACK = "coaching_feedback"  # 세션별 사용자 피드백 (items)
+NS_LIVE_SESSIONS = "ws_sessions"  # 연결 중인 WS 세션 스냅샷 + 라우팅 메타
+NS_LOG_SESSIONS = "log_sessions"  # SessionLogger 세션 메타
+NS_LOG_EVENTS = "log_events"  # SessionLogger 이벤트 (items)
+NS_INTERVENTION_LINKS = "intervention_links"  # intervention_id → session_id
+NS_SESSION_LOGS = "session_logs"  # CoachingSessionService 세션 레코드 (개입/결과 제외)
+NS_SESSION_INTERVENTIONS = "session_interventions"  # CoachingSessionService 개입 (items)
+NS_SESSION_OUTCOMES = "session_outcomes"  # CoachingSessionService 결과 (items)
+NS_COOLDOWNS = "session_cooldowns"  # CoachingSessionService 규칙별 쿨다운
+
+# 이 프로세스의 라우팅 식별자 (sticky routing / 세션 목록 표시용)
+NODE_ID = os.getenv("NODE_ID") or socket.gethostname()
+WORKER_ID = f"{NODE_ID}:{os.getpid()}"
+
+
+def _encode(fields: Dict[str, Any]) -> Dict[str, str]:
+    return {k: json.dumps(v, ensure_ascii=False, default=str) for k, v in fields.items()}
+
+
+def _decode(raw: Dict[str, str]) -> Dict[str, Any]:
+    return {k: json.loads(v) for k, v in raw.items()}
+
+
+class SessionRegistry(ABC):
+    """
+    세션 레지스트리 인터페이스 (비동기 API - 이벤트 루프에서 직접 await)
+
+    값은 JSON 직렬화 가능한 dict. 로컬 구현도 같은 직렬화를 거쳐
+    Redis 로 전환해도 동작이 같음.
+    """
+
+    backend = "base"
+
+    @abstractmethod
+    async def put(self, ns: str, key: str, value: Dict[str, Any], ttl_sec: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, ns: str, key: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def update(self, ns: str, key: str, fields: Dict[str, Any], ttl_sec: Optional[int] = None) -> bool:
+        """기존 레코드 필드 병합 (레코드 없으면 False)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, ns: str, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def values(self, ns: str) -> List[Dict[str, Any]]:
+        pass
+
+    async def count(self, ns: str) -> int:
+        return len(await self.values(ns))
+
+    @abstractmethod
+    async def append(self, ns: str, key: str, item: Dict[str, Any], ttl_sec: Optional[int] = None) -> None:
+        """키별 이벤트 리스트 끝에 추가 (워커 간 원자적 - 동시 append 유실 없음)"""
+        pass
+
+    @abstractmethod
+    async def items(self, ns: str, key: str) -> List[Dict[str, Any]]:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class LocalSessionRegistry(SessionRegistry):
+    """프로세스 내 레지스트리 (단일 워커 / 테스트)"""
+
+    backend = "local"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # ns → key → (expires_at | None, encoded fields)
+        self._records: Dict[str, Dict[str, Tuple[Optional[float], Dict[str, str]]]] = {}
+        # (ns, key) → (expires_at | None, encoded items)
+        self._items: Dict[Tuple[str, str], Tuple[Optional[float], List[str]]] = {}
+
+    @staticmethod
+    def _expiry(ttl_sec: Optional[int]) -> Optional[float]:
+        return time.monotonic() + ttl_sec if ttl_sec else None
+
+    @staticmethod
+    def _alive(expires_at: Optional[float]) -> bool:
+        return expires_at is None or expires_at > time.monotonic()
+
+    def _record(self, ns: str, key: str) -> Optional[Tuple[Optional[float], Dict[str, str]]]:
+        entry = self._records.get(ns, {}).get(key)
+        if entry is not None and not self._alive(entry[0]):
+            del self._records[ns][key]
+            return None
+        return entry
+
+    async def put(self, ns, key, value, ttl_sec=None):
+        with self._lock:
+            self._records.setdefault(ns, {})[key] = (self._expiry(ttl_sec), _encode(value))
+
+    async def get(self, ns, key):
+        with self._lock:
+            entry = self._record(ns, key)
+            return _decode(entry[1]) if entry else None
+
+    async def update(self, ns, key, fields, ttl_sec=None):
+        with self._lock:
+            entry = self._record(ns, key)
+            if entry is None:
+                return False
+            expires_at = self._expiry(ttl_sec) if ttl_sec else entry[0]
+            self._records[ns][key] = (expires_at, {**entry[1], **_encode(fields)})
+            return True
+
+    async def delete(self, ns, key):
+        with self._lock:
+            self._records.get(ns, {}).pop(key, None)
+            self._items.pop((ns, key), None)
+
+    async def values(self, ns):
+        with self._lock:
+            keys = list(self._records.get(ns, {}))
+            entries = [self._record(ns, key) for key in keys]
+            return [_decode(entry[1]) for entry in entries if entry]
+
+    async def append(self, ns, key, item, ttl_sec=None):
+        raw = json.dumps(item, ensure_ascii=False, default=str)
+        with self._lock:
+            expires_at, items = self._items.get((ns, key), (None, []))
+            if not self._alive(expires_at):
+                items = []
+            items.append(raw)
+            self._items[(ns, key)] = (self._expiry(ttl_sec) if ttl_sec else expires_at, items)
+
+    async def items(self, ns, key):
+        with self._lock:
+            expires_at, items = self._items.get((ns, key), (None, []))
+            if not self._alive(expires_at):
+                self._items.pop((ns, key), None)
+                return []
+            return [json.loads(raw) for raw in items]
+
+
+class RedisSessionRegistry(SessionRegistry):
+    """Redis 레지스트리 (여러 워커/노드 공유)"""
+
+    backend = "redis"
+
+    def __init__(self, client: Any, prefix: str = "coaching"):
+        """
+        Args:
+            client: redis.asyncio.Redis (decode_responses=True)
+            prefix: 키 접두사
+        """
+        self._redis = client
+        self.prefix = prefix
+
+    def _key(self, ns: str, key: str) -> str:
+        return f"{self.prefix}:{ns}:{key}"
+
+    def _index(self, ns: str) -> str:
+        return f"{self.prefix}:{ns}"
+
+    async def put(self, ns, key, value, ttl_sec=None):
+        record_key = self._key(ns, key)
+        pipe = self._redis.pipeline()
+        pipe.delete(record_key)
+        if value:
+            pipe.hset(record_key, mapping=_encode(value))
+        if ttl_sec:
+            pipe.expire(record_key, ttl_sec)
+        pipe.sadd(self._index(ns), key)
+        await pipe.execute()
+
+    async def get(self, ns, key):
+        raw = await self._redis.hgetall(self._key(ns, key))
+        return _decode(raw) if raw else None
+
+    async def update(self, ns, key, fields, ttl_sec=None):
+        record_key = self._key(ns, key)
+        if not await self._redis.exists(record_key):
+            return False
+        pipe = self._redis.pipeline()
+        pipe.hset(record_key, mapping=_encode(fields))
+        if ttl_sec:
+            pipe.expire(record_key, ttl_sec)
+        await pipe.execute()
+        return True
+
+    async def delete(self, ns, key):
+        pipe = self._redis.pipeline()
+        pipe.delete(self._key(ns, key), f"{self._key(ns, key)}:items")
+        pipe.srem(self._index(ns), key)
+        await pipe.execute()
+
+    async def values(self, ns):
+        keys = sorted(await self._redis.smembers(self._index(ns)))
+        if not keys:
+            return []
+        pipe = self._redis.pipeline()
+        for key in keys:
+            pipe.hgetall(self._key(ns, key))
+        records, expired = [], []
+        for key, raw in zip(keys, await pipe.execute()):
+            if raw:
+                records.append(_decode(raw))
+            else:
+                expired.append(key)
+        if expired:  # TTL 만료된 레코드는 인덱스에서 정리
+            await self._redis.srem(self._index(ns), *expired)
+        return records
+
+    async def append(self, ns, key, item, ttl_sec=None):
+        items_key = f"{self._key(ns, key)}:items"
+        pipe = self._redis.pipeline()
+        pipe.rpush(items_key, json.dumps(item, ensure_ascii=False, default=str))
+        if ttl_sec:
+            pipe.expire(items_key, ttl_sec)
+        await pipe.execute()
+
+    async def items(self, ns, key):
+        return [json.loads(raw) for raw in await self._redis.lrange(f"{self._key(ns, key)}:items", 0, -1)]
+
+    async def close(self):
+        await self._redis.close()
+
+
+# Singleton instance
+_session_registry: Optional[SessionRegistry] = None
+
+
+def get_session_registry() -> SessionRegistry:
+    """
+    싱글톤 SessionRegistry 반환
+
+    COACHING_SESSION_REGISTRY=redis 이면 Redis (연결은 첫 명령 시 수립 - 사전 확인은
+    init_session_registry), 그 외에는 LocalSessionRegistry.
+    """
+    global _session_registry
+    if _session_registry is None:
+        from app.config import settings
+
+        if settings.COACHING_SESSION_REGISTRY == "redis":
+            import redis.asyncio as redis
+            client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                decode_responses=True,
+                socket_timeout=1.0,
+            )
+            _session_registry = RedisSessionRegistry(client)
+        else:
+            _session_registry = LocalSessionRegistry()
+    return _session_registry
+
+
+async def init_session_registry() -> SessionRegistry:
+    """
+    앱 시작 시 호출 - Redis 레지스트리 연결 확인 (실패 시 로컬로 폴백 + 경고)
+    """
+    global _session_registry
+    registry = get_session_registry()
+    if isinstance(registry, RedisSessionRegistry):
+        from app.config import settings
+        try:
+            await registry._redis.ping()
+            logger.info(f"Coaching session registry: Redis ({settings.REDIS_HOST}:{settings.REDIS_PORT})")
+        except Exception as e:
+            logger.warning(f"Coaching session registry: Redis unavailable, local only ({e})")
+            await registry.close()
+            _session_registry = LocalSessionRegistry()
+    return _session_registry
+
+
+async def close_session_registry() -> None:
+    """앱 종료 시 호출 - Redis 연결 정리"""
+    global _session_registry
+    if _session_registry is not None:
+        await _session_registry.close()
+        _session_registry = None
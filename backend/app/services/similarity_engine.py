@@ -0,0 +1,323 @@
+"""
+Batch Similarity Engine (PEGL v1.0)
+
+PatternClusteringService.calculate_similarity 의 배치 버전.
+
+핵심 원칙:
+- 스키마는 한 번만 정규화 → 고정 크기 feature 배열로 패킹
+- 1개 child vs N개 parent 를 NumPy 한 번의 호출로 점수화
+- 점수는 calculate_similarity 와 동일 (동일 가중치/분기/합산 순서)
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.clustering import PatternClusteringService
+
+logger = logging.getLogger(__name__)
+
+
+# 시각/오디오 패턴은 앞 3개만 위치 비교 (calculate_similarity 와 동일)
+PATTERN_PREFIX_LEN = 3
+
+_NO_TOKEN = -1
+_TRENDING_UNKNOWN = -1
+
+
+@dataclass
+class SimilarityFeatures:
+    """정규화된 스키마 1개의 compact feature 표현"""
+    microbeat_ids: np.ndarray        # int32[L]
+    hook_type_id: int                # _NO_TOKEN = 훅 타입 없음
+    hook_duration: float             # NaN = 길이 없음
+    visual_ids: np.ndarray           # int32[<=3]
+    audio_ids: np.ndarray            # int32[<=3]
+    has_audio_flags: bool
+    trending: int                    # 1 / 0 / _TRENDING_UNKNOWN
+    timing_total: float              # NaN = 타이밍 프로필 없음
+
+
+class TokenVocabulary:
+    """패턴/마이크로비트 문자열 → 정수 ID 매핑"""
+
+    def __init__(self) -> None:
+        self._ids: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def token_id(self, value: Any) -> int:
+        if not isinstance(value, Hashable):
+            value = repr(value)
+        token_id = self._ids.get(value)
+        if token_id is None:
+            token_id = len(self._ids)
+            self._ids[value] = token_id
+        return token_id
+
+    def encode(self, values: Optional[Sequence[Any]], limit: Optional[int] = None) -> np.ndarray:
+        if not values:
+            return np.empty(0, dtype=np.int32)
+        if limit is not None:
+            values = values[:limit]
+        return np.fromiter((self.token_id(v) for v in values), dtype=np.int32, count=len(values))
+
+
+def _sum_timing(timing: Optional[List[float]]) -> float:
+    if not timing:
+        return np.nan
+    return float(sum(timing))
+
+
+class BatchSimilarityEngine:
+    """
+    Parent 후보 feature 를 배열로 보관하고 child 1개를 일괄 점수화
+
+    Usage:
+        engine = BatchSimilarityEngine()
+        engine.add_many(parent_ids, parent_schemas)
+        scores = engine.score(child_schema)       # float64[N]
+        top = engine.top_k(child_schema, k=5, threshold=0.7)
+    """
+
+    WEIGHTS = PatternClusteringService.WEIGHTS
+
+    def __init__(self, vocabulary: Optional[TokenVocabulary] = None) -> None:
+        self.vocabulary = vocabulary or TokenVocabulary()
+        self.keys: List[Any] = []
+        self._pending: List[SimilarityFeatures] = []
+        self._packed: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ------------------------------------------------------------------
+    # Feature extraction
+    # ------------------------------------------------------------------
+
+    def extract(self, schema: Any) -> SimilarityFeatures:
+        """스키마 → SimilarityFeatures (VideoAnalysisSchema / VDG / dict 지원)"""
+        normalized = PatternClusteringService._normalize_schema(schema)
+        vocab = self.vocabulary
+
+        hook = normalized.get("hook") or {}
+        hook_type = hook.get("type")
+        hook_duration = hook.get("duration_sec")
+
+        audio_flags = normalized.get("audio_flags")
+        trending = _TRENDING_UNKNOWN
+        if audio_flags is not None:
+            is_trending = audio_flags.get("is_trending")
+            if is_trending is not None:
+                trending = 1 if is_trending else 0
+
+        return SimilarityFeatures(
+            microbeat_ids=vocab.encode(normalized.get("microbeat_sequence")),
+            hook_type_id=vocab.token_id(hook_type) if hook_type else _NO_TOKEN,
+            hook_duration=float(hook_duration) if hook_duration is not None else np.nan,
+            visual_ids=vocab.encode(normalized.get("visual_patterns"), PATTERN_PREFIX_LEN),
+            audio_ids=vocab.encode(normalized.get("audio_patterns"), PATTERN_PREFIX_LEN),
+            has_audio_flags=audio_flags is not None,
+            trending=trending,
+            timing_total=_sum_timing(normalized.get("timing_profile")),
+        )
+
+    def add(self, key: Any, schema: Any) -> None:
+        """Parent 후보 1개 추가 (다음 score 호출 시 배열 재패킹)"""
+        self._pending.append(self.extract(schema))
+        self.keys.append(key)
+        self._packed = None
+
+    def add_many(self, keys: Sequence[Any], schemas: Sequence[Any]) -> None:
+        for key, schema in zip(keys, schemas):
+            try:
+                self.add(key, schema)
+            except Exception as e:
+                logger.warning(f"Feature extraction failed for {key}: {e}")
+
+    # ------------------------------------------------------------------
+    # Packing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _pad(rows: List[np.ndarray], width: int) -> np.ndarray:
+        matrix = np.full((len(rows), width), _NO_TOKEN, dtype=np.int32)
+        for i, row in enumerate(rows):
+            matrix[i, :len(row)] = row
+        return matrix
+
+    def _pack(self) -> Dict[str, np.ndarray]:
+        if self._packed is not None:
+            return self._packed
+
+        features = self._pending
+        seq_lens = np.array([len(f.microbeat_ids) for f in features], dtype=np.int32)
+        max_seq = int(seq_lens.max()) if len(features) else 0
+
+        self._packed = {
+            "seq": self._pad([f.microbeat_ids for f in features], max_seq),
+            "seq_len": seq_lens,
+            "hook_type": np.array([f.hook_type_id for f in features], dtype=np.int32),
+            "hook_duration": np.array([f.hook_duration for f in features], dtype=np.float64),
+            "visual": self._pad([f.visual_ids for f in features], PATTERN_PREFIX_LEN),
+            "visual_len": np.array([len(f.visual_ids) for f in features], dtype=np.int32),
+            "audio": self._pad([f.audio_ids for f in features], PATTERN_PREFIX_LEN),
+            "audio_len": np.array([len(f.audio_ids) for f in features], dtype=np.int32),
+            "has_audio_flags": np.array([f.has_audio_flags for f in features], dtype=bool),
+            "trending": np.array([f.trending for f in features], dtype=np.int8),
+            "timing_total": np.array([f.timing_total for f in features], dtype=np.float64),
+        }
+        return self._packed
+
+    # ------------------------------------------------------------------
+    # Component scores (vectorized over parents)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _sequence_scores(child_seq: np.ndarray, seq: np.ndarray, seq_len: np.ndarray) -> np.ndarray:
+        """
+        Levenshtein 거리 (child 1개 vs parent N개) 행 단위 DP
+
+        dp[i][j] = min(dp[i-1][j] + 1, dp[i-1][j-1] + cost, dp[i][j-1] + 1)
+        마지막 항은 prefix-min 으로 풀어 j 방향 루프 없이 계산:
+        dp[i][j] = j + min_{k<=j}(tmp[k] - k)
+        """
+        n_parents, width = seq.shape
+        cols = np.arange(width + 1, dtype=np.int32)
+        prev = np.broadcast_to(cols, (n_parents, width + 1)).copy()
+
+        for i, token in enumerate(child_seq, start=1):
+            tmp = np.empty_like(prev)
+            tmp[:, 0] = i
+            cost = (seq != token).astype(np.int32)
+            tmp[:, 1:] = np.minimum(prev[:, 1:] + 1, prev[:, :-1] + cost)
+            prev = cols + np.minimum.accumulate(tmp - cols, axis=1)
+
+        dist = np.take_along_axis(prev, seq_len[:, None].astype(np.intp), axis=1)[:, 0]
+        max_len = np.maximum(seq_len, len(child_seq)).astype(np.float64)
+        return np.maximum(0.0, 1.0 - dist / max_len)
+
+    @staticmethod
+    def _prefix_match_scores(
+        child_ids: np.ndarray,
+        ids: np.ndarray,
+        lengths: np.ndarray,
+    ) -> np.ndarray:
+        """앞 min(3, len1, len2) 개 위치 일치 비율 (길이 0 이면 NaN)"""
+        compare_count = np.minimum(lengths, len(child_ids))
+        padded_child = np.full(PATTERN_PREFIX_LEN, _NO_TOKEN - 1, dtype=np.int32)
+        padded_child[:len(child_ids)] = child_ids
+        positions = np.arange(PATTERN_PREFIX_LEN)
+        matches = (ids == padded_child) & (positions < compare_count[:, None])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return matches.sum(axis=1) / compare_count
+
+    def _hook_scores(self, child: SimilarityFeatures, packed: Dict[str, np.ndarray]) -> np.ndarray:
+        same_type = (packed["hook_type"] == child.hook_type_id) & (child.hook_type_id != _NO_TOKEN)
+        duration_diff = np.abs(packed["hook_duration"] - child.hook_duration)
+        with np.errstate(invalid="ignore"):
+            by_duration = np.select(
+                [np.isnan(duration_diff), duration_diff < 0.5, duration_diff < 1.0],
+                [0.9, 1.0, 0.8],
+                default=0.6,
+            )
+        return np.where(same_type, by_duration, 0.3)
+
+    def _timing_scores(self, child: SimilarityFeatures, packed: Dict[str, np.ndarray]) -> np.ndarray:
+        diff = np.abs(packed["timing_total"] - child.timing_total)
+        with np.errstate(invalid="ignore"):
+            scores = np.select([diff < 2.0, diff < 5.0], [0.9, 0.6], default=0.3)
+        return np.where(np.isnan(diff), np.nan, scores)
+
+    def _audio_scores(self, child: SimilarityFeatures, packed: Dict[str, np.ndarray]) -> np.ndarray:
+        pattern_scores = self._prefix_match_scores(child.audio_ids, packed["audio"], packed["audio_len"])
+        trending = packed["trending"]
+        flag_scores = np.where(
+            (trending == _TRENDING_UNKNOWN) | (child.trending == _TRENDING_UNKNOWN),
+            0.5,
+            np.where(trending == child.trending, 1.0, 0.5),
+        )
+        both_flags = packed["has_audio_flags"] & child.has_audio_flags
+        return np.where(both_flags, flag_scores, pattern_scores)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def score(self, schema: Any) -> np.ndarray:
+        """child 스키마 vs 모든 parent 유사도 (float64[N], 0.0 ~ 1.0)"""
+        if not self.keys:
+            return np.empty(0, dtype=np.float64)
+
+        child = self.extract(schema)
+        packed = self._pack()
+        n_parents = len(self.keys)
+        weights = self.WEIGHTS
+
+        total = np.zeros(n_parents, dtype=np.float64)
+        weight_sum = np.zeros(n_parents, dtype=np.float64)
+
+        def accumulate(component: np.ndarray, weight: float) -> None:
+            present = ~np.isnan(component)
+            total[present] += component[present] * weight
+            weight_sum[present] += weight
+
+        # 1. Microbeat sequence
+        if len(child.microbeat_ids):
+            seq_scores = np.full(n_parents, np.nan)
+            has_seq = packed["seq_len"] > 0
+            if has_seq.any():
+                seq_scores[has_seq] = self._sequence_scores(
+                    child.microbeat_ids, packed["seq"][has_seq], packed["seq_len"][has_seq]
+                )
+            accumulate(seq_scores, weights["microbeat_sequence"])
+
+        # 2. Hook
+        accumulate(self._hook_scores(child, packed), weights["hook"])
+
+        # 3. Visual
+        accumulate(
+            self._prefix_match_scores(child.visual_ids, packed["visual"], packed["visual_len"]),
+            weights["visual_pattern"],
+        )
+
+        # 4. Audio
+        accumulate(self._audio_scores(child, packed), weights["audio_pattern"])
+
+        # 5. Timing
+        accumulate(self._timing_scores(child, packed), weights["timing"])
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = np.minimum(1.0, total / weight_sum)
+        return np.where(weight_sum == 0, 0.5, scores)
+
+    def top_k(
+        self,
+        schema: Any,
+        k: int = 5,
+        threshold: float = 0.0,
+        exclude: Optional[Any] = None,
+    ) -> List[tuple]:
+        """
+        임계값 이상 상위 k개 parent
+
+        Returns:
+            [(key, score), ...] 점수 내림차순 (동점은 추가 순서 유지)
+        """
+        scores = self.score(schema)
+        if not len(scores):
+            return []
+
+        eligible = scores >= threshold
+        if exclude is not None:
+            eligible &= np.array([key != exclude for key in self.keys], dtype=bool)
+        candidates = np.flatnonzero(eligible)
+        if not len(candidates):
+            return []
+
+        order = np.argsort(-scores[candidates], kind="stable")[:k]
+        return [(self.keys[i], float(scores[i])) for i in candidates[order]]
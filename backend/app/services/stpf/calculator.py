@@ -13,7 +13,9 @@ v3.1 Safe Math:
 """
 import math
 import logging
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
 
 from app.services.stpf.schemas import (
     STPFGates,
@@ -27,6 +29,13 @@ from app.services.stpf.invariant_rules import STPFInvariantRules
 logger = logging.getLogger(__name__)
 
 
+# 컬럼 순서 (calculate_arrays 입력 배열의 열 순서)
+GATE_FIELDS = ("trust_gate", "legality_gate", "hygiene_gate")
+NUMERATOR_FIELDS = ("essence", "capability", "novelty", "connection", "proof")
+DENOMINATOR_FIELDS = ("cost", "risk", "threat", "pressure", "time_lag", "uncertainty")
+MULTIPLIER_FIELDS = ("scarcity", "network", "leverage")
+
+
 class STPFCalculator:
     """STPF v3.1 통합 점수 계산기 (수학적 안전장치 적용)"""
     
@@ -157,6 +166,63 @@ class STPFCalculator:
         
         return result
     
+    def calculate_arrays(
+        self,
+        gates: np.ndarray,
+        numerator: np.ndarray,
+        denominator: np.ndarray,
+        multipliers: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """calculate() 의 컬럼 버전 (N개 샘플 동시 계산, 엔트로피 보너스 제외)
+        
+        Args:
+            gates: (N, 3) GATE_FIELDS 순서
+            numerator: (N, 5) NUMERATOR_FIELDS 순서
+            denominator: (N, 6) DENOMINATOR_FIELDS 순서
+            multipliers: (N, 3) MULTIPLIER_FIELDS 순서
+        
+        Returns:
+            (raw_score, score_1000, gate_passed) 각 (N,) 배열
+            - 스칼라 calculate() 와 같은 연산 순서 (raw_score 차이는 ulp 수준)
+        """
+        gates = np.asarray(gates, dtype=np.float64)
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.asarray(denominator, dtype=np.float64)
+        multipliers = np.asarray(multipliers, dtype=np.float64)
+        
+        # 1. Gate Kill Switch
+        gate_passed = gates.min(axis=1) >= 4
+        g_total = np.ones(len(gates))
+        for j in range(gates.shape[1]):
+            g_total = g_total * (gates[:, j] / 10.0)
+        
+        # 2. 가치 (분자)
+        num_exp = STPFNumerator().EXPONENTS
+        v = numerator[:, 0] ** num_exp[NUMERATOR_FIELDS[0]]
+        for j, name in enumerate(NUMERATOR_FIELDS[1:], start=1):
+            v = v * (numerator[:, j] ** num_exp[name])
+        
+        # 3. 마찰 (분모)
+        den_exp = STPFDenominator().EXPONENTS
+        f_total = 1 + (denominator[:, 0] - 1) / 9 * den_exp[DENOMINATOR_FIELDS[0]]
+        for j, name in enumerate(DENOMINATOR_FIELDS[1:], start=1):
+            f_total = f_total * (1 + (denominator[:, j] - 1) / 9 * den_exp[name])
+        
+        # 4. 승수 (STPFMultipliers.calculate_boost, beta=0.5)
+        s = (multipliers[:, 0] - 1) / 9
+        nw = (multipliers[:, 1] - 1) / 9
+        lv = (multipliers[:, 2] - 1) / 9
+        nw_boost = 1 + (2 ** (nw * 10 / 10) - 1) * 0.5
+        m_boost = (1 + s) * nw_boost * (1 + lv)
+        
+        # 5. 최종 점수 + 리스케일
+        raw_score = g_total * (v / (f_total ** self.omega)) * m_boost
+        raw_score = np.where(gate_passed, raw_score, 0.0)
+        score_1000 = np.floor(1000 * raw_score / (raw_score + self.reference_score))
+        score_1000 = np.clip(score_1000, 0, 1000).astype(np.int64)
+        
+        return raw_score, score_1000, gate_passed
+    
     def _identify_failed_gate(self, gates: STPFGates) -> str:
         """실패한 Gate 식별"""
         if gates.trust_gate < 4:
@@ -12,6 +12,8 @@ Fractional Kelly (안전 버전): f* × confidence × 0.5
 """
 import logging
 from typing import Optional, Dict, Any, Tuple
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -236,6 +238,59 @@ class KellyDecisionEngine:
         
         return decision
     
+    def calculate_from_stpf_arrays(
+        self,
+        scores: np.ndarray,
+        time_investment_hours: float = 10.0,
+        expected_view_multiplier: float = 3.0,
+    ) -> Dict[str, np.ndarray]:
+        """calculate_from_stpf 의 컬럼 버전 (p_success 는 점수에서 추정)
+        
+        Returns:
+            raw_kelly_fraction, safe_kelly_fraction, recommended_effort_percent,
+            expected_value, signal 배열 (반올림은 calculate_optimal_bet 과 동일)
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        
+        p = 1 / (1 + np.power(2.718, -0.01 * (scores - 500)))
+        p = np.clip(p, 0.01, 0.99)
+        q = 1 - p
+        
+        upside = expected_view_multiplier
+        downside = time_investment_hours / 10.0
+        confidence = np.clip(np.minimum(1.0, 0.5 + (scores - 500) / 1000), 0.3, 1.0)
+        
+        b = upside / (downside + 1e-10)
+        kelly = np.clip((b * p - q) / b, 0, 1) if b > 0 else np.zeros_like(p)
+        safe = np.clip(kelly * confidence * self.fractional_multiplier, 0, 1)
+        expected_value = p * upside - q * downside
+        
+        signal = np.select(
+            [
+                (kelly <= 0) | (expected_value < 0),
+                safe < self.moderate_threshold,
+                safe < self.go_threshold,
+            ],
+            ["NO_GO", "CAUTION", "MODERATE"],
+            default="GO",
+        )
+        
+        return {
+            "raw_kelly_fraction": np.round(kelly, 4),
+            "safe_kelly_fraction": np.round(safe, 4),
+            "recommended_effort_percent": np.round(safe * 100, 1),
+            "expected_value": np.round(expected_value, 2),
+            "signal": signal,
+        }
+    
+    def grade_arrays(self, scores: np.ndarray) -> np.ndarray:
+        """점수 배열 → 등급 문자 배열 (get_grade_info 와 같은 구간)"""
+        brackets = sorted(STPF_GRADE_BRACKETS.items())
+        lows = np.array([low for (low, _), _ in brackets])
+        grades = np.array([info["grade"] for _, info in brackets])
+        idx = np.searchsorted(lows, np.asarray(scores), side="right") - 1
+        return grades[np.clip(idx, 0, len(grades) - 1)]
+    
     def get_grade_info(self, score_1000: int) -> GradeInfo:
         """STPF 점수에서 등급 정보 반환"""
         for (low, high), info in STPF_GRADE_BRACKETS.items():
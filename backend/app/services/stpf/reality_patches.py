@@ -11,12 +11,23 @@ STPF v3.1 Reality Distortion Patches
 """
 import math
 import logging
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
 
+# apply_patches_arrays 의 applied 마스크 열 순서
+PATCH_CODES = (
+    "A_CAPITAL_OVERRIDE",
+    "B_OVERCONFIDENCE_PENALTY",
+    "C_TRUST_COLLAPSE",
+    "D_NETWORK_WINNER_TAKES_ALL",
+)
+
+
 class PatchContext(BaseModel):
     """패치 적용을 위한 컨텍스트"""
     # Core variables
@@ -207,6 +218,45 @@ class RealityDistortionPatches:
             return new_score, True
         return score, False
     
+    def apply_patches_arrays(
+        self,
+        score: np.ndarray,
+        essence: np.ndarray,
+        proof: np.ndarray,
+        trust: np.ndarray,
+        network: np.ndarray,
+        capital: np.ndarray,
+        confidence_level: np.ndarray,
+        retention: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """apply_all_patches 의 컬럼 버전 (같은 순서 A → B → C → D)
+        
+        Returns:
+            (patched_score (N,), applied (N, 4) bool - PATCH_CODES 순서)
+        """
+        score = np.asarray(score, dtype=np.float64)
+        capital = np.asarray(capital, dtype=np.float64)
+        confidence_level = np.asarray(confidence_level, dtype=np.float64)
+        
+        applied = np.column_stack([
+            (essence <= 3) & (capital > self.CAPITAL_THRESHOLD),
+            (proof < self.OVERCONFIDENCE_PROOF_THRESHOLD)
+            & (confidence_level > self.OVERCONFIDENCE_CONFIDENCE_THRESHOLD),
+            trust < self.TRUST_COLLAPSE_THRESHOLD,
+            (network > self.NETWORK_THRESHOLD) & (retention > self.RETENTION_THRESHOLD),
+        ]) if len(score) else np.zeros((0, len(PATCH_CODES)), dtype=bool)
+        
+        factors = np.ones((len(score), len(PATCH_CODES)))
+        factors[:, 0] = 1 + np.log10(1 + np.maximum(capital, 0)) * self.CAPITAL_BOOST_FACTOR
+        factors[:, 1] = 1 - confidence_level * self.OVERCONFIDENCE_PENALTY * 0.1
+        factors[:, 2] = self.TRUST_COLLAPSE_FACTOR
+        factors[:, 3] = self.NETWORK_BOOST_FACTOR
+        
+        patched = score.copy()
+        for j in range(len(PATCH_CODES)):
+            patched = np.where(applied[:, j], patched * factors[:, j], patched)
+        return patched, applied
+    
     def get_applicable_patches(self, ctx: PatchContext) -> list[str]:
         """적용 가능한 패치 목록 미리보기"""
         applicable = []
@@ -7,11 +7,14 @@ Defines the core data structures for STPF computation:
 - STPFDenominator: Friction variables (Cost, Risk, Threat, Pressure, Time Lag, Uncertainty)
 - STPFMultipliers: Boost variables (Scarcity, Network, Leverage)
 - STPFResult: Final calculation result
+- STPFBatchItem: Batch scoring input item
 """
 import math
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from pydantic import BaseModel, Field
 
+from app.schemas.vdg_v4 import VDGv4
+
 
 class STPFGates(BaseModel):
     """G: 시그모이드 임계값 통과 변수 (Gate)
@@ -180,3 +183,16 @@ class STPFResult(BaseModel):
         if self.score_1000 >= 400:
             return "CONSIDER"
         return "NO-GO"
+
+
+class STPFBatchItem(BaseModel):
+    """배치 아이템: vdg 또는 변수 4종 중 하나 (STPFService.score_batch 가 아이템별로 검증)"""
+    id: Optional[str] = None
+    vdg: Optional[Union[VDGv4, Dict[str, Any]]] = None
+    gates: Optional[STPFGates] = None
+    numerator: Optional[STPFNumerator] = None
+    denominator: Optional[STPFDenominator] = None
+    multipliers: Optional[STPFMultipliers] = None
+    capital: float = 0
+    confidence_level: float = 5.0
+    retention: float = 0.5
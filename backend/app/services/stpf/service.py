@@ -6,9 +6,11 @@ Week 2: Bayesian + Reality Patches + Anchors 통합.
 Week 3: Simulation + Kelly Criterion 통합.
 """
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from datetime import datetime
 
+import numpy as np
+
 from app.schemas.vdg_v4 import VDGv4
 from app.services.stpf.schemas import (
     STPFGates,
@@ -16,8 +18,15 @@ from app.services.stpf.schemas import (
     STPFDenominator,
     STPFMultipliers,
     STPFResult,
+    STPFBatchItem,
+)
+from app.services.stpf.calculator import (
+    STPFCalculator,
+    GATE_FIELDS,
+    NUMERATOR_FIELDS,
+    DENOMINATOR_FIELDS,
+    MULTIPLIER_FIELDS,
 )
-from app.services.stpf.calculator import STPFCalculator
 from app.services.stpf.vdg_mapper import VDGToSTPFMapper
 from app.services.stpf.invariant_rules import STPFInvariantRules
 
@@ -31,6 +40,7 @@ from app.services.stpf.reality_patches import (
     RealityDistortionPatches,
     PatchContext,
     PatchResult,
+    PATCH_CODES,
 )
 from app.services.stpf.anchors import VDG_SCALE_ANCHORS, VDGAnchorLookup
 
@@ -342,6 +352,164 @@ class STPFService:
             anchor_interpretations=anchor_interpretations,
         )
     
+    # ========== Batch Scoring ==========
+    
+    def score_batch(
+        self,
+        items: List[Any],
+        apply_patches: bool = True,
+        time_investment_hours: float = 10.0,
+        expected_view_multiplier: float = 3.0,
+        chunk_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """여러 아이템 일괄 점수 계산 (chunk 단위 컬럼 연산, 입력 순서대로 yield)
+        
+        Args:
+            items: STPFBatchItem 또는 dict (아이템별 검증 - 잘못된 아이템은 success=False 행) -
+                [{"id"?, "vdg": {...}}] 또는
+                [{"id"?, "gates", "numerator", "denominator", "multipliers",
+                  "capital"?, "confidence_level"?, "retention"?}]
+            apply_patches: Reality Patches 적용 여부
+            chunk_size: 한 번에 계산할 아이템 수 (chunk 마다 결과 yield)
+        
+        Note:
+            단건 analyze_* 와 달리 베이지안 갱신/앵커 해석/why·how 텍스트 생략.
+            go_nogo 는 패치 반영 후 최종 점수 기준 (STPFResult.get_decision 과 동일).
+        """
+        for start in range(0, len(items), chunk_size):
+            yield from self._score_chunk(
+                items[start:start + chunk_size],
+                offset=start,
+                apply_patches=apply_patches,
+                time_investment_hours=time_investment_hours,
+                expected_view_multiplier=expected_view_multiplier,
+            )
+    
+    def _parse_batch_item(self, item: Any) -> Dict[str, Any]:
+        """배치 아이템 → 변수 행 (STPFBatchItem 으로 아이템별 검증, VDG 는 mapper 로 매핑)"""
+        if not isinstance(item, STPFBatchItem):
+            item = STPFBatchItem.model_validate(item)
+        if item.vdg is not None:
+            vdg = item.vdg if isinstance(item.vdg, VDGv4) else VDGv4(**item.vdg)
+            mapping = self.mapper.map_to_stpf(vdg)
+            return {
+                "id": item.id or vdg.content_id,
+                "gates": mapping["gates"],
+                "numerator": mapping["numerator"],
+                "denominator": mapping["denominator"],
+                "multipliers": mapping["multipliers"],
+                "mapping_confidence": mapping["mapping_confidence"],
+                "capital": 0.0,
+                "confidence_level": 5.0,
+                "retention": 0.5,
+            }
+        if not any((item.gates, item.numerator, item.denominator, item.multipliers)):
+            raise ValueError("item requires 'vdg' or STPF variables")
+        return {
+            "id": item.id,
+            "gates": item.gates or STPFGates(),
+            "numerator": item.numerator or STPFNumerator(),
+            "denominator": item.denominator or STPFDenominator(),
+            "multipliers": item.multipliers or STPFMultipliers(),
+            "mapping_confidence": 1.0,
+            "capital": item.capital,
+            "confidence_level": item.confidence_level,
+            "retention": item.retention,
+        }
+    
+    def _score_chunk(
+        self,
+        items: List[Dict[str, Any]],
+        offset: int,
+        apply_patches: bool,
+        time_investment_hours: float,
+        expected_view_multiplier: float,
+    ) -> List[Dict[str, Any]]:
+        """chunk 하나를 컬럼 연산으로 계산"""
+        rows: List[Dict[str, Any]] = []
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        
+        for i, item in enumerate(items):
+            try:
+                row = self._parse_batch_item(item)
+                row["pos"] = i
+                rows.append(row)
+            except Exception as e:
+                results[i] = {
+                    "index": offset + i,
+                    "id": item.get("id") if isinstance(item, dict) else None,
+                    "success": False,
+                    "error": str(e),
+                }
+        
+        if rows:
+            def matrix(group: str, fields) -> np.ndarray:
+                return np.array(
+                    [[getattr(r[group], f) for f in fields] for r in rows],
+                    dtype=np.float64,
+                )
+            
+            gates = matrix("gates", GATE_FIELDS)
+            numerator = matrix("numerator", NUMERATOR_FIELDS)
+            denominator = matrix("denominator", DENOMINATOR_FIELDS)
+            multipliers = matrix("multipliers", MULTIPLIER_FIELDS)
+            
+            raw, scores, gate_passed = self.calculator.calculate_arrays(
+                gates, numerator, denominator, multipliers
+            )
+            
+            applied = np.zeros((len(rows), len(PATCH_CODES)), dtype=bool)
+            if apply_patches:
+                patched, applied = self.patches.apply_patches_arrays(
+                    raw,
+                    essence=numerator[:, 0],
+                    proof=numerator[:, 4],
+                    trust=gates[:, 0],
+                    network=multipliers[:, 1],
+                    capital=np.array([r["capital"] for r in rows]),
+                    confidence_level=np.array([r["confidence_level"] for r in rows]),
+                    retention=np.array([r["retention"] for r in rows]),
+                )
+                applied &= gate_passed[:, None]
+                patched_any = applied.any(axis=1)
+                ref = self.calculator.reference_score
+                patched_scores = np.clip(
+                    np.floor(1000 * patched / (patched + ref)), 0, 1000
+                ).astype(np.int64)
+                raw = np.where(patched_any, patched, raw)
+                scores = np.where(patched_any, patched_scores, scores)
+            
+            go_nogo = np.select(
+                [~gate_passed, scores >= 700, scores >= 400],
+                ["NO-GO", "GO", "CONSIDER"],
+                default="NO-GO",
+            )
+            grades = self.kelly.grade_arrays(scores)
+            kelly = self.kelly.calculate_from_stpf_arrays(
+                scores,
+                time_investment_hours=time_investment_hours,
+                expected_view_multiplier=expected_view_multiplier,
+            )
+            
+            for j, row in enumerate(rows):
+                results[row["pos"]] = {
+                    "index": offset + row["pos"],
+                    "id": row["id"],
+                    "success": True,
+                    "score_1000": int(scores[j]),
+                    "raw_score": float(raw[j]),
+                    "gate_passed": bool(gate_passed[j]),
+                    "go_nogo": str(go_nogo[j]),
+                    "grade": str(grades[j]),
+                    "kelly": {key: values[j].item() for key, values in kelly.items()},
+                    "patches_applied": [
+                        code for code, hit in zip(PATCH_CODES, applied[j]) if hit
+                    ],
+                    "mapping_confidence": row["mapping_confidence"],
+                }
+        
+        return results
+    
     def _get_anchor_interpretations(
         self,
         gates: STPFGates,
@@ -15,6 +15,8 @@ from typing import Dict, Any, Optional, List, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+import numpy as np
+
 from app.services.stpf.schemas import (
     STPFGates,
     STPFNumerator,
@@ -22,7 +24,13 @@ from app.services.stpf.schemas import (
     STPFMultipliers,
     STPFResult,
 )
-from app.services.stpf.calculator import STPFCalculator
+from app.services.stpf.calculator import (
+    STPFCalculator,
+    GATE_FIELDS,
+    NUMERATOR_FIELDS,
+    DENOMINATOR_FIELDS,
+    MULTIPLIER_FIELDS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,26 @@ class STPFVariables(BaseModel):
     multipliers: STPFMultipliers = Field(default_factory=STPFMultipliers)
 
 
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """calculator.calculate_arrays 입력 순서의 1D 배열 4개 (gates, numerator, denominator, multipliers)"""
+        return (
+            np.array([getattr(self.gates, f) for f in GATE_FIELDS], dtype=np.float64),
+            np.array([getattr(self.numerator, f) for f in NUMERATOR_FIELDS], dtype=np.float64),
+            np.array([getattr(self.denominator, f) for f in DENOMINATOR_FIELDS], dtype=np.float64),
+            np.array([getattr(self.multipliers, f) for f in MULTIPLIER_FIELDS], dtype=np.float64),
+        )
+
+
+# Monte Carlo 노이즈 키 (uncertainty dict 키, None = 노이즈 없음)
+# 분모 uncertainty 는 기존 호환을 위해 "uncertainty_var"
+NOISE_KEYS = (
+    ("trust_gate", None, "hygiene_gate"),
+    NUMERATOR_FIELDS,
+    ("cost", "risk", "threat", "pressure", "time_lag", "uncertainty_var"),
+    MULTIPLIER_FIELDS,
+)
+
+
 class ScenarioResult(BaseModel):
     """시나리오 결과"""
     scenario: str  # worst, base, best
@@ -192,6 +220,8 @@ class STPFSimulator:
         n_simulations: int = 1000,
         noise_std: float = 1.0,
         uncertainty: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        vectorized: bool = True,
     ) -> MonteCarloResult:
         """Monte Carlo 시뮬레이션
         
@@ -200,18 +230,27 @@ class STPFSimulator:
             n_simulations: 시뮬레이션 횟수
             noise_std: 기본 노이즈 표준편차
             uncertainty: 변수별 불확실성 (변수명 → 표준편차)
+            seed: 난수 시드 (재현용)
+            vectorized: True면 NumPy 배열 경로 (100k 샘플 수십 ms),
+                False면 기존 샘플별 Pydantic 경로
         
         Returns:
             MonteCarloResult: 확률 분포 및 통계
         """
+        if vectorized:
+            return self._run_monte_carlo_vectorized(
+                base_variables, n_simulations, noise_std, uncertainty or {}, seed
+            )
+        
         start_time = datetime.now()
         
+        rng = random.Random(seed)  # 전역 random 상태를 건드리지 않음
         uncertainty = uncertainty or {}
         scores: List[int] = []
         
         for _ in range(n_simulations):
             # 각 변수에 노이즈 추가
-            noisy_vars = self._add_noise(base_variables, noise_std, uncertainty)
+            noisy_vars = self._add_noise(base_variables, noise_std, uncertainty, rng)
             result = self._calculate(noisy_vars)
             scores.append(result.score_1000)
         
@@ -274,6 +313,104 @@ class STPFSimulator:
             run_time_ms=run_time_ms,
         )
     
+    def sample_noisy_arrays(
+        self,
+        base_variables: STPFVariables,
+        n_simulations: int,
+        noise_std: float = 1.0,
+        uncertainty: Optional[Dict[str, float]] = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> List[np.ndarray]:
+        """_add_noise 의 배열 버전: 전체 노이즈를 한 번의 normal() 호출로 생성
+        
+        Returns:
+            [gates (N,3), numerator (N,5), denominator (N,6), multipliers (N,3)]
+        """
+        uncertainty = uncertainty or {}
+        rng = rng or np.random.default_rng()
+        
+        bases = base_variables.to_arrays()
+        base_row = np.concatenate(bases)
+        keys = [k for group in NOISE_KEYS for k in group]
+        stds = np.array(
+            [0.0 if k is None else uncertainty.get(k, noise_std) for k in keys],
+            dtype=np.float64,
+        )
+        
+        # (변수, 샘플) 레이아웃 → 전치 뷰의 각 열이 연속 메모리
+        samples = rng.normal(size=(len(keys), n_simulations))
+        samples *= stds[:, None]
+        samples += base_row[:, None]
+        np.clip(samples, 1.0, 10.0, out=samples)
+        
+        splits = np.cumsum([len(b) for b in bases])[:-1]
+        return np.split(samples.T, splits, axis=1)
+    
+    def _run_monte_carlo_vectorized(
+        self,
+        base_variables: STPFVariables,
+        n_simulations: int,
+        noise_std: float,
+        uncertainty: Dict[str, float],
+        seed: Optional[int],
+    ) -> MonteCarloResult:
+        """run_monte_carlo 배열 경로 (같은 MonteCarloResult 반환)"""
+        start_time = datetime.now()
+        
+        columns = self.sample_noisy_arrays(
+            base_variables, n_simulations, noise_std, uncertainty,
+            rng=np.random.default_rng(seed),
+        )
+        _, scores, _ = self.calculator.calculate_arrays(*columns)
+        
+        # 백분위수 (스칼라 경로와 같은 선형 보간, 정렬 1회)
+        scores_sorted = np.sort(scores)
+        k = (n_simulations - 1) * np.array([10, 25, 50, 75, 90]) / 100
+        f = k.astype(np.int64)
+        c = np.minimum(f + 1, n_simulations - 1)
+        lo, hi = scores_sorted[f], scores_sorted[c]
+        p10, p25, median, p75, p90 = lo + (k - f) * (hi - lo)
+        mean = float(scores.mean())
+        std = float(scores.std(ddof=1)) if n_simulations > 1 else 0.0
+        
+        # 의사결정 확률
+        go_prob = float(np.count_nonzero(scores >= 700)) / n_simulations
+        nogo_prob = float(np.count_nonzero(scores < 400)) / n_simulations
+        consider_prob = float(np.count_nonzero((scores >= 400) & (scores < 700))) / n_simulations
+        
+        # 분포 요약 (100점 단위)
+        counts = np.bincount(scores // 100, minlength=11)
+        distribution = {
+            f"{bucket * 100}-{bucket * 100 + 99}": int(counts[bucket])
+            for bucket in range(11)
+        }
+        
+        end_time = datetime.now()
+        run_time_ms = (end_time - start_time).total_seconds() * 1000
+        
+        logger.info(
+            f"Monte Carlo (vectorized): n={n_simulations}, mean={mean:.0f}, "
+            f"std={std:.0f}, P(GO)={go_prob:.2%}, {run_time_ms:.1f}ms"
+        )
+        
+        return MonteCarloResult(
+            n_simulations=n_simulations,
+            mean=mean,
+            median=float(median),
+            std=std,
+            percentile_10=float(p10),
+            percentile_25=float(p25),
+            percentile_75=float(p75),
+            percentile_90=float(p90),
+            min_score=int(scores.min()),
+            max_score=int(scores.max()),
+            go_probability=go_prob,
+            consider_probability=consider_prob,
+            nogo_probability=nogo_prob,
+            distribution_summary=distribution,
+            run_time_ms=run_time_ms,
+        )
+    
     def _calculate(self, variables: STPFVariables) -> STPFResult:
         """STPF 점수 계산"""
         return self.calculator.calculate(
@@ -361,11 +498,12 @@ class STPFSimulator:
         base: STPFVariables,
         noise_std: float,
         uncertainty: Dict[str, float],
+        rng: random.Random,
     ) -> STPFVariables:
         """변수에 가우시안 노이즈 추가"""
         def noisy(value: float, name: str) -> float:
             std = uncertainty.get(name, noise_std)
-            noise = random.gauss(0, std)
+            noise = rng.gauss(0, std)
             return max(1.0, min(10.0, value + noise))
         
         new_gates = STPFGates(
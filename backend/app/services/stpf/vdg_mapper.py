@@ -104,8 +104,8 @@ class VDGToSTPFMapper:
         
         # Hygiene Gate: 미디어 품질
         hygiene = self.defaults["gate"]
-        if vdg.media and vdg.media.duration_ms:
-            if vdg.media.duration_ms >= 5000:  # 5초 이상
+        if vdg.duration_sec:
+            if vdg.duration_sec * 1000 >= 5000:  # 5초 이상
                 hygiene = 7.0
                 confidence.append(0.8)
             else:
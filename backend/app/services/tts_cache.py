@@ -0,0 +1,198 @@
+"""
+TTS Clip Cache for Real-time Coaching
+
+기존: 피드백마다 generate_tts_fallback 이 gTTS 로 MP3 를 새로 합성 (네트워크 왕복, 수백 ms~수 초)
+→ 그런데 코칭 대사는 DirectorPack 의 coach_line_templates 에서 나오는 소수의 고정 문장.
+
+현재:
+- (text, lang, persona) 키로 합성 결과 캐시
+  - 메모리 LRU (base64 MP3, 전송 형식 그대로)
+  - 디스크 저장소: {TTS_CACHE_DIR}/{key[:2]}/{key}.mp3 (재시작/다른 워커에서도 재사용)
+- 같은 키 동시 요청은 합성 1회로 합침 (in-flight dedupe)
+- DirectorPack 로드 시 collect_coach_lines 로 모든 대사를 미리 렌더 (warm-up)
+  → 녹화 중 피드백은 합성 지연 0
+
+Usage:
+    cache = get_tts_clip_cache()
+    audio_b64 = await cache.get_or_render(text, "ko", persona, lambda: synthesize(text))
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+TTS_CACHE_VERSION = "tts_clip_v1"
+
+# 합성 함수: () → MP3 bytes (실패 시 None). 스레드에서 실행됨.
+Renderer = Callable[[], Optional[bytes]]
+
+
+def collect_coach_lines(pack: Any) -> List[str]:
+    """
+    DirectorPack 에서 TTS 로 읽힐 수 있는 모든 코칭 대사 수집 (중복 제거, 순서 유지)
+
+    - DNAInvariant.coach_line_templates (톤/페르소나 필드 + ko 딕셔너리)
+    - 템플릿이 비어 있는 규칙은 check_hint (AudioCoach._format_command 폴백과 동일)
+    - MutationSlot.coach_line_templates
+    """
+    lines: List[str] = []
+
+    def add(text: Optional[str]) -> None:
+        if text and len(text) >= 2 and text not in lines:
+            lines.append(text)
+
+    for rule in getattr(pack, "dna_invariants", None) or []:
+        templates = getattr(rule, "coach_line_templates", None)
+        before = len(lines)
+        if templates is not None:
+            for field in ("strict", "friendly", "neutral", "strict_pd", "close_friend", "calm_mentor", "energetic"):
+                add(getattr(templates, field, None))
+            for text in (getattr(templates, "ko", None) or {}).values():
+                add(text)
+        if len(lines) == before:
+            add(getattr(rule, "check_hint", None))
+
+    for slot in getattr(pack, "mutation_slots", None) or []:
+        for text in (getattr(slot, "coach_line_templates", None) or {}).values():
+            add(text)
+
+    return lines
+
+
+class TTSClipCache:
+    """메모리 LRU + 디스크 TTS 클립 캐시"""
+
+    def __init__(self, max_entries: int = 1024, cache_dir: Optional[str] = None):
+        """
+        Args:
+            max_entries: 메모리 LRU 최대 클립 수
+            cache_dir: 디스크 저장 경로 (None 이면 메모리만)
+        """
+        self.max_entries = max(1, max_entries)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats: Counter = Counter()
+
+    # ---- Key / Stores ----
+
+    @staticmethod
+    def make_key(text: str, lang: str, persona: str) -> str:
+        raw = json.dumps(
+            {"v": TTS_CACHE_VERSION, "text": text, "lang": lang, "persona": persona},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.mp3"
+
+    def _remember(self, key: str, audio_b64: str) -> None:
+        self._memory[key] = audio_b64
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _load_or_render(self, key: str, render: Renderer) -> Tuple[Optional[str], str]:
+        """디스크 조회 → 없으면 합성 후 저장 (스레드에서 실행)"""
+        path = self._path(key)
+        if path is not None:
+            try:
+                return base64.b64encode(path.read_bytes()).decode(), "disk_hits"
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"TTS cache read failed ({key[:12]}): {e}")
+
+        audio = render()
+        if not audio:
+            return None, "render_failures"
+
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(audio)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"TTS cache write failed ({key[:12]}): {e}")
+        return base64.b64encode(audio).decode(), "renders"
+
+    # ---- Public API ----
+
+    def peek(self, text: str, lang: str, persona: str) -> Optional[str]:
+        """메모리에 있는 클립만 조회 (합성/디스크 I/O 없음)"""
+        return self._memory.get(self.make_key(text, lang, persona))
+
+    async def get_or_render(self, text: str, lang: str, persona: str, render: Renderer) -> Optional[str]:
+        """
+        캐시된 base64 MP3 반환, 없으면 render() 로 합성 후 저장
+
+        Returns:
+            base64 MP3 또는 None (합성 실패 - 캐시하지 않음)
+        """
+        key = self.make_key(text, lang, persona)
+        cached = self._memory.get(key)
+        if cached is not None:
+            self._memory.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, render))
+            self._inflight[key] = task
+        else:
+            self._stats["inflight_joins"] += 1
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: str, render: Renderer) -> Optional[str]:
+        try:
+            audio_b64, event = await asyncio.to_thread(self._load_or_render, key, render)
+            self._stats[event] += 1
+            if audio_b64 is not None:
+                self._remember(key, audio_b64)
+            return audio_b64
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        local = dict(self._stats)
+        hits = local.get("memory_hits", 0) + local.get("disk_hits", 0)
+        lookups = hits + local.get("renders", 0) + local.get("render_failures", 0)
+        return {
+            **local,
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "disk": str(self.cache_dir) if self.cache_dir else None,
+        }
+
+
+# Singleton instance
+_tts_clip_cache: Optional[TTSClipCache] = None
+
+
+def get_tts_clip_cache() -> TTSClipCache:
+    """싱글톤 TTSClipCache 인스턴스 반환"""
+    global _tts_clip_cache
+    if _tts_clip_cache is None:
+        from app.config import settings
+        _tts_clip_cache = TTSClipCache(
+            max_entries=settings.TTS_CACHE_MAX_ENTRIES,
+            cache_dir=settings.TTS_CACHE_DIR or None,
+        )
+    return _tts_clip_cache
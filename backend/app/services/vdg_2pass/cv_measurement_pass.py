@@ -10,17 +10,22 @@ VDG CV Measurement Pass (Pass 2: 결정론적 측정)
 - 동일 입력 = 동일 출력 (100% 재현 가능)
 - ffmpeg + OpenCV 기반
 - 3개 MVP 메트릭: center_offset, brightness, blur
+- 기본 디코딩: 영상 1회 오픈 후 윈도우 순차 탐색 (StreamingFrameReader)
 """
 from __future__ import annotations
 
 import os
+import atexit
 import logging
 import tempfile
 import subprocess
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 import cv2
 import numpy as np
@@ -134,7 +139,12 @@ class FrameExtractor:
         start_sec = start_ms / 1000.0
         duration_sec = (end_ms - start_ms) / 1000.0
         
-        output_dir = output_dir or tempfile.mkdtemp(prefix="cv_frames_")
+        if output_dir is None:
+            with tempfile.TemporaryDirectory(prefix="cv_frames_") as tmp_dir:
+                return FrameExtractor.extract_frames_for_window(
+                    video_path, t_center_ms, t_window_ms, fps=fps, output_dir=tmp_dir
+                )
+        
         output_pattern = os.path.join(output_dir, "frame_%04d.jpg")
         
         # ffmpeg로 프레임 추출
@@ -186,10 +196,142 @@ class FrameExtractor:
         return frames[0][1] if frames else None
 
 
+@dataclass
+class _WindowState:
+    """StreamingFrameReader 내부: 진행 중인 윈도우"""
+    index: int
+    start_ms: int
+    end_ms: int
+    sample_idx: int = 0
+    frames: List[Tuple[int, np.ndarray]] = field(default_factory=list)
+
+    def next_sample_ms(self, step_ms: float) -> int:
+        # FrameExtractor 와 동일한 타임스탬프 규칙: start + int(i * 1000 / fps)
+        return self.start_ms + int(self.sample_idx * step_ms)
+
+
+class StreamingFrameReader:
+    """
+    단일 디코드 세션 프레임 리더 (OpenCV VideoCapture)
+    
+    영상을 한 번만 열고 윈도우를 시작 시각 순으로 훑으며
+    BGR numpy 프레임을 바로 넘깁니다 (프로세스 spawn / JPEG / 임시 파일 없음).
+    - 겹치는 윈도우는 같은 디코드 프레임을 공유
+    - 윈도우 사이 간격이 seek_gap_ms 이하면 seek 대신 grab 으로 통과
+    - 샘플링은 fps 그리드 기준 (원본 fps 가 낮으면 ffmpeg fps 필터처럼 프레임 복제)
+    """
+    
+    def __init__(
+        self,
+        video_path: str,
+        fps: float = 10.0,
+        seek_gap_ms: int = 2000,
+    ):
+        self.video_path = video_path
+        self.fps = fps
+        self.seek_gap_ms = seek_gap_ms
+        self.frames_decoded = 0
+    
+    @staticmethod
+    def window_bounds(t_center_ms: int, t_window_ms: int) -> Tuple[int, int]:
+        """FrameExtractor.extract_frames_for_window 와 동일한 윈도우 경계"""
+        return max(0, t_center_ms - t_window_ms // 2), t_center_ms + t_window_ms // 2
+    
+    def iter_windows(
+        self,
+        windows: List[Tuple[int, int]],
+    ) -> Iterator[Tuple[int, List[Tuple[int, np.ndarray]]]]:
+        """
+        윈도우별 프레임 스트리밍
+        
+        Args:
+            windows: [(t_center_ms, t_window_ms), ...] (plan 순서)
+        
+        Yields:
+            (window_index, [(timestamp_ms, frame), ...]) - 윈도우 완료 순서
+        """
+        step_ms = 1000.0 / self.fps
+        pending = sorted(
+            (_WindowState(i, *self.window_bounds(c, w)) for i, (c, w) in enumerate(windows)),
+            key=lambda ws: (ws.start_ms, ws.end_ms, ws.index),
+        )
+        pending.reverse()  # pop() = 가장 이른 윈도우
+        active: List[_WindowState] = []
+        
+        cap = cv2.VideoCapture(self.video_path)
+        try:
+            if not cap.isOpened():
+                logger.error(f"VideoCapture failed to open: {self.video_path}")
+                for ws in reversed(pending):
+                    yield ws.index, []
+                return
+            
+            position_ms: Optional[float] = None
+            while pending or active:
+                if not active and pending:
+                    next_start = pending[-1].start_ms
+                    if position_ms is None or next_start - position_ms > self.seek_gap_ms:
+                        cap.set(cv2.CAP_PROP_POS_MSEC, float(next_start))
+                
+                if not cap.grab():
+                    break  # EOF
+                self.frames_decoded += 1
+                position_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+                
+                while pending and pending[-1].start_ms <= position_ms:
+                    active.append(pending.pop())
+                
+                due = [
+                    ws for ws in active
+                    if ws.next_sample_ms(step_ms) <= position_ms
+                    and ws.next_sample_ms(step_ms) < ws.end_ms
+                ]
+                if due:
+                    ok, frame = cap.retrieve()
+                    if ok and frame is not None:
+                        for ws in due:
+                            while (
+                                ws.next_sample_ms(step_ms) <= position_ms
+                                and ws.next_sample_ms(step_ms) < ws.end_ms
+                            ):
+                                ws.frames.append((ws.next_sample_ms(step_ms), frame))
+                                ws.sample_idx += 1
+                
+                still_active = []
+                for ws in active:
+                    if ws.next_sample_ms(step_ms) >= ws.end_ms or position_ms >= ws.end_ms:
+                        yield ws.index, ws.frames
+                    else:
+                        still_active.append(ws)
+                active = still_active
+            
+            # EOF: 남은 윈도우는 수집된 프레임까지만
+            for ws in active:
+                yield ws.index, ws.frames
+            for ws in reversed(pending):
+                yield ws.index, []
+        finally:
+            cap.release()
+
+
 # ============================================
 # Metric Calculators
 # ============================================
 
+_cascade_local = threading.local()
+
+
+def _get_face_cascade() -> "cv2.CascadeClassifier":
+    """Haar face cascade (스레드 당 1회 로드 - XML 파싱이 프레임 처리보다 비쌈)"""
+    cascade = getattr(_cascade_local, "face", None)
+    if cascade is None:
+        cascade = cv2.CascadeClassifier(
+            cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+        )
+        _cascade_local.face = cascade
+    return cascade
+
+
 class MetricCalculators:
     """개별 메트릭 계산기 (결정론적)"""
     
@@ -219,10 +361,7 @@ class MetricCalculators:
             gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
             
             # Haar Cascade 사용 (결정론적)
-            face_cascade = cv2.CascadeClassifier(
-                cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-            )
-            faces = face_cascade.detectMultiScale(
+            faces = _get_face_cascade().detectMultiScale(
                 gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
             )
             
@@ -376,9 +515,7 @@ class MetricCalculators:
         if not frames:
             return {"detected": False, "bbox_normalized": None, "area_ratio": 0.0}, 0.0
         
-        face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-        )
+        face_cascade = _get_face_cascade()
         
         all_bboxes = []
         
@@ -488,6 +625,79 @@ class MetricCalculators:
         }, round(confidence, 4)
 
 
+# ============================================
+# Process Pool Worker
+# ============================================
+
+@dataclass
+class _PointTask:
+    """프로세스 풀 작업 단위: point 1개 × 메트릭 일부"""
+    point_index: int
+    spec_indices: List[int]
+    save_evidence: bool
+
+
+def _run_point_task(
+    video_path: str,
+    extraction_fps: float,
+    evidence_output_dir: Optional[str],
+    point: AnalysisPointSeedLLM,
+    task: _PointTask,
+) -> Tuple[_PointTask, Dict[int, Optional[MetricResult]], Optional[str]]:
+    """
+    워커 프로세스에서 실행 (모듈 레벨 함수 = pickle 가능)
+    
+    윈도우를 직접 디코딩하므로 프레임을 프로세스 간 전송하지 않음.
+    """
+    cv_pass = CVMeasurementPass(
+        extraction_fps=extraction_fps,
+        save_evidence_frames=task.save_evidence,
+        evidence_output_dir=evidence_output_dir,
+    )
+    reader = StreamingFrameReader(video_path, fps=extraction_fps)
+    _, frames_data = next(reader.iter_windows([(point.t_center_ms, point.t_window_ms)]))
+    frames = [f[1] for f in frames_data]
+    
+    results = {
+        spec_index: cv_pass._measure_metric(frames, point.measurements[spec_index])
+        for spec_index in task.spec_indices
+    }
+    
+    evidence_path = None
+    if task.save_evidence and frames:
+        evidence_path = cv_pass._save_evidence_frame(frames[len(frames) // 2], point.t_center_ms)
+    
+    return task, results, evidence_path
+
+
+# workers 수별 공유 프로세스 풀 (파이프라인 인스턴스마다 풀을 만들면 spawn 워커가 누적)
+_shared_executors: Dict[int, ProcessPoolExecutor] = {}
+_shared_executors_lock = threading.Lock()
+
+
+def get_shared_executor(workers: int) -> ProcessPoolExecutor:
+    """프로세스 풀 (lazy, 프로세스 내 공유). fork 대신 spawn: OpenCV 스레드와 fork 충돌 방지"""
+    with _shared_executors_lock:
+        executor = _shared_executors.get(workers)
+        if executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _shared_executors[workers] = executor
+        return executor
+
+
+@atexit.register
+def shutdown_shared_executors() -> None:
+    """공유 프로세스 풀 종료 (인터프리터 종료 시 자동 호출)"""
+    with _shared_executors_lock:
+        executors = list(_shared_executors.values())
+        _shared_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
 # ============================================
 # Main CV Pass Class
 # ============================================
@@ -500,17 +710,42 @@ class CVMeasurementPass:
     - 동일 입력 = 동일 출력
     - ffmpeg + OpenCV 기반
     - 3개 MVP 메트릭
+    
+    decode_mode:
+    - "stream": 영상 1회 오픈, 윈도우 순차 탐색 (StreamingFrameReader, 기본값)
+    - "per_point": point 마다 ffmpeg 프로세스 + JPEG (FrameExtractor, 레거시)
+    
+    workers > 1 이면 point/메트릭을 프로세스 풀 (workers 수별 프로세스 공유) 로 분산하고
+    결과는 plan 순서로 병합 (직렬 실행과 동일한 측정값).
     """
     
+    DECODE_MODES = ("stream", "per_point")
+    
     def __init__(
         self,
         extraction_fps: float = 10.0,
         save_evidence_frames: bool = False,
         evidence_output_dir: Optional[str] = None,
+        decode_mode: str = "stream",
+        workers: int = 0,
+        executor: Optional[Executor] = None,
     ):
+        if decode_mode not in self.DECODE_MODES:
+            raise ValueError(f"Unknown decode_mode: {decode_mode}")
         self.extraction_fps = extraction_fps
         self.save_evidence_frames = save_evidence_frames
         self.evidence_output_dir = evidence_output_dir
+        self.decode_mode = decode_mode
+        self.workers = workers
+        self._executor = executor
+    
+    def _get_executor(self) -> Executor:
+        """주입된 executor 또는 workers 수별 공유 프로세스 풀"""
+        return self._executor or get_shared_executor(self.workers)
+    
+    def close(self) -> None:
+        """executor 참조 해제 (공유 풀은 shutdown_shared_executors / atexit 에서 종료)"""
+        self._executor = None
     
     def run(
         self,
@@ -542,9 +777,17 @@ class CVMeasurementPass:
         metrics_requested = set()
         metrics_measured = set()
         
-        # 각 analysis point 처리
-        for point in analysis_plan.points:
-            point_result = self._process_point(video_path, point)
+        # 각 analysis point 처리 (결과는 plan 순서)
+        if self.workers > 1 and self.decode_mode == "stream":
+            point_results = self._process_points_parallel(video_path, analysis_plan.points)
+        elif self.decode_mode == "stream":
+            point_results = self._process_points_streaming(video_path, analysis_plan.points)
+        else:
+            point_results = [
+                self._process_point(video_path, point) for point in analysis_plan.points
+            ]
+        
+        for point, point_result in zip(analysis_plan.points, point_results):
             result.measurements.append(point_result)
             total_frames += max(
                 (m.frame_count for m in point_result.metrics.values()),
@@ -577,12 +820,96 @@ class CVMeasurementPass:
         
         return result, prov
     
+    def _process_points_streaming(
+        self,
+        video_path: str,
+        points: List[AnalysisPointSeedLLM],
+    ) -> List[PointMeasurement]:
+        """전체 point 를 단일 디코드 세션으로 처리"""
+        reader = StreamingFrameReader(video_path, fps=self.extraction_fps)
+        point_results: List[Optional[PointMeasurement]] = [None] * len(points)
+        
+        windows = [(p.t_center_ms, p.t_window_ms) for p in points]
+        for index, frames_data in reader.iter_windows(windows):
+            point_results[index] = self._measure_point(points[index], [f[1] for f in frames_data])
+        
+        logger.debug(f"StreamingFrameReader decoded {reader.frames_decoded} frames for {len(points)} points")
+        return point_results
+    
+    def _plan_tasks(self, points: List[AnalysisPointSeedLLM]) -> List[_PointTask]:
+        """
+        작업 분할
+        - point 수 >= workers: point 단위 (디코딩 1회에 모든 메트릭)
+        - point 수 < workers: (point, 메트릭) 단위로 쪼개 코어 활용
+        """
+        split_metrics = len(points) < self.workers
+        tasks = []
+        for point_index, point in enumerate(points):
+            spec_indices = list(range(len(point.measurements)))
+            if not split_metrics or len(spec_indices) <= 1:
+                tasks.append(_PointTask(point_index, spec_indices, self.save_evidence_frames))
+                continue
+            for spec_index in spec_indices:
+                tasks.append(_PointTask(
+                    point_index,
+                    [spec_index],
+                    self.save_evidence_frames and spec_index == 0,
+                ))
+        return tasks
+    
+    def _process_points_parallel(
+        self,
+        video_path: str,
+        points: List[AnalysisPointSeedLLM],
+    ) -> List[PointMeasurement]:
+        """프로세스 풀 분산 처리 후 plan 순서로 병합"""
+        if self.save_evidence_frames and self.evidence_output_dir is None:
+            self.evidence_output_dir = tempfile.mkdtemp(prefix="cv_evidence_")
+        
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _run_point_task,
+                video_path,
+                self.extraction_fps,
+                self.evidence_output_dir,
+                points[task.point_index],
+                task,
+            )
+            for task in self._plan_tasks(points)
+        ]
+        
+        metric_results: Dict[Tuple[int, int], Optional[MetricResult]] = {}
+        evidence_paths: Dict[int, str] = {}
+        for future in futures:
+            task, results, evidence_path = future.result()
+            for spec_index, metric_result in results.items():
+                metric_results[(task.point_index, spec_index)] = metric_result
+            if evidence_path:
+                evidence_paths[task.point_index] = evidence_path
+        
+        point_results = []
+        for point_index, point in enumerate(points):
+            point_result = PointMeasurement(
+                t_center_ms=point.t_center_ms,
+                t_window_ms=point.t_window_ms,
+                evidence_frame_path=evidence_paths.get(point_index),
+            )
+            # _measure_point 와 동일한 spec 순서로 병합
+            for spec_index, spec in enumerate(point.measurements):
+                metric_result = metric_results.get((point_index, spec_index))
+                if metric_result:
+                    point_result.metrics[spec.metric_id] = metric_result
+            point_results.append(point_result)
+        
+        return point_results
+    
     def _process_point(
         self,
         video_path: str,
         point: AnalysisPointSeedLLM,
     ) -> PointMeasurement:
-        """단일 analysis point 처리"""
+        """단일 analysis point 처리 (per_point 모드)"""
         
         # 프레임 추출
         frames_data = FrameExtractor.extract_frames_for_window(
@@ -592,8 +919,14 @@ class CVMeasurementPass:
             fps=self.extraction_fps,
         )
         
-        frames = [f[1] for f in frames_data]
-        
+        return self._measure_point(point, [f[1] for f in frames_data])
+    
+    def _measure_point(
+        self,
+        point: AnalysisPointSeedLLM,
+        frames: List[np.ndarray],
+    ) -> PointMeasurement:
+        """추출된 프레임으로 point 의 요청 메트릭 측정"""
         point_result = PointMeasurement(
             t_center_ms=point.t_center_ms,
             t_window_ms=point.t_window_ms,
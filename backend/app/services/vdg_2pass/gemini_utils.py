@@ -33,7 +33,7 @@ async def robust_generate_content(
     3. JSON repair loop (1 attempt if parsing fails)
     
     Args:
-        model: Gemini GenerativeModel instance
+        model: 모델 ID (str → 공유 GenAIGateway 경유) 또는 legacy GenerativeModel instance
         contents: Content parts to send
         result_schema: Pydantic model class for parsing
         max_retries: Maximum retry attempts
@@ -99,7 +99,16 @@ async def robust_generate_content(
 async def _try_generate_async(model, contents: list):
     """
     Try async generation with sync fallback.
+    
+    모델 ID 문자열이면 GenAIGateway (공유 client.aio + 동시성 상한) 로 1회 호출 -
+    재시도는 robust_generate_content 루프가 담당.
     """
+    if isinstance(model, str):
+        from app.services.genai_gateway import get_genai_gateway
+        return await get_genai_gateway().generate_or_raise(
+            contents, model=model, max_retries=1, site="gemini_utils"
+        )
+    
     try:
         # Try async method first
         if hasattr(model, 'generate_content_async'):
@@ -0,0 +1,272 @@
+# backend/app/services/vdg_2pass/pass_cache.py
+"""
+VDG Pass Cache (Content-addressed)
+
+Pass 1 (UnifiedPass) / Pass 2 (CVMeasurementPass) 결과를
+영상 내용 해시 기준으로 캐시 → 재크롤/재업로드 중복 영상은 두 Pass 모두 스킵.
+
+키 구성:
+- video_hash (compute_video_hash: 전체 파일 SHA-256) + 파일 크기
+- prompt_version / schema_version / model_id
+- pass 설정 (fps, media_resolution, CV 버전 등)
+- Pass 2 는 analysis_plan 해시 포함 (Pass 1 결과가 같으면 같은 키)
+
+저장소:
+- 로컬 디스크 (항상): {VDG_PASS_CACHE_DIR}/{pass}/{key[:2]}/{key}.json
+- Redis (옵션): VDG_PASS_CACHE_REDIS=true 일 때 read-through / write-through
+
+cache.py 의 URL 기반 cache_vdg_v4 와 달리 같은 영상이 다른 URL 로 들어와도 적중.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+PASS_CACHE_VERSION = "vdg_pass_cache_v1"
+PASS_NAMES = ("pass1", "pass2")
+
+
+def _json_default(value: Any) -> Any:
+    """numpy scalar 등 JSON 비호환 값 처리"""
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def _stable_hash(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ============================================
+# Codecs (dataclass / pydantic ↔ JSON dict)
+# ============================================
+
+def encode_pass1(llm_output, provenance) -> Dict[str, Any]:
+    return {
+        "llm_output": llm_output.model_dump(mode="json"),
+        "provenance": asdict(provenance),
+    }
+
+
+def decode_pass1(payload: Dict[str, Any]):
+    from app.schemas.vdg_unified_pass import UnifiedPassLLMOutput
+    from app.services.vdg_2pass.unified_pass import UnifiedPassProvenance
+
+    return (
+        UnifiedPassLLMOutput.model_validate(payload["llm_output"]),
+        UnifiedPassProvenance(**payload["provenance"]),
+    )
+
+
+def encode_pass2(cv_result, provenance) -> Dict[str, Any]:
+    return {
+        "cv_result": asdict(cv_result),
+        "provenance": asdict(provenance),
+    }
+
+
+def decode_pass2(payload: Dict[str, Any]):
+    from app.services.vdg_2pass.cv_measurement_pass import (
+        CVMeasurementResult,
+        CVPassProvenance,
+        MetricResult,
+        PointMeasurement,
+    )
+
+    raw = payload["cv_result"]
+    measurements = [
+        PointMeasurement(
+            t_center_ms=m["t_center_ms"],
+            t_window_ms=m["t_window_ms"],
+            metrics={k: MetricResult(**v) for k, v in (m.get("metrics") or {}).items()},
+            evidence_frame_path=m.get("evidence_frame_path"),
+        )
+        for m in raw.get("measurements") or []
+    ]
+    cv_result = CVMeasurementResult(
+        measurements=measurements,
+        version=raw["version"],
+        run_at=raw["run_at"],
+        total_frames_processed=raw["total_frames_processed"],
+        processing_time_ms=raw["processing_time_ms"],
+    )
+    return cv_result, CVPassProvenance(**payload["provenance"])
+
+
+# ============================================
+# Cache
+# ============================================
+
+class VDGPassCache:
+    """
+    Content-addressed VDG pass 결과 캐시 (동기 API: 파이프라인이 스레드에서 실행됨)
+
+    Usage:
+        key = vdg_pass_cache.make_key("pass1", video_hash=h, ...)
+        payload = vdg_pass_cache.get("pass1", key)
+        if payload is None:
+            ... run pass ...
+            vdg_pass_cache.put("pass1", key, encode_pass1(output, prov))
+    """
+
+    REDIS_PREFIX = "vdg_pass"
+    REDIS_STATS_KEY = "vdg_pass:stats"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        use_redis: bool = False,
+        ttl_sec: int = 7 * 86400,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.use_redis = use_redis
+        self.ttl_sec = ttl_sec
+        self._redis = None
+        self._redis_failed = False
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+
+    # ---- Key ----
+
+    def make_key(self, pass_name: str, **components: Any) -> str:
+        """버전/설정 컴포넌트를 모두 포함한 결정론적 키"""
+        if pass_name not in PASS_NAMES:
+            raise ValueError(f"Unknown pass: {pass_name}")
+        return _stable_hash({"cache_version": PASS_CACHE_VERSION, "pass": pass_name, **components})
+
+    # ---- Stores ----
+
+    def _path(self, pass_name: str, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / pass_name / key[:2] / f"{key}.json"
+
+    def _get_redis(self):
+        if not self.use_redis or self._redis_failed:
+            return None
+        if self._redis is None:
+            try:
+                import redis
+                client = redis.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    decode_responses=True,
+                    socket_timeout=1.0,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(f"VDG pass cache: Redis unavailable, disk only ({e})")
+                self._redis_failed = True
+                return None
+        return self._redis
+
+    def _count(self, pass_name: str, event: str) -> None:
+        field = f"{pass_name}_{event}"
+        with self._lock:
+            self._stats[field] += 1
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.hincrby(self.REDIS_STATS_KEY, field, 1)
+            except Exception:
+                pass
+
+    def _read_disk(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            if self.ttl_sec and time.time() - path.stat().st_mtime > self.ttl_sec:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, path: Path, raw: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+
+    # ---- Public API ----
+
+    def get(self, pass_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """디스크 → Redis 순으로 조회 (Redis 적중 시 디스크에 채움)"""
+        try:
+            path = self._path(pass_name, key)
+            payload = self._read_disk(path) if path else None
+            if payload is None:
+                client = self._get_redis()
+                raw = client.get(f"{self.REDIS_PREFIX}:{pass_name}:{key}") if client else None
+                if raw:
+                    payload = json.loads(raw)
+                    if path:
+                        self._write_disk(path, raw)
+        except Exception as e:
+            logger.warning(f"VDG pass cache read failed ({pass_name}:{key[:12]}): {e}")
+            self._count(pass_name, "errors")
+            payload = None
+
+        self._count(pass_name, "hits" if payload is not None else "misses")
+        return payload
+
+    def put(self, pass_name: str, key: str, payload: Dict[str, Any]) -> None:
+        try:
+            raw = json.dumps(payload, ensure_ascii=False, default=_json_default)
+            path = self._path(pass_name, key)
+            if path:
+                self._write_disk(path, raw)
+            client = self._get_redis()
+            if client is not None:
+                client.setex(f"{self.REDIS_PREFIX}:{pass_name}:{key}", self.ttl_sec, raw)
+            self._count(pass_name, "stores")
+        except Exception as e:
+            logger.warning(f"VDG pass cache write failed ({pass_name}:{key[:12]}): {e}")
+            self._count(pass_name, "errors")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss 카운터 (프로세스 로컬 + Redis 공유 카운터)"""
+        with self._lock:
+            local = dict(self._stats)
+
+        result: Dict[str, Any] = {"local": local}
+        for pass_name in PASS_NAMES:
+            hits = local.get(f"{pass_name}_hits", 0)
+            lookups = hits + local.get(f"{pass_name}_misses", 0)
+            result[f"{pass_name}_hit_rate"] = round(hits / lookups, 4) if lookups else None
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                result["global"] = {k: int(v) for k, v in client.hgetall(self.REDIS_STATS_KEY).items()}
+            except Exception:
+                pass
+        result["backends"] = {
+            "disk": str(self.cache_dir) if self.cache_dir else None,
+            "redis": client is not None,
+        }
+        return result
+
+
+# Singleton
+vdg_pass_cache = VDGPassCache(
+    cache_dir=settings.VDG_PASS_CACHE_DIR or None,
+    use_redis=settings.VDG_PASS_CACHE_REDIS,
+    ttl_sec=settings.VDG_PASS_CACHE_TTL_SEC,
+)
@@ -10,6 +10,8 @@ API 특징:
 - VideoMetadata: hook clip (10fps) + full video (1fps) 분리
 - media_resolution: low/high로 토큰 비용 제어
 - JSON output (manual validation)
+- GenAIGateway 경유: run() 은 executor 스레드에서 돌고, 업로드/폴링/생성은
+  앱 이벤트 루프에서 async 로 실행 (동시성 상한/백오프 공통 적용)
 """
 from __future__ import annotations
 
@@ -23,7 +25,8 @@ from typing import List, Optional, Dict, Any, Tuple
 
 from google.genai import types
 
-from app.services.genai_client import get_genai_client, DEFAULT_MODEL_PRO
+from app.services.genai_client import DEFAULT_MODEL_PRO
+from app.services.genai_gateway import GenAIGatewayError, get_genai_gateway
 from app.schemas.metric_registry import METRIC_DEFINITIONS, validate_metric_id
 from app.schemas.vdg_unified_pass import UnifiedPassLLMOutput
 from app.services.vdg_2pass.prompts.unified_prompt import (
@@ -33,6 +36,9 @@ from app.services.vdg_2pass.prompts.unified_prompt import (
 
 logger = logging.getLogger(__name__)
 
+# 비디오 1회 분석 호출 타임아웃 (게이트웨이 기본 60초는 장편 영상에 부족)
+UNIFIED_PASS_TIMEOUT_SEC = 300
+
 
 # ============================================
 # Provenance
@@ -129,11 +135,11 @@ class UnifiedPass:
             (UnifiedPassLLMOutput, UnifiedPassProvenance)
         """
         start_time = time.time()
-        client = get_genai_client()
+        gateway = get_genai_gateway()
         top_comments = top_comments or []
 
         # 1. 비디오 업로드
-        video_file = self._upload_video(client, video_path)
+        video_file = self._upload_video(gateway, video_path)
         logger.info(f"📹 Video uploaded: {video_file.name}")
 
         # 2. Video parts in ONE request (추가 호출 없이 심층 해석):
@@ -188,10 +194,13 @@ class UnifiedPass:
         )
 
         try:
-            resp = client.models.generate_content(
+            resp = gateway.run_sync(
+                gateway.generate_or_raise,
+                contents,
                 model=self.model_id,
-                contents=contents,
                 config=config,
+                timeout=UNIFIED_PASS_TIMEOUT_SEC,
+                site="vdg_pass1",
             )
         except Exception as e:
             raise UnifiedPassError(f"UnifiedPass API call failed: {e}") from e
@@ -485,34 +494,16 @@ class UnifiedPass:
     # Helpers
     # ============================================
 
-    def _upload_video(self, client, video_path: str):
-        """비디오 파일 업로드 및 처리 대기"""
+    def _upload_video(self, gateway, video_path: str):
+        """비디오 파일 업로드 및 처리 대기 (게이트웨이 async 폴링, 최대 60초)"""
         p = Path(video_path)
         if not p.exists():
             raise UnifiedPassError(f"video_path not found: {video_path}")
 
-        video_file = client.files.upload(file=p)
-
-        # Poll until ACTIVE (일부 모델은 처리 시간 필요)
-        for _ in range(60):
-            state = getattr(video_file, "state", None)
-            name = getattr(state, "name", None) if state else None
-            if name in (None, "ACTIVE", "SUCCEEDED"):
-                return video_file
-            if name in ("FAILED", "ERROR"):
-                raise UnifiedPassError(f"video file processing failed: state={name}")
-            time.sleep(1.0)
-            try:
-                video_file = client.files.get(name=video_file.name)
-            except Exception:
-                pass
-
-        # Warn if polling timed out without reaching ACTIVE state
-        state = getattr(video_file, 'state', None)
-        name = getattr(state, 'name', None) if state else None
-        if name and name not in ('ACTIVE', 'SUCCEEDED'):
-            logger.warning(f'Video file polling timed out, state={name}. Inference may fail.')
-        return video_file
+        try:
+            return gateway.run_sync(gateway.upload_file, p, poll_interval_sec=1.0, timeout_sec=60.0)
+        except GenAIGatewayError as e:
+            raise UnifiedPassError(f"video {e}") from e
 
     def _normalize_and_validate_metrics(
         self, out: UnifiedPassLLMOutput
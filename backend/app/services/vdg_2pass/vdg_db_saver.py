@@ -76,6 +76,13 @@ class VDGDatabaseSaver:
                 return {"error": f"Node not found: {node_id}"}
             node_uuid = node.id
         
+        # 1-1. Parent 후보 ANN 인덱스 갱신 (kick 유무와 무관)
+        try:
+            from app.services.vdg_vector_index import vdg_vector_index
+            vdg_vector_index.upsert(str(node_uuid), vdg_data)
+        except Exception as e:
+            logger.warning(f"VDG vector index update failed for {node_id}: {e}")
+        
         # 2. OutlierItem UUID
         outlier_uuid = None
         if outlier_item_id:
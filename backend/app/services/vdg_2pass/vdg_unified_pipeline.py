@@ -29,11 +29,13 @@ VDG Unified Pipeline Orchestrator
 from __future__ import annotations
 
 import os
+import json
 import logging
 import hashlib
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, ContextManager, Dict, List, Optional, Any, Tuple
 
 from app.schemas.vdg_unified_pass import (
     UnifiedPassLLMOutput,
@@ -46,12 +48,26 @@ from app.services.vdg_2pass.unified_pass import (
     get_video_duration_ms,
 )
 from app.services.vdg_2pass.cv_measurement_pass import (
+    CV_PASS_VERSION,
     CVMeasurementPass,
     CVMeasurementResult,
     CVPassProvenance,
     PointMeasurement,
     MetricResult,
 )
+from app.services.vdg_2pass.prompts.unified_prompt import PROMPT_VERSION_UNIFIED
+from app.services.vdg_2pass.video_fingerprint import (
+    compute_perceptual_fingerprint,
+    hash_video_file,
+)
+from app.services.vdg_2pass.pass_cache import (
+    VDGPassCache,
+    vdg_pass_cache,
+    encode_pass1,
+    decode_pass1,
+    encode_pass2,
+    decode_pass2,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -75,11 +91,22 @@ class PipelineConfig:
     
     # Pass 2 설정
     cv_extraction_fps: float = 10.0
+    cv_decode_mode: str = "stream"  # stream | per_point
+    cv_workers: int = field(default_factory=lambda: int(os.getenv("CV_PASS_WORKERS", "0")))  # >1: 프로세스 풀
     save_evidence_frames: bool = False
     evidence_output_dir: Optional[str] = None
     
     # 일반 설정
     skip_cv_pass: bool = False  # CV Pass 스킵 (디버깅용)
+    compute_fingerprint: bool = True  # 근사 중복 탐지용 dHash fingerprint
+    
+    # Content-addressed Pass 캐시
+    use_pass_cache: bool = True
+    cache_key_includes_context: bool = False  # True: caption/hashtags/comments 도 키에 포함
+
+    # 스테이지 슬롯 ("llm" | "cv" → context manager, 캐시 미스일 때만 잡음)
+    # 분석 워커는 StageLimiter.slot 을 넘겨 프로세스 내 동시 Gemini/CV 실행 수를 제한
+    stage_slot: Optional[Callable[[str], ContextManager]] = None
 
 
 # ============================================
@@ -112,6 +139,8 @@ class VDGUnifiedResult:
     run_at: str = ""
     video_path: str = ""
     duration_ms: int = 0
+    video_hash: str = ""  # 전체 파일 SHA-256
+    video_fingerprint: Optional[str] = None  # 샘플 프레임 dHash (hex)
     
     # Pass 1 결과
     llm_output: Optional[UnifiedPassLLMOutput] = None
@@ -128,6 +157,10 @@ class VDGUnifiedResult:
     total_latency_ms: int = 0
     pass1_latency_ms: int = 0
     pass2_latency_ms: int = 0
+    
+    # 캐시
+    pass1_cache_hit: bool = False
+    pass2_cache_hit: bool = False
 
 
 # ============================================
@@ -147,13 +180,21 @@ def generate_ap_id(
     return f"ap_{video_hash[:8]}_{t_center_ms}_{t_window_ms}"
 
 
-def compute_video_hash(video_path: str) -> str:
-    """비디오 파일 해시 (첫 1MB만)"""
-    hasher = hashlib.sha256()
-    with open(video_path, "rb") as f:
-        chunk = f.read(1024 * 1024)  # 1MB
-        hasher.update(chunk)
-    return hasher.hexdigest()
+_SCHEMA_FINGERPRINT: Optional[str] = None
+
+
+def llm_schema_fingerprint() -> str:
+    """UnifiedPassLLMOutput JSON 스키마 해시 (스키마 변경 시 캐시 자동 무효화)"""
+    global _SCHEMA_FINGERPRINT
+    if _SCHEMA_FINGERPRINT is None:
+        schema = json.dumps(UnifiedPassLLMOutput.model_json_schema(), sort_keys=True)
+        _SCHEMA_FINGERPRINT = hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+    return _SCHEMA_FINGERPRINT
+
+
+def compute_video_hash(video_path: str, algorithm: str = "sha256") -> str:
+    """비디오 파일 해시 (전체 파일, mmap 스트리밍)"""
+    return hash_video_file(video_path, algorithm=algorithm)
 
 
 # ============================================
@@ -167,8 +208,13 @@ class VDGUnifiedPipeline:
     Pass 1 (UnifiedPass) → Pass 2 (CVMeasurementPass) → Merge
     """
     
-    def __init__(self, config: Optional[PipelineConfig] = None):
+    def __init__(
+        self,
+        config: Optional[PipelineConfig] = None,
+        pass_cache: Optional[VDGPassCache] = None,
+    ):
         self.config = config or PipelineConfig()
+        self.pass_cache = (pass_cache or vdg_pass_cache) if self.config.use_pass_cache else None
         
         # Pass 1 초기화
         self.pass1 = UnifiedPass(
@@ -184,6 +230,8 @@ class VDGUnifiedPipeline:
             extraction_fps=self.config.cv_extraction_fps,
             save_evidence_frames=self.config.save_evidence_frames,
             evidence_output_dir=self.config.evidence_output_dir,
+            decode_mode=self.config.cv_decode_mode,
+            workers=self.config.cv_workers,
         )
     
     def run(
@@ -221,29 +269,61 @@ class VDGUnifiedPipeline:
             if duration_ms == 0:
                 duration_ms = 60000  # 기본 60초
         
-        # 비디오 해시 (ID 생성용)
+        # 비디오 해시 (ID 생성 + 캐시 키)
         video_hash = compute_video_hash(video_path)
+        video_identity = {"video_hash": video_hash, "size": os.path.getsize(video_path)}
         
         result = VDGUnifiedResult(
             run_at=datetime.now(timezone.utc).isoformat(),
             video_path=video_path,
             duration_ms=duration_ms,
+            video_hash=video_hash,
         )
         
+        if self.config.compute_fingerprint:
+            try:
+                fingerprint = compute_perceptual_fingerprint(video_path)
+                result.video_fingerprint = fingerprint.to_hex() if fingerprint else None
+            except Exception as e:
+                logger.warning(f"⚠️ Video fingerprint failed: {e}")
+        
         # ============================================
         # Pass 1: UnifiedPass (LLM)
         # ============================================
         pass1_start = time.time()
         
         try:
-            llm_output, llm_prov = self.pass1.run(
-                video_path=video_path,
-                duration_ms=duration_ms,
-                platform=platform,
-                caption=caption,
-                hashtags=hashtags,
-                top_comments=top_comments,
-            )
+            pass1_key = None
+            cached = None
+            if self.pass_cache:
+                pass1_key = self.pass_cache.make_key(
+                    "pass1",
+                    **video_identity,
+                    **self._pass1_key_components(
+                        duration_ms=duration_ms,
+                        platform=platform,
+                        caption=caption,
+                        hashtags=hashtags,
+                        top_comments=top_comments,
+                    ),
+                )
+                cached = self.pass_cache.get("pass1", pass1_key)
+            
+            if cached is not None:
+                llm_output, llm_prov = decode_pass1(cached)
+                result.pass1_cache_hit = True
+            else:
+                with self._stage("llm"):
+                    llm_output, llm_prov = self.pass1.run(
+                        video_path=video_path,
+                        duration_ms=duration_ms,
+                        platform=platform,
+                        caption=caption,
+                        hashtags=hashtags,
+                        top_comments=top_comments,
+                    )
+                if self.pass_cache:
+                    self.pass_cache.put("pass1", pass1_key, encode_pass1(llm_output, llm_prov))
             result.llm_output = llm_output
             result.llm_provenance = llm_prov
             result.pass1_latency_ms = int((time.time() - pass1_start) * 1000)
@@ -251,7 +331,7 @@ class VDGUnifiedPipeline:
             logger.info(
                 f"✅ Pass 1 complete: "
                 f"analysis_points={len(llm_output.analysis_plan.points)}, "
-                f"latency={result.pass1_latency_ms}ms"
+                f"latency={result.pass1_latency_ms}ms, cache_hit={result.pass1_cache_hit}"
             )
         except Exception as e:
             logger.error(f"❌ Pass 1 failed: {e}")
@@ -266,10 +346,32 @@ class VDGUnifiedPipeline:
             logger.info(f"🔬 Pass 2 starting (CV measurement)...")
             
             try:
-                cv_result, cv_prov = self.pass2.run(
-                    video_path=video_path,
-                    analysis_plan=llm_output.analysis_plan,
-                )
+                # evidence frame 경로는 임시 파일이므로 저장 모드에서는 캐시 안 함
+                use_cache = self.pass_cache is not None and not self.config.save_evidence_frames
+                pass2_key = None
+                cached = None
+                if use_cache:
+                    pass2_key = self.pass_cache.make_key(
+                        "pass2",
+                        **video_identity,
+                        cv_version=CV_PASS_VERSION,
+                        extraction_fps=self.config.cv_extraction_fps,
+                        decode_mode=self.config.cv_decode_mode,
+                        analysis_plan=llm_output.analysis_plan.model_dump(mode="json"),
+                    )
+                    cached = self.pass_cache.get("pass2", pass2_key)
+                
+                if cached is not None:
+                    cv_result, cv_prov = decode_pass2(cached)
+                    result.pass2_cache_hit = True
+                else:
+                    with self._stage("cv"):
+                        cv_result, cv_prov = self.pass2.run(
+                            video_path=video_path,
+                            analysis_plan=llm_output.analysis_plan,
+                        )
+                    if use_cache:
+                        self.pass_cache.put("pass2", pass2_key, encode_pass2(cv_result, cv_prov))
                 result.cv_result = cv_result
                 result.cv_provenance = cv_prov
                 result.pass2_latency_ms = int((time.time() - pass2_start) * 1000)
@@ -277,7 +379,7 @@ class VDGUnifiedPipeline:
                 logger.info(
                     f"✅ Pass 2 complete: "
                     f"frames={cv_result.total_frames_processed}, "
-                    f"latency={result.pass2_latency_ms}ms"
+                    f"latency={result.pass2_latency_ms}ms, cache_hit={result.pass2_cache_hit}"
                 )
             except Exception as e:
                 logger.error(f"❌ Pass 2 failed: {e}")
@@ -302,6 +404,48 @@ class VDGUnifiedPipeline:
         
         return result
     
+    def _stage(self, stage: str) -> ContextManager:
+        return self.config.stage_slot(stage) if self.config.stage_slot else nullcontext()
+    
+    def _pass1_key_components(
+        self,
+        *,
+        duration_ms: int,
+        platform: str,
+        caption: Optional[str],
+        hashtags: Optional[List[str]],
+        top_comments: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        """Pass 1 캐시 키: 프롬프트/스키마/모델 버전 + Pass 1 설정"""
+        p1 = self.pass1
+        components: Dict[str, Any] = {
+            "prompt_version": PROMPT_VERSION_UNIFIED,
+            "schema": llm_schema_fingerprint(),
+            "model_id": p1.model_id,
+            "pipeline_version": PIPELINE_VERSION,
+            "media_resolution": p1.media_resolution,
+            "hook_clip_seconds": p1.hook_clip_seconds,
+            "hook_clip_fps": p1.hook_clip_fps,
+            "full_video_fps": p1.full_video_fps,
+            "max_output_tokens": p1.max_output_tokens,
+            "temperature": p1.temperature,
+            "zoom_windows": [
+                p1.enable_zoom_windows,
+                p1.zoom_window_fps,
+                p1.zoom_window_duration,
+                p1.max_zoom_windows,
+            ],
+            "duration_ms": duration_ms,
+            "platform": platform,
+        }
+        if self.config.cache_key_includes_context:
+            components["context"] = {
+                "caption": caption,
+                "hashtags": hashtags or [],
+                "top_comments": top_comments or [],
+            }
+        return components
+    
     def _merge_results(
         self,
         llm_output: UnifiedPassLLMOutput,
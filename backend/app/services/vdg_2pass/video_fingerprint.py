@@ -0,0 +1,207 @@
+# backend/app/services/vdg_2pass/video_fingerprint.py
+"""
+Video Fingerprint (Content Hash + Perceptual dHash)
+
+1. hash_video_file: 전체 파일 스트리밍 해시 (mmap, Python 메모리로 복사 안 함)
+   - "sha256": 결정론적 ID / 캐시 키 (기본값)
+   - "fast": 비암호 해시 (xxhash 설치 시 xxh3_128, 없으면 blake2b-128)
+2. compute_perceptual_fingerprint: 샘플 프레임 dHash
+   - 길이 대비 상대 위치에서 N 프레임 샘플 → 재인코딩/해상도 변경에도 유지
+   - TikTok/YouTube/Instagram 재업로드 근사 중복 탐지용
+
+기존 compute_video_hash 는 첫 1MB 만 해시 → 같은 컨테이너 헤더를 공유하는
+다른 영상이 충돌할 수 있었음.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import xxhash  # optional
+except ImportError:  # pragma: no cover - depends on environment
+    xxhash = None
+
+
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+HASH_ALGORITHMS = ("sha256", "fast")
+FINGERPRINT_VERSION = "dhash64_v1"
+
+
+# ============================================
+# Content Hash
+# ============================================
+
+def _new_hasher(algorithm: str):
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "fast":
+        if xxhash is not None:
+            return xxhash.xxh3_128()
+        return hashlib.blake2b(digest_size=16)
+    raise ValueError(f"Unknown hash algorithm: {algorithm} (expected one of {HASH_ALGORITHMS})")
+
+
+def fast_hash_name() -> str:
+    """'fast' 알고리즘의 실제 구현 이름 (캐시 키에 포함 가능)"""
+    return "xxh3_128" if xxhash is not None else "blake2b_128"
+
+
+def hash_video_file(
+    video_path: str,
+    algorithm: str = "sha256",
+    chunk_size: int = HASH_CHUNK_BYTES,
+) -> str:
+    """
+    전체 파일 해시 (hex)
+
+    mmap 위 memoryview 슬라이스를 chunk 단위로 hasher 에 전달 → 파일 크기와 무관하게
+    Python 힙 사용량은 일정. mmap 불가(빈 파일, 특수 FS)면 버퍼 read 로 fallback.
+    """
+    hasher = _new_hasher(algorithm)
+    with open(video_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return hasher.hexdigest()
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+        with mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                try:
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            view = memoryview(mm)
+            try:
+                for offset in range(0, size, chunk_size):
+                    hasher.update(view[offset:offset + chunk_size])
+            finally:
+                view.release()
+    return hasher.hexdigest()
+
+
+# ============================================
+# Perceptual Fingerprint
+# ============================================
+
+@dataclass
+class VideoFingerprint:
+    """샘플 프레임 dHash 시퀀스"""
+    hashes: List[int] = field(default_factory=list)  # 64-bit dHash per sample
+    duration_ms: int = 0
+    version: str = FINGERPRINT_VERSION
+
+    def to_hex(self) -> str:
+        return "".join(f"{h:016x}" for h in self.hashes)
+
+    @classmethod
+    def from_hex(cls, value: str, duration_ms: int = 0) -> "VideoFingerprint":
+        hashes = [int(value[i:i + 16], 16) for i in range(0, len(value), 16)]
+        return cls(hashes=hashes, duration_ms=duration_ms)
+
+
+def _dhash(frame, hash_size: int = 8) -> int:
+    """Difference hash: 인접 픽셀 밝기 비교 (hash_size^2 bit)"""
+    import cv2
+    import numpy as np
+
+    gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def compute_perceptual_fingerprint(
+    video_path: str,
+    n_samples: int = 16,
+    margin: float = 0.05,
+) -> Optional[VideoFingerprint]:
+    """
+    길이 대비 [margin, 1 - margin] 구간에서 균등 샘플한 프레임의 dHash
+
+    Returns:
+        VideoFingerprint 또는 영상을 열 수 없으면 None
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        logger.warning(f"Fingerprint: cannot open video {video_path}")
+        return None
+
+    try:
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        if total_frames <= 0:
+            return None
+        duration_ms = int(total_frames / fps * 1000) if fps > 0 else 0
+
+        span = 1.0 - 2 * margin
+        positions = [
+            margin + span * (i + 0.5) / n_samples
+            for i in range(n_samples)
+        ]
+        frame_indices = sorted({
+            min(total_frames - 1, int(p * total_frames)) for p in positions
+        })
+
+        hashes = []
+        current = 0
+        for idx in frame_indices:
+            # 가까우면 grab 으로 전진, 멀면 seek
+            if idx - current > 30 or idx < current:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                current = idx
+            while current < idx:
+                if not cap.grab():
+                    break
+                current += 1
+            ok, frame = cap.read()
+            if not ok:
+                break
+            current += 1
+            hashes.append(_dhash(frame))
+
+        if not hashes:
+            return None
+        return VideoFingerprint(hashes=hashes, duration_ms=duration_ms)
+    finally:
+        cap.release()
+
+
+def fingerprint_distance(a: VideoFingerprint, b: VideoFingerprint) -> float:
+    """
+    정규화 Hamming 거리 (0 = 동일, ~0.5 = 무관)
+
+    샘플 수가 다르면 짧은 쪽 길이까지만 비교.
+    """
+    n = min(len(a.hashes), len(b.hashes))
+    if n == 0:
+        return 1.0
+    diff_bits = sum(bin(x ^ y).count("1") for x, y in zip(a.hashes[:n], b.hashes[:n]))
+    return diff_bits / (n * 64)
+
+
+def is_near_duplicate(
+    a: VideoFingerprint,
+    b: VideoFingerprint,
+    threshold: float = 0.12,
+    duration_tolerance: float = 0.1,
+) -> bool:
+    """재업로드 근사 중복 여부 (길이 ±10% + dHash 거리 threshold 이하)"""
+    if a.duration_ms and b.duration_ms:
+        longer = max(a.duration_ms, b.duration_ms)
+        if abs(a.duration_ms - b.duration_ms) / longer > duration_tolerance:
+            return False
+    return fingerprint_distance(a, b) <= threshold
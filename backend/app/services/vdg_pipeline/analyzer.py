@@ -10,9 +10,10 @@ import asyncio
 import hashlib
 from typing import List, Dict, Any, Optional
 
-from google import genai
 from google.genai import types
 from app.config import settings
+from app.services.analysis_queue import STAGE_DOWNLOAD, STAGE_LLM, get_stage_limiter
+from app.services.genai_gateway import get_genai_gateway
 from app.services.video_downloader import video_downloader
 from app.schemas.vdg import VDG
 from app.schemas.vdg_v4 import VDGv4
@@ -43,7 +44,8 @@ class GeminiPipeline:
         if api_key:
             if settings.GEMINI_API_KEY and settings.GOOGLE_API_KEY:
                 logger.info("Using GEMINI_API_KEY (preferred)")
-            self.client = genai.Client(api_key=api_key)
+            # 공유 Client (GenAIGateway) - opal / debate 엔진도 이 client 로 가용성 판단
+            self.client = get_genai_gateway().client
         else:
             self.client = None
             logger.warning("No API key set. GeminiPipeline will use mock data.")
@@ -73,7 +75,8 @@ class GeminiPipeline:
         try:
             # 1. Download Video
             logger.warning(f"📥 Downloading video from {video_url}...")
-            temp_path, metadata = await video_downloader.download(video_url)
+            async with get_stage_limiter().aslot(STAGE_DOWNLOAD):
+                temp_path, metadata = await video_downloader.download(video_url)
             try:
                 size_mb = os.path.getsize(temp_path) / (1024 * 1024)
                 logger.warning(f"📦 Downloaded size: {size_mb:.2f} MB ({temp_path})")
@@ -104,15 +107,16 @@ class GeminiPipeline:
             # 4. Analyze with Gemini
             logger.info(f"🔍 Running Gemini analysis for {node_id}...")
             
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.model,
-                contents=[video_part, enhanced_prompt],
-                config=types.GenerateContentConfig(
-                    temperature=0.4,
-                    response_mime_type="application/json",
+            async with get_stage_limiter().aslot(STAGE_LLM):
+                response = await get_genai_gateway().generate_or_raise(
+                    [video_part, enhanced_prompt],
+                    model=self.model,
+                    config=types.GenerateContentConfig(
+                        temperature=0.4,
+                        response_mime_type="application/json",
+                    ),
+                    site="vdg_legacy",
                 )
-            )
 
             # 5. Parse response
             raw_text = response.text.strip()
@@ -176,7 +180,8 @@ class GeminiPipeline:
         try:
             # 1. Download
             logger.info(f"📥 [v5] Downloading {video_url}...")
-            temp_path, metadata = await video_downloader.download(video_url)
+            async with get_stage_limiter().aslot(STAGE_DOWNLOAD):
+                temp_path, metadata = await video_downloader.download(video_url)
             
             duration_sec = metadata.duration or 0.0
             if duration_sec == 0.0:
@@ -204,7 +209,7 @@ class GeminiPipeline:
             def _run_sync():
                 from app.services.vdg_2pass.vdg_unified_pipeline import PipelineConfig
                 # Skip CV Pass to prevent indefinite hangs (CV optimization is separate task)
-                config = PipelineConfig(skip_cv_pass=True)
+                config = PipelineConfig(skip_cv_pass=True, stage_slot=get_stage_limiter().slot)
                 pipeline = VDGUnifiedPipeline(config=config)
                 return pipeline.run(
                     video_path=temp_path,
@@ -212,7 +217,8 @@ class GeminiPipeline:
                     top_comments=top_comments,
                 )
             
-            # Run sync pipeline in thread pool
+            # Run sync pipeline in thread pool (its Gemini calls are delegated back to this loop)
+            get_genai_gateway().bind_loop()
             loop = asyncio.get_event_loop()
             unified_result = await loop.run_in_executor(None, _run_sync)
             
@@ -245,6 +251,8 @@ class GeminiPipeline:
                 "prompt_version": "v4.2",
                 "model_id": "gemini-3.0-pro",
                 "schema_version": vdg.vdg_version,
+                "video_hash": unified_result.video_hash,
+                "video_fingerprint": unified_result.video_fingerprint,
             }
             
             if proof_ready:
@@ -252,6 +260,14 @@ class GeminiPipeline:
             else:
                 logger.warning(f"⚠️ [v5] Quality Gate FAILED: {quality_issues[:3]}")
             
+            # 4.6 Keep the source video for Ghost Overlay on-demand frame extraction
+            if settings.FRAME_KEEP_SOURCE_VIDEO:
+                try:
+                    from app.services.frame_store import get_frame_store
+                    await asyncio.to_thread(get_frame_store().register_source, node_id, temp_path)
+                except Exception as e:
+                    logger.warning(f"Frame source video cache failed: {e}")
+            
             # Get final vdg_data for cache
             vdg_data = vdg.model_dump()
             
@@ -0,0 +1,398 @@
+"""
+VDG Vector Index (PEGL v1.0)
+
+Parent 후보 검색용 영속 ANN 인덱스.
+
+핵심 원칙:
+- PatternClusteringService._normalize_schema 결과를 hashed feature 벡터로 변환
+- Random-hyperplane LSH (multi-table) 로 후보 검색, 소규모 코퍼스는 brute-force
+- 디스크 스냅샷(.npz) + updated_at watermark 기반 DB catch-up
+  → 워커 여러 개가 같은 스냅샷을 공유해도 재시작 시 누락 없음
+
+사용:
+    from app.services.vdg_vector_index import vdg_vector_index
+    vdg_vector_index.upsert(str(node.id), node.gemini_analysis)
+    candidates = vdg_vector_index.query(child_schema, k=200)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.services.clustering import PatternClusteringService
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_VERSION = "vdg_vector_index_v1"
+
+
+def _bucket(value: Optional[float], width: float) -> Optional[int]:
+    if value is None:
+        return None
+    return int(value // width)
+
+
+class VDGVectorIndex:
+    """
+    정규화 VDG feature 벡터 ANN 인덱스
+
+    벡터는 L2 정규화된 float32 이며 점수는 cosine 유사도 (후보 추림용).
+    최종 순위는 BatchSimilarityEngine 의 정확한 유사도로 재정렬합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        dim: int = 128,
+        n_tables: int = 8,
+        n_bits: int = 10,
+        brute_force_below: int = 5000,
+        autosave_every: int = 100,
+        seed: int = 42,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.dim = dim
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.brute_force_below = brute_force_below
+        self.autosave_every = autosave_every
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((n_tables, n_bits, dim)).astype(np.float32)
+        self._bit_weights = (1 << np.arange(n_bits, dtype=np.int64))
+
+        self.keys: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._codes = np.zeros((0, n_tables), dtype=np.int64)
+        self._alive = np.zeros(0, dtype=bool)
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(n_tables)]
+
+        self.watermark: Optional[datetime] = None
+        self._dirty = 0
+        self._save_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    # ------------------------------------------------------------------
+    # Featurization
+    # ------------------------------------------------------------------
+
+    def featurize(self, schema: Any) -> np.ndarray:
+        """스키마 → L2 정규화 hashed feature 벡터 (signed feature hashing)"""
+        normalized = PatternClusteringService._normalize_schema(schema)
+        features: List[Tuple[str, float]] = []
+
+        sequence = [str(t) for t in (normalized.get("microbeat_sequence") or [])]
+        features.extend((f"mb:{token}", 1.0) for token in sequence)
+        features.extend((f"mb2:{a}>{b}", 1.0) for a, b in zip(sequence, sequence[1:]))
+
+        hook = normalized.get("hook") or {}
+        if hook.get("type"):
+            features.append((f"hook:{hook['type']}", 2.0))
+        duration_bucket = _bucket(hook.get("duration_sec"), 0.5)
+        if duration_bucket is not None:
+            features.append((f"hook_dur:{duration_bucket}", 0.5))
+
+        for i, pattern in enumerate((normalized.get("visual_patterns") or [])[:3]):
+            features.append((f"vis{i}:{pattern}", 1.0))
+        for i, pattern in enumerate((normalized.get("audio_patterns") or [])[:3]):
+            features.append((f"aud{i}:{pattern}", 1.0))
+
+        audio_flags = normalized.get("audio_flags") or {}
+        if audio_flags.get("is_trending") is not None:
+            features.append((f"trend:{bool(audio_flags['is_trending'])}", 0.5))
+
+        timing = normalized.get("timing_profile") or []
+        if timing:
+            try:
+                features.append((f"timing:{_bucket(float(sum(timing)), 2.0)}", 1.0))
+            except TypeError:
+                pass
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for name, weight in features:
+            h = zlib.crc32(name.encode("utf-8"))
+            sign = 1.0 if (h >> 31) & 1 else -1.0
+            vector[h % self.dim] += sign * weight
+
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    # ------------------------------------------------------------------
+    # LSH buckets
+    # ------------------------------------------------------------------
+
+    def _hash(self, vectors: np.ndarray) -> np.ndarray:
+        """(N, dim) → (N, n_tables) bucket codes"""
+        projections = np.einsum("nd,tbd->ntb", vectors, self._planes)
+        return (projections > 0).astype(np.int64) @ self._bit_weights
+
+    def _bucket_add(self, row: int, codes: np.ndarray) -> None:
+        for table, code in enumerate(codes.tolist()):
+            self._buckets[table].setdefault(code, []).append(row)
+
+    def _bucket_remove(self, row: int) -> None:
+        for table, code in enumerate(self._codes[row].tolist()):
+            members = self._buckets[table].get(code)
+            if members and row in members:
+                members.remove(row)
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 64)
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        vectors[:capacity] = self._vectors
+        codes = np.zeros((new_capacity, self.n_tables), dtype=np.int64)
+        codes[:capacity] = self._codes
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:capacity] = self._alive
+        self._vectors, self._codes, self._alive = vectors, codes, alive
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def upsert(self, key: str, schema: Any) -> None:
+        """노드 1개 추가/갱신 (키는 RemixNode.id 문자열)"""
+        key = str(key)
+        vector = self.featurize(schema)
+        codes = self._hash(vector[None, :])[0]
+
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self.keys)
+            self._grow(row + 1)
+            self.keys.append(key)
+            self._rows[key] = row
+        else:
+            self._bucket_remove(row)
+
+        self._vectors[row] = vector
+        self._codes[row] = codes
+        self._alive[row] = True
+        self._bucket_add(row, codes)
+        self._mark_dirty()
+
+    def remove(self, key: str) -> bool:
+        row = self._rows.pop(str(key), None)
+        if row is None:
+            return False
+        self._bucket_remove(row)
+        self.keys[row] = None
+        self._alive[row] = False
+        self._mark_dirty()
+        return True
+
+    def _mark_dirty(self) -> None:
+        self._dirty += 1
+        if self.path and self.autosave_every and self._dirty >= self.autosave_every:
+            self.schedule_save()
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        schema: Any,
+        k: int = 100,
+        exclude: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        근사 top-k 후보
+
+        Returns:
+            [(key, cosine), ...] cosine 내림차순
+        """
+        if not self._rows:
+            return []
+
+        vector = self.featurize(schema)
+
+        candidates: Optional[np.ndarray] = None
+        if len(self._rows) >= self.brute_force_below:
+            codes = self._hash(vector[None, :])[0]
+            rows = set()
+            for table, code in enumerate(codes.tolist()):
+                rows.update(self._buckets[table].get(code, ()))
+            if len(rows) >= k:
+                candidates = np.fromiter(rows, dtype=np.int64, count=len(rows))
+        if candidates is None:
+            candidates = np.arange(len(self.keys))
+
+        alive = self._alive[candidates]
+        excluded_row = self._rows.get(exclude) if exclude is not None else None
+        if excluded_row is not None:
+            alive &= candidates != excluded_row
+        candidates = candidates[alive]
+        scores = self._vectors[candidates] @ vector
+
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [(self.keys[i], float(s)) for i, s in zip(candidates[order], scores[order])]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _snapshot(self) -> Dict[str, Any]:
+        rows = [i for i, key in enumerate(self.keys) if key is not None]
+        return {
+            "keys": np.array([self.keys[i] for i in rows], dtype=str),
+            "vectors": self._vectors[rows].copy(),
+            "meta": np.array(json.dumps({
+                "version": INDEX_VERSION,
+                "dim": self.dim,
+                "n_tables": self.n_tables,
+                "n_bits": self.n_bits,
+                "seed": self.seed,
+                "watermark": self.watermark.isoformat() if self.watermark else None,
+            })),
+        }
+
+    @staticmethod
+    def _write(path: Path, snapshot: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **snapshot)
+        os.replace(tmp_path, path)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """원자적 스냅샷 저장 (tmp → rename)"""
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("VDGVectorIndex.save requires a path")
+        self._write(target, self._snapshot())
+        self._dirty = 0
+        logger.info(f"Saved VDG vector index: {len(self)} vectors → {target}")
+
+    def schedule_save(self) -> None:
+        """이벤트 루프 안이면 스레드에서 저장, 아니면 동기 저장"""
+        if self.path is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        if self._save_task and not self._save_task.done():
+            return
+        snapshot = self._snapshot()
+        self._dirty = 0
+        self._save_task = loop.create_task(asyncio.to_thread(self._write, self.path, snapshot))
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """스냅샷 로드 (설정이 다르거나 파일이 없으면 False)"""
+        source = Path(path) if path else self.path
+        if source is None or not source.exists():
+            return False
+
+        with np.load(source, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if (
+                meta.get("version") != INDEX_VERSION
+                or (meta.get("dim"), meta.get("n_tables"), meta.get("n_bits"), meta.get("seed"))
+                != (self.dim, self.n_tables, self.n_bits, self.seed)
+            ):
+                logger.warning(f"VDG vector index config mismatch, ignoring snapshot: {source}")
+                return False
+            keys = [str(k) for k in data["keys"]]
+            vectors = data["vectors"].astype(np.float32)
+
+        self.keys = list(keys)
+        self._rows = {key: i for i, key in enumerate(keys)}
+        self._vectors = vectors
+        self._alive = np.ones(len(vectors), dtype=bool)
+        self._codes = self._hash(vectors) if len(vectors) else np.zeros((0, self.n_tables), dtype=np.int64)
+        self._buckets = [{} for _ in range(self.n_tables)]
+        for row, codes in enumerate(self._codes):
+            self._bucket_add(row, codes)
+        self.watermark = datetime.fromisoformat(meta["watermark"]) if meta.get("watermark") else None
+        self._dirty = 0
+
+        logger.info(f"Loaded VDG vector index: {len(self)} vectors from {source}")
+        return True
+
+    # ------------------------------------------------------------------
+    # DB sync
+    # ------------------------------------------------------------------
+
+    async def sync_from_db(self, db, batch_size: int = 1000) -> int:
+        """
+        watermark 이후 갱신된 RemixNode 를 인덱스에 반영
+
+        다른 워커가 추가한 노드도 여기서 따라잡습니다.
+
+        Returns:
+            반영된 노드 수
+        """
+        from sqlalchemy import select
+        from app.models import RemixNode
+
+        query = (
+            select(RemixNode.id, RemixNode.gemini_analysis, RemixNode.updated_at)
+            .where(RemixNode.gemini_analysis.isnot(None))
+            .order_by(RemixNode.updated_at)
+            .execution_options(yield_per=batch_size)
+        )
+        if self.watermark is not None:
+            # >= : 같은 시각에 커밋된 노드 누락 방지 (upsert 는 멱등)
+            query = query.where(RemixNode.updated_at >= self.watermark)
+
+        synced = 0
+        result = await db.stream(query)
+        async for row in result:
+            try:
+                self.upsert(str(row.id), row.gemini_analysis)
+                synced += 1
+            except Exception as e:
+                logger.warning(f"VDG vector index upsert failed for {row.id}: {e}")
+            if row.updated_at and (self.watermark is None or row.updated_at > self.watermark):
+                self.watermark = row.updated_at
+
+        if synced:
+            logger.info(f"VDG vector index synced {synced} nodes (watermark={self.watermark})")
+        return synced
+
+    async def startup(self) -> None:
+        """스냅샷 로드 후 DB catch-up (FastAPI lifespan 에서 호출)"""
+        from app.database import async_session_maker
+
+        await asyncio.to_thread(self.load)
+        async with async_session_maker() as db:
+            await self.sync_from_db(db)
+        if self._dirty:
+            self.schedule_save()
+
+    async def shutdown(self) -> None:
+        if self._save_task and not self._save_task.done():
+            await self._save_task
+        if self.path and self._dirty:
+            await asyncio.to_thread(self.save)
+
+
+# Singleton
+vdg_vector_index = VDGVectorIndex(path=settings.VDG_INDEX_PATH)
@@ -0,0 +1,276 @@
+"""
+Vision Request Batcher for Multi-session Frame Analysis
+
+기존: FrameAnalyzer._call_vision_api 가 프레임마다 generate_content 1회 (asyncio.to_thread)
+→ 동시 코칭 세션 N개 = HTTP 왕복 N회 + 스레드풀 슬롯 N개.
+
+현재: 짧은 윈도우 (COACHING_VISION_BATCH_WINDOW_MS, 기본 100ms) 동안 여러 세션의 프레임을 모아
+멀티 이미지 요청 1회로 합침
+- 응답 JSON: {"frame_1": {rule_id: {...}}, "frame_2": {...}} → 프레임(세션)별로 분리해 반환
+- 대기 프레임이 1개뿐이면 기존 단일 프레임 프롬프트로 호출 (배치 오버헤드 없음)
+- max_batch 도달 시 윈도우를 기다리지 않고 즉시 전송
+- 호출 실패는 배치 내 모든 대기자에게 예외로 전달 (FrameAnalyzer 가 기존처럼 {} 처리)
+
+백엔드:
+- GeminiVisionBackend: GenAIGateway (운영, async - 스레드 없음)
+- MockVisionBackend: 고정 지연 + 결정적 응답 (COACHING_VISION_BACKEND=mock, 오프라인 부하 테스트)
+
+Usage:
+    batcher = VisionBatcher(GeminiVisionBackend(client, model), window_sec=0.1)
+    data = await batcher.submit(frame, visual_rules)  # {rule_id: {"compliant": ...}}
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from app.services.frame_analyzer import (
+    build_analysis_prompt,
+    format_rule_lines,
+    frame_bytes,
+    parse_vision_json,
+)
+
+logger = logging.getLogger(__name__)
+
+FramePayload = Union[str, bytes, memoryview]
+
+# 프레임당 응답 토큰 예산 (단일 호출 max_output_tokens 와 동일)
+OUTPUT_TOKENS_PER_FRAME = 500
+
+
+@dataclass
+class VisionRequest:
+    """배치에 들어가는 프레임 1개 (세션 1개 분)"""
+    frame: FramePayload
+    rules: List[Any]
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+
+def frame_key(index: int) -> str:
+    """배치 응답의 프레임 키 (1-based)"""
+    return f"frame_{index + 1}"
+
+
+def build_batch_prompt(requests: List[VisionRequest]) -> str:
+    """멀티 이미지 배치 프롬프트 (프레임마다 자기 규칙만 평가)"""
+    prompt = f"""You are a video coaching assistant analyzing {len(requests)} independent frames.
+Each frame comes from a different recording session. The images are attached in order,
+each preceded by its label (frame_1, frame_2, ...).
+
+Evaluate each frame ONLY against its own rules and respond in JSON format:
+"""
+    for i, request in enumerate(requests):
+        prompt += f"\n{frame_key(i)}:\n{format_rule_lines(request.rules)}\n"
+
+    prompt += """
+Respond with one object per frame:
+{
+    "frame_1": {
+        "rule_id": {
+            "compliant": true/false,
+            "confidence": 0.0-1.0,
+            "measured_value": number or null,
+            "feedback": "brief Korean feedback if not compliant"
+        }
+    },
+    "frame_2": { ... }
+}
+
+Important:
+- center_offset: 0.0 = perfect center, 1.0 = edge
+- brightness: 0.0 = dark, 1.0 = bright
+- stability: inferred from blur/motion (1.0 = stable)
+
+Respond ONLY with valid JSON, no markdown or explanation."""
+    return prompt
+
+
+# ====================
+# Backends
+# ====================
+
+class GeminiVisionBackend:
+    """GenAIGateway generate_content 백엔드 (async)"""
+
+    def __init__(self, gateway: Any, model: str):
+        self.gateway = gateway
+        self.model = model
+
+    async def generate(self, prompt: str, requests: List[VisionRequest]) -> str:
+        from google.genai import types
+
+        parts = [types.Part(text=prompt)]
+        for i, request in enumerate(requests):
+            if len(requests) > 1:
+                parts.append(types.Part(text=frame_key(i)))
+            parts.append(types.Part(inline_data=types.Blob(
+                mime_type="image/jpeg",
+                data=frame_bytes(request.frame),
+            )))
+
+        response = await self.gateway.generate_or_raise(
+            [types.Content(parts=parts)],
+            model=self.model,
+            config=types.GenerateContentConfig(
+                temperature=0.1,  # 낮은 온도로 일관된 분석
+                max_output_tokens=OUTPUT_TOKENS_PER_FRAME * len(requests),
+            ),
+            site="frame_analysis_batch" if len(requests) > 1 else "frame_analysis",
+        )
+        return response.text
+
+
+class MockVisionBackend:
+    """
+    오프라인 Mock 백엔드 (부하 테스트용)
+
+    호출마다 latency_sec 동안 블로킹 (HTTP 왕복 흉내) 후 모든 규칙을 준수로 응답.
+    calls 에 호출별 배치 크기 기록.
+    """
+
+    def __init__(self, latency_sec: float = 0.3):
+        self.latency_sec = latency_sec
+        self.calls: List[int] = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, requests: List[VisionRequest]) -> str:
+        with self._lock:
+            self.calls.append(len(requests))
+        if self.latency_sec > 0:
+            time.sleep(self.latency_sec)
+
+        def answer(rules: List[Any]) -> Dict[str, Any]:
+            return {
+                rule.rule_id: {"compliant": True, "confidence": 0.7, "measured_value": None, "feedback": None}
+                for rule in rules
+            }
+
+        if len(requests) == 1:
+            return json.dumps(answer(requests[0].rules))
+        return json.dumps({frame_key(i): answer(r.rules) for i, r in enumerate(requests)})
+
+
+# ====================
+# Batcher
+# ====================
+
+@dataclass
+class VisionBatchStats:
+    """배치 통계"""
+    frames: int = 0
+    calls: int = 0
+    single_calls: int = 0
+    batched_frames: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "calls": self.calls,
+            "single_calls": self.single_calls,
+            "batched_frames": self.batched_frames,
+            "errors": self.errors,
+            "avg_batch_size": round(self.frames / self.calls, 2) if self.calls else 0.0,
+        }
+
+
+class VisionBatcher:
+    """세션 간 Vision 요청 합치기 (micro-batching)"""
+
+    def __init__(self, backend: Any, window_sec: float = 0.1, max_batch: int = 8):
+        """
+        Args:
+            backend: generate(prompt, requests) -> str 제공 객체
+                     (async 면 그대로 await, sync 면 스레드에서 실행)
+            window_sec: 첫 프레임 도착 후 배치를 모으는 시간
+            max_batch: 요청 1회당 최대 프레임 수 (도달 시 즉시 전송)
+        """
+        self.backend = backend
+        self.window_sec = max(0.0, window_sec)
+        self.max_batch = max(1, max_batch)
+        self.stats = VisionBatchStats()
+        self._pending: List[VisionRequest] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(self, frame: FramePayload, rules: List[Any]) -> Dict[str, Any]:
+        """
+        프레임 1개 제출 → 배치 호출 완료 후 이 프레임 몫의 응답 반환
+
+        Returns:
+            {rule_id: {"compliant", "confidence", "measured_value", "feedback"}}
+
+        Raises:
+            json.JSONDecodeError: 응답 파싱 실패 (배치 전체) - 호출자가 단일 호출과 같은 폴백 적용
+            Exception: backend 호출 실패
+        """
+        loop = asyncio.get_running_loop()
+        request = VisionRequest(frame=frame, rules=rules, future=loop.create_future())
+        self._pending.append(request)
+        self.stats.frames += 1
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_sec, self._flush)
+
+        return await request.future
+
+    def _flush(self) -> None:
+        """대기 프레임을 배치 1개로 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # 대기 중 취소된 요청 (세션 종료 등) 은 빼고 보냄
+        batch = [r for r in self._pending if not r.future.done()]
+        self._pending = []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _generate(self, prompt: str, batch: List[VisionRequest]) -> str:
+        if asyncio.iscoroutinefunction(self.backend.generate):
+            return await self.backend.generate(prompt, batch)
+        return await asyncio.to_thread(self.backend.generate, prompt, batch)
+
+    async def _run(self, batch: List[VisionRequest]) -> None:
+        self.stats.calls += 1
+        try:
+            if len(batch) == 1:
+                # 단일 프레임: 기존 프롬프트 그대로 (응답도 {rule_id: ...})
+                self.stats.single_calls += 1
+                prompt = build_analysis_prompt(batch[0].rules)
+                text = await self._generate(prompt, batch)
+                per_frame = [parse_vision_json(text)]
+            else:
+                self.stats.batched_frames += len(batch)
+                prompt = build_batch_prompt(batch)
+                text = await self._generate(prompt, batch)
+                data = parse_vision_json(text)
+                per_frame = [data.get(frame_key(i)) or {} for i in range(len(batch))]
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Vision batch call failed ({len(batch)} frames): {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request, data in zip(batch, per_frame):
+            if not request.future.done():
+                request.future.set_result(data if isinstance(data, dict) else {})
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats.to_dict(),
+            "window_ms": round(self.window_sec * 1000, 1),
+            "max_batch": self.max_batch,
+            "pending": len(self._pending),
+            "backend": type(self.backend).__name__,
+        }
@@ -15,7 +15,6 @@ import sys
 from typing import Dict, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -24,7 +23,8 @@ load_dotenv(os.path.join(BASE_DIR, ".env"), override=True)
 sys.path.append(BASE_DIR)
 
 from app.config import settings
-from app.models import OutlierItem, OutlierSource, OutlierItemStatus
+from app.models import OutlierSource, OutlierItemStatus
+from app.services.outlier_ingest import bulk_insert_outliers, get_or_create_source
 
 FIELD_ALIASES = {
     "external_id": ["external_id", "id", "content_id", "video_id"],
@@ -83,37 +83,13 @@ def normalize_external_id(source_name: str, external_id: str, video_url: str) ->
     return f"{safe_source}:{raw_id}"
 
 
-async def get_or_create_source(db: AsyncSession, source_name: str) -> OutlierSource:
-    result = await db.execute(select(OutlierSource).where(OutlierSource.name == source_name))
-    source = result.scalar_one_or_none()
-    if source:
-        return source
-    source = OutlierSource(
-        name=source_name,
-        base_url="provider://",
-        auth_type="none",
-        crawl_interval_hours=24,
-    )
-    db.add(source)
-    await db.flush()
-    return source
-
-
-async def outlier_exists(db: AsyncSession, external_id: str, video_url: str) -> bool:
-    result = await db.execute(
-        select(OutlierItem.id).where(
-            or_(OutlierItem.external_id == external_id, OutlierItem.video_url == video_url)
-        ).limit(1)
-    )
-    return result.scalar_one_or_none() is not None
-
-
 async def main_async(args: argparse.Namespace) -> None:
     engine = create_async_engine(settings.DATABASE_URL, echo=False)
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-    inserted = 0
     async with async_session() as db:
+        sources: Dict[str, OutlierSource] = {}
+        rows = []
         with open(args.csv, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for raw in reader:
@@ -132,7 +108,10 @@ async def main_async(args: argparse.Namespace) -> None:
                 growth_rate = parse_number(resolve_field(row, "growth_rate"))
 
                 source_name = resolve_field(row, "source_name") or args.source_name or "external"
-                source = await get_or_create_source(db, source_name)
+                if source_name not in sources:
+                    sources[source_name] = await get_or_create_source(
+                        db, source_name, base_url="provider://", crawl_interval_hours=24
+                    )
 
                 external_id = normalize_external_id(
                     source_name,
@@ -140,27 +119,23 @@ async def main_async(args: argparse.Namespace) -> None:
                     source_url,
                 )
 
-                if await outlier_exists(db, external_id, source_url):
-                    continue
-
-                item = OutlierItem(
-                    source_id=source.id,
-                    external_id=external_id,
-                    video_url=source_url,
-                    title=title,
-                    platform=platform,
-                    category=category,
-                    view_count=int(views) if views is not None else 0,
-                    growth_rate=str(growth_rate) if growth_rate is not None else None,
-                    status=OutlierItemStatus.PENDING,
-                )
-                db.add(item)
-                inserted += 1
-
+                rows.append({
+                    "source_id": sources[source_name].id,
+                    "external_id": external_id,
+                    "video_url": source_url,
+                    "title": title,
+                    "platform": platform,
+                    "category": category,
+                    "view_count": int(views) if views is not None else 0,
+                    "growth_rate": str(growth_rate) if growth_rate is not None else None,
+                    "status": OutlierItemStatus.PENDING,
+                })
+
+        result = await bulk_insert_outliers(db, rows)
         await db.commit()
 
     await engine.dispose()
-    print(f"Inserted {inserted} outliers into DB.")
+    print(f"Inserted {result.inserted} outliers into DB (skipped {result.skipped}).")
 
 
 def main() -> None:
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+rebuild_search_index.py
+
+Rebuild outlier_search_documents (MCP search_patterns full-text / trigram search).
+New documents are written when a VDG analysis completes; run this once after the
+migration, or after changing tokenization in app/services/search_index.py.
+
+Examples:
+    python backend/scripts/rebuild_search_index.py
+    python backend/scripts/rebuild_search_index.py --all --batch-size 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(BASE_DIR, ".env"), override=True)
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models import OutlierItem
+from app.services.search_index import refresh_search_document
+
+
+async def main(include_all: bool = False, batch_size: int = 500):
+    async with AsyncSessionLocal() as db:
+        stmt = select(OutlierItem.id).order_by(OutlierItem.id)
+        if not include_all:
+            stmt = stmt.where(OutlierItem.analysis_status == "completed")
+        item_ids = (await db.execute(stmt)).scalars().all()
+
+        print(f"🔎 Rebuilding search documents for {len(item_ids)} outliers")
+        for i, item_id in enumerate(item_ids, 1):
+            await refresh_search_document(db, item_id)
+            if i % batch_size == 0:
+                await db.commit()
+                db.expunge_all()
+                print(f"  {i}/{len(item_ids)}")
+        await db.commit()
+    print("✅ Search index rebuilt")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--all", action="store_true", help="index every outlier, not only analyzed ones")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(include_all=args.all, batch_size=args.batch_size))
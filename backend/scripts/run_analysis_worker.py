@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+run_analysis_worker.py
+
+VDG analysis queue worker (dedicated process - the API only enqueues).
+
+Examples:
+    python backend/scripts/run_analysis_worker.py
+    python backend/scripts/run_analysis_worker.py --concurrency 2 --lanes high,normal
+    python backend/scripts/run_analysis_worker.py --once   # drain runnable jobs and exit
+
+Run several processes (or hosts with ANALYSIS_QUEUE_BACKEND=redis) to scale out;
+stage limits (ANALYSIS_STAGE_*_CONCURRENCY) apply per process.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from dotenv import load_dotenv
+load_dotenv(os.path.join(BASE_DIR, ".env"), override=True)
+
+from app.services.analysis_queue import LANES, build_analysis_worker, get_analysis_queue, get_stage_limiter
+from app.services.genai_gateway import get_genai_gateway
+
+
+async def main(concurrency: int = None, lanes: str = None, once: bool = False):
+    # VDG pipeline threads hand their Gemini calls to this loop
+    get_genai_gateway().bind_loop()
+
+    worker = build_analysis_worker(
+        concurrency=concurrency,
+        lanes=lanes.split(",") if lanes else None,
+    )
+    print(f"🛠️ Analysis worker {worker.worker_id} "
+          f"(backend={get_analysis_queue().backend}, concurrency={worker.concurrency}, lanes={worker.lanes})")
+    print(f"   stage limits: {get_stage_limiter().limits}")
+
+    if once:
+        await worker.drain()
+    else:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    stats = worker.stats
+    print(f"🏁 claimed={stats.claimed} succeeded={stats.succeeded} retried={stats.retried} failed={stats.failed}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the VDG analysis job queue worker")
+    parser.add_argument("--concurrency", type=int, default=None, help="jobs in parallel (default: ANALYSIS_WORKER_CONCURRENCY)")
+    parser.add_argument("--lanes", type=str, default=None, help=f"comma-separated lanes to consume (default: {','.join(LANES)})")
+    parser.add_argument("--once", action="store_true", help="drain currently runnable jobs and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main(concurrency=args.concurrency, lanes=args.lanes, once=args.once))
@@ -39,7 +39,6 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
 
 from app.utils.time import utcnow
 from app.utils.run_manager import RunManager, generate_idempotency_key
@@ -70,6 +69,7 @@ async def run_outlier_crawlers(
     Run outlier crawlers for specified platforms.
     
     PEGL v1.0: RunManager 적용, run_id 연결
+    플랫폼 크롤은 CrawlOrchestrator 로 동시 실행, DB 적재만 순차
     
     Args:
         platforms: List of platform names
@@ -81,12 +81,15 @@ async def run_outlier_crawlers(
     Returns:
         Dict with results per platform
     """
-    from app.crawlers.factory import CrawlerFactory
-    from app.models import OutlierSource, OutlierItem, OutlierItemStatus
+    from app.crawlers.orchestrator import CrawlOrchestrator
+    from app.models import OutlierItemStatus
+    from app.services.outlier_ingest import bulk_insert_outliers, get_or_create_source
     from app.services.notification_service import notify_s_tier, notification_service
+    from app.services.quota_manager import get_quota_manager
     
     results = {}
     total_inserted = 0
+    total_skipped = 0
     total_collected = 0
     total_s_tier = 0
     
@@ -108,65 +111,67 @@ async def run_outlier_crawlers(
         run_id = run_ctx.run.id if run_ctx.run else None
         logger.info(f"Started crawl run: {run_ctx.run.run_id if run_ctx.run else 'N/A'}")
         
+        # 모든 플랫폼 동시 크롤 (소요 시간 = 가장 느린 플랫폼)
+        orchestrator = CrawlOrchestrator(quota_manager=get_quota_manager())
+        runners = {}
+        if "virlo" in platforms:
+            from app.services.virlo_scraper import scrape_and_save_to_db
+            runners["virlo"] = lambda: scrape_and_save_to_db(limit=limit, run_id=run_id)
+        crawled = await orchestrator.run(
+            platforms, limit=limit, category=category, region=region, runners=runners
+        )
+        
+        # DB 적재는 순차 (AsyncSession 동시 사용 불가)
         for platform in platforms:
-            logger.info(f"Starting crawler for: {platform}")
-            platform_result = {"status": "pending"}
+            outcome = crawled[platform]
+            platform_result = {"status": outcome.status, "elapsed_ms": outcome.elapsed_ms}
             
             try:
-                # Special handling for Virlo (async scraper)
-                if platform == "virlo":
-                    from app.services.virlo_scraper import scrape_and_save_to_db
-                    result = await scrape_and_save_to_db(limit=limit, run_id=run_id)
-                    platform_result = {
-                        "status": "success",
+                if outcome.status != "success":
+                    platform_result["error"] = outcome.error
+                elif platform == "virlo":
+                    # Virlo 는 자체 세션으로 저장
+                    result = outcome.result
+                    platform_result.update({
                         "collected": result.get("collected", 0),
                         "inserted": result.get("inserted", 0),
-                    }
+                    })
                     total_collected += result.get("collected", 0)
                     total_inserted += result.get("inserted", 0)
                 else:
-                    # Standard crawler
-                    crawler = CrawlerFactory.create(platform)
-                    items = crawler.crawl(
-                        limit=limit,
-                        category=category,
-                        region_code=region if platform == "youtube" else None,
-                        region=region if platform != "youtube" else None,
-                    )
-                    
-                    if hasattr(crawler, 'close'):
-                        crawler.close()
+                    items = outcome.items
                     
                     # Get or create source
-                    source_name = f"{platform}_auto"
-                    source_result = await db.execute(
-                        select(OutlierSource).where(OutlierSource.name == source_name)
+                    source = await get_or_create_source(
+                        db,
+                        f"{platform}_auto",
+                        base_url=f"https://crawler.{platform}.auto",
+                        auth_type="api_key",
+                        is_active=True,
                     )
-                    source = source_result.scalar_one_or_none()
-                    
-                    if not source:
-                        source = OutlierSource(
-                            name=source_name,
-                            base_url=f"https://crawler.{platform}.auto",
-                            auth_type="api_key",
-                            is_active=True,
-                        )
-                        db.add(source)
-                        await db.flush()
                     
-                    # Insert items
-                    inserted = 0
-                    s_tier_count = 0
-                    
-                    for item in items:
-                        existing = await db.execute(
-                            select(OutlierItem).where(
-                                OutlierItem.external_id == item.external_id
-                            )
-                        )
-                        if not existing.scalar_one_or_none():
-                            # PEGL v1.0: raw_payload 저장
-                            raw_payload = {
+                    # Bulk insert (메모리 dedupe + chunk 당 INSERT ... ON CONFLICT DO NOTHING 1회)
+                    crawled_at = utcnow()
+                    rows = [
+                        {
+                            "source_id": source.id,
+                            "external_id": item.external_id,
+                            "video_url": item.video_url,
+                            "platform": item.platform,
+                            "category": item.category,
+                            "title": item.title,
+                            "thumbnail_url": item.thumbnail_url,
+                            "view_count": item.view_count,
+                            "like_count": item.like_count,
+                            "share_count": item.share_count,
+                            "growth_rate": item.growth_rate,
+                            "outlier_score": item.outlier_score,
+                            "outlier_tier": item.outlier_tier,
+                            "status": OutlierItemStatus.PENDING,
+                            "crawled_at": crawled_at,
+                            # PEGL v1.0 필드
+                            "run_id": run_id,
+                            "raw_payload": {
                                 "external_id": item.external_id,
                                 "video_url": item.video_url,
                                 "platform": item.platform,
@@ -177,64 +182,48 @@ async def run_outlier_crawlers(
                                 "share_count": item.share_count,
                                 "growth_rate": item.growth_rate,
                                 "outlier_score": item.outlier_score,
-                                "crawled_at": utcnow().isoformat(),
-                            }
-                            
-                            outlier = OutlierItem(
-                                source_id=source.id,
-                                external_id=item.external_id,
-                                video_url=item.video_url,
-                                platform=item.platform,
-                                category=item.category,
-                                title=item.title,
-                                thumbnail_url=item.thumbnail_url,
-                                view_count=item.view_count,
-                                like_count=item.like_count,
-                                share_count=item.share_count,
-                                growth_rate=item.growth_rate,
-                                outlier_score=item.outlier_score,
-                                outlier_tier=item.outlier_tier,
-                                status=OutlierItemStatus.PENDING,
-                                crawled_at=utcnow(),
-                                # PEGL v1.0 필드
-                                run_id=run_id,
-                                raw_payload=raw_payload,
-                                canonical_url=item.video_url,  # TODO: URL 정규화 함수 적용
-                            )
-                            db.add(outlier)
-                            await db.flush()
-                            inserted += 1
-                            
-                            # S-tier notification
-                            if item.outlier_score and item.outlier_score >= 500:
-                                s_tier_count += 1
-                                try:
-                                    await notify_s_tier(
-                                        outlier_id=str(outlier.id),
-                                        title=item.title or "Untitled",
-                                        platform=platform,
-                                        video_url=item.video_url,
-                                        outlier_score=item.outlier_score,
-                                        view_count=item.view_count or 0,
-                                    )
-                                except Exception as e:
-                                    logger.warning(f"S-tier notification failed: {e}")
+                                "crawled_at": crawled_at.isoformat(),
+                            },
+                            "canonical_url": item.video_url,  # TODO: URL 정규화 함수 적용
+                        }
+                        for item in items
+                    ]
+                    ingest = await bulk_insert_outliers(db, rows)
+                    
+                    # S-tier notification (새로 들어간 아이템만)
+                    s_tier_count = 0
+                    items_by_id = {item.external_id: item for item in reversed(items)}  # 첫 행 우선
+                    for outlier_id, external_id in ingest.inserted_ids:
+                        item = items_by_id[external_id]
+                        if item.outlier_score and item.outlier_score >= 500:
+                            s_tier_count += 1
+                            try:
+                                await notify_s_tier(
+                                    outlier_id=str(outlier_id),
+                                    title=item.title or "Untitled",
+                                    platform=platform,
+                                    video_url=item.video_url,
+                                    outlier_score=item.outlier_score,
+                                    view_count=item.view_count or 0,
+                                )
+                            except Exception as e:
+                                logger.warning(f"S-tier notification failed: {e}")
                     
                     # Update source timestamp
                     source.last_crawled = utcnow()
                     
-                    platform_result = {
-                        "status": "success",
+                    platform_result.update({
                         "collected": len(items),
-                        "inserted": inserted,
+                        **ingest.to_summary(),
                         "s_tier_count": s_tier_count,
-                    }
+                    })
                     total_collected += len(items)
-                    total_inserted += inserted
+                    total_inserted += ingest.inserted
+                    total_skipped += ingest.skipped
                     total_s_tier += s_tier_count
                     
             except Exception as e:
-                logger.error(f"Crawler {platform} failed: {e}")
+                logger.error(f"Ingest {platform} failed: {e}")
                 platform_result = {"status": "failed", "error": str(e)}
             
             results[platform] = platform_result
@@ -243,10 +232,11 @@ async def run_outlier_crawlers(
         await db.commit()
         
         # Update run with results
-        run_ctx.set_result({
+        run_ctx.set_result_summary({
             "platforms": results,
             "total_collected": total_collected,
             "total_inserted": total_inserted,
+            "total_skipped": total_skipped,
             "total_s_tier": total_s_tier,
         })
     
@@ -393,6 +383,9 @@ Examples:
     
     await engine.dispose()
     
+    from app.crawlers.async_http import aclose_async_client
+    await aclose_async_client()
+    
     logger.info(f"Crawl completed: {results}")
     
     # Exit with error code if any failures
@@ -0,0 +1,138 @@
+"""
+Tests for the VDG analysis job queue (SQLite/Redis stores, worker retries, stage limits)
+backend/tests/test_analysis_queue.py
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.analysis_queue import (
+    LANE_HIGH,
+    LANE_LOW,
+    LANE_NORMAL,
+    STATUS_FAILED,
+    STATUS_RETRYING,
+    STATUS_SUCCEEDED,
+    AnalysisWorker,
+    PermanentJobError,
+    RedisAnalysisJobStore,
+    SQLiteAnalysisJobStore,
+    StageLimiter,
+)
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteAnalysisJobStore(str(tmp_path / "queue.sqlite3"))
+    fakeredis = pytest.importorskip("fakeredis")  # Lua 스크립트 실행에 lupa 필요
+    pytest.importorskip("lupa")
+    return RedisAnalysisJobStore(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_lanes_are_claimed_by_priority_and_active_jobs_are_deduped(store):
+    low = store.enqueue("vdg_analysis", {"item_id": "a"}, lane=LANE_LOW, dedupe_key="vdg:a")
+    normal = store.enqueue("vdg_analysis", {"item_id": "b"}, lane=LANE_NORMAL, dedupe_key="vdg:b")
+    high = store.enqueue("vdg_analysis", {"item_id": "c"}, lane=LANE_HIGH)
+    assert store.enqueue("vdg_analysis", {"item_id": "a"}, lane=LANE_HIGH, dedupe_key="vdg:a").job_id == low.job_id
+    assert store.counts()["pending"] == {LANE_HIGH: 1, LANE_NORMAL: 1, LANE_LOW: 1}
+
+    claimed = [store.claim("w1", [LANE_HIGH, LANE_NORMAL, LANE_LOW], lease_sec=60) for _ in range(3)]
+    assert [job.job_id for job in claimed] == [high.job_id, normal.job_id, low.job_id]
+    assert store.claim("w2", [LANE_HIGH, LANE_NORMAL, LANE_LOW], lease_sec=60) is None
+    assert store.counts()["running"][LANE_LOW] == 1
+
+    # a finished job no longer blocks a new one with the same dedupe key
+    assert store.complete(low.job_id, "w1")
+    assert store.get(low.job_id).status == STATUS_SUCCEEDED
+    assert store.enqueue("vdg_analysis", {"item_id": "a"}, dedupe_key="vdg:a").job_id != low.job_id
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff_and_fails_permanent_errors_fast(store):
+    calls = []
+
+    async def flaky(item_id):
+        calls.append(item_id)
+        if calls.count(item_id) == 1:
+            raise RuntimeError("503 upstream")
+
+    async def gated(item_id):
+        calls.append(item_id)
+        raise PermanentJobError("comments pending review")
+
+    async def broken(item_id):
+        calls.append(item_id)
+        raise RuntimeError("always")
+
+    retried = store.enqueue("flaky", {"item_id": "f"})
+    permanent = store.enqueue("gated", {"item_id": "g"})
+    exhausted = store.enqueue("broken", {"item_id": "b"}, max_attempts=2)
+
+    worker = AnalysisWorker(
+        store, concurrency=2, retry_base_sec=0.0,
+        handlers={"flaky": flaky, "gated": gated, "broken": broken},
+    )
+    await worker.drain()
+
+    job = store.get(retried.job_id)
+    assert (job.status, job.attempts, job.last_error) == (STATUS_SUCCEEDED, 2, "RuntimeError: 503 upstream")
+    job = store.get(permanent.job_id)
+    assert (job.status, job.attempts) == (STATUS_FAILED, 1)
+    job = store.get(exhausted.job_id)
+    assert (job.status, job.attempts) == (STATUS_FAILED, 2)
+    assert calls.count("g") == 1 and calls.count("b") == 2
+    assert (worker.stats.succeeded, worker.stats.retried, worker.stats.failed) == (1, 2, 2)
+
+    delayed = store.enqueue("flaky", {"item_id": "d"})
+    await AnalysisWorker(store, retry_base_sec=60.0, handlers={"flaky": flaky}).drain()
+    job = store.get(delayed.job_id)
+    assert job.status == STATUS_RETRYING and job.available_at > time.time() + 30
+
+
+def test_expired_lease_is_reclaimed_and_stale_worker_cannot_finish(store):
+    job = store.enqueue("vdg_analysis", {"item_id": "a"}, max_attempts=2)
+    assert store.claim("dead-worker", [LANE_NORMAL], lease_sec=-1).job_id == job.job_id
+
+    assert store.reclaim_expired() == 1
+    assert store.get(job.job_id).status == STATUS_RETRYING
+    assert store.claim("w2", [LANE_NORMAL], lease_sec=60).attempts == 2
+    assert not store.complete(job.job_id, "dead-worker")  # lost its lease
+    assert store.heartbeat(job.job_id, "w2", lease_sec=60)
+    assert store.complete(job.job_id, "w2")
+
+
+@pytest.mark.asyncio
+async def test_stage_limiter_caps_async_and_thread_slots_together():
+    limiter = StageLimiter({"llm": 2}, poll_interval_sec=0.001)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    def in_thread():
+        with limiter.slot("llm"):
+            work()
+
+    async def in_loop():
+        async with limiter.aslot("llm"):
+            await asyncio.to_thread(work)
+
+    await asyncio.gather(*(asyncio.to_thread(in_thread) for _ in range(3)), *(in_loop() for _ in range(3)))
+
+    assert peak[0] == 2
+    assert limiter.get_stats()["llm"] == {"limit": 2, "active": 0, "waiting": 0}
+    async with limiter.aslot("download"):  # unlimited stage passes through
+        pass
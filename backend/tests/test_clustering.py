@@ -219,5 +219,172 @@ class TestPatternTypeInference:
         assert self.service._infer_pattern_type(schema) == "audio"
 
 
+class TestBatchSimilarityEngine:
+    """Batch engine must reproduce calculate_similarity exactly"""
+    
+    def setup_method(self):
+        self.mock_db = AsyncMock()
+        self.service = PatternClusteringService(self.mock_db)
+    
+    def _random_schema(self, rng):
+        tokens = ["a", "b", "c", "d"]
+        if rng.random() < 0.5:
+            return {
+                "hook_genome": {
+                    "pattern": rng.choice(["problem_solution", "question", None]),
+                    "start_sec": 0.0,
+                    "end_sec": rng.choice([1.0, 1.4, 2.2, 4.0, None]),
+                    "microbeats": [
+                        {"role": rng.choice(tokens), "cue": rng.choice(tokens)}
+                        for _ in range(rng.randint(0, 6))
+                    ],
+                },
+                "scenes": [{"shots": [
+                    {"camera": {"move": rng.choice(tokens)}, "start": 0, "end": rng.uniform(0, 4)}
+                    for _ in range(rng.randint(0, 5))
+                ]}],
+            }
+        return {
+            "hook": {
+                "attention_technique": rng.choice(["question", "text_punch", None]),
+                "hook_duration_sec": rng.choice([1.0, 1.6, 3.0, None]),
+            },
+            "shots": [
+                {
+                    "visual_pattern": rng.choice(tokens),
+                    "audio_pattern": rng.choice(tokens + [None]),
+                    "duration_sec": rng.uniform(0, 4),
+                }
+                for _ in range(rng.randint(0, 5))
+            ],
+            "audio_is_trending": rng.choice([True, False, None]),
+        }
+    
+    def test_matches_scalar_similarity(self):
+        """Vectorized scores equal pairwise calculate_similarity"""
+        import random
+        from app.services.similarity_engine import BatchSimilarityEngine
+        
+        rng = random.Random(7)
+        parents = [self._random_schema(rng) for _ in range(200)]
+        engine = BatchSimilarityEngine()
+        engine.add_many(list(range(len(parents))), parents)
+        
+        for _ in range(20):
+            child = self._random_schema(rng)
+            scores = engine.score(child)
+            expected = [self.service.calculate_similarity(child, p) for p in parents]
+            assert scores.tolist() == pytest.approx(expected, abs=1e-12)
+    
+    def test_top_k_threshold_and_order(self):
+        """top_k returns best parents above threshold in descending order"""
+        from app.services.similarity_engine import BatchSimilarityEngine
+        
+        child = {
+            "hook": {"attention_technique": "question", "hook_duration_sec": 2.0},
+            "shots": [{"visual_pattern": "close_up", "audio_pattern": "music", "duration_sec": 2.0}],
+            "audio_is_trending": True,
+        }
+        different = {
+            "hook": {"attention_technique": "text_punch", "hook_duration_sec": 9.0},
+            "shots": [{"visual_pattern": "wide", "audio_pattern": "sfx", "duration_sec": 20.0}],
+            "audio_is_trending": False,
+        }
+        engine = BatchSimilarityEngine()
+        engine.add_many(["same", "different"], [child, different])
+        
+        top = engine.top_k(child, k=5, threshold=0.7)
+        assert [key for key, _ in top] == ["same"]
+        assert top[0][1] >= 0.9
+        assert engine.top_k(child, k=5, threshold=0.7, exclude="same") == []
+    
+    def test_empty_engine(self):
+        """Empty engine returns no scores"""
+        from app.services.similarity_engine import BatchSimilarityEngine
+        
+        engine = BatchSimilarityEngine()
+        assert len(engine.score({"hook": {}})) == 0
+        assert engine.top_k({"hook": {}}) == []
+
+
+class TestVDGVectorIndex:
+    """ANN parent-candidate index"""
+    
+    def _schema(self, hook, moves):
+        return {
+            "hook_genome": {
+                "pattern": hook,
+                "start_sec": 0.0,
+                "end_sec": 2.0,
+                "microbeats": [{"role": m, "cue": "visual"} for m in moves],
+            },
+            "scenes": [{"shots": [{"camera": {"move": m}, "start": 0, "end": 1} for m in moves]}],
+        }
+    
+    def test_query_ranks_identical_schema_first(self):
+        """Identical schema is the top candidate, excluded key is skipped"""
+        from app.services.vdg_vector_index import VDGVectorIndex
+        
+        index = VDGVectorIndex()
+        index.upsert("a", self._schema("question", ["zoom", "pan", "cut"]))
+        index.upsert("b", self._schema("problem_solution", ["static", "tilt"]))
+        index.upsert("c", self._schema("question", ["zoom", "pan"]))
+        
+        results = index.query(self._schema("question", ["zoom", "pan", "cut"]), k=2)
+        assert [key for key, _ in results] == ["a", "c"]
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+        
+        results = index.query(self._schema("question", ["zoom", "pan", "cut"]), k=3, exclude="a")
+        assert "a" not in [key for key, _ in results]
+    
+    def test_lsh_path_finds_near_duplicates(self):
+        """LSH buckets return the matching node on large corpora"""
+        import random
+        from app.services.vdg_vector_index import VDGVectorIndex
+        
+        rng = random.Random(3)
+        moves = ["zoom", "pan", "cut", "tilt", "static", "dolly", "whip"]
+        index = VDGVectorIndex(brute_force_below=0)
+        for i in range(500):
+            index.upsert(f"n{i}", self._schema(rng.choice(["q", "p", "s"]), rng.sample(moves, 4)))
+        target = self._schema("unique_hook", ["whip", "dolly", "cut", "pan"])
+        index.upsert("target", target)
+        
+        results = index.query(target, k=5)
+        assert results[0][0] == "target"
+    
+    def test_save_load_roundtrip_and_remove(self, tmp_path):
+        """Snapshot restores vectors, watermark and buckets"""
+        from app.services.vdg_vector_index import VDGVectorIndex
+        
+        path = tmp_path / "index.npz"
+        index = VDGVectorIndex(path=str(path))
+        index.upsert("a", self._schema("question", ["zoom", "pan"]))
+        index.upsert("b", self._schema("problem_solution", ["static"]))
+        index.upsert("c", self._schema("question", ["cut"]))
+        assert index.remove("b")
+        index.watermark = datetime(2026, 1, 1, 12, 0, 0)
+        index.save()
+        
+        restored = VDGVectorIndex(path=str(path))
+        assert restored.load()
+        assert len(restored) == 2
+        assert "b" not in restored
+        assert restored.watermark == index.watermark
+        query = self._schema("question", ["zoom", "pan"])
+        assert restored.query(query, k=1) == index.query(query, k=1)
+    
+    def test_load_rejects_mismatched_config(self, tmp_path):
+        """Snapshots built with other hashing params are ignored"""
+        from app.services.vdg_vector_index import VDGVectorIndex
+        
+        path = tmp_path / "index.npz"
+        index = VDGVectorIndex(path=str(path), dim=64)
+        index.upsert("a", self._schema("question", ["zoom"]))
+        index.save()
+        
+        assert not VDGVectorIndex(path=str(path)).load()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+Tests for the coaching WebSocket binary sub-protocol
+backend/tests/test_coaching_wire.py
+"""
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.coaching_wire import (
+    BINARY_SUBPROTOCOL,
+    HEADER_SIZE,
+    KIND_AUDIO_PCM16,
+    KIND_VIDEO_JPEG,
+    WIRE_BINARY,
+    WIRE_JSON,
+    WireProtocolError,
+    negotiate_wire,
+    pack_binary_message,
+    parse_binary_message,
+)
+from app.services.hybrid_frame_evaluator import decode_frame
+
+
+def test_header_roundtrip_returns_zero_copy_payload():
+    pcm = b"\x01\x00" * 1600
+    data = pack_binary_message(KIND_AUDIO_PCM16, pcm, seq=7, t_ms=2500, client_ts_ms=1_700_000_000_000)
+
+    header, payload = parse_binary_message(data)
+
+    assert len(data) == HEADER_SIZE + len(pcm)
+    assert header.is_audio and header.seq == 7 and header.t_ms == 2500
+    assert header.client_ts_ms == 1_700_000_000_000
+    assert isinstance(payload, memoryview)
+    assert payload.obj is data  # view over the received buffer, not a copy
+    assert payload == pcm
+
+
+def test_malformed_messages_are_rejected():
+    with pytest.raises(WireProtocolError):
+        parse_binary_message(b"\x01\x01")
+    with pytest.raises(WireProtocolError):
+        parse_binary_message(pack_binary_message(99, b"x"))
+    bad_version = bytearray(pack_binary_message(KIND_VIDEO_JPEG, b"x"))
+    bad_version[0] = 2
+    with pytest.raises(WireProtocolError):
+        parse_binary_message(bytes(bad_version))
+
+
+def test_negotiation_prefers_subprotocol_and_defaults_to_json():
+    assert negotiate_wire(["other", BINARY_SUBPROTOCOL]) == (WIRE_BINARY, BINARY_SUBPROTOCOL)
+    assert negotiate_wire([], "binary") == (WIRE_BINARY, None)
+    assert negotiate_wire([], None) == (WIRE_JSON, None)
+
+
+def test_decode_frame_accepts_binary_payload():
+    ok, buf = cv2.imencode(".jpg", np.full((48, 64, 3), 128, dtype=np.uint8))
+    assert ok
+    _, payload = parse_binary_message(pack_binary_message(KIND_VIDEO_JPEG, buf.tobytes()))
+
+    frame = decode_frame(payload)
+
+    assert frame is not None and frame.shape == (48, 64, 3)
+
+
+@pytest.mark.asyncio
+async def test_binary_messages_dispatch_to_audio_and_frame_paths(monkeypatch):
+    from app.routers import coaching_ws
+
+    audio, frames, sent = [], [], []
+
+    async def fake_audio(session_id, session, pcm_data):
+        audio.append(pcm_data)
+
+    async def fake_frame(session_id, session, frame, t_sec, t_ms, codec):
+        frames.append((frame, t_sec, t_ms, codec))
+
+    async def fake_send(session_id, message):
+        sent.append(message)
+
+    monkeypatch.setattr(coaching_ws, "handle_audio_pcm", fake_audio)
+    monkeypatch.setattr(coaching_ws, "submit_video_frame", fake_frame)
+    monkeypatch.setattr(coaching_ws.manager, "send_message", fake_send)
+
+    session = {"wire": WIRE_BINARY}
+    await coaching_ws.handle_binary_message("s", session, pack_binary_message(KIND_AUDIO_PCM16, b"\x00\x01" * 4), "friendly")
+    await coaching_ws.handle_binary_message(
+        "s", session, pack_binary_message(KIND_VIDEO_JPEG, b"jpeg", t_ms=1500, client_ts_ms=42), "friendly"
+    )
+
+    assert isinstance(audio[0], memoryview) and audio[0] == b"\x00\x01" * 4
+    frame, t_sec, t_ms, codec = frames[0]
+    assert isinstance(frame, memoryview) and frame == b"jpeg"
+    assert (t_sec, t_ms, codec) == (1.5, 42, "jpeg")
+    assert sent == []
+
+    # JSON-mode sessions never had the binary protocol negotiated
+    await coaching_ws.handle_binary_message("s", {"wire": WIRE_JSON}, pack_binary_message(KIND_AUDIO_PCM16, b"\x00\x00"), "friendly")
+    assert len(audio) == 1
+    assert sent[-1]["type"] == "error"
@@ -0,0 +1,63 @@
+"""
+Tests for the crawler ContentFilter (Aho-Corasick keyword matcher, combined regexes, filter_batch)
+backend/tests/test_content_filter.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.crawlers.content_filter import ContentFilter, KeywordAutomaton
+
+
+def test_automaton_reports_overlapping_matches_with_positions():
+    automaton = KeywordAutomaton([("he", 1), ("she", 2), ("hers", 3), ("his", 4)])
+
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 3)]
+    assert list(KeywordAutomaton([]).iter_matches("anything")) == []
+
+
+def test_reject_reasons_follow_group_priority_and_list_order():
+    cf = ContentFilter()
+
+    assert cf.filter("뉴진스 BTS 커버").reject_reason == "celebrity:bts"  # list order, not text order
+    assert cf.filter("먹방 3회", description="손흥민").reject_reason == r"tv_program:\d+회"
+    assert cf.filter("오늘의 골프 레슨").reject_reason == "news_sports:골프"
+    assert cf.filter("레전드 모음 vlog").reject_reason == "tv_program:레전드"
+    assert cf.filter("일상 vlog", channel_name="SBS Entertainment").reject_reason == (
+        "broadcast_channel:sbs entertainment"  # leftmost, then longest channel keyword
+    )
+    assert cf.filter("일상", hashtags=["#Daily", "#KPOP"]).reject_reason == "hashtag:#kpop"
+    # TV / edit keywords only count in the title or description, celebrity keywords anywhere
+    assert cf.filter("일상 vlog", channel_name="드라마덕후").should_collect
+    assert cf.filter("일상 vlog", channel_name="아이유팬").reject_reason == "celebrity:아이유"
+    assert cf.get_remixable_score("짧은 제목", channel_name="MBC drama")[1] == ["simple_title"]
+
+
+def test_filter_batch_matches_filter():
+    cf = ContentFilter()
+    items = [
+        {"title": "오늘 저녁 먹방", "channel_name": "my_food"},
+        {"title": "Best Moment 총정리", "description": "하이라이트"},
+        {"title": None, "channel_name": "JTBC", "hashtags": ["#먹방"]},
+        {"title": "운동 루틴", "hashtags": ["#축구"]},
+    ]
+
+    results = cf.filter_batch(items)
+    assert results == [
+        cf.filter(item.get("title"), item.get("channel_name"), item.get("hashtags"), item.get("description"))
+        for item in items
+    ]
+    assert [r.should_collect for r in results] == [True, False, False, False]
+
+
+def test_large_keyword_lists_compile_into_one_automaton():
+    class BigFilter(ContentFilter):
+        CELEBRITY_KEYWORDS = ContentFilter.CELEBRITY_KEYWORDS + [f"creator{i:05d}" for i in range(5000)]
+
+    cf = BigFilter()
+    titles = [{"title": f"daily vlog {i}"} for i in range(2000)] + [{"title": "collab with CREATOR04999"}]
+
+    results = cf.filter_batch(titles)
+    assert sum(not r.should_collect for r in results) == 1
+    assert results[-1].reject_reason == "celebrity:creator04999"
@@ -22,3 +22,158 @@ def test_mock_crawler_crawl():
         assert item.platform in MockCrawler.PLATFORMS
         assert item.view_count >= 100_000
         assert item.growth_rate.endswith("x")
+
+
+class _FakeIngestSession:
+    """Records INSERT statements; rows whose external_id is in `existing` conflict"""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.statements = []
+
+    async def execute(self, stmt):
+        from unittest.mock import MagicMock
+        import uuid
+
+        self.statements.append(stmt)
+        params = stmt.compile().params
+        ext_ids = [v for k, v in params.items() if k.startswith("external_id")]
+        result = MagicMock()
+        result.all.return_value = [
+            (uuid.uuid4(), ext_id) for ext_id in ext_ids if ext_id not in self.existing
+        ]
+        return result
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_outliers_dedupes_and_chunks():
+    from sqlalchemy.dialects import postgresql
+    from app.services.outlier_ingest import bulk_insert_outliers
+
+    rows = [
+        {"external_id": f"yt_{i}", "video_url": f"https://y/{i}", "platform": "youtube", "category": "c"}
+        for i in range(5)
+    ]
+    rows += [
+        {"external_id": "yt_0", "video_url": "https://y/other", "platform": "youtube", "category": "c"},
+        {"external_id": "yt_new", "video_url": "https://y/1", "platform": "youtube", "category": "c"},
+        {"external_id": None, "video_url": "https://y/none", "platform": "youtube", "category": "c"},
+    ]
+    db = _FakeIngestSession(existing={"yt_3"})
+
+    result = await bulk_insert_outliers(db, rows, chunk_size=2)
+
+    assert len(db.statements) == 3  # 5 unique rows / chunk 2
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT DO NOTHING" in sql and "RETURNING" in sql
+    # missing raw_payload is SQL NULL, not a bound None (JSONB would store JSON 'null')
+    assert not any(k.startswith("raw_payload") for k in db.statements[0].compile(dialect=postgresql.dialect()).params)
+    assert result.received == 8
+    assert result.inserted == 4
+    assert result.skipped_existing == 1
+    assert result.duplicates_in_batch == 2
+    assert result.invalid == 1
+    assert result.skipped == 4
+    assert sorted(ext for _, ext in result.inserted_ids) == ["yt_0", "yt_1", "yt_2", "yt_4"]
+
+
+class _SlowCrawler:
+    """acrawl sleeps to stand in for network latency"""
+
+    delay = 0.2
+
+    def __init__(self, platform):
+        self.platform = platform
+        self.closed = False
+
+    async def acrawl(self, limit=10, ctx=None, **kwargs):
+        import asyncio
+
+        await asyncio.sleep(self.delay)
+        return [
+            OutlierCrawlItem(
+                source_name=self.platform,
+                external_id=f"{self.platform}_{i}",
+                video_url=f"https://{self.platform}/{i}",
+                platform=self.platform,
+                category="trending",
+                title="t",
+                view_count=1,
+            )
+            for i in range(limit)
+        ]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_runs_platforms_concurrently(monkeypatch):
+    import asyncio
+    import time
+    from app.crawlers.orchestrator import CrawlOrchestrator
+    from app.services.quota_manager import QuotaManager
+
+    monkeypatch.setattr(CrawlerFactory, "create", classmethod(lambda cls, name: _SlowCrawler(name)))
+
+    async def virlo_runner():
+        await asyncio.sleep(_SlowCrawler.delay)
+        return {"collected": 3, "inserted": 2}
+
+    quota = QuotaManager(limits={"youtube": 10000, "tiktok": 1000, "instagram": 0})
+    start = time.perf_counter()
+    results = await CrawlOrchestrator(quota_manager=quota).run(
+        ["youtube", "tiktok", "instagram", "virlo"], limit=3, runners={"virlo": virlo_runner}
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < _SlowCrawler.delay * 2  # slowest platform, not the sum
+    assert list(results) == ["youtube", "tiktok", "instagram", "virlo"]
+    assert [i.external_id for i in results["youtube"].items] == ["youtube_0", "youtube_1", "youtube_2"]
+    assert results["tiktok"].concurrency == 2
+    assert results["instagram"].status == "skipped"  # no quota left
+    assert results["virlo"].result == {"collected": 3, "inserted": 2}
+
+
+@pytest.mark.asyncio
+async def test_youtube_acrawl_consumes_quota_and_dedupes_channels():
+    import httpx
+    from app.crawlers.async_http import CrawlContext
+    from app.crawlers.youtube import YouTubeCrawler
+    from app.services.quota_manager import QuotaManager
+
+    calls = []
+
+    def handler(request):
+        path = request.url.path
+        params = request.url.params
+        calls.append((path, params.get("part"), params.get("channelId")))
+        if path.endswith("/search"):
+            return httpx.Response(200, json={"items": [{"id": {"videoId": "b1"}}]})
+        if params.get("chart") == "mostPopular":
+            return httpx.Response(200, json={"items": [{"id": "v1"}, {"id": "v2"}]})
+        ids = params["id"].split(",")
+        stats = {"v1": 500000, "v2": 300000, "b1": 1000}
+        return httpx.Response(200, json={"items": [
+            {
+                "id": vid,
+                "snippet": {"title": f"vlog {vid}", "channelId": "ch1", "channelTitle": "creator"},
+                "statistics": {"viewCount": str(stats[vid]), "likeCount": "10"},
+                "contentDetails": {"duration": "PT30S"},
+            }
+            for vid in ids
+        ]})
+
+    quota = QuotaManager(limits={"youtube": 10000})
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        crawler = YouTubeCrawler(api_key="test")
+        ctx = CrawlContext(platform="youtube", client=client, quota_manager=quota)
+        items = await crawler.acrawl(limit=5, ctx=ctx)
+        crawler.close()
+
+    assert [i.external_id for i in items] == ["v1", "v2"]
+    assert all(i.creator_avg_views == 1000 for i in items)
+    assert sum(1 for path, _, _ in calls if path.endswith("/search")) == 1  # one lookup per channel
+    # 1 (ids) + 2 (details) + 100 (search) + 1 (baseline details)
+    assert crawler.quota_used == 104
+    assert await quota.get_remaining("youtube") == 10000 - 104
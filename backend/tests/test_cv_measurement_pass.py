@@ -0,0 +1,160 @@
+"""
+Tests for CV Measurement Pass (Pass 2) frame decoding
+backend/tests/test_cv_measurement_pass.py
+"""
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vdg_2pass.cv_measurement_pass import (
+    CVMeasurementPass,
+    StreamingFrameReader,
+    shutdown_shared_executors,
+)
+from app.schemas.vdg_unified_pass import (
+    AnalysisPlanSeedLLM,
+    AnalysisPointSeedLLM,
+    MeasurementSpecLLM,
+)
+
+
+@pytest.fixture(scope="module")
+def synthetic_video(tmp_path_factory):
+    """10s, 30fps clip whose brightness encodes the frame index"""
+    path = tmp_path_factory.mktemp("cv") / "synthetic.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 30, (160, 120))
+    if not writer.isOpened():
+        pytest.skip("mp4v encoder unavailable")
+    for i in range(300):
+        writer.write(np.full((120, 160, 3), (i * 4) % 250, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class TestStreamingFrameReader:
+    """Single-session window decoding"""
+
+    def test_window_timestamps_match_frame_extractor_grid(self, synthetic_video):
+        """Each window yields start + i*100ms samples, same as FrameExtractor"""
+        reader = StreamingFrameReader(synthetic_video, fps=10.0)
+        windows = dict(reader.iter_windows([(1000, 1000), (5000, 2000)]))
+
+        assert [t for t, _ in windows[0]] == list(range(500, 1500, 100))
+        assert [t for t, _ in windows[1]] == list(range(4000, 6000, 100))
+        assert all(frame.shape == (120, 160, 3) for _, frame in windows[1])
+
+    def test_overlapping_and_unsorted_windows(self, synthetic_video):
+        """Overlapping windows share decoded frames, all indices are returned"""
+        reader = StreamingFrameReader(synthetic_video, fps=10.0)
+        windows = dict(reader.iter_windows([(8000, 1000), (1200, 1000), (1000, 1000)]))
+
+        assert set(windows) == {0, 1, 2}
+        assert len(windows[1]) == 10 and len(windows[2]) == 10
+        shared = dict(windows[2])
+        for t, frame in windows[1]:
+            if t in shared:
+                assert frame is shared[t]
+        # 영상 전체(300 frame)를 디코딩하지 않음
+        assert reader.frames_decoded < 300
+
+    def test_window_past_end_of_video(self, synthetic_video):
+        """Windows beyond EOF yield truncated / empty frame lists"""
+        reader = StreamingFrameReader(synthetic_video, fps=10.0)
+        windows = dict(reader.iter_windows([(9900, 1000), (20000, 1000)]))
+
+        assert 0 < len(windows[0]) < 10
+        assert windows[1] == []
+
+    def test_missing_video(self, tmp_path):
+        """Unopenable video yields empty windows instead of raising"""
+        reader = StreamingFrameReader(str(tmp_path / "missing.mp4"))
+        assert dict(reader.iter_windows([(1000, 1000)])) == {0: []}
+
+
+class TestCVMeasurementPassStreaming:
+    """CVMeasurementPass stream mode"""
+
+    def _plan(self):
+        spec = MeasurementSpecLLM(metric_id="lit.brightness_ratio.v1")
+        return AnalysisPlanSeedLLM(points=[
+            AnalysisPointSeedLLM(t_center_ms=6000, t_window_ms=1000, priority="high",
+                                 reason="hook_punch", measurements=[spec]),
+            AnalysisPointSeedLLM(t_center_ms=1000, t_window_ms=1000, priority="high",
+                                 reason="hook_start", measurements=[spec]),
+        ])
+
+    def test_results_in_plan_order(self, synthetic_video):
+        """Measurements follow plan order even though decoding is time-sorted"""
+        cv_pass = CVMeasurementPass(decode_mode="stream")
+        result, prov = cv_pass.run(video_path=synthetic_video, analysis_plan=self._plan())
+
+        assert [m.t_center_ms for m in result.measurements] == [6000, 1000]
+        assert all(
+            m.metrics["lit.brightness_ratio.v1"].frame_count == 10 for m in result.measurements
+        )
+        assert result.total_frames_processed == 20
+        assert prov.metrics_measured == ["lit.brightness_ratio.v1"]
+
+    def test_parallel_matches_serial(self, synthetic_video):
+        """Process-pool execution merges to identical measurements in plan order"""
+        from dataclasses import asdict
+        
+        specs = [
+            MeasurementSpecLLM(metric_id="lit.brightness_ratio.v1"),
+            MeasurementSpecLLM(metric_id="cmp.blur_score.v1"),
+            MeasurementSpecLLM(metric_id="edit.scene_change.v1"),
+            MeasurementSpecLLM(metric_id="unknown.metric.v1"),
+        ]
+        plan = AnalysisPlanSeedLLM(points=[
+            AnalysisPointSeedLLM(t_center_ms=t, t_window_ms=800, priority="medium",
+                                 reason="probe", measurements=specs)
+            for t in (7000, 500, 3000)
+        ])
+        
+        serial, _ = CVMeasurementPass().run(video_path=synthetic_video, analysis_plan=plan)
+        
+        parallel_pass = CVMeasurementPass(workers=4)
+        try:
+            parallel, _ = parallel_pass.run(video_path=synthetic_video, analysis_plan=plan)
+        finally:
+            parallel_pass.close()
+        
+        assert [asdict(m) for m in parallel.measurements] == [asdict(m) for m in serial.measurements]
+        assert parallel.total_frames_processed == serial.total_frames_processed
+    
+    def test_task_split_by_metric_when_few_points(self):
+        """Fewer points than workers → one task per (point, metric)"""
+        cv_pass = CVMeasurementPass(workers=8, save_evidence_frames=True)
+        tasks = cv_pass._plan_tasks(self._plan().points)
+        assert [(t.point_index, t.spec_indices, t.save_evidence) for t in tasks] == [
+            (0, [0], True),
+            (1, [0], True),
+        ]
+        
+        specs = [MeasurementSpecLLM(metric_id="cmp.blur_score.v1")] * 3
+        point = AnalysisPointSeedLLM(t_center_ms=0, t_window_ms=500, priority="low",
+                                     reason="x", measurements=specs)
+        tasks = cv_pass._plan_tasks([point])
+        assert [t.spec_indices for t in tasks] == [[0], [1], [2]]
+        assert [t.save_evidence for t in tasks] == [True, False, False]
+
+    def test_instances_share_process_pool(self):
+        """Pipelines built per request must not spawn a new pool each"""
+        first, second = CVMeasurementPass(workers=2), CVMeasurementPass(workers=2)
+        try:
+            pool = first._get_executor()
+            assert second._get_executor() is pool
+            assert CVMeasurementPass(workers=3)._get_executor() is not pool
+            shutdown_shared_executors()
+            assert first._get_executor() is not pool  # shut down → recreated on demand
+        finally:
+            shutdown_shared_executors()
+
+    def test_unknown_decode_mode(self):
+        with pytest.raises(ValueError):
+            CVMeasurementPass(decode_mode="gpu")
@@ -0,0 +1,137 @@
+"""
+Tests for the For-You feed ranking (tier_rank ordering, deferred page load, cached totals)
+backend/tests/test_feed_ranking.py
+"""
+import asyncio
+import os
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import feed_ranking
+from app.services.feed_ranking import FeedCountCache, feed_filters, feed_page_ids_statement
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_page_statement_uses_tier_rank_range_and_index_order():
+    sql = _sql(feed_page_ids_statement(feed_filters(platform="tiktok", min_tier="a"), offset=40, limit=10))
+
+    assert sql.startswith("SELECT outlier_items.id \nFROM outlier_items")
+    assert "array_position" not in sql
+    assert "outlier_items.tier_rank <= 2" in sql
+    assert "outlier_items.analysis_status = 'completed'" in sql
+    assert (
+        "ORDER BY outlier_items.tier_rank ASC, outlier_items.outlier_score DESC, "
+        "outlier_items.view_count DESC, outlier_items.id DESC"
+    ) in sql
+    assert "outlier_items.tier_rank <= 4" in _sql(feed_page_ids_statement(feed_filters(min_tier="Z")))
+
+
+def _advance_clock(monkeypatch, seconds):
+    now = feed_ranking.time.monotonic() + seconds
+    monkeypatch.setattr(feed_ranking, "time", SimpleNamespace(monotonic=lambda: now))
+
+
+@pytest.mark.asyncio
+async def test_count_cache_coalesces_loads_and_refreshes_after_ttl(monkeypatch):
+    cache = FeedCountCache(ttl_sec=60)
+    calls = []
+    release = asyncio.Event()
+
+    async def loader():
+        calls.append(1)
+        await release.wait()
+        return 42
+
+    pending = [asyncio.ensure_future(cache.get_or_load("k", loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*pending) == [42] * 5
+    assert len(calls) == 1
+    assert await cache.get_or_load("k", loader) == 42
+    assert len(calls) == 1 and cache.hits == 1
+
+    _advance_clock(monkeypatch, 61)  # counts only refresh on TTL expiry
+    assert await cache.get_or_load("k", loader) == 42
+    assert len(calls) == 2
+
+
+class _FakeResult:
+    def __init__(self, values):
+        self._values = values
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self._values)
+
+    def scalar(self):
+        return self._values[0]
+
+
+class _FakeSession:
+    """id 페이지 → 행 로드 → count 순서로 응답 (행은 id 순서와 다르게 돌려줌)"""
+
+    def __init__(self, items):
+        self.items = items
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(_sql(statement))
+        sql = self.statements[-1]
+        if "count(" in sql:
+            return _FakeResult([len(self.items)])
+        if sql.startswith("SELECT outlier_items.id \n"):
+            return _FakeResult([item.id for item in self.items])
+        return _FakeResult(list(reversed(self.items)))
+
+
+def _item(tier, score):
+    return SimpleNamespace(
+        id=uuid.uuid4(), title=f"{tier}-{score}", video_url="https://x", thumbnail_url=None, platform="tiktok",
+        category="meme", outlier_tier=tier, outlier_score=score, view_count=1000, engagement_rate=None,
+        growth_rate=None, best_comments=[{"text": "wow", "likes": 3}],
+    )
+
+
+def test_for_you_router_keeps_rank_order_and_caches_total(monkeypatch):
+    from app import database
+    from app.database import get_db
+    from app.routers.for_you import router
+
+    monkeypatch.setattr(feed_ranking, "_feed_count_cache", FeedCountCache(ttl_sec=60))
+    session = _FakeSession([_item("S", 9.0), _item("A", 8.0)])
+    count_session = _FakeSession(session.items)
+
+    @asynccontextmanager
+    async def _session_maker():
+        yield count_session
+
+    monkeypatch.setattr(database, "async_session_maker", _session_maker)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = lambda: session
+    client = TestClient(app)
+
+    body = client.get("/for-you?limit=2").json()
+    assert [r["tier"] for r in body["recommendations"]] == ["S", "A"]
+    assert body["total_count"] == 2 and body["has_more"] is False
+
+    client.get("/for-you?limit=2")
+    # total counted once, on its own session (not the request's), and reused for the second page
+    assert sum("count(" in sql for sql in count_session.statements) == 1
+    assert not any("count(" in sql for sql in session.statements)
+
+    _advance_clock(monkeypatch, 61)
+    client.get("/for-you?limit=2")
+    assert sum("count(" in sql for sql in count_session.statements) == 2
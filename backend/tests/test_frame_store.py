@@ -0,0 +1,108 @@
+"""
+Tests for the Ghost Overlay FrameStore (timestamp index, on-demand extraction, variants)
+backend/tests/test_frame_store.py
+"""
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+cv2 = pytest.importorskip("cv2")
+
+from app.services import frame_store as frame_store_module
+from app.services.frame_store import FrameStore
+
+
+def _write_frame(path, value=128, size=(480, 640)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cv2.imwrite(str(path), np.full((*size, 3), value, dtype=np.uint8))
+
+
+def _write_video(path, seconds=3, fps=10):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (64, 48))
+    for i in range(seconds * fps):
+        writer.write(np.full((48, 64, 3), (i * 8) % 256, dtype=np.uint8))
+    writer.release()
+
+
+@pytest.mark.asyncio
+async def test_nearest_frame_index_and_cached_resized_variants(tmp_path):
+    for t_ms in (0, 1000, 2000):
+        _write_frame(tmp_path / "c1" / f"{t_ms}.jpg", value=t_ms // 10)
+    store = FrameStore(str(tmp_path), match_tolerance_ms=500)
+
+    assert store.timestamps("c1") == [0, 1000, 2000]
+    assert (await store.get_frame("c1", 1400)).t_ms == 1000
+    assert (await store.get_frame("c1", 1600)).t_ms == 2000
+    assert await store.get_frame("c1", 2600) is None  # outside tolerance, no source video
+    assert await store.get_frame("missing", 0) is None
+
+    small = await store.get_frame("c1", 1000, width=160, quality=60)
+    decoded = cv2.imdecode(np.frombuffer(small.data, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape[:2] == (120, 160)
+    assert (tmp_path / "_variants" / "c1" / "1000_w160_q60.jpg").exists()
+    # arbitrary width/quality snap to buckets → bounded variants per frame
+    for width, quality in ((150, 55), (161, 70), (300, 84), (2000, 99)):
+        await store.get_frame("c1", 1000, width=width, quality=quality)
+    assert sorted(p.name for p in (tmp_path / "_variants" / "c1").iterdir()) == [
+        "1000_w160_q60.jpg", "1000_w320_q60.jpg", "1000_w320_q85.jpg",
+    ]
+    scans = store.stats()["index_scans"]
+    assert (await store.get_frame("c1", 1000, width=160, quality=60)).source == "memory"
+    assert store.stats()["index_scans"] == scans  # hot path: one stat, no directory scan
+
+    # a frame written by the CV pass later is picked up via the directory mtime
+    _write_frame(tmp_path / "c1" / "3000.jpg")
+    os.utime(tmp_path / "c1", ns=(0, os.stat(tmp_path / "c1").st_mtime_ns + 1))
+    assert (await store.get_frame("c1", 3100)).t_ms == 3000
+
+
+@pytest.mark.asyncio
+async def test_missing_frames_are_extracted_once_per_span_from_source_video(tmp_path):
+    video = tmp_path / "download.mp4"
+    _write_video(video)
+    store = FrameStore(str(tmp_path / "frames"), extract_step_ms=100, extract_span_ms=1000)
+    store.register_source("c2", str(video))
+
+    frames = await asyncio.gather(*(store.get_frame("c2", t, width=100) for t in range(1000, 1500, 20)))
+
+    assert all(frame is not None for frame in frames)
+    assert {frame.t_ms for frame in frames} == {1000, 1100, 1200, 1300, 1400, 1500}
+    assert store.timestamps("c2") == list(range(1000, 2000, 100))
+    assert store.stats()["inflight_joins"] >= 1
+    assert store.stats()["index_scans"] == 2  # before and after the single decode
+    assert (await store.get_frame("c2", 260)).t_ms == 300  # next span decoded on demand
+
+    # past the end of the video: decoded once, then answered from the negative cache
+    extractions = store.stats()["extractions"]
+    assert await store.get_frame("c2", 9500) is None
+    assert await store.get_frame("c2", 9700) is None
+    assert await store.get_frame("c2", 12000) is None
+    assert store.stats()["extractions"] == extractions + 1
+    assert store.stats()["empty_span_hits"] == 2
+
+
+def test_frames_router_serves_jpeg_or_placeholder(tmp_path, monkeypatch):
+    from app.routers.frames import router
+
+    _write_frame(tmp_path / "c3" / "500.jpg")
+    monkeypatch.setattr(frame_store_module, "_frame_store", FrameStore(str(tmp_path)))
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.get("/frames/c3/700?width=200")
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["x-frame-t-ms"] == "500"
+    assert client.get("/frames/c3/5000").headers["content-type"] == "image/png"
+    assert client.get("/frames/c3").json()["count"] == 1
+    (tmp_path / "c3" / "500.jpg").unlink()  # deleted after indexing (same directory mtime)
+    os.utime(tmp_path / "c3", ns=(0, frame_store_module._frame_store._indexes["c3"].mtime_ns))
+    assert client.get("/frames/c3").json()["count"] == 0
+    assert client.get("/frames/..c3/0").status_code == 400
@@ -0,0 +1,147 @@
+"""
+Tests for GenAIGateway (shared async Gemini client, concurrency limits, async backoff)
+backend/tests/test_genai_gateway.py
+"""
+import asyncio
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.genai_client import GenAIErrorCode
+from app.services.genai_gateway import GenAIGateway, GenAIGatewayError
+
+
+class _FakeModels:
+    def __init__(self, errors=None, delay=0.01):
+        self.errors = list(errors or [])
+        self.delay = delay
+        self.calls = 0
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+        self.threads = set()
+
+    async def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        if self.errors:
+            raise self.errors.pop(0)
+        self.active[model] = self.active.get(model, 0) + 1
+        self.peak[model] = max(self.peak.get(model, 0), self.active[model])
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        await asyncio.sleep(self.delay)
+        self.active[model] -= 1
+        return SimpleNamespace(text=f"{model}:{contents}", usage_metadata=None)
+
+
+class _FakeFiles:
+    def __init__(self, states):
+        self.states = list(states)
+
+    def _file(self):
+        return SimpleNamespace(name="files/1", state=SimpleNamespace(name=self.states.pop(0)))
+
+    async def upload(self, file):
+        return self._file()
+
+    async def get(self, name):
+        return self._file()
+
+
+def _client(models=None, files=None):
+    return SimpleNamespace(aio=SimpleNamespace(models=models or _FakeModels(), files=files))
+
+
+@pytest.mark.asyncio
+async def test_global_and_per_model_concurrency_limits():
+    models = _FakeModels(delay=0.02)
+    gateway = GenAIGateway(client=_client(models), max_concurrency=3, model_concurrency=2)
+
+    responses = await asyncio.gather(*(
+        gateway.generate("hi", model=model) for model in ["flash", "pro"] * 6
+    ))
+
+    assert all(r.success for r in responses)
+    assert max(models.peak.values()) == 2
+    assert models.peak_total == 3
+    assert gateway.stats.in_flight == 0 and gateway.stats.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_releases_the_semaphore_it_acquired_after_rebind():
+    gateway = GenAIGateway(client=_client(), max_concurrency=2, model_concurrency=2)
+    other_loop = asyncio.new_event_loop()
+    try:
+        async with gateway._slot("flash"):
+            held = gateway._global_sem
+            gateway.bind_loop(other_loop)  # a call from another loop rebinds mid-slot
+        rebound = gateway._global_sem
+    finally:
+        other_loop.close()
+
+    assert rebound is not held
+    assert held._value == 2  # the acquired semaphore got its permit back
+    assert rebound._value == 2  # the new one was not over-released
+
+
+@pytest.mark.asyncio
+async def test_retry_after_drives_async_backoff_and_non_retryable_fails_fast():
+    gateway = GenAIGateway(client=_client(), max_retry_wait_sec=30.0)
+    assert gateway._retry_delay(0, 2000) == 2.0  # server hint beats the 1s base backoff
+    assert gateway._retry_delay(0, 60000) == 30.0  # capped
+
+    models = _FakeModels(errors=[Exception("429 rate limit exceeded"), Exception("503 unavailable")])
+    gateway = GenAIGateway(client=_client(models), max_retry_wait_sec=0.01)
+    response = await gateway.generate("hi", model="flash")
+    assert response.success and response.attempt_count == 3
+    assert gateway.stats.retries == 2
+
+    models = _FakeModels(errors=[Exception("400 invalid argument")])
+    gateway = GenAIGateway(client=_client(models), max_retry_wait_sec=0.01)
+    response = await gateway.generate("hi", model="flash")
+    assert not response.success
+    assert response.error_code == GenAIErrorCode.INVALID_REQUEST
+    assert models.calls == 1
+    with pytest.raises(GenAIGatewayError):
+        await GenAIGateway(client=_client(_FakeModels(errors=[Exception("400")]))).generate_or_raise("hi")
+
+
+@pytest.mark.asyncio
+async def test_upload_polls_without_blocking_and_surfaces_failed_state():
+    gateway = GenAIGateway(client=_client(files=_FakeFiles(["PROCESSING", "PROCESSING", "ACTIVE"])))
+    uploaded = await gateway.upload_file("video.mp4", poll_interval_sec=0.001)
+    assert uploaded.state.name == "ACTIVE"
+
+    gateway = GenAIGateway(client=_client(files=_FakeFiles(["PROCESSING", "FAILED"])))
+    with pytest.raises(GenAIGatewayError, match="state=FAILED"):
+        await gateway.upload_file("video.mp4", poll_interval_sec=0.001)
+
+
+@pytest.mark.asyncio
+async def test_run_sync_from_worker_thread_executes_on_bound_loop():
+    models = _FakeModels()
+    gateway = GenAIGateway(client=_client(models))
+    gateway.bind_loop()
+
+    raw = await asyncio.to_thread(gateway.run_sync, gateway.generate_or_raise, "hi", model="pro")
+
+    assert raw.text == "pro:hi"
+    assert models.threads == {threading.get_ident()}  # ran on this (event loop) thread
+
+
+def test_run_sync_without_bound_loop_reuses_one_gateway_loop():
+    models = _FakeModels()
+    gateway = GenAIGateway(client=_client(models))
+
+    # CLI/script path: no bind_loop, upload + generate must share the client's loop
+    first = gateway.run_sync(gateway.generate_or_raise, "a", model="pro")
+    second = gateway.run_sync(gateway.generate_or_raise, "b", model="pro")
+
+    assert (first.text, second.text) == ("pro:a", "pro:b")
+    assert len(models.threads) == 1 and threading.get_ident() not in models.threads
+    assert gateway._loop.is_running()
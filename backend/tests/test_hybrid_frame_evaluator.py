@@ -0,0 +1,98 @@
+"""
+Tests for HybridFrameEvaluator (local CV pre-screening for coaching frames)
+backend/tests/test_hybrid_frame_evaluator.py
+"""
+import base64
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.director_pack import DNAInvariant, RuleSpec, TimeScope
+from app.services.frame_analyzer import FrameAnalysisResult
+from app.services.hybrid_frame_evaluator import HybridFrameEvaluator, decode_frame
+from app.services.proof_patterns import EXPOSURE_FLOOR
+
+
+SHARPNESS_RULE = DNAInvariant(
+    rule_id="sharpness_floor_v1",
+    domain="composition",
+    priority="medium",
+    time_scope=TimeScope(t_window=[0.0, 60.0]),
+    spec=RuleSpec(metric_id="cmp.blur_score.v1", op=">=", target=0.2),
+)
+
+SEMANTIC_RULE = DNAInvariant(
+    rule_id="product_in_frame_v1",
+    domain="composition",
+    priority="high",
+    time_scope=TimeScope(t_window=[0.0, 10.0]),
+    spec=RuleSpec(metric_id="cmp.product_visible.v1", op="exists"),
+    check_hint="제품이 화면에 보여야 함",
+)
+
+
+class _FakeVisionAnalyzer:
+    def __init__(self):
+        self.calls = []
+
+    async def analyze_frame(self, frame_base64, rules, current_time=0.0, session_id=None):
+        self.calls.append([r.rule_id for r in rules])
+        return {
+            r.rule_id: FrameAnalysisResult(rule_id=r.rule_id, is_compliant=False, confidence=0.9, message="제품 보여주세요")
+            for r in rules
+        }
+
+
+def _frame_b64(value: int) -> str:
+    frame = np.full((240, 320, 3), value, dtype=np.uint8)
+    ok, buf = cv2.imencode(".jpg", frame)
+    assert ok
+    return base64.b64encode(buf.tobytes()).decode()
+
+
+@pytest.mark.asyncio
+async def test_metric_rules_are_evaluated_locally_without_vision_call():
+    vision = _FakeVisionAnalyzer()
+    evaluator = HybridFrameEvaluator(vision_analyzer=vision)
+
+    results = await evaluator.evaluate_frame(_frame_b64(40), [EXPOSURE_FLOOR, SHARPNESS_RULE], t_sec=1.0)
+
+    assert vision.calls == []
+    exposure = results["exposure_floor_v1"]
+    assert exposure.source == "local_cv"
+    assert exposure.is_compliant is False
+    assert exposure.measured_value == pytest.approx(40 / 255, abs=0.01)
+    assert exposure.message  # coach line from the pattern templates
+    assert results["sharpness_floor_v1"].is_compliant is False  # flat frame = no edges
+
+    bright = await evaluator.evaluate_frame(_frame_b64(220), [EXPOSURE_FLOOR], t_sec=2.0)
+    assert bright["exposure_floor_v1"].is_compliant is True
+
+
+@pytest.mark.asyncio
+async def test_only_semantic_rules_escalate_to_vision():
+    vision = _FakeVisionAnalyzer()
+    evaluator = HybridFrameEvaluator(vision_analyzer=vision)
+
+    results = await evaluator.evaluate_frame(_frame_b64(200), [EXPOSURE_FLOOR, SEMANTIC_RULE])
+
+    assert vision.calls == [["product_in_frame_v1"]]
+    assert results["product_in_frame_v1"].source == "vision"
+    assert results["exposure_floor_v1"].source == "local_cv"
+    assert evaluator.stats.to_dict()["escalated_rules"] == 1
+
+
+@pytest.mark.asyncio
+async def test_undecodable_frame_skips_local_rules():
+    evaluator = HybridFrameEvaluator(use_vision=False)
+
+    assert decode_frame("not-base64!!") is None
+    results = await evaluator.evaluate_frame(base64.b64encode(b"garbage").decode(), [EXPOSURE_FLOOR])
+
+    assert results == {}
+    assert evaluator.stats.decode_failures == 1
@@ -0,0 +1,82 @@
+"""
+Tests for the LLM metrics registry and its Prometheus exposition
+backend/tests/test_llm_metrics.py
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.genai_client import GenAIErrorCode, GenAIResponse
+from app.services.llm_metrics import LLMMetricsRegistry, llm_metrics
+
+
+def test_registry_aggregates_latency_tokens_and_retries():
+    registry = LLMMetricsRegistry(buckets=(0.5, 2.0))
+    registry.record(GenAIResponse(
+        success=True, model="pro", latency_ms=1500, attempt_count=2,
+        usage={"prompt_tokens": 1000, "completion_tokens": 200, "total_tokens": 1200},
+    ), site="vdg_pass1")
+    registry.record(GenAIResponse(success=True, model="pro", latency_ms=300), site="vdg_pass1")
+    registry.record(GenAIResponse(
+        success=False, model="flash", latency_ms=4000, error_code=GenAIErrorCode.RATE_LIMIT, attempt_count=3,
+    ), site="frame_analysis")
+
+    text = registry.render_prometheus()
+    assert 'komission_llm_requests_total{model="pro",site="vdg_pass1",status="success"} 2' in text
+    assert 'komission_llm_requests_total{model="flash",site="frame_analysis",status="rate_limit"} 1' in text
+    assert 'komission_llm_request_duration_seconds_bucket{model="pro",site="vdg_pass1",le="0.5"} 1' in text
+    assert 'komission_llm_request_duration_seconds_bucket{model="pro",site="vdg_pass1",le="2.0"} 2' in text
+    assert 'komission_llm_request_duration_seconds_bucket{model="flash",site="frame_analysis",le="+Inf"} 1' in text
+    assert 'komission_llm_request_duration_seconds_sum{model="pro",site="vdg_pass1"} 1.8' in text
+    assert 'komission_llm_tokens_total{model="pro",site="vdg_pass1",type="prompt"} 1000' in text
+    assert 'komission_llm_retries_total{model="flash",site="frame_analysis"} 2' in text
+
+    [flash, pro] = registry.snapshot()["calls"]
+    assert (flash["site"], flash["errors"], flash["p95_latency_ms_upper"]) == ("frame_analysis", 1, None)
+    assert (pro["calls"], pro["avg_latency_ms"], pro["completion_tokens"]) == (2, 900.0, 200)
+
+
+@pytest.mark.asyncio
+async def test_gateway_calls_are_recorded_per_site():
+    from app.services.genai_gateway import GenAIGateway
+
+    class _Models:
+        async def generate_content(self, model, contents, config=None):
+            usage = SimpleNamespace(prompt_token_count=7, candidates_token_count=3, total_token_count=10)
+            return SimpleNamespace(text="ok", usage_metadata=usage)
+
+    llm_metrics.reset()
+    gateway = GenAIGateway(client=SimpleNamespace(aio=SimpleNamespace(models=_Models())))
+    await gateway.generate("hi", model="flash", site="agent_chat")
+
+    [row] = llm_metrics.snapshot()["calls"]
+    assert (row["model"], row["site"], row["prompt_tokens"], row["completion_tokens"]) == ("flash", "agent_chat", 7, 3)
+    llm_metrics.reset()
+
+
+def test_metrics_endpoint_negotiates_prometheus_text():
+    from app.routers.monitoring import router
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    llm_metrics.reset()
+    llm_metrics.observe(model="pro", site="vdg_pass1", status="success", latency_ms=1200)
+
+    scraped = client.get("/api/v1/monitoring/metrics", headers={"Accept": "text/plain;version=0.0.4;q=0.5,*/*;q=0.1"})
+    assert scraped.headers["content-type"].startswith("text/plain")
+    assert 'komission_llm_request_duration_seconds_count{model="pro",site="vdg_pass1"} 1' in scraped.text
+    assert "# TYPE komission_llm_in_flight gauge" in scraped.text
+
+    as_json = client.get("/api/v1/monitoring/metrics").json()
+    assert "uptime_seconds" in as_json  # existing JSON consumers unchanged
+    assert as_json["llm"]["calls"][0]["site"] == "vdg_pass1"
+    assert client.get("/api/v1/monitoring/metrics?format=prometheus").text.startswith("# HELP")
+    llm_metrics.reset()
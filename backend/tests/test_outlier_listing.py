@@ -0,0 +1,132 @@
+"""
+Tests for the outlier listing engine (column projection, keyset cursors, ETags)
+backend/tests/test_outlier_listing.py
+"""
+import os
+import sys
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import OutlierItemStatus
+from app.services.outlier_listing import (
+    OutlierListQuery,
+    build_list_statement,
+    compute_etag,
+    decode_cursor,
+    encode_cursor,
+    etag_matches,
+)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_list_statement_projects_columns_and_opts_into_vdg():
+    sql = _sql(build_list_statement(OutlierListQuery(limit=50)))
+    select_clause = sql.split(" FROM ")[0]
+
+    assert "jsonb_array_length(outlier_items.best_comments)" in select_clause
+    assert "outlier_items.best_comments," not in select_clause  # only the count, not the array
+    assert "outlier_items.raw_payload ->>" in select_clause  # creator_username fallback only
+    assert "outlier_items.raw_payload[" not in select_clause
+    assert "outlier_items.raw_payload," not in select_clause
+    assert "ORDER BY outlier_items.outlier_score DESC NULLS LAST, outlier_items.id DESC" in sql
+
+    with_vdg = _sql(build_list_statement(OutlierListQuery(include_vdg=True))).split(" FROM ")[0]
+    assert "outlier_items.raw_payload[" in with_vdg and "AS vdg_analysis" in with_vdg
+
+
+def test_cursor_roundtrip_and_keyset_predicate():
+    item_id = uuid.uuid4()
+    crawled = datetime(2026, 1, 2, 3, 4, 5)
+
+    assert decode_cursor(encode_cursor("crawled_at", crawled, item_id), "crawled_at") == (crawled, item_id)
+    assert decode_cursor(encode_cursor("outlier_score", None, item_id), "outlier_score") == (None, item_id)
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("view_count", 10, item_id), "outlier_score")  # sort changed
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "outlier_score")
+
+    sql = _sql(build_list_statement(OutlierListQuery(sort_by="view_count", cursor=encode_cursor("view_count", 10, item_id))))
+    assert "outlier_items.view_count < " in sql and "outlier_items.view_count IS NULL" in sql
+    assert "OFFSET" not in sql
+
+
+def test_etag_changes_with_query_and_data_version():
+    updated = datetime(2026, 1, 1)
+    etag = compute_etag(OutlierListQuery(), 10, updated)
+
+    assert etag.startswith('W/"')
+    assert etag == compute_etag(OutlierListQuery(), 10, updated)
+    assert etag != compute_etag(OutlierListQuery(), 11, updated)
+    assert etag != compute_etag(OutlierListQuery(), 10, datetime(2026, 1, 2))
+    assert etag != compute_etag(OutlierListQuery(include_vdg=True), 10, updated)
+    assert etag_matches(f'"other", {etag[2:]}', etag)
+    assert not etag_matches(None, etag)
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def one(self):
+        return self._rows[0]
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    """validator 쿼리에는 (count, max(updated_at)), 목록 쿼리에는 rows 를 돌려주는 세션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        if len(statement.selected_columns) == 2:  # validator
+            return _FakeResult([(len(self.rows), datetime(2026, 1, 1))])
+        return _FakeResult(self.rows)
+
+
+def _row(score):
+    return SimpleNamespace(
+        id=uuid.uuid4(), external_id=f"ext-{score}", video_url=f"https://x/{score}", platform="tiktok",
+        category="meme", title=None, thumbnail_url=None, view_count=1000, like_count=100, share_count=None,
+        outlier_score=score, outlier_tier="A", creator_avg_views=None, creator_username="creator",
+        upload_date=None, crawled_at=datetime(2026, 1, 1), status=OutlierItemStatus.PROMOTED,
+        analysis_status="completed", promoted_to_node_id=None, best_comments_count=3, vdg_analysis=None,
+    )
+
+
+def test_router_returns_next_cursor_and_304_for_matching_etag():
+    from app.database import get_db
+    from app.routers.outliers import router
+
+    session = _FakeSession([_row(9.0), _row(8.0), _row(7.0)])
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_db] = lambda: session
+    client = TestClient(app)
+
+    response = client.get("/api/v1/outliers?limit=2")
+    body = response.json()
+    assert response.status_code == 200
+    assert [item["outlier_score"] for item in body["items"]] == [9.0, 8.0]
+    assert body["items"][0]["best_comments_count"] == 3 and body["items"][0]["status"] == "promoted"
+    assert decode_cursor(body["next_cursor"], "outlier_score")[0] == 8.0
+
+    cached = client.get("/api/v1/outliers?limit=2", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert len(session.statements) == 3  # the 304 ran only the validator query
+    assert client.get("/api/v1/outliers?cursor=garbage").status_code == 400
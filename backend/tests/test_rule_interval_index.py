@@ -0,0 +1,99 @@
+"""
+Tests for RuleIntervalIndex (time-windowed rule activation)
+backend/tests/test_rule_interval_index.py
+"""
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.rule_interval_index import PRIORITY_ORDER, IntervalTable, RuleIntervalIndex
+
+
+def _rule(rule_id, priority, t_window=None):
+    time_scope = SimpleNamespace(t_window=t_window) if t_window else None
+    return SimpleNamespace(rule_id=rule_id, priority=priority, time_scope=time_scope)
+
+
+def _checkpoint(checkpoint_id, t_window, active_rules):
+    return SimpleNamespace(checkpoint_id=checkpoint_id, t_window=t_window, active_rules=active_rules)
+
+
+def _linear_active_rules(pack, t):
+    """Previous AudioCoach._get_active_rules scan + priority queue order"""
+    ids = set()
+    for cp in pack.checkpoints:
+        if cp.t_window[0] <= t <= cp.t_window[1]:
+            ids.update(cp.active_rules)
+    if not ids:
+        overall = next((cp for cp in pack.checkpoints if cp.checkpoint_id == "overall"), None)
+        if overall is None:
+            rules = list(pack.dna_invariants)
+        else:
+            rules = [r for r in pack.dna_invariants if r.rule_id in set(overall.active_rules)]
+    else:
+        rules = [r for r in pack.dna_invariants if r.rule_id in ids]
+    return [r for p in PRIORITY_ORDER for r in rules if r.priority == p]
+
+
+def test_interval_table_closed_windows():
+    table = IntervalTable([(0.0, 2.0, "a"), (2.0, 5.0, "b"), (4.0, 4.0, "c"), (6.0, 3.0, "bad")])
+
+    assert table.at(-1.0) == ()
+    assert table.at(0.0) == ("a",)
+    assert table.at(2.0) == ("a", "b")  # both ends inclusive
+    assert table.at(3.5) == ("b",)
+    assert table.at(4.0) == ("b", "c")
+    assert table.at(5.0) == ("b",)
+    assert table.at(5.5) == ()
+
+
+def test_index_matches_linear_scan_on_random_packs():
+    rng = random.Random(7)
+    for trial in range(30):
+        rules = [
+            _rule(f"r{i}", rng.choice(PRIORITY_ORDER), [a, a + rng.choice([0, 1, 3, 10])] if rng.random() < 0.8 else None)
+            for i, a in enumerate(rng.randint(0, 30) for _ in range(40))
+        ]
+        checkpoints = [
+            _checkpoint(f"cp{j}", [a, a + rng.randint(0, 8)], rng.sample([r.rule_id for r in rules], 5))
+            for j, a in enumerate(rng.randint(0, 30) for _ in range(6))
+        ]
+        if trial % 2:
+            checkpoints.append(_checkpoint("overall", [100, 100], [r.rule_id for r in rules[:3]]))
+        pack = SimpleNamespace(dna_invariants=rules, checkpoints=checkpoints)
+        index = RuleIntervalIndex(pack)
+
+        for t in [x / 2 for x in range(-2, 90)]:
+            assert [r.rule_id for r in index.active_rules_at(t)] == [r.rule_id for r in _linear_active_rules(pack, t)]
+            expected_cp = next((cp.checkpoint_id for cp in checkpoints if cp.t_window[0] <= t <= cp.t_window[1]), None)
+            assert index.checkpoint_id_at(t) == expected_cp
+            scoped = [
+                r.rule_id for r in rules
+                if (r.time_scope.t_window if r.time_scope else [0, 999])[0] <= t
+                <= (r.time_scope.t_window if r.time_scope else [0, 999])[1]
+            ]
+            assert [r.rule_id for r in index.scoped_rules_at(t)] == scoped
+
+
+def test_audio_coach_uses_compiled_index(monkeypatch):
+    pytest.importorskip("google.genai")
+    from app.services.audio_coach import AudioCoach
+    from app.services.proof_patterns import create_proof_pack
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test")
+    coach = AudioCoach()
+    pack = create_proof_pack()
+    coach.set_coaching_context(pack, tone="friendly")
+
+    assert coach._rule_index is not None
+    active = coach._get_active_rules(1.0)
+    assert [PRIORITY_ORDER.index(r.priority) for r in active] == sorted(PRIORITY_ORDER.index(r.priority) for r in active)
+
+    command = coach.get_next_command(1.0)
+    assert command
+    assert coach.get_coaching_log()[-1].rule_id == active[0].rule_id  # highest priority first
@@ -0,0 +1,127 @@
+"""
+Tests for the outlier search index (Korean-aware tokenization, in-memory fallback, Postgres statements)
+backend/tests/test_search_index.py
+"""
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.feed_ranking import feed_filters
+from app.services.search_index import (
+    InMemorySearchIndex,
+    PostgresSearchIndex,
+    SearchDocument,
+    build_search_document,
+    tokenize,
+)
+
+
+def test_tokenize_handles_particles_hashtags_and_fullwidth():
+    tokens = tokenize("#Squat 스쿼트댄스를 ＴＥＳＴ")
+
+    assert {"squat", "test", "스쿼트댄스를"} <= set(tokens)
+    assert {"스쿼", "댄스"} <= set(tokens)  # syllable bigrams meet "스쿼트 댄스" without a morphology dependency
+    assert set(tokenize("스쿼트 댄스")) - {"스쿼트", "댄스"} <= set(tokens)
+    assert tokenize("!!! ...") == []
+
+
+def test_document_collects_hashtags_hooks_kicks_and_top_comments():
+    item = SimpleNamespace(
+        id=uuid.uuid4(), title="Gym fail", category="fitness", platform="tiktok", outlier_score=5.0, tier_rank=1,
+        raw_payload={
+            "hashtags": ["#헬창밈"],
+            "vdg_analysis": {"semantic": {"hook_genome": {"pattern": "pattern_break", "delivery": "other"}}},
+        },
+        best_comments=[{"text": f"댓글{i}"} for i in range(8)],
+    )
+    document = build_search_document(item, kicks=[("반전 킥", "expectation_violation")])
+
+    assert document.keywords == ["fitness", "#헬창밈", "pattern_break", "반전 킥", "expectation_violation"]
+    assert document.comments == [f"댓글{i}" for i in range(5)]
+
+
+def test_in_memory_index_ranks_by_relevance_then_outlier_score_and_filters():
+    index = InMemorySearchIndex()
+    in_title = SearchDocument(uuid.uuid4(), title="스쿼트 댄스 챌린지", outlier_score=1.0, platform="tiktok", tier_rank=2)
+    in_comment = SearchDocument(uuid.uuid4(), title="헬스장", comments=["스쿼트댄스 대박"], outlier_score=1.0,
+                                platform="tiktok", tier_rank=1)
+    boosted = SearchDocument(uuid.uuid4(), title="스쿼트 댄스", outlier_score=50.0, platform="youtube", tier_rank=1)
+    for document in (in_title, in_comment, boosted):
+        index.upsert(document)
+
+    ranked = [document for document, _ in index.search("스쿼트댄스")]
+    assert ranked == [boosted, in_title, in_comment]  # same relevance → outlier_score breaks the tie; comments rank last
+    assert [d for d, _ in index.search("스쿼트댄스", platform="tiktok", max_tier_rank=1)] == [in_comment]
+
+    index.upsert(SearchDocument(in_title.outlier_item_id, title="요리"))  # re-index replaces old tokens
+    assert in_title.outlier_item_id not in {d.outlier_item_id for d, _ in index.search("스쿼트")}
+    index.remove(boosted.outlier_item_id)
+    assert len(index) == 2 and index.search("") == []
+
+
+def test_postgres_statement_uses_tsvector_and_trigram_indexes():
+    sql = str(PostgresSearchIndex().search_statement(
+        "스쿼트", filters=feed_filters(min_tier="A"), limit=5,
+    ).compile(dialect=postgresql.dialect()))
+
+    assert "outlier_search_documents.search_vector @@ to_tsquery(" in sql
+    assert "outlier_search_documents.search_text %%> " in sql
+    assert "ts_rank(" in sql and "word_similarity(" in sql
+    assert "outlier_items.tier_rank <= " in sql
+    assert "ILIKE" not in sql.upper()
+
+
+class _FakeItemSession:
+    """select(OutlierItem) → item, commit / rollback 횟수 기록"""
+
+    def __init__(self, item):
+        self.item = item
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one_or_none=lambda: self.item)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.mark.asyncio
+async def test_failed_search_refresh_does_not_break_the_caller(monkeypatch):
+    from contextlib import asynccontextmanager
+
+    from app import database
+    from app.routers import outliers
+    from app.services import search_index
+
+    async def _failing_refresh(db, item_id):
+        raise RuntimeError('relation "outlier_search_documents" does not exist')
+
+    refresh_sessions = []
+
+    @asynccontextmanager
+    async def _session_maker():
+        refresh_sessions.append(_FakeItemSession(None))
+        yield refresh_sessions[-1]
+
+    monkeypatch.setattr(search_index, "refresh_search_document", _failing_refresh)
+    monkeypatch.setattr(database, "async_session_maker", _session_maker)
+
+    item = SimpleNamespace(id=uuid.uuid4(), analysis_status="comments_pending_review", best_comments=None)
+    db = _FakeItemSession(item)
+    payload = outliers.ManualCommentsInput(comments=[{"text": "대박", "likes": 3}])
+
+    result = await outliers.add_manual_comments(str(item.id), payload, db=db, current_user=None)
+
+    assert result["success"] is True and result["analysis_status"] == "comments_ready"
+    assert db.commits == 1 and db.rollbacks == 0  # caller's session (and loaded objects) untouched
+    assert len(refresh_sessions) == 1  # refresh ran on its own session
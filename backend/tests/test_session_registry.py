@@ -0,0 +1,227 @@
+"""
+Tests for the shared coaching SessionRegistry (multi-worker session state)
+backend/tests/test_session_registry.py
+"""
+import asyncio
+import os
+import sys
+from collections import defaultdict
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.vdg_v4 import CoachingIntervention, CoachingOutcome
+from app.services import session_registry as registry_module
+from app.services.session_logger import SessionLogger
+from app.services.session_registry import (
+    NS_COACHING_SESSIONS,
+    NS_LIVE_SESSIONS,
+    LocalSessionRegistry,
+    RedisSessionRegistry,
+)
+
+
+class _FakeRedis:
+    """Dict-backed subset of redis.asyncio.Redis used by RedisSessionRegistry"""
+
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+        self.sets = defaultdict(set)
+        self.lists = defaultdict(list)
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def _hset(self, key, mapping):
+        self.hashes[key].update(mapping)
+
+    def _hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def _delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.lists.pop(key, None)
+
+    def _expire(self, key, ttl):
+        pass
+
+    def _sadd(self, key, *members):
+        self.sets[key].update(members)
+
+    def _srem(self, key, *members):
+        self.sets[key].difference_update(members)
+
+    def _rpush(self, key, value):
+        self.lists[key].append(value)
+
+    async def hgetall(self, key):
+        return self._hgetall(key)
+
+    async def exists(self, key):
+        return int(bool(self.hashes.get(key)))
+
+    async def srem(self, key, *members):
+        self._srem(key, *members)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    async def close(self):
+        pass
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        return [getattr(self._client, f"_{name}")(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+@pytest.fixture(params=["local", "redis"])
+def registry(request):
+    if request.param == "local":
+        return LocalSessionRegistry()
+    return RedisSessionRegistry(_FakeRedis())
+
+
+@pytest.mark.asyncio
+async def test_registry_records_and_items(registry):
+    await registry.put("ns", "a", {"status": "created", "pack": {"rules": [1, 2]}})
+    await registry.put("ns", "b", {"status": "created"})
+
+    assert await registry.update("ns", "a", {"status": "ended"}) is True
+    assert await registry.update("ns", "missing", {"status": "ended"}) is False
+    assert await registry.get("ns", "a") == {"status": "ended", "pack": {"rules": [1, 2]}}
+    assert await registry.count("ns") == 2
+
+    await registry.append("ns", "a", {"n": 1})
+    await registry.append("ns", "a", {"n": 2})
+    assert await registry.items("ns", "a") == [{"n": 1}, {"n": 2}]
+
+    await registry.delete("ns", "a")
+    assert await registry.get("ns", "a") is None
+    assert await registry.items("ns", "a") == []
+    assert [r["status"] for r in await registry.values("ns")] == ["created"]
+
+
+@pytest.mark.asyncio
+async def test_local_registry_expires_records(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(registry_module.time, "monotonic", lambda: now[0])
+    registry = LocalSessionRegistry()
+
+    await registry.put("ns", "a", {"v": 1}, ttl_sec=60)
+    await registry.update("ns", "a", {"v": 2}, ttl_sec=60)  # refresh
+    now[0] += 59
+    assert await registry.get("ns", "a") == {"v": 2}
+    now[0] += 2
+    assert await registry.get("ns", "a") is None
+    assert await registry.values("ns") == []
+
+
+@pytest.mark.asyncio
+async def test_session_logs_are_shared_between_workers(registry):
+    worker_a = SessionLogger(registry=registry)
+    worker_b = SessionLogger(registry=registry)
+
+    await worker_a.start_session("sess_1", pack_id="pack_1")
+    await worker_a.log_rule_evaluated("sess_1", rule_id="r1", ap_id="ap", checkpoint_id="cp", result="violated")
+    await worker_a.log_intervention(CoachingIntervention(
+        session_id="sess_1",
+        intervention_id="int_1",
+        pack_id="pack_1",
+        rule_id="r1",
+        ap_id="ap",
+        delivered_at="2026-01-01T00:00:01Z",
+        t_video=1.0,
+        command_text="화면 중앙으로",
+    ))
+    # outcome arrives on another worker and still links to the session
+    await worker_b.log_outcome(CoachingOutcome(intervention_id="int_1", compliance_detected=True))
+
+    summary = await worker_b.get_session_summary("sess_1")
+    assert (summary.rules_evaluated, summary.interventions_delivered, summary.outcomes_observed) == (1, 1, 1)
+    assert summary.intervention_outcome_join_rate == 1.0
+    assert (await worker_b.get_all_sessions_summary())["total_sessions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coaching_service_state_is_shared_between_workers(registry):
+    from app.services.coaching_session import CoachingSessionService
+
+    worker_a = CoachingSessionService(registry=registry)
+    worker_b = CoachingSessionService(registry=registry)
+
+    session = await worker_a.start_session(user_id_hash="u", mode="homage")
+    await worker_b.record_upload_outcome(session.session_id, uploaded=True)
+    await worker_a._update_cooldown(session.session_id, "r1", 1.0)
+
+    assert (await worker_a.get_session(session.session_id)).upload_outcome.uploaded is True
+    assert await worker_b._can_intervene(session.session_id, "r1", 2.0) is False
+    assert (await worker_b.end_session(session.session_id)).session.ended_at is not None
+
+
+@pytest.mark.asyncio
+async def test_coaching_service_events_from_different_workers_are_all_kept(registry):
+    from app.services.coaching_session import CoachingSessionService
+
+    worker_a = CoachingSessionService(registry=registry)
+    worker_b = CoachingSessionService(registry=registry)
+    session = await worker_a.start_session(user_id_hash="u", mode="homage")
+    session_id = session.session_id
+
+    # interleaved writes from two workers: each event is appended, nothing is overwritten
+    await asyncio.gather(
+        worker_a.record_outcome(session_id, rule_id="r1", t_sec=1.0, compliance=True),
+        worker_b.record_outcome(session_id, rule_id="r2", t_sec=1.5, compliance=False),
+        worker_b.record_upload_outcome(session_id, uploaded=True),
+    )
+
+    complete_log = await worker_a.end_session(session_id)
+    assert sorted(o.rule_id for o in complete_log.outcomes) == ["r1", "r2"]
+    assert complete_log.compliance_rate == 0.5
+    assert complete_log.upload_outcome.uploaded is True
+    # aggregates persisted on the session record, events still assembled on read
+    stored = await worker_b.get_session(session_id)
+    assert (stored.compliance_rate, len(stored.outcomes)) == (0.5, 2)
+
+
+@pytest.mark.asyncio
+async def test_live_session_snapshot_and_bookkeeping_visible_to_other_workers(registry):
+    from app.routers.coaching_ws import CoachingSessionManager
+
+    class _FakeWebSocket:
+        async def accept(self, subprotocol=None):
+            pass
+
+    worker_a = CoachingSessionManager(registry=registry)
+    worker_b = CoachingSessionManager(registry=registry)
+    await registry.put(NS_COACHING_SESSIONS, "sess_1", {"session_id": "sess_1", "status": "created"})
+
+    await worker_a.connect(_FakeWebSocket(), "sess_1")
+    session = worker_a.create_session("sess_1", coach=None)
+    session.update({"status": "recording", "effective_tier": "basic", "tier_downgraded": True, "recording_time": 12.5})
+    await worker_a.publish("sess_1")
+
+    [live] = await worker_b.list_sessions()
+    assert live["status"] == "recording"
+    assert live["worker_id"] == registry_module.WORKER_ID
+    # session-end bookkeeping on any worker sees the downgraded tier
+    post = await registry.get(NS_COACHING_SESSIONS, "sess_1")
+    assert (post["status"], post["effective_tier"], post["tier_downgraded"]) == ("created", "basic", True)
+
+    await worker_a.disconnect("sess_1")
+    assert await worker_b.list_sessions() == []
+    assert await registry.get(NS_LIVE_SESSIONS, "sess_1") is None
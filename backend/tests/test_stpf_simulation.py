@@ -0,0 +1,218 @@
+"""
+Tests for STPF vectorized scoring / Monte Carlo
+backend/tests/test_stpf_simulation.py
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.stpf.calculator import (
+    GATE_FIELDS,
+    NUMERATOR_FIELDS,
+    DENOMINATOR_FIELDS,
+    MULTIPLIER_FIELDS,
+)
+from app.services.stpf.schemas import (
+    STPFGates,
+    STPFNumerator,
+    STPFDenominator,
+    STPFMultipliers,
+)
+from app.services.stpf.simulation import STPFSimulator, STPFVariables
+
+
+@pytest.fixture
+def base_variables():
+    return STPFVariables(
+        gates=STPFGates(trust_gate=6, legality_gate=8, hygiene_gate=6),
+        numerator=STPFNumerator(essence=7, novelty=6, proof=5),
+        multipliers=STPFMultipliers(network=7),
+    )
+
+
+class TestCalculateArrays:
+    def test_matches_scalar_calculate(self, base_variables):
+        """Columnar scores equal STPFCalculator.calculate row by row"""
+        simulator = STPFSimulator()
+        cols = simulator.sample_noisy_arrays(
+            base_variables, 500, noise_std=2.5, rng=np.random.default_rng(7)
+        )
+        raw, scores, gate_passed = simulator.calculator.calculate_arrays(*cols)
+
+        assert (~gate_passed).any() and gate_passed.any()
+        for i in range(500):
+            g, n, d, m = (c[i] for c in cols)
+            result = simulator.calculator.calculate(
+                gates=STPFGates(**dict(zip(GATE_FIELDS, g))),
+                numerator=STPFNumerator(**dict(zip(NUMERATOR_FIELDS, n))),
+                denominator=STPFDenominator(**dict(zip(DENOMINATOR_FIELDS, d))),
+                multipliers=STPFMultipliers(**dict(zip(MULTIPLIER_FIELDS, m))),
+            )
+            assert scores[i] == result.score_1000
+            assert gate_passed[i] == result.gate_passed
+            assert raw[i] == pytest.approx(result.raw_score, rel=1e-12)
+
+    def test_noise_respects_bounds_and_fixed_legality(self, base_variables):
+        gates, numerator, denominator, multipliers = STPFSimulator().sample_noisy_arrays(
+            base_variables, 2000, noise_std=5.0, uncertainty={"essence": 0.0},
+            rng=np.random.default_rng(0),
+        )
+        for col in (gates, numerator, denominator, multipliers):
+            assert col.min() >= 1.0 and col.max() <= 10.0
+        assert (gates[:, 1] == 8).all()  # legality_gate 노이즈 없음
+        assert (numerator[:, 0] == 7).all()  # uncertainty override
+
+
+class TestMonteCarloVectorized:
+    def test_result_shape_and_consistency(self, base_variables):
+        result = STPFSimulator().run_monte_carlo(base_variables, n_simulations=20000, seed=1)
+
+        assert result.n_simulations == 20000
+        assert sum(result.distribution_summary.values()) == 20000
+        assert len(result.distribution_summary) == 11
+        assert result.go_probability + result.consider_probability + result.nogo_probability == pytest.approx(1.0)
+        assert result.min_score <= result.percentile_10 <= result.median <= result.percentile_90 <= result.max_score
+
+    def test_seed_is_reproducible(self, base_variables):
+        simulator = STPFSimulator()
+        a = simulator.run_monte_carlo(base_variables, n_simulations=1000, seed=42)
+        b = simulator.run_monte_carlo(base_variables, n_simulations=1000, seed=42)
+        assert a.model_dump(exclude={"run_time_ms"}) == b.model_dump(exclude={"run_time_ms"})
+
+    def test_agrees_with_scalar_path(self, base_variables):
+        """Both paths estimate the same distribution"""
+        simulator = STPFSimulator()
+        fast = simulator.run_monte_carlo(base_variables, n_simulations=20000, seed=3)
+        slow = simulator.run_monte_carlo(base_variables, n_simulations=2000, seed=3, vectorized=False)
+
+        assert fast.mean == pytest.approx(slow.mean, abs=25)
+        assert fast.go_probability == pytest.approx(slow.go_probability, abs=0.05)
+
+    def test_scalar_path_leaves_global_random_untouched(self, base_variables):
+        import random
+
+        simulator = STPFSimulator()
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        a = simulator.run_monte_carlo(base_variables, n_simulations=200, seed=5, vectorized=False)
+        assert random.random() == expected
+        b = simulator.run_monte_carlo(base_variables, n_simulations=200, seed=5, vectorized=False)
+        assert a.model_dump(exclude={"run_time_ms"}) == b.model_dump(exclude={"run_time_ms"})
+
+
+class TestBatchScoring:
+    """STPFService.score_batch vs single-item analyze_manual"""
+
+    def _random_items(self, n, seed=0):
+        rng = np.random.default_rng(seed)
+        items = []
+        for i in range(n):
+            def group(fields):
+                return dict(zip(fields, np.round(rng.uniform(1, 10, len(fields)), 2).tolist()))
+            items.append({
+                "id": f"item-{i}",
+                "gates": group(GATE_FIELDS),
+                "numerator": group(NUMERATOR_FIELDS),
+                "denominator": group(DENOMINATOR_FIELDS),
+                "multipliers": group(MULTIPLIER_FIELDS),
+                "capital": float(rng.choice([0, 5_000_000])),
+                "confidence_level": float(rng.uniform(1, 10)),
+                "retention": float(rng.uniform(0, 1)),
+            })
+        return items
+
+    @pytest.mark.asyncio
+    async def test_matches_single_item_analysis(self):
+        from app.services.stpf.service import STPFService
+
+        service = STPFService()
+        items = self._random_items(300)
+        rows = list(service.score_batch(items, chunk_size=64))
+
+        assert [r["index"] for r in rows] == list(range(300))
+        for item, row in zip(items, rows):
+            single = await service.analyze_manual(
+                gates=STPFGates(**item["gates"]),
+                numerator=STPFNumerator(**item["numerator"]),
+                denominator=STPFDenominator(**item["denominator"]),
+                multipliers=STPFMultipliers(**item["multipliers"]),
+                capital=item["capital"],
+                confidence_level=item["confidence_level"],
+                retention=item["retention"],
+            )
+            assert row["id"] == item["id"]
+            assert row["score_1000"] == single.result.score_1000
+            assert row["go_nogo"] == single.result.get_decision()
+            assert row["patches_applied"] == [
+                p["patch"] for p in single.patch_info.get("patches_applied", [])
+            ]
+
+            kelly = service.get_kelly_decision(row["score_1000"])
+            assert row["grade"] == kelly.grade_info["grade"]
+            assert row["kelly"]["signal"] == kelly.signal
+            assert row["kelly"]["safe_kelly_fraction"] == pytest.approx(kelly.safe_kelly_fraction, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_vdg_items_use_mapper(self):
+        from app.schemas.vdg_v4 import VDGv4
+        from app.services.stpf.service import STPFService
+
+        service = STPFService()
+        vdg = {"content_id": "c1", "duration_sec": 12}
+        row = next(service.score_batch([{"vdg": vdg}]))
+        single = await service.analyze_vdg(VDGv4(**vdg), update_bayesian=False)
+
+        assert row["id"] == "c1"
+        assert row["score_1000"] == single.result.score_1000
+        assert row["mapping_confidence"] == single.mapping_info["confidence"]
+
+    def test_invalid_items_do_not_abort_batch(self):
+        from app.services.stpf.service import STPFService
+
+        items = self._random_items(2) + [{"id": "bad"}, {"id": "bad-vdg", "vdg": {"nope": 1}}]
+        rows = list(STPFService().score_batch(items))
+
+        assert [r["success"] for r in rows] == [True, True, False, False]
+        assert rows[2]["id"] == "bad" and "error" in rows[2]
+
+    def test_ndjson_endpoint_streams_rows_and_summary(self):
+        import json
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.routers.stpf import router
+
+        app = FastAPI()
+        app.include_router(router)
+        items = self._random_items(5)
+        with TestClient(app) as client:
+            resp = client.post("/stpf/batch/score", json={"items": items, "chunk_size": 2})
+
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [l["id"] for l in lines[:-1]] == [i["id"] for i in items]
+        assert lines[-1]["done"] is True and lines[-1]["succeeded"] == 5
+
+    def test_ndjson_endpoint_reports_malformed_items_per_row(self):
+        import json
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.routers.stpf import router
+
+        app = FastAPI()
+        app.include_router(router)
+        items = self._random_items(3)
+        items[1] = {"id": "bad-gates", "gates": {"trust_gate": "high"}}
+        items.append("not-an-object")
+        with TestClient(app) as client:
+            resp = client.post("/stpf/batch/score", json={"items": items})
+
+        assert resp.status_code == 200
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [l["success"] for l in lines[:-1]] == [True, False, True, False]
+        assert lines[1]["id"] == "bad-gates" and "trust_gate" in lines[1]["error"]
+        assert lines[-1]["succeeded"] == 2 and lines[-1]["failed"] == 2
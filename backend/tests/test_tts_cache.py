@@ -0,0 +1,97 @@
+"""
+Tests for TTSClipCache (pre-rendered coaching TTS clips)
+backend/tests/test_tts_cache.py
+"""
+import asyncio
+import base64
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.proof_patterns import create_proof_pack
+from app.services.tts_cache import TTSClipCache, collect_coach_lines
+
+
+class _Renderer:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, text):
+        def render():
+            with self._lock:
+                self.calls += 1
+            if self.delay:
+                threading.Event().wait(self.delay)
+            return f"mp3:{text}".encode()
+        return render
+
+
+@pytest.mark.asyncio
+async def test_memory_lru_and_disk_store(tmp_path):
+    render = _Renderer()
+    cache = TTSClipCache(max_entries=2, cache_dir=str(tmp_path))
+
+    first = await cache.get_or_render("화면 중앙으로", "ko", "calm_mentor", render("a"))
+    again = await cache.get_or_render("화면 중앙으로", "ko", "calm_mentor", render("a"))
+    assert first == again == base64.b64encode(b"mp3:a").decode()
+    assert render.calls == 1
+
+    # persona is part of the key
+    await cache.get_or_render("화면 중앙으로", "ko", "bestie", render("b"))
+    await cache.get_or_render("밝은 곳으로", "ko", "calm_mentor", render("c"))
+    assert render.calls == 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.peek("화면 중앙으로", "ko", "calm_mentor") is None  # LRU evicted
+
+    # evicted from memory, still on disk; a fresh process reuses it too
+    fresh = TTSClipCache(max_entries=8, cache_dir=str(tmp_path))
+    assert await fresh.get_or_render("화면 중앙으로", "ko", "calm_mentor", render("x")) == first
+    assert render.calls == 3
+    assert fresh.stats()["disk_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_render_once_and_failures_are_not_cached():
+    render = _Renderer(delay=0.05)
+    cache = TTSClipCache()
+
+    results = await asyncio.gather(*(
+        cache.get_or_render("같은 대사", "ko", "calm_mentor", render("same")) for _ in range(5)
+    ))
+    assert len(set(results)) == 1
+    assert render.calls == 1
+
+    assert await cache.get_or_render("실패", "ko", "calm_mentor", lambda: None) is None
+    assert await cache.get_or_render("실패", "ko", "calm_mentor", render("retry")) is not None
+
+
+@pytest.mark.asyncio
+async def test_director_pack_warmup_prerenders_coach_lines(monkeypatch):
+    from app.routers import coaching_ws
+    from app.services import tts_cache
+
+    pack = create_proof_pack()
+    lines = collect_coach_lines(pack)
+    assert lines and len(lines) == len(set(lines))
+
+    rendered = []
+
+    def fake_synthesize(text, lang, slow):
+        rendered.append(text)
+        return b"mp3"
+
+    monkeypatch.setattr(coaching_ws, "_synthesize_gtts", fake_synthesize)
+    monkeypatch.setattr(tts_cache, "_tts_clip_cache", TTSClipCache())
+
+    assert await coaching_ws.warm_tts_clips(pack) == len(lines)
+    assert sorted(rendered) == sorted(lines)
+
+    # feedback during recording is served from memory, no synthesis
+    assert await coaching_ws.generate_tts_fallback(lines[0]) == base64.b64encode(b"mp3").decode()
+    assert len(rendered) == len(lines)
@@ -0,0 +1,158 @@
+"""
+Tests for content-addressed VDG Pass cache
+backend/tests/test_vdg_pass_cache.py
+"""
+import os
+import sys
+import time
+from dataclasses import asdict
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vdg_2pass.pass_cache import (
+    VDGPassCache,
+    decode_pass2,
+    encode_pass2,
+)
+from app.services.vdg_2pass.cv_measurement_pass import (
+    CVMeasurementResult,
+    CVPassProvenance,
+    MetricResult,
+    PointMeasurement,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return VDGPassCache(cache_dir=str(tmp_path), ttl_sec=3600)
+
+
+class TestPassCacheKeys:
+    def test_key_is_deterministic_and_order_independent(self, cache):
+        a = cache.make_key("pass1", video_hash="abc", model_id="m", fps=1.0)
+        b = cache.make_key("pass1", fps=1.0, model_id="m", video_hash="abc")
+        assert a == b
+
+    def test_key_changes_with_any_component(self, cache):
+        base = dict(video_hash="abc", model_id="m", prompt_version="v1")
+        key = cache.make_key("pass1", **base)
+        assert cache.make_key("pass2", **base) != key
+        assert cache.make_key("pass1", **{**base, "prompt_version": "v2"}) != key
+        assert cache.make_key("pass1", **{**base, "video_hash": "abd"}) != key
+
+    def test_unknown_pass(self, cache):
+        with pytest.raises(ValueError):
+            cache.make_key("pass3", video_hash="abc")
+
+
+class TestPassCacheStore:
+    def test_disk_roundtrip_and_stats(self, cache):
+        key = cache.make_key("pass1", video_hash="abc")
+        assert cache.get("pass1", key) is None
+
+        cache.put("pass1", key, {"llm_output": {"x": 1}})
+        assert cache.get("pass1", key) == {"llm_output": {"x": 1}}
+
+        stats = cache.stats()
+        assert stats["local"] == {"pass1_misses": 1, "pass1_stores": 1, "pass1_hits": 1}
+        assert stats["pass1_hit_rate"] == 0.5
+        assert stats["pass2_hit_rate"] is None
+        assert stats["backends"]["redis"] is False
+
+    def test_ttl_expiry(self, cache):
+        key = cache.make_key("pass2", video_hash="abc")
+        cache.put("pass2", key, {"v": 1})
+        path = cache._path("pass2", key)
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+        assert cache.get("pass2", key) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        key = cache.make_key("pass1", video_hash="abc")
+        path = cache._path("pass1", key)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert cache.get("pass1", key) is None
+        assert cache.stats()["local"]["pass1_errors"] == 1
+
+    def test_redis_read_through_backfills_disk(self, cache):
+        client = MagicMock()
+        client.get.return_value = '{"v": 2}'
+        cache.use_redis = True
+        cache._redis = client
+
+        key = cache.make_key("pass1", video_hash="abc")
+        assert cache.get("pass1", key) == {"v": 2}
+        assert cache._path("pass1", key).exists()
+        client.hincrby.assert_called_with(VDGPassCache.REDIS_STATS_KEY, "pass1_hits", 1)
+
+    def test_without_disk_or_redis_always_misses(self):
+        cache = VDGPassCache(cache_dir=None)
+        key = cache.make_key("pass1", video_hash="abc")
+        cache.put("pass1", key, {"v": 1})
+        assert cache.get("pass1", key) is None
+
+
+class TestPassCodecs:
+    def test_pass2_roundtrip(self):
+        result = CVMeasurementResult(
+            measurements=[
+                PointMeasurement(
+                    t_center_ms=1000,
+                    t_window_ms=500,
+                    metrics={"lit.brightness_ratio.v1": MetricResult(
+                        metric_id="lit.brightness_ratio.v1",
+                        value=0.42,
+                        confidence=0.9,
+                        frame_count=5,
+                    )},
+                ),
+            ],
+            version="cv_pass_v1",
+            run_at="2026-01-01T00:00:00",
+            total_frames_processed=5,
+            processing_time_ms=12,
+        )
+        prov = CVPassProvenance(
+            version="cv_pass_v1",
+            run_at="2026-01-01T00:00:00",
+            video_path="/tmp/x.mp4",
+            metrics_requested=["lit.brightness_ratio.v1"],
+            metrics_measured=["lit.brightness_ratio.v1"],
+            total_frames=5,
+            processing_time_ms=12,
+        )
+        decoded_result, decoded_prov = decode_pass2(encode_pass2(result, prov))
+        assert asdict(decoded_result) == asdict(result)
+        assert decoded_prov == prov
+
+
+class TestPipelineCacheKey:
+    def test_context_excluded_from_pass1_key_by_default(self):
+        from app.services.vdg_2pass.vdg_unified_pipeline import (
+            PipelineConfig,
+            VDGUnifiedPipeline,
+        )
+
+        def components(pipeline, caption):
+            return pipeline._pass1_key_components(
+                duration_ms=10000, platform="tiktok", caption=caption,
+                hashtags=None, top_comments=None,
+            )
+
+        pipeline = VDGUnifiedPipeline(PipelineConfig())
+        assert components(pipeline, "a") == components(pipeline, "b")
+
+        strict = VDGUnifiedPipeline(PipelineConfig(cache_key_includes_context=True))
+        assert components(strict, "a") != components(strict, "b")
+
+    def test_cache_disabled(self):
+        from app.services.vdg_2pass.vdg_unified_pipeline import (
+            PipelineConfig,
+            VDGUnifiedPipeline,
+        )
+
+        assert VDGUnifiedPipeline(PipelineConfig(use_pass_cache=False)).pass_cache is None
@@ -0,0 +1,86 @@
+"""
+Tests for VDG video fingerprints (full-file hash + perceptual dHash)
+backend/tests/test_video_fingerprint.py
+"""
+import hashlib
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vdg_2pass.video_fingerprint import (
+    VideoFingerprint,
+    compute_perceptual_fingerprint,
+    hash_video_file,
+    is_near_duplicate,
+)
+
+
+def _write_video(path, size, frame_fn, frames=300):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 30, size)
+    if not writer.isOpened():
+        pytest.skip("mp4v encoder unavailable")
+    for i in range(frames):
+        writer.write(frame_fn(i))
+    writer.release()
+    return str(path)
+
+
+def _pattern(seed):
+    base = np.random.default_rng(seed).integers(0, 256, (12, 16), dtype=np.uint8)
+
+    def frame(i, size):
+        moved = np.roll(base, i // 20, axis=1)  # 같은 시점 = 같은 내용
+        big = cv2.resize(moved, size, interpolation=cv2.INTER_LINEAR)
+        return cv2.cvtColor(big, cv2.COLOR_GRAY2BGR)
+    return frame
+
+
+class TestFileHash:
+    """Full-file content hash"""
+
+    def test_full_file_hash_detects_tail_changes(self, tmp_path):
+        """Files sharing the first MB no longer collide"""
+        header = b"\x00" * (2 * 1024 * 1024)
+        a, b = tmp_path / "a.mp4", tmp_path / "b.mp4"
+        a.write_bytes(header + b"tail-a")
+        b.write_bytes(header + b"tail-b")
+
+        assert hash_video_file(str(a)) != hash_video_file(str(b))
+        assert hash_video_file(str(a), chunk_size=4096) == hashlib.sha256(a.read_bytes()).hexdigest()
+        assert hash_video_file(str(a), algorithm="fast") != hash_video_file(str(b), algorithm="fast")
+
+    def test_empty_file_and_unknown_algorithm(self, tmp_path):
+        empty = tmp_path / "empty.mp4"
+        empty.write_bytes(b"")
+        assert hash_video_file(str(empty)) == hashlib.sha256(b"").hexdigest()
+        with pytest.raises(ValueError):
+            hash_video_file(str(empty), algorithm="md5")
+
+
+class TestPerceptualFingerprint:
+    """Perceptual dHash over sampled frames"""
+
+    def test_reencoded_copy_is_near_duplicate(self, tmp_path):
+        """Resized re-encode matches, a different clip does not"""
+        clip, unrelated = _pattern(0), _pattern(1)
+        original = _write_video(tmp_path / "orig.mp4", (160, 120), lambda i: clip(i, (160, 120)))
+        resized = _write_video(tmp_path / "small.mp4", (96, 72), lambda i: clip(i, (96, 72)))
+        other = _write_video(tmp_path / "other.mp4", (160, 120), lambda i: unrelated(i, (160, 120)))
+
+        fp_orig = compute_perceptual_fingerprint(original)
+        fp_small = compute_perceptual_fingerprint(resized)
+        fp_other = compute_perceptual_fingerprint(other)
+
+        assert len(fp_orig.hashes) == 16
+        assert is_near_duplicate(fp_orig, fp_small)
+        assert not is_near_duplicate(fp_orig, fp_other)
+        assert VideoFingerprint.from_hex(fp_orig.to_hex()).hashes == fp_orig.hashes
+
+    def test_unreadable_video(self, tmp_path):
+        assert compute_perceptual_fingerprint(str(tmp_path / "missing.mp4")) is None
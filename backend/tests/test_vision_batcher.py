@@ -0,0 +1,110 @@
+"""
+Tests for VisionBatcher (multi-session Gemini Vision micro-batching)
+backend/tests/test_vision_batcher.py
+"""
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.director_pack import DNAInvariant, RuleSpec, TimeScope
+from app.services.frame_analyzer import FrameAnalyzer, frame_bytes
+from app.services.vision_batcher import MockVisionBackend, VisionBatcher, frame_key
+
+
+def _rule(rule_id):
+    return DNAInvariant(
+        rule_id=rule_id,
+        domain="composition",
+        priority="high",
+        time_scope=TimeScope(t_window=[0.0, 10.0]),
+        spec=RuleSpec(metric_id="cmp.product_visible.v1", op="exists"),
+        check_hint="제품이 화면에 보여야 함",
+    )
+
+
+class _EchoBackend:
+    """Marks a rule compliant only when the frame bytes equal b"ok" """
+
+    def __init__(self, fail=False, garbage=False):
+        self.prompts = []
+        self.fail = fail
+        self.garbage = garbage
+
+    def generate(self, prompt, requests):
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        if self.garbage:
+            return "I cannot analyze these frames."
+
+        def answer(request):
+            ok = frame_bytes(request.frame) == b"ok"
+            return {r.rule_id: {"compliant": ok, "confidence": 0.9} for r in request.rules}
+
+        if len(requests) == 1:
+            return json.dumps(answer(requests[0]))
+        return "```json\n" + json.dumps({frame_key(i): answer(r) for i, r in enumerate(requests)}) + "\n```"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_share_one_call_and_results_are_split():
+    backend = MockVisionBackend(latency_sec=0.01)
+    batcher = VisionBatcher(backend, window_sec=0.05)
+
+    results = await asyncio.gather(*(
+        batcher.submit(b"jpeg", [_rule(f"rule_{i}")]) for i in range(5)
+    ))
+
+    assert backend.calls == [5]
+    assert [list(r) for r in results] == [[f"rule_{i}"] for i in range(5)]
+    assert batcher.get_stats()["avg_batch_size"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_single_pending_frame_uses_single_prompt_and_max_batch_flushes_early():
+    backend = _EchoBackend()
+    batcher = VisionBatcher(backend, window_sec=10.0, max_batch=3)
+
+    # max_batch reached → sent without waiting for the 10s window
+    await asyncio.wait_for(asyncio.gather(*(batcher.submit("b2s=", [_rule("r")]) for _ in range(3))), 1.0)
+    assert "3 independent frames" in backend.prompts[0]
+
+    solo = VisionBatcher(backend, window_sec=0.0)
+    assert (await solo.submit(b"ok", [_rule("r")]))["r"]["compliant"] is True
+    assert "analyzing a single frame" in backend.prompts[-1]
+    assert solo.stats.single_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_frame_analyzer_routes_through_batcher_per_session():
+    batcher = VisionBatcher(_EchoBackend(), window_sec=0.05)
+    analyzer = FrameAnalyzer(api_key="test", batcher=batcher)
+
+    good, bad = await asyncio.gather(
+        analyzer.analyze_frame(b"ok", [_rule("a_rule")], session_id="a"),
+        analyzer.analyze_frame(b"blurry", [_rule("b_rule")], session_id="b"),
+    )
+
+    assert batcher.stats.calls == 1
+    assert good["a_rule"].is_compliant is True
+    assert bad["b_rule"].is_compliant is False
+
+    # a failed batch call degrades to "no result" for every session, like a failed single call
+    analyzer.batcher = VisionBatcher(_EchoBackend(fail=True), window_sec=0.0)
+    assert await analyzer.analyze_frame(b"ok", [_rule("a_rule")], session_id="c") == {}
+    assert analyzer.batcher.stats.errors == 1
+
+    # an unparseable batch response falls back like the single-call path: compliant at low confidence
+    analyzer.batcher = VisionBatcher(_EchoBackend(garbage=True), window_sec=0.05)
+    first, second = await asyncio.gather(
+        analyzer.analyze_frame(b"ok", [_rule("a_rule")], session_id="d"),
+        analyzer.analyze_frame(b"ok", [_rule("b_rule")], session_id="e"),
+    )
+    assert analyzer.batcher.stats.calls == 1
+    assert (first["a_rule"].is_compliant, first["a_rule"].confidence) == (True, 0.1)
+    assert (second["b_rule"].is_compliant, second["b_rule"].confidence) == (True, 0.1)
@@ -161,7 +161,8 @@ export default function ForYouPage() {
             const response = await api.listOutliers({
                 limit: 10,
                 status: 'selected',
-                sortBy: 'outlier_score'
+                sortBy: 'outlier_score',
+                includeVdg: true,
             });
             setOutliers(response.items.length > 0 ? response.items : MOCK_OUTLIERS);
         } catch {
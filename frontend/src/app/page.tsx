@@ -111,15 +111,14 @@ export default function Home() {
       setIsLoading(true);
     }
     try {
-      const params: Record<string, string> = {
-        limit: '50',
+      const response = await api.listOutliers({
+        limit: 50,
         status: 'promoted',
-        analysis_status: 'completed'  // Only show fully analyzed videos on main page
-      };
-      if (platform !== 'all') params.platform = platform;
-      if (tier !== 'all') params.tier = tier;
-
-      const response = await api.listOutliers(params);
+        analysisStatus: 'completed',  // Only show fully analyzed videos on main page
+        platform: platform !== 'all' ? platform : undefined,
+        tier: tier !== 'all' ? tier : undefined,
+        includeVdg: true,  // cards render vdg_analysis
+      });
       if (!isMountedRef.current) return;
       if (response.items && response.items.length > 0) {
         setItems(response.items.map(mapToCardItem));
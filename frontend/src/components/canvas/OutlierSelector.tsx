@@ -48,7 +48,7 @@ export function OutlierSelector({ onSelect, onClose }: OutlierSelectorProps) {
         }
         try {
             // Use unified outliers API
-            const response = await fetch('/api/v1/outliers/?limit=100');
+            const response = await fetch('/api/v1/outliers/?limit=100&include_vdg=true');
             if (!response.ok) throw new Error('Failed to fetch outliers');
 
             const data = await response.json();
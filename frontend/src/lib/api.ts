@@ -575,8 +575,11 @@ export class ApiClient {
         tier?: string;
         status?: string;
         freshness?: string;
+        analysisStatus?: string;
         sortBy?: string;
         limit?: number;
+        cursor?: string;
+        includeVdg?: boolean;
     }): Promise<OutlierListResponse> {
         const params = new URLSearchParams();
         if (options?.category) params.set('category', options.category);
@@ -585,7 +588,10 @@ export class ApiClient {
         if (options?.status) params.set('status', options.status);
         if (options?.freshness) params.set('freshness', options.freshness);
         if (options?.sortBy) params.set('sort_by', options.sortBy);
+        if (options?.analysisStatus) params.set('analysis_status', options.analysisStatus);
         if (options?.limit) params.set('limit', options.limit.toString());
+        if (options?.cursor) params.set('cursor', options.cursor);
+        if (options?.includeVdg) params.set('include_vdg', 'true');
         const query = params.toString();
         return this.request<OutlierListResponse>(`/api/v1/outliers${query ? '?' + query : ''}`);
     }
@@ -1573,6 +1579,7 @@ export interface OutlierItem {
 export interface OutlierListResponse {
     total: number;
     items: OutlierItem[];
+    next_cursor?: string | null;  // keyset cursor for the next page (null = last page)
 }
 
 export interface PromoteOutlierResponse {